@@ -612,9 +612,11 @@ if IS_LOCAL:
                     'SOCKET_CONNECT_TIMEOUT': 2,  # 로컬이므로 짧은 타임아웃
                     'SOCKET_TIMEOUT': 2,  # 로컬이므로 짧은 타임아웃
                     'IGNORE_EXCEPTIONS': True,
-                    'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
+                    # msgpack + 압축 직렬화 (기존 JSON 캐시 항목도 읽기 가능)
+                    'SERIALIZER': 'quiz.cache_backend.MsgPackSerializer',
+                    'SERIALIZER_COMPRESSION': 'zlib',
+                    'SERIALIZER_COMPRESS_MIN_SIZE': 1024,
                     'REDIS_CLIENT_KWARGS': {
-                        'decode_responses': True,
                         'socket_keepalive': True,
                     },
                     'KEY_FUNCTION': 'django_redis.util.make_key',
@@ -663,10 +665,12 @@ elif ENVIRONMENT == 'production' or ENVIRONMENT == 'qa':
                 'SOCKET_TIMEOUT': 5,
                 # FLUSHDB 명령어 사용 방지
                 'IGNORE_EXCEPTIONS': True,
-                'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
+                # msgpack + 압축 직렬화 (기존 JSON 캐시 항목도 읽기 가능)
+                'SERIALIZER': 'quiz.cache_backend.MsgPackSerializer',
+                'SERIALIZER_COMPRESSION': 'zlib',
+                'SERIALIZER_COMPRESS_MIN_SIZE': 1024,
                 # Redis 명령어 제한 설정
                 'REDIS_CLIENT_KWARGS': {
-                    'decode_responses': True,
                     'socket_keepalive': True,
                 },
                 # 캐시 무효화 시 개별 키 삭제 사용
@@ -717,10 +721,12 @@ else:
                     'SOCKET_TIMEOUT': 5,
                     # FLUSHDB 명령어 사용 방지
                     'IGNORE_EXCEPTIONS': True,
-                    'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
+                    # msgpack + 압축 직렬화 (기존 JSON 캐시 항목도 읽기 가능)
+                    'SERIALIZER': 'quiz.cache_backend.MsgPackSerializer',
+                    'SERIALIZER_COMPRESSION': 'zlib',
+                    'SERIALIZER_COMPRESS_MIN_SIZE': 1024,
                     # Redis 명령어 제한 설정
                     'REDIS_CLIENT_KWARGS': {
-                        'decode_responses': True,
                         'socket_keepalive': True,
                     },
                     # 캐시 무효화 시 개별 키 삭제 사용
@@ -1,47 +1,216 @@
 """
 커스텀 Redis 캐시 백엔드
 FLUSHDB 명령어를 사용하지 않고 개별 키 삭제를 사용
+
+키 삭제는 KEYS 대신 SCAN 커서로 배치 단위 조회 후 파이프라인 UNLINK로 처리하여
+공유 Redis(Celery 브로커, Channels 레이어 포함)를 블로킹하지 않는다.
+
+값 직렬화는 MsgPackSerializer(msgpack + 크기 기준 압축)를 사용하며,
+기존 JSONSerializer로 저장된 항목도 그대로 읽을 수 있다.
 """
 
 from django_redis.cache import RedisCache
 from django_redis.client import DefaultClient
+from django_redis.serializers.base import BaseSerializer
 from django.core.cache.backends.base import InvalidCacheBackendError
+from django.core.serializers.json import DjangoJSONEncoder
+from redis.exceptions import ResponseError
+import json
 import logging
+import zlib
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+class MsgPackSerializer(BaseSerializer):
+    """
+    msgpack + 크기 기준 압축 캐시 직렬화기
+
+    저장 형식: 1바이트 헤더 + 본문
+    - 0x01: msgpack
+    - 0x02: msgpack + zlib
+    - 0x03: msgpack + lz4 (lz4 패키지 설치 시)
+    헤더가 없는 값은 기존 JSONSerializer로 저장된 항목으로 보고 JSON으로 읽는다.
+
+    OPTIONS:
+    - SERIALIZER_COMPRESSION: 'zlib' (기본값) | 'lz4' | 'none'
+    - SERIALIZER_COMPRESS_MIN_SIZE: 이 크기(바이트) 이상일 때만 압축 (기본값: 1024)
+    - SERIALIZER_COMPRESS_LEVEL: zlib 압축 레벨 (기본값: 6)
+    """
+
+    FORMAT_MSGPACK = 0x01
+    FORMAT_MSGPACK_ZLIB = 0x02
+    FORMAT_MSGPACK_LZ4 = 0x03
+
+    def __init__(self, options):
+        super().__init__(options)
+        options = options or {}
+        compression = str(options.get('SERIALIZER_COMPRESSION', 'zlib')).lower()
+        if compression == 'lz4' and not LZ4_AVAILABLE:
+            logger.warning("lz4 패키지가 없어 zlib 압축을 사용합니다.")
+            compression = 'zlib'
+        self.compression = compression
+        self.compress_min_size = int(options.get('SERIALIZER_COMPRESS_MIN_SIZE', 1024))
+        self.compress_level = int(options.get('SERIALIZER_COMPRESS_LEVEL', 6))
+        self._json_encoder = DjangoJSONEncoder()
+
+    def _default(self, value):
+        """msgpack이 지원하지 않는 타입은 JSONSerializer와 같은 문자열로 변환 (datetime, UUID, Decimal 등)"""
+        return self._json_encoder.default(value)
+
+    def dumps(self, value):
+        if not MSGPACK_AVAILABLE:
+            # msgpack이 없으면 JSON으로 저장 (읽기 경로에서 그대로 처리됨)
+            return json.dumps(value, cls=DjangoJSONEncoder).encode()
+
+        packed = msgpack.packb(value, default=self._default, use_bin_type=True)
+        if self.compression != 'none' and len(packed) >= self.compress_min_size:
+            if self.compression == 'lz4':
+                compressed, header = lz4.frame.compress(packed), self.FORMAT_MSGPACK_LZ4
+            else:
+                compressed, header = zlib.compress(packed, self.compress_level), self.FORMAT_MSGPACK_ZLIB
+            # 압축 효과가 없으면 원본 유지
+            if len(compressed) < len(packed):
+                return bytes((header,)) + compressed
+        return bytes((self.FORMAT_MSGPACK,)) + packed
+
+    def loads(self, value):
+        if isinstance(value, str):
+            # decode_responses 연결에서 읽힌 기존 JSON 항목
+            return json.loads(value)
+
+        header = value[0] if value else None
+        if header == self.FORMAT_MSGPACK:
+            return self._unpack(value[1:])
+        if header == self.FORMAT_MSGPACK_ZLIB:
+            return self._unpack(zlib.decompress(value[1:]))
+        if header == self.FORMAT_MSGPACK_LZ4:
+            if not LZ4_AVAILABLE:
+                raise ValueError("lz4로 압축된 캐시 항목이지만 lz4 패키지가 설치되어 있지 않습니다.")
+            return self._unpack(lz4.frame.decompress(value[1:]))
+
+        # 호환 경로: 헤더 없는 값은 기존 JSONSerializer 항목
+        return json.loads(value.decode())
+
+    @staticmethod
+    def _unpack(payload):
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack 캐시 항목이지만 msgpack 패키지가 설치되어 있지 않습니다.")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
 class SafeRedisClient(DefaultClient):
     """
     FLUSHDB 명령어를 사용하지 않는 안전한 Redis 클라이언트
     """
-    
-    def clear(self, version=None):
+
+    SCAN_COUNT = 1000          # SCAN 한 번에 조회할 키 수 (힌트)
+    UNLINK_CHUNK_SIZE = 100    # UNLINK 명령 하나에 담을 키 수
+    PIPELINE_CHUNKS = 10       # 파이프라인 한 번에 보낼 UNLINK 명령 수
+    PROGRESS_LOG_INTERVAL = 10000  # 진행 상황 로그 간격 (키 수)
+
+    def _unlink_keys(self, client, keys):
+        """키 목록을 UNLINK 명령 묶음으로 파이프라인 전송하고 삭제된 키 수를 반환"""
+        pipeline = client.pipeline(transaction=False)
+        for offset in range(0, len(keys), self.UNLINK_CHUNK_SIZE):
+            pipeline.unlink(*keys[offset:offset + self.UNLINK_CHUNK_SIZE])
+        try:
+            return sum(pipeline.execute())
+        except ResponseError:
+            # UNLINK 미지원 Redis(4.0 미만)는 DELETE로 폴백
+            pipeline = client.pipeline(transaction=False)
+            for offset in range(0, len(keys), self.UNLINK_CHUNK_SIZE):
+                pipeline.delete(*keys[offset:offset + self.UNLINK_CHUNK_SIZE])
+            return sum(pipeline.execute())
+
+    def scan_unlink(self, match, client=None, itersize=None, progress_callback=None):
+        """
+        SCAN 커서로 패턴에 맞는 키를 순회하며 배치 단위로 UNLINK 합니다.
+
+        Args:
+            match: Redis MATCH 패턴 (prefix/version이 적용된 실제 키 패턴)
+            client: Redis 클라이언트 (기본값: 쓰기 클라이언트)
+            itersize: SCAN COUNT 힌트 (기본값: SCAN_COUNT)
+            progress_callback: 배치마다 호출되는 콜백 (scanned, deleted)
+
+        Returns:
+            dict: {'scanned': 조회한 키 수, 'deleted': 삭제한 키 수, 'batches': 파이프라인 실행 횟수}
         """
-        FLUSHDB 대신 개별 키 삭제를 사용하여 캐시를 정리
+        if client is None:
+            client = self.get_client(write=True)
+
+        batch_size = self.UNLINK_CHUNK_SIZE * self.PIPELINE_CHUNKS
+        stats = {'scanned': 0, 'deleted': 0, 'batches': 0}
+        next_log = self.PROGRESS_LOG_INTERVAL
+        batch = []
+
+        def flush():
+            nonlocal next_log
+            stats['deleted'] += self._unlink_keys(client, batch)
+            stats['batches'] += 1
+            batch.clear()
+            if progress_callback:
+                progress_callback(stats['scanned'], stats['deleted'])
+            if stats['scanned'] >= next_log:
+                logger.info(f"캐시 키 삭제 진행 중: {stats['scanned']}개 조회, {stats['deleted']}개 삭제 ({match})")
+                next_log += self.PROGRESS_LOG_INTERVAL
+
+        for key in client.scan_iter(match=match, count=itersize or self.SCAN_COUNT):
+            batch.append(key)
+            stats['scanned'] += 1
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+
+        return stats
+
+    def delete_pattern(self, pattern, version=None, prefix=None, client=None, itersize=None):
+        """
+        패턴에 맞는 키를 SCAN + 파이프라인 UNLINK로 삭제합니다.
+
+        Returns:
+            int: 삭제된 키 수
+        """
+        match = self.make_pattern(pattern, version=version, prefix=prefix)
+        try:
+            stats = self.scan_unlink(match, client=client, itersize=itersize)
+        except Exception as e:
+            logger.error(f"패턴 캐시 삭제 중 오류 발생: {pattern}, 에러: {e}")
+            raise
+        logger.debug(f"패턴 캐시 삭제 완료: {pattern} - {stats['deleted']}개 키 삭제 ({stats['batches']}회 배치)")
+        return stats['deleted']
+
+    def clear(self, version=None, progress_callback=None):
+        """
+        FLUSHDB 대신 SCAN + 파이프라인 UNLINK로 이 캐시의 키(KEY_PREFIX 범위)만 정리
+
+        Returns:
+            int: 삭제된 키 수
         """
         try:
-            # 키 패턴을 사용하여 개별 키 삭제
-            pattern = self.make_key('*', version=version)
-            keys = self.connection.keys(pattern)
-            
-            if keys:
-                # 개별 키 삭제
-                deleted_count = 0
-                for key in keys:
-                    try:
-                        if self.connection.delete(key):
-                            deleted_count += 1
-                    except Exception as e:
-                        logger.warning(f"키 삭제 실패: {key}, 에러: {e}")
-                        continue
-                
-                logger.info(f"캐시 정리 완료: {deleted_count}개 키 삭제됨")
-                return deleted_count
+            match = self.make_pattern('*', version=version)
+            stats = self.scan_unlink(match, progress_callback=progress_callback)
+
+            if stats['deleted']:
+                logger.info(f"캐시 정리 완료: {stats['deleted']}개 키 삭제됨 (조회 {stats['scanned']}개, {stats['batches']}회 배치)")
             else:
                 logger.info("삭제할 캐시 키가 없습니다.")
-                return 0
-                
+            return stats['deleted']
+
         except Exception as e:
             logger.error(f"캐시 정리 중 오류 발생: {e}")
             # 오류가 발생해도 애플리케이션이 중단되지 않도록 함
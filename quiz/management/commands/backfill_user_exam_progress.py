@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from quiz.models import ExamResult
+from quiz.utils.stats_utils import refresh_user_exam_progress
+import time
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'UserQuestionStat과 최신 ExamResult로 사용자별 시험 진행 요약(UserExamProgress)을 배치 단위로 백필합니다. (재실행해도 같은 결과)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--usernames',
+            nargs='+',
+            help='특정 사용자만 백필 (없으면 시험 결과가 있는 모든 사용자)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='한 번에 재계산할 사용자 수 (기본값: 100)'
+        )
+
+    def handle(self, *args, **options):
+        usernames = options.get('usernames')
+        batch_size = max(options['batch_size'], 1)
+
+        if usernames:
+            user_ids = list(User.objects.filter(username__in=usernames).values_list('id', flat=True))
+        else:
+            user_ids = list(
+                ExamResult.objects.filter(user__isnull=False)
+                .values_list('user_id', flat=True).distinct().order_by('user_id')
+            )
+
+        self.stdout.write(f'UserExamProgress 백필 시작: {len(user_ids)}명 사용자 (배치 크기: {batch_size})')
+
+        start_time = time.time()
+        total_rows = 0
+
+        for offset in range(0, len(user_ids), batch_size):
+            batch_user_ids = user_ids[offset:offset + batch_size]
+            try:
+                total_rows += refresh_user_exam_progress(batch_user_ids)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'  배치 {offset // batch_size + 1} 백필 실패: {e}'))
+                continue
+
+            self.stdout.write(f'  {min(offset + batch_size, len(user_ids))}/{len(user_ids)}명 처리 완료 (누적 {total_rows}행)')
+
+        elapsed = time.time() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(f'\nUserExamProgress 백필 완료: {total_rows}행 생성 ({elapsed:.2f}초)')
+        )
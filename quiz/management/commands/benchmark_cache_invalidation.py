@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from quiz.utils.cache_utils import ExamCacheManager
+import time
+
+
+class Command(BaseCommand):
+    help = '키스페이스 크기별로 패턴 삭제(delete_pattern) 무효화와 세대 카운터 무효화의 지연 시간을 비교합니다. (생성한 키는 삭제됨)'
+
+    FILLER_PREFIX = '__benchmark_cache_filler'
+    BENCHMARK_USER = '__benchmark_cache_user'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[1000, 10000, 100000],
+            help='측정할 키스페이스 크기 목록 (기본값: 1000 10000 100000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='크기별 무효화 반복 횟수 (기본값: 20)'
+        )
+
+    def handle(self, *args, **options):
+        sizes = options['sizes']
+        repeat = max(options['repeat'], 1)
+        has_pattern = hasattr(cache, 'delete_pattern')
+
+        if not has_pattern:
+            self.stdout.write(self.style.WARNING(
+                '현재 캐시 백엔드는 delete_pattern을 지원하지 않아 패턴 삭제 측정은 건너뜁니다.'
+            ))
+
+        self.stdout.write(f"{'키 수':>10} | {'delete_pattern 평균':>20} | {'버전 증가 평균':>16} | {'배수':>8}")
+        self.stdout.write('-' * 66)
+
+        for size in sizes:
+            filler_keys = [f'{self.FILLER_PREFIX}_{i}' for i in range(size)]
+            for offset in range(0, size, 1000):
+                cache.set_many({key: 1 for key in filler_keys[offset:offset + 1000]}, 600)
+
+            try:
+                pattern_seconds = self._measure_pattern(repeat) if has_pattern else None
+                version_seconds = self._measure_version(repeat)
+            finally:
+                for offset in range(0, size, 1000):
+                    cache.delete_many(filler_keys[offset:offset + 1000])
+
+            if pattern_seconds is None:
+                self.stdout.write(f"{size:>10} | {'N/A':>20} | {version_seconds * 1000:>14.3f}ms | {'N/A':>8}")
+            else:
+                ratio = pattern_seconds / version_seconds if version_seconds else 0
+                self.stdout.write(
+                    f"{size:>10} | {pattern_seconds * 1000:>18.3f}ms | {version_seconds * 1000:>14.3f}ms | {ratio:>7.1f}x"
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            '\n벤치마크 완료: 버전 증가 방식은 키스페이스 크기와 무관하게 일정해야 합니다.'
+        ))
+
+    def _populate_user_cache(self):
+        """무효화 대상이 되는 사용자 시험 목록 캐시 생성"""
+        for page in range(1, 6):
+            ExamCacheManager.set_exam_list_cache(self.BENCHMARK_USER, {'results': []}, page=page)
+
+    def _measure_pattern(self, repeat):
+        """기존 방식: 사용자 키 패턴 SCAN 삭제"""
+        total = 0.0
+        pattern = f'{ExamCacheManager.CACHE_PREFIX}_{self.BENCHMARK_USER}_*'
+        for _ in range(repeat):
+            self._populate_user_cache()
+            start = time.perf_counter()
+            cache.delete_pattern(pattern)
+            total += time.perf_counter() - start
+        return total / repeat
+
+    def _measure_version(self, repeat):
+        """세대 카운터 방식: 사용자 버전 INCR"""
+        total = 0.0
+        for _ in range(repeat):
+            self._populate_user_cache()
+            start = time.perf_counter()
+            ExamCacheManager.invalidate_user_exam_cache(self.BENCHMARK_USER)
+            total += time.perf_counter() - start
+            if ExamCacheManager.get_exam_list_cache(self.BENCHMARK_USER, page=1) is not None:
+                raise RuntimeError('버전 증가 후에도 이전 캐시가 조회됩니다.')
+        return total / repeat
@@ -0,0 +1,152 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_redis.serializers.json import JSONSerializer
+from quiz.cache_backend import MsgPackSerializer, LZ4_AVAILABLE, MSGPACK_AVAILABLE
+import time
+import uuid
+
+LANGUAGES = ['ko', 'en', 'es', 'zh', 'ja']
+
+SAMPLE_TITLES = {
+    'ko': '쿠버네티스 클러스터 운영과 장애 대응 실전 문제',
+    'en': 'Kubernetes cluster operations and incident response practice',
+    'es': 'Operaciones de clúster de Kubernetes y respuesta a incidentes',
+    'zh': 'Kubernetes 集群运维与故障处理实战题',
+    'ja': 'Kubernetesクラスタ運用と障害対応の実践問題',
+}
+
+
+class Command(BaseCommand):
+    help = 'get_exams 응답 형태의 데이터로 캐시 직렬화기(JSON / msgpack / msgpack+압축)의 저장 크기와 인코딩/디코딩 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-sizes',
+            nargs='+',
+            type=int,
+            default=[20, 100, 500],
+            help='측정할 시험 목록 페이지 크기 목록 (기본값: 20 100 500)'
+        )
+        parser.add_argument(
+            '--tags',
+            type=int,
+            default=3,
+            help='시험별 태그 수 (기본값: 3)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=50,
+            help='직렬화/역직렬화 반복 횟수 (기본값: 50)'
+        )
+
+    def handle(self, *args, **options):
+        if not MSGPACK_AVAILABLE:
+            self.stdout.write(self.style.ERROR('msgpack 패키지가 설치되어 있지 않습니다.'))
+            return
+
+        repeat = max(options['repeat'], 1)
+        serializers = [
+            ('json', JSONSerializer({})),
+            ('msgpack', MsgPackSerializer({'SERIALIZER_COMPRESSION': 'none'})),
+            ('msgpack+zlib', MsgPackSerializer({'SERIALIZER_COMPRESSION': 'zlib'})),
+        ]
+        if LZ4_AVAILABLE:
+            serializers.append(('msgpack+lz4', MsgPackSerializer({'SERIALIZER_COMPRESSION': 'lz4'})))
+
+        self.stdout.write(f"{'페이지 크기':>10} | {'직렬화기':<14} | {'저장 크기':>12} | {'JSON 대비':>9} | {'인코딩':>10} | {'디코딩':>10}")
+        self.stdout.write('-' * 82)
+
+        for page_size in options['page_sizes']:
+            payload = self._build_exam_list_payload(page_size, options['tags'])
+            json_size = None
+
+            for name, serializer in serializers:
+                encoded = serializer.dumps(payload)
+                if serializer.loads(encoded) is None:
+                    raise RuntimeError(f'{name} 역직렬화 결과가 비어 있습니다.')
+
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    serializer.dumps(payload)
+                encode_ms = (time.perf_counter() - start) / repeat * 1000
+
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    serializer.loads(encoded)
+                decode_ms = (time.perf_counter() - start) / repeat * 1000
+
+                size = len(encoded)
+                json_size = json_size or size
+                self.stdout.write(
+                    f"{page_size:>10} | {name:<14} | {size:>10,}B | {size / json_size * 100:>8.1f}% | "
+                    f"{encode_ms:>8.3f}ms | {decode_ms:>8.3f}ms"
+                )
+            self.stdout.write('-' * 82)
+
+        self.stdout.write(self.style.SUCCESS('벤치마크 완료'))
+
+    def _build_tag(self, index):
+        """TagSerializer 응답 형태의 태그"""
+        tag = {
+            'id': index,
+            'name_ko': f'태그 {index}',
+            'name_en': f'Tag {index}',
+            'created_language': 'ko',
+            'localized_name': f'태그 {index}',
+            'available_languages': LANGUAGES,
+            'usage_count': index * 3,
+            'categories': [{'id': index % 7, 'name': 'IT 기술', 'full_path': 'IT 기술 > IT 기술'}],
+            'category_paths': ['IT 기술 > IT 기술'],
+            'created_at': timezone.now(),
+            'updated_at': timezone.now(),
+        }
+        for lang in LANGUAGES:
+            tag[f'is_{lang}_complete'] = True
+        return tag
+
+    def _build_exam_list_payload(self, page_size, tag_count):
+        """get_exams(ExamListSerializer) 응답과 같은 구조의 페이지 데이터"""
+        results = []
+        for i in range(page_size):
+            exam = {
+                'id': str(uuid.uuid4()),
+                'title_ko': f"{SAMPLE_TITLES['ko']} {i}",
+                'title_en': f"{SAMPLE_TITLES['en']} {i}",
+                'display_title': f"{SAMPLE_TITLES['ko']} {i}",
+                'is_original': i % 3 != 0,
+                'original_exam': None if i % 3 else str(uuid.uuid4()),
+                'version_number': 1 + i % 4,
+                'is_public': i % 2 == 0,
+                'created_at': timezone.now(),
+                'total_questions': 20 + i % 30,
+                'has_results': i % 2 == 1,
+                'latest_score_percentage': 72.5,
+                'latest_correct_count': 14,
+                'latest_total_score': 20,
+                'user_correct_questions': 14,
+                'created_by': {'id': 1, 'username': 'admin'},
+                'accuracy_percentage': 70.0,
+                'tags': [self._build_tag(i * tag_count + t) for t in range(tag_count)],
+                'ai_mock_interview': False,
+            }
+            results.append(exam)
+
+        return {
+            'results': results,
+            'pagination': {
+                'page': 1,
+                'page_size': page_size,
+                'total_count': page_size * 10,
+                'total_pages': 10,
+                'has_next': True,
+                'has_previous': False,
+            },
+            'filters': {
+                'is_public': None,
+                'my_exams': None,
+                'search_title': '',
+                'select_fields': [],
+                'tags': [],
+            },
+        }
@@ -0,0 +1,118 @@
+from django.core.management.base import BaseCommand
+from quiz.models import Exam
+from quiz.utils.pagination_utils import (
+    COUNT_MODE_ESTIMATE, COUNT_MODE_EXACT, apply_created_at_cursor, encode_cursor, get_total_count
+)
+import time
+
+
+class Command(BaseCommand):
+    help = '시험 목록의 OFFSET 페이지네이션과 (created_at, id) 커서 페이지네이션, 전체 개수 계산 방식의 지연 시간을 비교합니다. (생성한 시험은 삭제됨)'
+
+    TITLE_PREFIX = '__benchmark_pagination_exam'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--exams',
+            type=int,
+            default=100000,
+            help='생성할 벤치마크 시험 수 (기본값: 100000)'
+        )
+        parser.add_argument(
+            '--pages',
+            nargs='+',
+            type=int,
+            default=[1, 500],
+            help='측정할 페이지 번호 목록 (기본값: 1 500)'
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=20,
+            help='페이지 크기 (기본값: 20)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=10,
+            help='측정 반복 횟수 (기본값: 10)'
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='측정 후 생성한 시험을 삭제하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        page_size = max(options['page_size'], 1)
+        repeat = max(options['repeat'], 1)
+
+        self._create_exams(options['exams'])
+        try:
+            queryset = Exam.objects.select_related('original_exam', 'created_by').order_by('-created_at', '-id')
+
+            self.stdout.write(f"\n{'페이지':>8} | {'OFFSET':>12} | {'커서':>12} | {'배수':>8}")
+            self.stdout.write('-' * 50)
+            for page in options['pages']:
+                offset = (page - 1) * page_size
+                cursor = self._cursor_before(queryset, offset)
+
+                offset_seconds = self._measure(lambda: list(queryset[offset:offset + page_size]), repeat)
+                cursor_seconds = self._measure(
+                    lambda: list(apply_created_at_cursor(queryset, cursor)[:page_size + 1]), repeat
+                )
+                ratio = offset_seconds / cursor_seconds if cursor_seconds else 0
+                self.stdout.write(
+                    f"{page:>8} | {offset_seconds * 1000:>10.3f}ms | {cursor_seconds * 1000:>10.3f}ms | {ratio:>7.1f}x"
+                )
+
+            self.stdout.write(f"\n{'개수 계산':>10} | {'결과':>10} | {'평균':>12}")
+            self.stdout.write('-' * 40)
+            for count_mode in (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATE):
+                total_count = get_total_count(queryset, count_mode)
+                seconds = self._measure(lambda: get_total_count(queryset, count_mode), repeat)
+                self.stdout.write(f"{count_mode:>10} | {total_count:>10,} | {seconds * 1000:>10.3f}ms")
+        finally:
+            if not options['keep']:
+                deleted, _ = Exam.objects.filter(title_ko__startswith=self.TITLE_PREFIX).delete()
+                self.stdout.write(f'\n벤치마크 시험 {deleted}개 삭제')
+
+        self.stdout.write(self.style.SUCCESS('벤치마크 완료'))
+
+    def _create_exams(self, count):
+        """벤치마크용 시험을 배치로 생성 (이미 있으면 부족한 만큼만 생성)"""
+        existing = Exam.objects.filter(title_ko__startswith=self.TITLE_PREFIX).count()
+        missing = max(count - existing, 0)
+        self.stdout.write(f'벤치마크 시험 준비: 기존 {existing}개, 추가 생성 {missing}개')
+
+        start = time.time()
+        for offset in range(0, missing, 5000):
+            Exam.objects.bulk_create([
+                Exam(
+                    title_ko=f'{self.TITLE_PREFIX} {existing + i}',
+                    title_en=f'{self.TITLE_PREFIX} {existing + i}',
+                    total_questions=20,
+                    is_public=True,
+                    supported_languages='ko,en',
+                )
+                for i in range(offset, min(offset + 5000, missing))
+            ], batch_size=1000)
+        if missing:
+            self.stdout.write(f'  생성 완료 ({time.time() - start:.2f}초)')
+
+    def _cursor_before(self, queryset, offset):
+        """offset 위치 직전 행의 커서 (첫 페이지는 빈 커서)"""
+        if offset == 0:
+            return ''
+        row = queryset.values_list('created_at', 'id')[offset - 1:offset].first()
+        if row is None:
+            return ''
+        return encode_cursor(*row)
+
+    def _measure(self, func, repeat):
+        """평균 실행 시간(초)"""
+        func()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat
@@ -0,0 +1,95 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from quiz.models import Exam, Question, ExamResult, ExamResultDetail
+from quiz.utils.question_utils import filter_wrong_questions, rank_most_wrong_questions
+import time
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    """벤치마크 데이터 롤백용 예외"""
+
+
+class Command(BaseCommand):
+    help = "create_exam의 wrong_only/most_wrong 문제 선택 쿼리 수와 소요 시간을 후보 문제 수별로 측정합니다. (데이터는 롤백됨)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[50, 200, 500, 1000],
+            help='측정할 후보 문제 수 목록 (기본값: 50 200 500 1000)'
+        )
+        parser.add_argument(
+            '--attempts',
+            type=int,
+            default=3,
+            help='문제별 생성할 시도 기록 수 (기본값: 3)'
+        )
+
+    def handle(self, *args, **options):
+        sizes = options['sizes']
+        attempts = options['attempts']
+
+        self.stdout.write(f"{'후보 수':>8} | {'wrong_only 쿼리':>15} | {'wrong_only 시간':>15} | {'most_wrong 쿼리':>15} | {'most_wrong 시간':>15}")
+        self.stdout.write('-' * 82)
+
+        for size in sizes:
+            try:
+                with transaction.atomic():
+                    row = self._run(size, attempts)
+                    raise _Rollback()
+            except _Rollback:
+                pass
+
+            self.stdout.write(
+                f"{size:>8} | {row['wrong_only_queries']:>15} | {row['wrong_only_seconds']:>14.4f}s | "
+                f"{row['most_wrong_queries']:>15} | {row['most_wrong_seconds']:>14.4f}s"
+            )
+
+        self.stdout.write(self.style.SUCCESS('\n벤치마크 완료: 쿼리 수는 후보 문제 수와 무관하게 일정해야 합니다.'))
+
+    def _run(self, size, attempts):
+        user = User.objects.create(username=f'__benchmark_exam_selection_{size}')
+        exam = Exam.objects.create(title_ko=f'__benchmark_{size}', total_questions=size)
+        questions = Question.objects.bulk_create([
+            Question(title_ko=f'benchmark question {i}', content_ko='content', answer_ko='answer')
+            for i in range(size)
+        ])
+
+        result = ExamResult.objects.create(
+            exam=exam, user=user, score=0, total_score=size, correct_count=0, wrong_count=0
+        )
+        ExamResultDetail.objects.bulk_create([
+            ExamResultDetail(
+                result=result,
+                question=question,
+                user_answer='answer',
+                is_correct=(i + attempt) % 3 == 0
+            )
+            for i, question in enumerate(questions)
+            for attempt in range(attempts)
+        ])
+
+        question_list = list(Question.objects.filter(id__in=[q.id for q in questions]))
+
+        with CaptureQueriesContext(connection) as wrong_only_ctx:
+            start = time.perf_counter()
+            filter_wrong_questions(question_list)
+            wrong_only_seconds = time.perf_counter() - start
+
+        with CaptureQueriesContext(connection) as most_wrong_ctx:
+            start = time.perf_counter()
+            rank_most_wrong_questions(question_list, user)
+            most_wrong_seconds = time.perf_counter() - start
+
+        return {
+            'wrong_only_queries': len(wrong_only_ctx.captured_queries),
+            'wrong_only_seconds': wrong_only_seconds,
+            'most_wrong_queries': len(most_wrong_ctx.captured_queries),
+            'most_wrong_seconds': most_wrong_seconds,
+        }
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from quiz.models import Study, Member, StudyTaskProgress, StudyProgressRecord, ExamResult, ExamResultDetail, IgnoredQuestion
+from quiz.utils.stats_utils import refresh_user_question_stats
 
 User = get_user_model()
 
@@ -243,6 +244,9 @@ class Command(BaseCommand):
             self.stdout.write(f"✓ 시험 '{result.exam.title}'의 결과 복사 (점수: {result.score}/{result.total_score})")
             copied_count += 1
 
+        # 대상 사용자의 문제 통계(UserQuestionStat)를 복사된 이력 기준으로 재계산
+        refresh_user_question_stats([target_user.id])
+
         # 6. IgnoredQuestion 복사
         ignored_questions = IgnoredQuestion.objects.filter(user=source_user)
         for ignored in ignored_questions:
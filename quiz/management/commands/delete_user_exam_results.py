@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from quiz.models import Exam, ExamResult, ExamResultDetail
+from quiz.utils.stats_utils import refresh_user_question_stats
 
 class Command(BaseCommand):
     help = '특정 사용자의 특정 시험 결과를 삭제합니다.'
@@ -38,6 +39,9 @@ class Command(BaseCommand):
                 ExamResultDetail.objects.filter(result=result).delete()
                 result.delete()
             
+            # 사용자별 문제 통계(UserQuestionStat) 재계산
+            refresh_user_question_stats([user.id], exam_ids=[exam.id])
+            
             self.stdout.write(
                 self.style.SUCCESS(f"사용자 '{username}'의 시험 '{exam_title}' 결과 {result_count}개를 삭제했습니다.")
             )
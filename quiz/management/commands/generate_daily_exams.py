@@ -0,0 +1,99 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from quiz.models import UserProfile, ExamSubscription
+from quiz.utils.recommendation_utils import generate_daily_exams_bulk
+from quiz.utils.cache_utils import ExamCacheManager
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "구독자들의 Today's Quizzes 시험을 집합 기반 점수 계산으로 일괄 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--usernames',
+            nargs='+',
+            help='특정 사용자만 생성 (없으면 랜덤 시험 이메일 수신 사용자 전체)'
+        )
+        parser.add_argument(
+            '--all-subscribers',
+            action='store_true',
+            help='활성 구독이 있는 모든 사용자 대상으로 생성'
+        )
+        parser.add_argument(
+            '--per-exam',
+            type=int,
+            default=1,
+            help='시험별 선택할 문제 수 (기본값: 1)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 점수를 계산할 사용자 수 (기본값: 200)'
+        )
+        parser.add_argument(
+            '--public',
+            action='store_true',
+            help='생성되는 시험을 공개로 설정'
+        )
+
+    def handle(self, *args, **options):
+        usernames = options.get('usernames')
+        per_exam = options['per_exam']
+        batch_size = max(options['batch_size'], 1)
+
+        if usernames:
+            user_ids = list(User.objects.filter(username__in=usernames).values_list('id', flat=True))
+        elif options['all_subscribers']:
+            user_ids = list(
+                ExamSubscription.objects.filter(is_active=True, user__isnull=False)
+                .values_list('user_id', flat=True).distinct()
+            )
+        else:
+            user_ids = list(
+                UserProfile.objects.filter(random_exam_email_enabled=True, user__is_active=True)
+                .values_list('user_id', flat=True)
+            )
+
+        self.stdout.write(f'일일 시험 생성 시작: {len(user_ids)}명 사용자 (배치 크기: {batch_size})')
+
+        start_time = time.time()
+        created_count = 0
+        updated_count = 0
+        failed_count = 0
+
+        for offset in range(0, len(user_ids), batch_size):
+            batch_user_ids = user_ids[offset:offset + batch_size]
+            results = generate_daily_exams_bulk(
+                batch_user_ids,
+                per_exam=per_exam,
+                is_public=options['public']
+            )
+
+            for user_id, result in results.items():
+                if 'error' in result:
+                    failed_count += 1
+                    self.stdout.write(self.style.WARNING(f'  사용자 {user_id}: 생성 실패 ({result["error"]})'))
+                elif result['is_new']:
+                    created_count += 1
+                else:
+                    updated_count += 1
+
+            self.stdout.write(f'  {min(offset + batch_size, len(user_ids))}/{len(user_ids)}명 처리 완료')
+
+        # 시험 캐시는 전체 처리 후 한 번만 무효화
+        if created_count or updated_count:
+            ExamCacheManager.invalidate_all_exam_cache()
+
+        elapsed = time.time() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\n일일 시험 생성 완료: 신규 {created_count}개, 갱신 {updated_count}개, 실패 {failed_count}개 ({elapsed:.2f}초)'
+            )
+        )
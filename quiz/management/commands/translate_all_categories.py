@@ -4,12 +4,14 @@
 
 사용법:
     python manage.py translate_all_categories
+    python manage.py translate_all_categories --background --workers 4  # Celery 워커에서 처리
 
 이 명령어는 모든 TagCategory 레코드를 조회하여:
 1. name_en이 있지만 다른 언어(ko, es, zh)가 비어있는 경우 번역 수행
 2. 번역 완료 후 완성도 필드 자동 업데이트
 """
 
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from quiz.models import TagCategory
@@ -41,11 +43,25 @@ class Command(BaseCommand):
             action='store_true',
             help='실제로 저장하지 않고 번역 결과만 확인합니다',
         )
+        parser.add_argument(
+            '--background',
+            action='store_true',
+            help='번역 작업(TranslationJob)을 만들어 Celery 워커에서 나누어 처리합니다 (진행 상황: translation_job 명령어)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='--background 사용 시 작업을 처리할 Celery 태스크 수',
+        )
 
     def handle(self, *args, **options):
         force = options['force']
         dry_run = options['dry_run']
         
+        if options['background'] and not dry_run:
+            self.start_background_job(force, options['workers'])
+            return
+        
         self.stdout.write(self.style.SUCCESS('=== 카테고리 다국어 번역 시작 ==='))
         
         # 모든 카테고리 조회
@@ -97,6 +113,27 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write(self.style.WARNING('\n⚠ DRY RUN 모드: 실제로 저장하지 않았습니다.'))
 
+    def start_background_job(self, force, workers):
+        """번역 작업을 만들어 Celery 워커로 전송 (전송 실패 시 현재 프로세스에서 처리)"""
+        from quiz.models import TranslationJob
+        from quiz.utils.translation_jobs import create_translation_job, start_translation_job
+        
+        job = create_translation_job(
+            TranslationJob.JOB_TYPE_CATEGORIES,
+            {'target_languages': [LANGUAGE_ES, LANGUAGE_ZH, LANGUAGE_JA], 'force': force},
+        )
+        self.stdout.write(f'번역 작업 생성: {job.id} (카테고리 {job.total_items}개)')
+        if job.status == TranslationJob.STATUS_COMPLETED:
+            self.stdout.write(self.style.SUCCESS('번역이 필요한 카테고리가 없습니다.'))
+            return
+        
+        if start_translation_job(job, workers):
+            self.stdout.write(self.style.SUCCESS(f'Celery 워커로 전송했습니다. 진행 상황: python manage.py translation_job {job.id}'))
+            return
+        
+        self.stdout.write(self.style.WARNING('Celery 전송 실패 - 현재 프로세스에서 처리합니다.'))
+        call_command('translation_job', str(job.id), '--run', stdout=self.stdout)
+
     def translate_category(self, category, force=False, dry_run=False):
         """
         개별 카테고리의 다국어 번역 처리
@@ -4,6 +4,7 @@ DrillQuiz 콘텐츠 일괄 번역 관리 명령어
 백엔드에서 스터디, 시험 등의 콘텐츠를 일괄적으로 번역합니다.
 """
 
+from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.conf import settings
@@ -46,6 +47,16 @@ class Command(BaseCommand):
             action='store_true',
             help='번역 캐시를 정리한 후 번역 실행'
         )
+        parser.add_argument(
+            '--background',
+            action='store_true',
+            help='번역 작업(TranslationJob)을 만들어 Celery 워커에서 나누어 처리 (진행 상황: translation_job 명령어)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='--background 사용 시 작업을 처리할 Celery 태스크 수'
+        )
     
     def handle(self, *args, **options):
         content_type = options['content_type']
@@ -63,6 +74,10 @@ class Command(BaseCommand):
             TranslationManager.clear_cache()
             self.stdout.write(self.style.SUCCESS('✅ 번역 캐시 정리 완료'))
         
+        if options['background'] and not dry_run:
+            self.start_background_job(content_type, direction, limit, options['workers'])
+            return
+        
         if dry_run:
             self.stdout.write('🔍 번역이 필요한 콘텐츠 확인 중... (실제 번역 없음)')
         
@@ -82,6 +97,27 @@ class Command(BaseCommand):
             logger.error(f'일괄 번역 중 오류: {str(e)}')
             raise CommandError(f'번역 중 오류가 발생했습니다: {str(e)}')
     
+    def start_background_job(self, content_type, direction, limit, workers):
+        """번역 작업을 만들어 Celery 워커로 전송 (전송 실패 시 현재 프로세스에서 처리)"""
+        from quiz.models import TranslationJob
+        from quiz.utils.translation_jobs import create_translation_job, start_translation_job
+        
+        params = {'content_type': content_type, 'direction': direction}
+        if limit:
+            params['limit'] = limit
+        job = create_translation_job(TranslationJob.JOB_TYPE_CONTENT, params)
+        self.stdout.write(f'📋 번역 작업 생성: {job.id} (항목 {job.total_items}개)')
+        if job.status == TranslationJob.STATUS_COMPLETED:
+            self.stdout.write(self.style.SUCCESS('✅ 번역이 필요한 콘텐츠가 없습니다.'))
+            return
+        
+        if start_translation_job(job, workers):
+            self.stdout.write(self.style.SUCCESS(f'🚀 Celery 워커로 전송했습니다. 진행 상황: python manage.py translation_job {job.id}'))
+            return
+        
+        self.stdout.write(self.style.WARNING('⚠️ Celery 전송 실패 - 현재 프로세스에서 처리합니다.'))
+        call_command('translation_job', str(job.id), '--run', stdout=self.stdout)
+    
     def translate_studies(self, direction, dry_run, limit):
         """스터디 콘텐츠 번역"""
         from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES, BASE_LANGUAGE
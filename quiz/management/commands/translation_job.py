@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+번역 작업(TranslationJob) 관리 명령어
+
+사용법:
+    python manage.py translation_job                      # 최근 작업 목록
+    python manage.py translation_job <job_id>             # 진행 상황
+    python manage.py translation_job <job_id> --run       # 현재 프로세스에서 남은 항목 처리
+    python manage.py translation_job <job_id> --resume --workers 4 [--retry-failed]  # Celery 워커로 다시 전송
+    python manage.py translation_job <job_id> --cancel
+
+작업 생성은 translate_content / translate_all_categories 명령어의 --background 옵션으로 합니다.
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from quiz.models import TranslationJob
+from quiz.utils.translation_jobs import (
+    cancel_translation_job,
+    get_job_progress,
+    resume_translation_job,
+    run_translation_worker,
+    start_translation_job,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '번역 작업의 진행 상황을 확인하고 처리/재개/취소합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('job_id', nargs='?', help='번역 작업 ID (생략 시 최근 작업 목록)')
+        parser.add_argument('--run', action='store_true', help='현재 프로세스에서 남은 항목을 처리합니다')
+        parser.add_argument('--resume', action='store_true', help='처리 중 상태로 남은 항목을 되돌리고 Celery 워커로 다시 전송합니다')
+        parser.add_argument('--retry-failed', action='store_true', help='--run/--resume 시 실패한 항목도 다시 처리합니다')
+        parser.add_argument('--cancel', action='store_true', help='작업을 취소합니다')
+        parser.add_argument('--workers', type=int, help='--resume 시 전송할 Celery 태스크 수')
+
+    def handle(self, *args, **options):
+        job_id = options['job_id']
+        if not job_id:
+            self.list_jobs()
+            return
+
+        try:
+            job = TranslationJob.objects.get(id=job_id)
+        except (TranslationJob.DoesNotExist, ValidationError):
+            raise CommandError(f'번역 작업을 찾을 수 없습니다: {job_id}')
+
+        if options['cancel']:
+            if cancel_translation_job(job):
+                self.stdout.write(self.style.SUCCESS('작업을 취소했습니다.'))
+            else:
+                self.stdout.write(self.style.WARNING(f'취소할 수 없는 상태입니다: {job.status}'))
+        elif options['run'] or options['resume']:
+            if options['retry_failed'] or options['resume'] or job.status == TranslationJob.STATUS_CANCELLED:
+                job = resume_translation_job(job, retry_failed=options['retry_failed'])
+            if options['resume']:
+                if job.status == TranslationJob.STATUS_COMPLETED:
+                    self.stdout.write(self.style.SUCCESS('처리할 항목이 없습니다.'))
+                elif start_translation_job(job, options['workers']):
+                    self.stdout.write(self.style.SUCCESS('Celery 워커로 전송했습니다.'))
+                else:
+                    raise CommandError('Celery 전송 실패 - --run 옵션으로 현재 프로세스에서 처리하세요.')
+            else:
+                self.stdout.write(f'번역 작업 처리 시작: {job.id}')
+                run_translation_worker(job.id, on_batch=lambda current_job, counts: self.write_progress(current_job))
+
+        job.refresh_from_db()
+        self.write_progress(job, detail=True)
+
+    def list_jobs(self):
+        jobs = TranslationJob.objects.all()[:20]
+        if not jobs:
+            self.stdout.write('번역 작업이 없습니다.')
+            return
+        for job in jobs:
+            self.stdout.write(
+                f'{job.id}  {job.job_type:<10} {job.status:<10} '
+                f'{job.processed_items}/{job.total_items}  {job.created_at:%Y-%m-%d %H:%M}'
+            )
+
+    def write_progress(self, job, detail=False):
+        job.refresh_from_db()
+        progress = get_job_progress(job)
+        eta = f", 남은 시간 약 {progress['eta_seconds'] // 60}분" if progress['eta_seconds'] is not None else ''
+        self.stdout.write(
+            f"[{progress['status']}] {progress['processed_items']}/{progress['total_items']} "
+            f"({progress['progress_percent']}%) - 번역 {progress['translated_items']}, "
+            f"건너뜀 {progress['skipped_items']}, 실패 {progress['failed_items']}, "
+            f"분당 {progress['items_per_minute']}개{eta}"
+        )
+        if detail:
+            self.stdout.write(f"처리 중인 워커: {progress['active_workers']}개, 경과 {progress['elapsed_seconds']}초")
+            for error in progress['recent_errors']:
+                self.stdout.write(self.style.ERROR(
+                    f"  ✗ {error['content_type']}:{error['object_id']} "
+                    f"{error['source_language']}→{error['target_language']} ({error['attempts']}회): {error['error']}"
+                ))
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:16
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quiz', '0088_add_it_tech_subcategories'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserQuestionStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('correct', models.PositiveIntegerField(default=0, verbose_name='정답 횟수')),
+                ('last_correct_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 정답 일시')),
+                ('last_attempt_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 시도 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_question_stats', to='quiz.exam', verbose_name='시험')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_stats', to='quiz.question', verbose_name='문제')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_stats', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '사용자 문제 통계',
+                'verbose_name_plural': '사용자 문제 통계들',
+                'indexes': [models.Index(fields=['user', 'question'], name='quiz_userqu_user_id_633c26_idx'), models.Index(fields=['user', 'exam'], name='quiz_userqu_user_id_4c6c7b_idx')],
+                'unique_together': {('user', 'exam', 'question')},
+            },
+        ),
+    ]
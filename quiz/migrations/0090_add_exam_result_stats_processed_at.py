@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0089_add_user_question_stat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examresult',
+            name='stats_processed_at',
+            field=models.DateTimeField(blank=True, help_text='스터디 진행률 등 제출 후처리가 완료된 시각 (중복 처리 방지)', null=True, verbose_name='제출 후 통계 처리일'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quiz', '0090_add_exam_result_stats_processed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserExamProgress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('correct', models.PositiveIntegerField(default=0, verbose_name='정답 횟수')),
+                ('attempted_questions', models.PositiveIntegerField(default=0, verbose_name='시도한 문제 수')),
+                ('correct_questions', models.PositiveIntegerField(default=0, verbose_name='맞춘 문제 수')),
+                ('latest_score', models.IntegerField(blank=True, null=True, verbose_name='최신 점수')),
+                ('latest_total_score', models.IntegerField(blank=True, null=True, verbose_name='최신 총점')),
+                ('latest_correct_count', models.IntegerField(blank=True, null=True, verbose_name='최신 정답 수')),
+                ('latest_completed_at', models.DateTimeField(blank=True, null=True, verbose_name='최신 완료일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_progresses', to='quiz.exam', verbose_name='시험')),
+                ('latest_result', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='quiz.examresult', verbose_name='최신 결과')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exam_progresses', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '사용자 시험 진행 요약',
+                'verbose_name_plural': '사용자 시험 진행 요약들',
+                'unique_together': {('user', 'exam')},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:44
+
+from django.db import migrations, models
+
+
+def normalize_group_title(title):
+    """Question.normalize_group_title과 동일 (공백 정리, 대소문자 무시)"""
+    return ' '.join(title.split()).casefold()[:207]
+
+
+def fill_title_group_keys(apps, schema_editor):
+    """기존 문제의 제목 그룹 키 채우기 (Question.build_title_group_key와 동일한 규칙)"""
+    Question = apps.get_model('quiz', 'Question')
+
+    batch = []
+    for question in Question.objects.only('id', 'title_en', 'title_ko').iterator(chunk_size=2000):
+        if question.title_en and question.title_en.strip():
+            question.title_group_key = f"en:{normalize_group_title(question.title_en)}"
+        elif question.title_ko and question.title_ko.strip():
+            question.title_group_key = f"ko:{normalize_group_title(question.title_ko)}"
+        else:
+            question.title_group_key = f"id:{question.id}"
+        batch.append(question)
+        if len(batch) >= 2000:
+            Question.objects.bulk_update(batch, ['title_group_key'])
+            batch = []
+    if batch:
+        Question.objects.bulk_update(batch, ['title_group_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0091_add_user_exam_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='title_group_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=210, verbose_name='제목 그룹 키'),
+        ),
+        migrations.RunPython(fill_title_group_keys, migrations.RunPython.noop),
+    ]
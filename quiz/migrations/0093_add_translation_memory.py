@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0092_add_question_title_group_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(max_length=64, verbose_name='원문 해시')),
+                ('source_language', models.CharField(max_length=10, verbose_name='원본 언어')),
+                ('target_language', models.CharField(max_length=10, verbose_name='대상 언어')),
+                ('source_text', models.TextField(verbose_name='원문')),
+                ('translated_text', models.TextField(verbose_name='번역문')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '번역 메모리',
+                'verbose_name_plural': '번역 메모리들',
+                'unique_together': {('source_hash', 'source_language', 'target_language')},
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-18 00:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quiz', '0093_add_translation_memory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('job_type', models.CharField(choices=[('content', '콘텐츠 번역'), ('categories', '카테고리 번역')], max_length=20, verbose_name='작업 종류')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='작업 옵션')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '진행 중'), ('completed', '완료'), ('cancelled', '취소')], db_index=True, default='pending', max_length=20, verbose_name='상태')),
+                ('total_items', models.PositiveIntegerField(default=0, verbose_name='전체 항목 수')),
+                ('processed_items', models.PositiveIntegerField(default=0, verbose_name='처리한 항목 수')),
+                ('translated_items', models.PositiveIntegerField(default=0, verbose_name='번역한 항목 수')),
+                ('skipped_items', models.PositiveIntegerField(default=0, verbose_name='건너뛴 항목 수')),
+                ('failed_items', models.PositiveIntegerField(default=0, verbose_name='실패한 항목 수')),
+                ('processing_seconds', models.FloatField(default=0, verbose_name='워커 처리 시간(초)')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='생성자')),
+            ],
+            options={
+                'verbose_name': '번역 작업',
+                'verbose_name_plural': '번역 작업들',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TranslationJobItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_type', models.CharField(max_length=20, verbose_name='콘텐츠 종류')),
+                ('object_id', models.CharField(max_length=64, verbose_name='객체 ID')),
+                ('source_language', models.CharField(blank=True, default='', max_length=10, verbose_name='원본 언어')),
+                ('target_language', models.CharField(blank=True, default='', max_length=10, verbose_name='대상 언어')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('done', '번역 완료'), ('skipped', '건너뜀'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류')),
+                ('worker', models.CharField(blank=True, default='', max_length=100, verbose_name='처리 워커')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='가져간 시각')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='quiz.translationjob', verbose_name='번역 작업')),
+            ],
+            options={
+                'verbose_name': '번역 작업 항목',
+                'verbose_name_plural': '번역 작업 항목들',
+                'indexes': [models.Index(fields=['job', 'status'], name='quiz_transl_job_id_86a56a_idx')],
+            },
+        ),
+    ]
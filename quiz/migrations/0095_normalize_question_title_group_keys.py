@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def normalize_title_group_keys(apps, schema_editor):
+    """0092에서 원본 제목으로 채운 제목 그룹 키를 정규화한 제목 기준으로 다시 계산"""
+    Question = apps.get_model('quiz', 'Question')
+
+    batch = []
+    for question in Question.objects.only('id', 'title_en', 'title_ko', 'title_group_key').iterator(chunk_size=2000):
+        if question.title_en and question.title_en.strip():
+            title_group_key = f"en:{' '.join(question.title_en.split()).casefold()[:207]}"
+        elif question.title_ko and question.title_ko.strip():
+            title_group_key = f"ko:{' '.join(question.title_ko.split()).casefold()[:207]}"
+        else:
+            title_group_key = f"id:{question.id}"
+        if question.title_group_key == title_group_key:
+            continue
+        question.title_group_key = title_group_key
+        batch.append(question)
+        if len(batch) >= 2000:
+            Question.objects.bulk_update(batch, ['title_group_key'])
+            batch = []
+    if batch:
+        Question.objects.bulk_update(batch, ['title_group_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0094_add_translation_jobs'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_title_group_keys, migrations.RunPython.noop),
+    ]
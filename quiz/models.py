@@ -22,6 +22,9 @@ LANGUAGE_CHOICES = [
     (LANGUAGE_JA, '日本語'),
 ]
 
+# Question.title_group_key(max_length=210)에 'en:'/'ko:' 접두어와 함께 들어갈 수 있는 제목 길이
+TITLE_GROUP_KEY_MAX_TITLE_LENGTH = 207
+
 
 class Question(models.Model):
     """문제 모델 - 다국어 지원"""
@@ -60,6 +63,8 @@ class Question(models.Model):
     difficulty = models.CharField(max_length=20, verbose_name="난이도", blank=True, null=True)
     url = models.URLField(verbose_name="문제 URL", blank=True, null=True)
     group_id = models.CharField(max_length=50, verbose_name="그룹 ID", blank=True, null=True)
+    # 같은 제목의 문제 통계를 합산하기 위한 키 (en:영어 제목 → ko:한국어 제목 → id:문제 ID 순, 저장 시 갱신)
+    title_group_key = models.CharField(max_length=210, verbose_name="제목 그룹 키", blank=True, default='', db_index=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     
@@ -136,14 +141,44 @@ class Question(models.Model):
             from quiz.utils.multilingual_utils import LANGUAGE_KO
             self.created_language = BASE_LANGUAGE  # 기본값
         
-        # 언어별 완성도 자동 업데이트
+        # 언어별 완성도 및 제목 그룹 키 갱신 (제목만 저장하는 경우에도 함께 저장)
+        self.refresh_derived_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'title_en', 'title_ko'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'title_group_key'}
+        
+        super().save(*args, **kwargs)
+    
+    def refresh_derived_fields(self):
+        """
+        언어별 완성도와 제목 그룹 키를 현재 필드 값으로 다시 계산합니다.
+        
+        save()를 거치지 않는 bulk_create/bulk_update 전에도 호출한다.
+        """
         self.is_ko_complete = bool(self.title_ko and self.content_ko and self.answer_ko)
         self.is_en_complete = bool(self.title_en and self.content_en and self.answer_en)
         self.is_es_complete = bool(self.title_es and self.content_es and self.answer_es)
         self.is_zh_complete = bool(self.title_zh and self.content_zh and self.answer_zh)
         self.is_ja_complete = bool(self.title_ja and self.content_ja and self.answer_ja)
+        self.title_group_key = self.build_title_group_key()
+    
+    @staticmethod
+    def normalize_group_title(title):
+        """제목 그룹 키용 제목 정규화 (앞뒤 공백 제거, 연속 공백을 하나로, 대소문자 무시)"""
+        return ' '.join(title.split()).casefold()[:TITLE_GROUP_KEY_MAX_TITLE_LENGTH]
+
+    def build_title_group_key(self):
+        """
+        통계 합산용 제목 그룹 키를 계산합니다.
         
-        super().save(*args, **kwargs)
+        title_en이 있으면 'en:제목', 없으면 'ko:제목', 둘 다 없으면 'id:문제 ID'
+        제목은 정규화하여 공백/대소문자만 다른 제목이 같은 그룹이 되도록 한다.
+        """
+        if self.title_en and self.title_en.strip():
+            return f"en:{self.normalize_group_title(self.title_en)}"
+        if self.title_ko and self.title_ko.strip():
+            return f"ko:{self.normalize_group_title(self.title_ko)}"
+        return f"id:{self.id}"
 
 
 class TagCategory(models.Model):
@@ -656,11 +691,9 @@ class Exam(models.Model):
         # 현재 요청의 사용자 정보를 가져오기 위해 serializer context에서 확인
         # 이 속성은 serializer에서만 사용되므로 context를 통해 사용자 정보를 전달받아야 함
         # 기본적으로는 모든 사용자의 결과를 반환하되, serializer에서 필터링
-        if self.is_original:
-            all_exam_ids = [self.id] + list(self.versions.values_list('id', flat=True))
-            return ExamResult.objects.filter(exam_id__in=all_exam_ids).order_by('-completed_at').first()
-        else:
-            return ExamResult.objects.filter(exam=self).order_by('-completed_at').first()
+        # 원본 시험은 복사본(versions)의 결과까지 한 번의 쿼리로 포함
+        from quiz.utils.exam_utils import get_latest_exam_results
+        return get_latest_exam_results([self], include_versions=True).get(str(self.id))
 
     @property
     def latest_correct_count(self):
@@ -697,6 +730,69 @@ class Exam(models.Model):
         
         return total_correct
 
+    def _get_daily_exam_question_stats(self, user):
+        """
+        추천 시험(Today's Quizzes)의 문제별 통계를 원본 시험 기준으로 조회합니다.
+
+        문제의 group_id(원본 시험 제목)로 원본 시험을 찾고, 해당 원본 시험에 쌓인
+        UserQuestionStat을 한 번에 조회한다.
+
+        Returns:
+            list: [(attempts, correct), ...] (원본 시험을 찾은 문제만)
+        """
+        questions = [question for question in self.questions.all() if question.group_id]
+        if not questions:
+            return []
+
+        group_ids = {question.group_id for question in questions}
+        original_exam_ids = {}
+        # title_ko 일치를 title_en 일치보다 우선 (기존 조회 순서와 동일)
+        for title_ko, title_en, exam_id in Exam.objects.filter(
+            models.Q(title_ko__in=group_ids) | models.Q(title_en__in=group_ids),
+            is_original=True
+        ).values_list('title_ko', 'title_en', 'id'):
+            if title_en in group_ids:
+                original_exam_ids.setdefault(('en', title_en), exam_id)
+            if title_ko in group_ids:
+                original_exam_ids.setdefault(('ko', title_ko), exam_id)
+
+        pairs = []
+        for question in questions:
+            exam_id = original_exam_ids.get(('ko', question.group_id)) or original_exam_ids.get(('en', question.group_id))
+            if exam_id:
+                pairs.append((exam_id, question.id))
+        if not pairs:
+            return []
+
+        stats = {
+            (exam_id, question_id): (attempts, correct)
+            for exam_id, question_id, attempts, correct in UserQuestionStat.objects.filter(
+                user=user,
+                exam_id__in={exam_id for exam_id, _ in pairs},
+                question_id__in={question_id for _, question_id in pairs}
+            ).values_list('exam_id', 'question_id', 'attempts', 'correct')
+        }
+        return [stats.get(pair, (0, 0)) for pair in pairs]
+
+    def _get_stat_target_exam(self):
+        """통계가 저장되는 시험 (복사된 시험이면 원본 시험)"""
+        if not self.is_original and self.original_exam:
+            return self.original_exam
+        return self
+
+    def get_user_exam_progress(self, user):
+        """
+        통계 대상 시험의 사용자 진행 요약(UserExamProgress)을 반환합니다. 없으면 None.
+
+        prefetch_user_exam_progress로 미리 조회된 값이 있으면 쿼리하지 않는다.
+        """
+        target = self._get_stat_target_exam()
+        cached = getattr(target, '_user_exam_progress', None) or {}
+        if user.id not in cached:
+            cached[user.id] = UserExamProgress.objects.filter(user=user, exam=target).first()
+            target._user_exam_progress = cached
+        return cached[user.id]
+
     def get_total_correct_questions_for_user(self, user):
         """
         특정 사용자의 맞춘 시도 수 계산 (문제별이 아닌 시도별)
@@ -705,117 +801,51 @@ class Exam(models.Model):
         - 특정 사용자의 개인 통계만 반환 (다른 사용자 정보 노출 금지)
         - 모든 통계는 원본 시험에만 남김 - 복사된 시험인 경우 원본 시험의 결과 반환
         - 개인정보 보호 및 보안 강화
+        - UserExamProgress 요약 테이블에서 조회
         """
         # 추천 시험인 경우 각 문제별로 개별 원본 시험에서 푼 점수를 합산
         if ("Today's Quizzes for" in (self.title_ko or '')) or ("Today's Quizzes for" in (self.title_en or '')):
-            total_correct = 0
-            
-            for question in self.questions.all():
-                # 문제의 group_id를 통해 원본 시험 찾기
-                if question.group_id:
-                    try:
-                        # group_id가 원본 시험 제목인 경우
-                        original_exam = Exam.objects.filter(
-                            title_ko=question.group_id,
-                            is_original=True
-                        ).first()
-                        
-                        if not original_exam:
-                            original_exam = Exam.objects.filter(
-                                title_en=question.group_id,
-                                is_original=True
-                            ).first()
-                        
-                        if original_exam:
-                            # 해당 원본 시험에서 이 문제를 정답으로 맞춘 시도 수 계산
-                            correct_attempts = ExamResultDetail.objects.filter(
-                                result__exam=original_exam,
-                                result__user=user,
-                                question=question,
-                                is_correct=True
-                            ).count()
-                            
-                            total_correct += correct_attempts
-                    except Exception:
-                        pass
-            
-            return total_correct
+            return sum(correct for _, correct in self._get_daily_exam_question_stats(user))
         
         # 복사된 시험인 경우 원본 시험의 결과를 참조
-        if not self.is_original and self.original_exam:
-            # 원본 시험에서 해당 사용자의 정답 시도 수 계산
-            total_correct = ExamResultDetail.objects.filter(
-                result__exam=self.original_exam,
-                result__user=user,
-                is_correct=True
-            ).count()
-            return total_correct
-        
-        # 일반적인 경우: 현재 시험의 결과 반환
-        total_correct = ExamResultDetail.objects.filter(
-            result__exam=self,
-            result__user=user,
-            is_correct=True
-        ).count()
-        
-        return total_correct
+        progress = self.get_user_exam_progress(user)
+        return progress.correct if progress else 0
 
     def get_total_attempted_questions_for_user(self, user):
         """특정 사용자가 해당 시험에서 시도한 문제 수를 반환합니다."""
         if not user.is_authenticated:
             return 0
         
-        # 추천 시험인 경우 각 문제별로 개별 원본 시험에서 푼 점수를 합산
+        # 추천 시험인 경우 원본 시험에서 시도한 문제 수 (문제 단위)
         if ("Today's Quizzes for" in (self.title_ko or '')) or ("Today's Quizzes for" in (self.title_en or '')):
-            total_attempts = 0
-            
-            for question in self.questions.all():
-                # 문제의 group_id를 통해 원본 시험 찾기
-                if question.group_id:
-                    try:
-                        # group_id가 원본 시험 제목인 경우
-                        original_exam = Exam.objects.filter(
-                            title_ko=question.group_id,
-                            is_original=True
-                        ).first()
-                        
-                        if not original_exam:
-                            original_exam = Exam.objects.filter(
-                                title_en=question.group_id,
-                                is_original=True
-                            ).first()
-                        
-                        if original_exam:
-                            # 해당 원본 시험에서 이 문제를 시도했는지 확인
-                            has_attempted = ExamResultDetail.objects.filter(
-                                result__exam=original_exam,
-                                result__user=user,
-                                question=question
-                            ).exists()
-                            
-                            if has_attempted:
-                                total_attempts += 1
-                    except Exception:
-                        pass
-            
-            return total_attempts
+            return sum(1 for attempts, _ in self._get_daily_exam_question_stats(user) if attempts > 0)
         
-        # 복사된 시험인 경우 원본 시험의 결과를 참조
-        if not self.is_original and self.original_exam:
-            # 원본 시험에서 해당 사용자의 시도 수 계산
-            total_attempts = ExamResultDetail.objects.filter(
-                result__exam=self.original_exam,
-                result__user=user
-            ).count()
-            return total_attempts
-        
-        # 일반적인 경우: 현재 시험의 결과 반환
-        total_attempts = ExamResultDetail.objects.filter(
-            result__exam=self,
-            result__user=user
-        ).count()
-        
-        return total_attempts
+        # 복사된 시험인 경우 원본 시험의 결과를 참조 (시도 단위)
+        progress = self.get_user_exam_progress(user)
+        return progress.attempts if progress else 0
+
+    def get_question_progress_for_user(self, user):
+        """
+        특정 사용자가 해당 시험에서 시도한/맞춘 고유 문제 수를 반환합니다. (문제 단위, 시도 횟수 아님)
+
+        Returns:
+            tuple: (attempted_questions, correct_questions)
+        """
+        if not user.is_authenticated:
+            return 0, 0
+
+        # 추천 시험인 경우 원본 시험에 쌓인 문제별 통계를 합산
+        if ("Today's Quizzes for" in (self.title_ko or '')) or ("Today's Quizzes for" in (self.title_en or '')):
+            question_stats = self._get_daily_exam_question_stats(user)
+            return (
+                sum(1 for attempts, _ in question_stats if attempts > 0),
+                sum(1 for _, correct in question_stats if correct > 0),
+            )
+
+        progress = self.get_user_exam_progress(user)
+        if not progress:
+            return 0, 0
+        return progress.attempted_questions, progress.correct_questions
 
     def get_accuracy_percentage_for_user(self, user):
         """
@@ -823,78 +853,26 @@ class Exam(models.Model):
         
         계산 방식:
         1. 전체 시도 횟수 중 정답 횟수의 비율
-        2. ExamResultDetail에서 해당 사용자의 모든 시도 기록을 기반으로 계산
+        2. UserExamProgress에 요약된 해당 사용자의 시도/정답 횟수를 기반으로 계산
         """
         if not user.is_authenticated:
             return None
         
-        # 추천 시험인 경우 각 문제별로 개별 원본 시험에서 푼 점수를 합산
+        # 추천 시험인 경우 문제 단위로 시도/정답 여부를 합산
         if ("Today's Quizzes for" in (self.title_ko or '')) or ("Today's Quizzes for" in (self.title_en or '')):
-            total_correct = 0
-            total_attempts = 0
-            
-            for question in self.questions.all():
-                # 문제의 group_id를 통해 원본 시험 찾기
-                if question.group_id:
-                    try:
-                        # group_id가 원본 시험 제목인 경우
-                        original_exam = Exam.objects.filter(
-                            title_ko=question.group_id,
-                            is_original=True
-                        ).first()
-                        
-                        if not original_exam:
-                            original_exam = Exam.objects.filter(
-                                title_en=question.group_id,
-                                is_original=True
-                            ).first()
-                        
-                        if original_exam:
-                            # 해당 원본 시험에서 이 문제를 시도했는지 확인
-                            has_attempted = ExamResultDetail.objects.filter(
-                                result__exam=original_exam,
-                                result__user=user,
-                                question=question
-                            ).exists()
-                            
-                            if has_attempted:
-                                total_attempts += 1
-                                # 정답인지 확인
-                                is_correct = ExamResultDetail.objects.filter(
-                                    result__exam=original_exam,
-                                    result__user=user,
-                                    question=question,
-                                    is_correct=True
-                                ).exists()
-                                
-                                if is_correct:
-                                    total_correct += 1
-                    except Exception:
-                        pass
-            
-            if total_attempts > 0:
-                return (total_correct / total_attempts) * 100
+            question_stats = [
+                (attempts, correct)
+                for attempts, correct in self._get_daily_exam_question_stats(user)
+                if attempts > 0
+            ]
+            if question_stats:
+                total_correct = sum(1 for _, correct in question_stats if correct > 0)
+                return (total_correct / len(question_stats)) * 100
             return None
         
         # 일반적인 경우: 원본 시험이 있으면 원본 시험의 결과 반환
-        target_exam = self.original_exam if not self.is_original and self.original_exam else self
-        
-        # 원본 시험의 모든 시도 중 정답 비율 계산
-        total_attempts = ExamResultDetail.objects.filter(
-            result__exam=target_exam,
-            result__user=user
-        ).count()
-        
-        if total_attempts == 0:
-            return None
-        
-        total_correct = ExamResultDetail.objects.filter(
-            result__exam=target_exam,
-            result__user=user,
-            is_correct=True
-        ).count()
-        
-        return (total_correct / total_attempts) * 100
+        progress = self.get_user_exam_progress(user)
+        return progress.accuracy_percentage if progress else None
 
     @property
     def total_questions_attempted(self):
@@ -1037,6 +1015,7 @@ class ExamResult(models.Model):
     completed_at = models.DateTimeField(default=timezone.now, verbose_name="완료일", db_index=True)
     elapsed_seconds = models.IntegerField(default=0, verbose_name="소요 시간(초)")
     is_voice_interview = models.BooleanField(default=False, verbose_name="음성 인터뷰 결과", db_index=True, help_text="Voice Interview 모드로 진행된 시험 결과인지 여부")
+    stats_processed_at = models.DateTimeField(null=True, blank=True, verbose_name="제출 후 통계 처리일", help_text="스터디 진행률 등 제출 후처리가 완료된 시각 (중복 처리 방지)")
 
     class Meta:
         verbose_name = "시험 결과"
@@ -1077,8 +1056,12 @@ class ExamResultDetail(models.Model):
             models.Index(fields=['question', 'is_correct']),
         ]
 
-    def save(self, *args, **kwargs):
-        """저장 시 문제 정보를 보존"""
+    def fill_question_snapshot(self):
+        """
+        문제 삭제 후에도 통계를 보존하기 위해 문제 정보를 복사합니다.
+
+        save()를 거치지 않는 bulk_create 전에도 호출하여 동일한 값을 저장한다.
+        """
         if self.question and not self.question_title:
             # 다국어 제목 필드 사용
             question_language = self.question.created_language if hasattr(self.question, 'created_language') else BASE_LANGUAGE
@@ -1086,9 +1069,79 @@ class ExamResultDetail(models.Model):
             self.question_content = get_localized_field(self.question, 'content', question_language)
             self.question_answer = get_localized_field(self.question, 'answer', question_language)
             self.question_difficulty = self.question.difficulty
+
+    def save(self, *args, **kwargs):
+        """저장 시 문제 정보를 보존"""
+        self.fill_question_snapshot()
         super().save(*args, **kwargs)
 
 
+class UserQuestionStat(models.Model):
+    """
+    사용자별 문제 통계 집계 모델
+
+    ExamResultDetail을 매번 집계하지 않도록 (사용자, 시험, 문제) 단위의 시도/정답 수를
+    시험 제출 시 증분 갱신한다. 시험은 ExamResultDetail이 저장된 시험(원본 시험)이다.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='question_stats', verbose_name="사용자")
+    exam = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name='user_question_stats', verbose_name="시험")
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='user_stats', verbose_name="문제")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="시도 횟수")
+    correct = models.PositiveIntegerField(default=0, verbose_name="정답 횟수")
+    last_correct_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 정답 일시")
+    last_attempt_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 시도 일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "사용자 문제 통계"
+        verbose_name_plural = "사용자 문제 통계들"
+        unique_together = ['user', 'exam', 'question']
+        indexes = [
+            models.Index(fields=['user', 'question']),
+            models.Index(fields=['user', 'exam']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.question_id} - {self.correct}/{self.attempts}"
+
+
+class UserExamProgress(models.Model):
+    """
+    사용자별 시험 진행 요약 모델
+
+    UserQuestionStat을 (사용자, 시험) 단위로 합산하고 최신 결과를 함께 저장하여
+    시험/스터디 목록에서 문제별 집계 없이 한 번의 조회로 사용한다.
+    시험 제출(record_question_attempts)과 이력 재계산(refresh_user_question_stats) 시 갱신된다.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='exam_progresses', verbose_name="사용자")
+    exam = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name='user_progresses', verbose_name="시험")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="시도 횟수")
+    correct = models.PositiveIntegerField(default=0, verbose_name="정답 횟수")
+    attempted_questions = models.PositiveIntegerField(default=0, verbose_name="시도한 문제 수")
+    correct_questions = models.PositiveIntegerField(default=0, verbose_name="맞춘 문제 수")
+    latest_result = models.ForeignKey(ExamResult, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name="최신 결과")
+    latest_score = models.IntegerField(null=True, blank=True, verbose_name="최신 점수")
+    latest_total_score = models.IntegerField(null=True, blank=True, verbose_name="최신 총점")
+    latest_correct_count = models.IntegerField(null=True, blank=True, verbose_name="최신 정답 수")
+    latest_completed_at = models.DateTimeField(null=True, blank=True, verbose_name="최신 완료일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "사용자 시험 진행 요약"
+        verbose_name_plural = "사용자 시험 진행 요약들"
+        unique_together = ['user', 'exam']
+
+    def __str__(self):
+        return f"{self.user_id} - {self.exam_id} - {self.correct}/{self.attempts}"
+
+    @property
+    def accuracy_percentage(self):
+        """전체 시도 중 정답 비율 (시도가 없으면 None)"""
+        if not self.attempts:
+            return None
+        return (self.correct / self.attempts) * 100
+
+
 class Study(models.Model):
     """
     스터디 모델 - 다국어 제목/목표 지원
@@ -1777,4 +1830,124 @@ class ShortUrl(models.Model):
         from django.utils import timezone
         self.access_count += 1
         self.last_accessed_at = timezone.now()
-        self.save(update_fields=['access_count', 'last_accessed_at'])
\ No newline at end of file
+        self.save(update_fields=['access_count', 'last_accessed_at'])
+
+class TranslationMemory(models.Model):
+    """
+    번역 메모리 모델
+
+    (원문 해시, 원본 언어, 대상 언어) 단위로 번역 결과를 영구 저장하여
+    같은 문제/태그/카테고리 문자열을 다시 LLM(OpenAI/Gemini)으로 번역하지 않도록 한다.
+    조회/저장은 quiz.utils.translation_memory를 통해 일괄로 처리한다.
+    """
+    source_hash = models.CharField(max_length=64, verbose_name="원문 해시")
+    source_language = models.CharField(max_length=10, verbose_name="원본 언어")
+    target_language = models.CharField(max_length=10, verbose_name="대상 언어")
+    source_text = models.TextField(verbose_name="원문")
+    translated_text = models.TextField(verbose_name="번역문")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "번역 메모리"
+        verbose_name_plural = "번역 메모리들"
+        unique_together = ['source_hash', 'source_language', 'target_language']
+
+    def __str__(self):
+        return f"{self.source_language}->{self.target_language}: {self.source_text[:50]}"
+
+
+class TranslationJob(models.Model):
+    """
+    번역 작업 모델
+
+    translate_content / translate_all_categories 같은 대량 번역(백필)을 작업 단위로 기록한다.
+    번역 대상은 TranslationJobItem으로 미리 나누어 저장하고, 여러 Celery 워커가 항목을 나누어 처리한다.
+    처리 로직과 진행률 계산은 quiz.utils.translation_jobs를 통해 수행한다.
+    """
+    JOB_TYPE_CONTENT = 'content'
+    JOB_TYPE_CATEGORIES = 'categories'
+    JOB_TYPE_CHOICES = [
+        (JOB_TYPE_CONTENT, '콘텐츠 번역'),
+        (JOB_TYPE_CATEGORIES, '카테고리 번역'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '진행 중'),
+        (STATUS_COMPLETED, '완료'),
+        (STATUS_CANCELLED, '취소'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES, verbose_name="작업 종류")
+    params = models.JSONField(default=dict, blank=True, verbose_name="작업 옵션")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True, verbose_name="상태")
+    total_items = models.PositiveIntegerField(default=0, verbose_name="전체 항목 수")
+    processed_items = models.PositiveIntegerField(default=0, verbose_name="처리한 항목 수")
+    translated_items = models.PositiveIntegerField(default=0, verbose_name="번역한 항목 수")
+    skipped_items = models.PositiveIntegerField(default=0, verbose_name="건너뛴 항목 수")
+    failed_items = models.PositiveIntegerField(default=0, verbose_name="실패한 항목 수")
+    processing_seconds = models.FloatField(default=0, verbose_name="워커 처리 시간(초)")
+    last_error = models.TextField(blank=True, default='', verbose_name="마지막 오류")
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="생성자")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="시작일")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "번역 작업"
+        verbose_name_plural = "번역 작업들"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.get_job_type_display()} ({self.status}) {self.processed_items}/{self.total_items}"
+
+
+class TranslationJobItem(models.Model):
+    """
+    번역 작업 항목 모델
+
+    번역 작업의 처리 단위 (객체 하나 + 번역 방향). 워커는 select_for_update(skip_locked=True)로
+    대기 항목을 배치 단위로 가져가고, 처리 결과를 항목 상태로 기록(체크포인트)한다.
+    워커가 중단되어 처리 중 상태로 남은 항목은 임대 시간이 지나면 다른 워커가 다시 가져간다.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_SKIPPED = 'skipped'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_PROCESSING, '처리 중'),
+        (STATUS_DONE, '번역 완료'),
+        (STATUS_SKIPPED, '건너뜀'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    job = models.ForeignKey(TranslationJob, on_delete=models.CASCADE, related_name='items', verbose_name="번역 작업")
+    content_type = models.CharField(max_length=20, verbose_name="콘텐츠 종류")
+    object_id = models.CharField(max_length=64, verbose_name="객체 ID")
+    source_language = models.CharField(max_length=10, blank=True, default='', verbose_name="원본 언어")
+    target_language = models.CharField(max_length=10, blank=True, default='', verbose_name="대상 언어")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="상태")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")
+    error = models.TextField(blank=True, default='', verbose_name="오류")
+    worker = models.CharField(max_length=100, blank=True, default='', verbose_name="처리 워커")
+    claimed_at = models.DateTimeField(null=True, blank=True, verbose_name="가져간 시각")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "번역 작업 항목"
+        verbose_name_plural = "번역 작업 항목들"
+        indexes = [
+            models.Index(fields=['job', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type}:{self.object_id} {self.source_language}->{self.target_language} ({self.status})"
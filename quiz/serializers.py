@@ -4,11 +4,12 @@ from .models import Study, StudyTask, Member, StudyTaskProgress, ExamResult, Exa
 from .utils.multilingual_utils import (
     MultilingualSerializerMixin, 
     get_user_language, 
-    is_auto_translation_enabled, 
     get_completion_fields,
     get_localized_field
 )
+from .utils.stats_utils import get_user_question_stats_map, prefetch_user_exam_progress
 from django.contrib.auth import get_user_model
+from django.db import models
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -128,11 +129,11 @@ class TagCategorySerializer(MultilingualSerializerMixin, serializers.ModelSerial
         user_language = get_user_language(request)
         return get_localized_field(obj, 'name', user_language, '')
     
-    def get_full_path(self, obj):
-        """전체 카테고리 경로 반환"""
+    @staticmethod
+    def get_full_path_language(request):
+        """전체 경로에 사용할 언어 (X-Language/Accept-Language 헤더 → 사용자 프로필 순)"""
         from quiz.utils.multilingual_utils import BASE_LANGUAGE, LANGUAGE_KO, LANGUAGE_EN, LANGUAGE_ES, LANGUAGE_ZH
         
-        request = self.context.get('request')
         user_language = BASE_LANGUAGE  # 기본값
         
         # 1. 요청 헤더에서 언어 확인 (Accept-Language 또는 X-Language 헤더)
@@ -160,7 +161,11 @@ class TagCategorySerializer(MultilingualSerializerMixin, serializers.ModelSerial
                 except:
                     pass
         
-        return obj.get_full_path(user_language)
+        return user_language
+    
+    def get_full_path(self, obj):
+        """전체 카테고리 경로 반환"""
+        return obj.get_full_path(self.get_full_path_language(self.context.get('request')))
     
     def get_available_languages(self, obj):
         """사용 가능한 언어 목록 반환"""
@@ -178,11 +183,17 @@ class TagCategorySerializer(MultilingualSerializerMixin, serializers.ModelSerial
         return languages
     
     def get_children_count(self, obj):
-        """하위 카테고리 개수 반환"""
+        """하위 카테고리 개수 반환 (트리 구성 시 미리 계산된 값 우선)"""
+        children_total = getattr(obj, 'children_total', None)
+        if children_total is not None:
+            return children_total
         return obj.children.count()
     
     def get_tags_count(self, obj):
-        """해당 카테고리에 속한 태그 개수 반환"""
+        """해당 카테고리에 속한 태그 개수 반환 (트리 구성 시 미리 계산된 값 우선)"""
+        tags_total = getattr(obj, 'tags_total', None)
+        if tags_total is not None:
+            return tags_total
         return obj.tags.count()
     
     def get_parent_name(self, obj):
@@ -339,15 +350,13 @@ class QuestionSerializer(MultilingualSerializerMixin, serializers.ModelSerialize
             if stats:
                 return stats.get('attempt_count', 0)
         
-        # 폴백: 기존 방식 (컨텍스트에 통계가 없는 경우)
+        # 폴백: UserQuestionStat 집계 테이블에서 조회 (컨텍스트에 통계가 없는 경우)
         request = self.context.get('request')
         if not request or not request.user or not hasattr(request.user, 'is_authenticated') or not request.user.is_authenticated:
             return 0
         
-        return ExamResultDetail.objects.filter(
-            question=obj,
-            result__user=request.user
-        ).count()
+        stats = get_user_question_stats_map(request.user, question_ids=[obj.id]).get(obj.id)
+        return stats['attempts'] if stats else 0
     
     def get_correct_count(self, obj):
         """현재 사용자의 해당 문제 정답 횟수 (최적화: 컨텍스트에서 미리 계산된 데이터 사용)"""
@@ -358,16 +367,13 @@ class QuestionSerializer(MultilingualSerializerMixin, serializers.ModelSerialize
             if stats:
                 return stats.get('correct_count', 0)
         
-        # 폴백: 기존 방식 (컨텍스트에 통계가 없는 경우)
+        # 폴백: UserQuestionStat 집계 테이블에서 조회 (컨텍스트에 통계가 없는 경우)
         request = self.context.get('request')
         if not request or not request.user or not hasattr(request.user, 'is_authenticated') or not request.user.is_authenticated:
             return 0
         
-        return ExamResultDetail.objects.filter(
-            question=obj,
-            result__user=request.user,
-            is_correct=True
-        ).count()
+        stats = get_user_question_stats_map(request.user, question_ids=[obj.id]).get(obj.id)
+        return stats['correct'] if stats else 0
 
     def get_correct_rate(self, obj):
         """현재 사용자의 해당 문제 정답률 (최적화: 컨텍스트에서 미리 계산된 데이터 사용)"""
@@ -505,6 +511,7 @@ class ExamListSerializer(serializers.ModelSerializer):
         super().__init__(*args, **kwargs)
         # 같은 시험에 대해 _get_latest_result 결과를 캐싱
         self._latest_result_cache = {}
+        self._user_exam_progress_prefetched = False
     
     class Meta:
         model = Exam
@@ -541,6 +548,18 @@ class ExamListSerializer(serializers.ModelSerializer):
         # 마지막 수단: count() 사용
         return obj.questions.count()
     
+    def _get_listed_exams(self, obj):
+        """목록(many=True) 직렬화면 목록 전체, 단건이면 obj만 반환"""
+        if self.parent is not None and self.parent.instance is not None:
+            return list(self.parent.instance)
+        return [obj]
+    
+    def _prefetch_user_exam_progress(self, obj, user):
+        """context에 통계가 없을 때 목록 전체의 UserExamProgress를 한 번만 조회"""
+        if not self._user_exam_progress_prefetched:
+            prefetch_user_exam_progress(self._get_listed_exams(obj), user)
+            self._user_exam_progress_prefetched = True
+    
     def _get_latest_result(self, obj):
         """prefetch된 최신 결과를 가져오는 헬퍼 메서드 (캐싱 지원)"""
         request = self.context.get('request')
@@ -549,36 +568,24 @@ class ExamListSerializer(serializers.ModelSerializer):
         
         # 캐시 확인 (같은 시험에 대해 여러 번 호출되는 것을 방지)
         exam_id_str = str(obj.id)
-        if hasattr(self, '_latest_result_cache') and exam_id_str in self._latest_result_cache:
+        if exam_id_str in self._latest_result_cache:
             return self._latest_result_cache[exam_id_str]
         
         # context에서 prefetch된 결과 딕셔너리 가져오기
         user_latest_results_dict = self.context.get('user_latest_results_dict', {})
-        
-        # 현재 시험 ID로 먼저 확인
         if exam_id_str in user_latest_results_dict:
             result = user_latest_results_dict[exam_id_str]
-            # 캐시에 저장
-            if hasattr(self, '_latest_result_cache'):
-                self._latest_result_cache[exam_id_str] = result
+            self._latest_result_cache[exam_id_str] = result
             return result
         
-        # 복사된 시험인 경우 원본 시험의 결과를 찾기
-        if not obj.is_original and obj.original_exam:
-            original_exam_id_str = str(obj.original_exam.id)
-            if original_exam_id_str in user_latest_results_dict:
-                result = user_latest_results_dict[original_exam_id_str]
-                # 캐시에 저장 (현재 시험 ID로도 저장)
-                if hasattr(self, '_latest_result_cache'):
-                    self._latest_result_cache[exam_id_str] = result
-                    self._latest_result_cache[original_exam_id_str] = result
-                return result
-        
-        # user_latest_results_dict에 없는 경우 None으로 처리 (fallback 쿼리 방지)
-        # 이는 해당 시험에 결과가 없다는 의미이므로 None 반환
-        if hasattr(self, '_latest_result_cache'):
-            self._latest_result_cache[exam_id_str] = None
-        return None
+        # context에 없으면 목록 전체(many=True인 경우)의 최신 결과를 한 번의 쿼리로 조회
+        # 복사된 시험에 결과가 없으면 원본 시험의 결과 사용
+        from quiz.utils.exam_utils import get_latest_exam_results
+        pending_exams = [exam for exam in self._get_listed_exams(obj) if str(exam.id) not in self._latest_result_cache]
+        self._latest_result_cache.update(
+            get_latest_exam_results(pending_exams, user=request.user, fallback_to_original=True)
+        )
+        return self._latest_result_cache.get(exam_id_str)
     
     def get_has_results(self, obj):
         """현재 사용자의 시험 결과 존재 여부"""
@@ -621,9 +628,9 @@ class ExamListSerializer(serializers.ModelSerializer):
             if original_exam_id_str in user_correct_questions_dict:
                 return user_correct_questions_dict[original_exam_id_str]
         
-        # prefetch되지 않은 경우에만 쿼리 실행 (fallback)
-        target_exam = obj.original_exam if not obj.is_original and obj.original_exam else obj
-        return target_exam.get_total_correct_questions_for_user(request.user)
+        # prefetch되지 않은 경우 목록 전체의 진행 요약을 한 번에 조회 (fallback)
+        self._prefetch_user_exam_progress(obj, request.user)
+        return obj.get_total_correct_questions_for_user(request.user)
 
     def get_accuracy_percentage(self, obj):
         """현재 사용자의 합격률 계산 (exam-detail과 동일한 로직)"""
@@ -644,9 +651,9 @@ class ExamListSerializer(serializers.ModelSerializer):
             if original_exam_id_str in user_accuracy_percentage_dict:
                 return user_accuracy_percentage_dict[original_exam_id_str]
         
-        # prefetch되지 않은 경우에만 쿼리 실행 (fallback)
-        target_exam = obj.original_exam if not obj.is_original and obj.original_exam else obj
-        return target_exam.get_accuracy_percentage_for_user(request.user)
+        # prefetch되지 않은 경우 목록 전체의 진행 요약을 한 번에 조회 (fallback)
+        self._prefetch_user_exam_progress(obj, request.user)
+        return obj.get_accuracy_percentage_for_user(request.user)
 
     def get_created_by(self, obj):
         """시험 생성자 정보 반환"""
@@ -898,7 +905,7 @@ class ExamSerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
 
     
     def get_questions(self, obj):
-        """성능 최적화된 문제 목록 반환 (필요한 필드만) + 개별 번역 처리"""
+        """성능 최적화된 문제 목록 반환 (필요한 필드만) + 누락 번역 백그라운드 요청"""
         import logging
         logger = logging.getLogger(__name__)
         
@@ -920,37 +927,17 @@ class ExamSerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
                 *completion_fields
             )
         
-        # 자동 번역이 활성화된 경우에만 번역 처리
+        # 누락된 번역은 조회 경로에서 실행하지 않고 Celery 번역 워커로 전송
+        # 응답은 현재 있는 언어 필드로 즉시 반환하고, 클라이언트는 translation_pending 문제를
+        # questions/translation-status/ 로 폴링하여 번역 결과를 받는다
+        pending_question_ids = set()
         request = self.context.get('request')
         if request and hasattr(request, 'user'):
-            auto_translation_enabled = is_auto_translation_enabled(request.user)
-            
-            if auto_translation_enabled:
-                # 각 문제에 대해 개별 번역 처리
-                # MultilingualContentManager가 내부에서 번역 필요성을 올바르게 판단하므로
-                # 여기서는 직접 확인하지 않고 항상 MultilingualContentManager를 호출합니다.
-                for question in questions:
-                    try:
-                        from quiz.utils.multilingual_utils import MultilingualContentManager
-                        
-                        # Question 모델용 다국어 필드 지정
-                        question_multilingual_fields = ['title', 'content', 'answer', 'explanation']
-                        
-                        # MultilingualContentManager로 개별 번역 처리
-                        # MultilingualContentManager가 내부에서 번역 필요성을 올바르게 판단합니다.
-                        # - user_language가 'en'이고 created_language가 'ko'인 경우
-                        #   → title_ko를 확인하고 title_en이 비어있으면 ko → en 번역
-                        # - user_language가 'ko'인 경우
-                        #   → title_ko를 확인하고 title_en이 비어있으면 ko → en 번역
-                        # 조회 시에는 완성도 상태 업데이트를 건너뛰기 (skip_completion_update=True)
-                        manager = MultilingualContentManager(question, request.user, question_multilingual_fields, skip_completion_update=True)
-                        manager.handle_multilingual_update()
-                        
-                        # 번역 후 데이터베이스에서 최신 정보 가져오기
-                        question.refresh_from_db()
-                        
-                    except Exception as e:
-                        logger.warning(f"[EXAM_SERIALIZER] 문제 {question.id} 번역 처리 실패: {str(e)}")
+            try:
+                from quiz.utils.translation_queue import queue_missing_question_translations
+                pending_question_ids = queue_missing_question_translations(questions, request.user)
+            except Exception as e:
+                logger.warning(f"[EXAM_SERIALIZER] 문제 번역 요청 실패 - exam_id: {obj.id}, error: {str(e)}")
         
         return [
             {
@@ -987,7 +974,8 @@ class ExamSerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
                 'is_es_complete': getattr(q, 'is_es_complete', False),
                 'is_zh_complete': getattr(q, 'is_zh_complete', False),
                 'is_ja_complete': getattr(q, 'is_ja_complete', False),
-                'created_by': q.created_by.id if q.created_by else None
+                'created_by': q.created_by.id if q.created_by else None,
+                'translation_pending': str(q.id) in pending_question_ids
             }
             for q in questions
         ]
@@ -1066,6 +1054,17 @@ class SubmitExamSerializer(serializers.Serializer):
     ) 
 
 
+class StudyTaskListSerializer(serializers.ListSerializer):
+    """태스크 목록 직렬화 전에 사용자 진행 요약(UserExamProgress)을 한 번에 조회"""
+    
+    def to_representation(self, data):
+        tasks = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            prefetch_user_exam_progress([task.exam for task in tasks], request.user)
+        return super().to_representation(tasks)
+
+
 class StudyTaskSerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
     exam_title = serializers.SerializerMethodField()
     effective_progress = serializers.FloatField(read_only=True)
@@ -1093,6 +1092,7 @@ class StudyTaskSerializer(MultilingualSerializerMixin, serializers.ModelSerializ
     
     class Meta:
         model = StudyTask
+        list_serializer_class = StudyTaskListSerializer
         fields = [
             'id', 'study', 'name_ko', 'name_en', 'progress', 'exam', 'exam_title', 
             'effective_progress', 'user_progress', 'attempted_progress', 'correct_progress', 
@@ -1772,6 +1772,9 @@ class StudySerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
             if not tasks:
                 print(f"🔍 태스크가 없음")
                 return 0
+
+            # 태스크 시험들의 사용자 진행 요약을 한 번에 조회
+            prefetch_user_exam_progress([task.exam for task in tasks], user)
             
             # 사용자별 개별 진행률 계산
             total_progress = 0
@@ -1822,6 +1825,9 @@ class StudySerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
             tasks = obj.tasks.all()
             if not tasks:
                 return 0
+
+            # 태스크 시험들의 사용자 진행 요약을 한 번에 조회
+            prefetch_user_exam_progress([task.exam for task in tasks], user)
             
             total_correct = 0
             total_questions = 0
@@ -1859,6 +1865,9 @@ class StudySerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
             tasks = obj.tasks.all()
             if not tasks:
                 return 0
+
+            # 태스크 시험들의 사용자 진행 요약을 한 번에 조회
+            prefetch_user_exam_progress([task.exam for task in tasks], user)
             
             total_attempted = 0
             total_questions = 0
@@ -1896,6 +1905,9 @@ class StudySerializer(MultilingualSerializerMixin, serializers.ModelSerializer):
             tasks = obj.tasks.all()
             if not tasks:
                 return None
+
+            # 태스크 시험들의 사용자 진행 요약을 한 번에 조회
+            prefetch_user_exam_progress([task.exam for task in tasks], user)
             
             total_accuracy = 0
             task_count = 0
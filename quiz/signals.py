@@ -18,6 +18,7 @@ from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from .models import Study, Member, StudyJoinRequest, UserProfile, Exam, ExamQuestion
 from .utils.cache_utils import StudyCacheManager
+from .utils.deferred_signals import schedule_exam_question_count, schedule_exam_subscriptions
 from .utils.multilingual_utils import get_localized_field, BASE_LANGUAGE
 import logging
 
@@ -107,40 +108,18 @@ def invalidate_cache_on_join_request_change(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Member)
 def auto_subscribe_exams_on_study_join(sender, instance, **kwargs):
-    """스터디 가입 시 연결된 시험 자동 구독"""
+    """스터디 가입 시 연결된 시험 자동 구독 (deferred_signals 블록 안에서는 모아서 일괄 처리)"""
     # 새로 생성된 멤버이고 활성 상태인 경우에만 실행
-    if kwargs.get('created', False) and instance.is_active:
+    if kwargs.get('created', False) and instance.is_active and instance.user_id:
         try:
-            from .models import ExamSubscription, StudyTask
-            study_title = get_localized_field(instance.study, 'title', instance.study.created_language if hasattr(instance.study, 'created_language') else BASE_LANGUAGE, 'Unknown')
-            logger.info(f"🔔 스터디 가입 시 자동 구독 시작: 사용자 {instance.user.username}, 스터디 {study_title}")
+            from .models import StudyTask
             
             # 해당 스터디에 연결된 모든 시험 조회
-            study_tasks = StudyTask.objects.filter(study=instance.study)
-            subscribed_count = 0
-            
-            for task in study_tasks:
-                if task.exam:
-                    # 이미 구독되어 있는지 확인
-                    subscription, created = ExamSubscription.objects.get_or_create(
-                        user=instance.user,
-                        exam=task.exam,
-                        defaults={'is_active': True}
-                    )
-                    if created:
-                        subscribed_count += 1
-                        exam_title = get_localized_field(task.exam, 'title', task.exam.created_language if hasattr(task.exam, 'created_language') else BASE_LANGUAGE, 'Unknown')
-                        logger.info(f"✅ 시험 자동 구독 생성: {exam_title}")
-                    else:
-                        # 기존 구독이 비활성화되어 있다면 활성화
-                        if not subscription.is_active:
-                            subscription.is_active = True
-                            subscription.save()
-                            subscribed_count += 1
-                            exam_title = get_localized_field(task.exam, 'title', task.exam.created_language if hasattr(task.exam, 'created_language') else BASE_LANGUAGE, 'Unknown')
-                            logger.info(f"✅ 기존 구독 활성화: {exam_title}")
-            
-            logger.info(f"🎯 스터디 가입 시 자동 구독 완료: {subscribed_count}개 시험 구독됨")
+            exam_ids = set(
+                StudyTask.objects.filter(study_id=instance.study_id, exam__isnull=False).values_list('exam_id', flat=True)
+            )
+            schedule_exam_subscriptions((instance.user_id, exam_id) for exam_id in exam_ids)
+            logger.info(f"🔔 스터디 가입 시 자동 구독: 사용자 {instance.user_id}, 스터디 {instance.study_id}, 시험 {len(exam_ids)}개")
             
         except Exception as e:
             logger.error(f"❌ 스터디 가입 시 자동 구독 실패: {e}")
@@ -148,40 +127,16 @@ def auto_subscribe_exams_on_study_join(sender, instance, **kwargs):
 
 @receiver(post_save, sender='quiz.StudyTask')
 def auto_subscribe_existing_members_to_new_exam(sender, instance, **kwargs):
-    """스터디에 새 시험이 추가될 때 기존 멤버들 자동 구독"""
+    """스터디에 새 시험이 추가될 때 기존 멤버들 자동 구독 (deferred_signals 블록 안에서는 모아서 일괄 처리)"""
     # 새로 생성된 StudyTask이고 시험이 연결된 경우에만 실행
-    if kwargs.get('created', False) and instance.exam:
+    if kwargs.get('created', False) and instance.exam_id:
         try:
-            from .models import ExamSubscription, Member
-            study_title = get_localized_field(instance.study, 'title', instance.study.created_language if hasattr(instance.study, 'created_language') else BASE_LANGUAGE, 'Unknown')
-            exam_title = get_localized_field(instance.exam, 'title', instance.exam.created_language if hasattr(instance.exam, 'created_language') else BASE_LANGUAGE, 'Unknown')
-            logger.info(f"🔔 스터디에 새 시험 추가 시 자동 구독 시작: 스터디 {study_title}, 시험 {exam_title}")
-            
             # 해당 스터디의 활성 멤버들 조회
-            active_members = Member.objects.filter(study=instance.study, is_active=True)
-            subscribed_count = 0
-            
-            for member in active_members:
-                # 이미 구독되어 있는지 확인
-                subscription, created = ExamSubscription.objects.get_or_create(
-                    user=member.user,
-                    exam=instance.exam,
-                    defaults={'is_active': True}
-                )
-                if created:
-                    subscribed_count += 1
-                    exam_title = get_localized_field(instance.exam, 'title', instance.exam.created_language if hasattr(instance.exam, 'created_language') else BASE_LANGUAGE, 'Unknown')
-                    logger.info(f"✅ 기존 멤버 자동 구독 생성: {member.user.username} -> {exam_title}")
-                else:
-                    # 기존 구독이 비활성화되어 있다면 활성화
-                    if not subscription.is_active:
-                        subscription.is_active = True
-                        subscription.save()
-                        subscribed_count += 1
-                        exam_title = get_localized_field(instance.exam, 'title', instance.exam.created_language if hasattr(instance.exam, 'created_language') else BASE_LANGUAGE, 'Unknown')
-                        logger.info(f"✅ 기존 멤버 구독 활성화: {member.user.username} -> {exam_title}")
-            
-            logger.info(f"🎯 스터디 새 시험 자동 구독 완료: {subscribed_count}명의 멤버가 구독됨")
+            user_ids = set(
+                Member.objects.filter(study_id=instance.study_id, is_active=True, user__isnull=False).values_list('user_id', flat=True)
+            )
+            schedule_exam_subscriptions((user_id, instance.exam_id) for user_id in user_ids)
+            logger.info(f"🔔 스터디에 새 시험 추가 시 자동 구독: 스터디 {instance.study_id}, 시험 {instance.exam_id}, 멤버 {len(user_ids)}명")
             
         except Exception as e:
             logger.error(f"❌ 스터디 새 시험 자동 구독 실패: {e}")
@@ -202,27 +157,21 @@ def auto_subscribe_existing_members_to_new_exam(sender, instance, **kwargs):
 
 
 @receiver(m2m_changed, sender=Exam.questions.through)
-def update_exam_total_questions(sender, instance, action, pk_set, **kwargs):
+def update_exam_total_questions(sender, instance, action, pk_set, reverse, **kwargs):
     """Exam의 questions 관계가 변경될 때 total_questions 자동 업데이트"""
     if action in ["post_add", "post_remove", "post_clear"]:
         try:
-            # Exam 인스턴스의 total_questions 업데이트
-            if hasattr(instance, 'id'):
-                exam = Exam.objects.get(id=instance.id)
-                exam.total_questions = exam.questions.count()
-                exam.save(update_fields=['total_questions'])
-                logger.info(f"🔄 Exam {exam.id}의 total_questions 자동 업데이트: {exam.total_questions}")
+            # question.exam_set 쪽에서 변경된 경우 pk_set이 시험 ID 목록
+            exam_ids = (pk_set or []) if reverse else [instance.id]
+            schedule_exam_question_count(*exam_ids)
         except Exception as e:
             logger.error(f"❌ Exam total_questions 자동 업데이트 실패: {e}")
 
 
 @receiver([post_save, post_delete], sender=ExamQuestion)
 def update_exam_total_questions_on_examquestion_change(sender, instance, **kwargs):
-    """ExamQuestion 모델 변경 시 Exam의 total_questions 자동 업데이트"""
+    """ExamQuestion 모델 변경 시 Exam의 total_questions 자동 업데이트 (deferred_signals 블록 안에서는 한 번만)"""
     try:
-        exam = instance.exam
-        exam.total_questions = exam.questions.count()
-        exam.save(update_fields=['total_questions'])
-        logger.info(f"🎯 Exam {exam.id}의 total_questions 자동 업데이트 (ExamQuestion 변경): {exam.total_questions}")
+        schedule_exam_question_count(instance.exam_id)
     except Exception as e:
-        logger.error(f"❌ Exam total_questions 자동 업데이트 실패 (ExamQuestion 변경): {e}")
\ No newline at end of file
+        logger.error(f"❌ Exam total_questions 자동 업데이트 실패 (ExamQuestion 변경): {e}")
@@ -265,9 +265,10 @@ def save_study_list_cache(self, cache_key, data, timeout=300):
         bool: 저장 성공 여부
     """
     try:
-        from django.core.cache import cache
+        from quiz.utils.cache_utils import StudyCacheManager
         
-        cache.set(cache_key, data, timeout)
+        # 봉투 형식으로 저장하고 계산 락 해제
+        StudyCacheManager.set_cache_by_key(cache_key, data, timeout)
         
         logger.info(f"[CELERY_TASK] 스터디 목록 캐시 저장 완료 - cache_key: {cache_key}")
         return True
@@ -294,6 +295,7 @@ def record_study_progress_task(self, user_id, study_ids, page_type):
     try:
         from django.contrib.auth import get_user_model
         from quiz.models import Study, StudyProgressRecord
+        from quiz.utils.stats_utils import prefetch_user_exam_progress
         
         User = get_user_model()
         user = User.objects.get(id=user_id)
@@ -305,7 +307,8 @@ def record_study_progress_task(self, user_id, study_ids, page_type):
                 study = Study.objects.get(id=study_id)
                 
                 # 현재 진행율 계산 (StudyTaskProgress의 실제 진행률 사용)
-                tasks = study.tasks.all()
+                tasks = list(study.tasks.select_related('exam__original_exam'))
+                prefetch_user_exam_progress([task.exam for task in tasks], user)
                 task_progresses = {}
                 total_progress = 0
                 
@@ -356,3 +359,126 @@ def record_study_progress_task(self, user_id, study_ids, page_type):
         # 재시도
         raise self.retry(exc=e)
 
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True)
+def process_exam_submission_task(self, result_id, question_ids=None):
+    """
+    시험 제출 후 스터디 진행률/통계를 비동기로 갱신하는 Celery 태스크.
+    
+    같은 result_id로 여러 번 실행되어도 한 번만 처리됩니다 (ExamResult.stats_processed_at).
+    
+    Args:
+        result_id: 제출로 생성된 ExamResult ID
+        question_ids: 제출 답안의 문제 ID 목록 (추천 시험의 원본 시험 탐색용)
+    
+    Returns:
+        bool: 이번 실행에서 처리했는지 여부
+    """
+    try:
+        from quiz.utils.submission_utils import process_exam_submission_stats
+        
+        processed = process_exam_submission_stats(result_id, question_ids)
+        logger.info(f"[CELERY_TASK] 시험 제출 후처리 완료 - result_id: {result_id}, processed: {processed}")
+        return processed
+        
+    except Exception as e:
+        logger.error(f"[CELERY_TASK] 시험 제출 후처리 중 오류 - result_id: {result_id}, error: {str(e)}")
+        # 재시도
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=30, ignore_result=True)
+def translate_questions_task(self, items, fields=None):
+    """
+    시험 조회 시 누락이 감지된 문제 번역을 실행하는 Celery 태스크.
+    
+    조회 경로(ExamSerializer.get_questions)는 번역 대기 표시만 남기고 이 태스크로 전송합니다.
+    
+    Args:
+        items: [[question_id, from_lang, to_lang], ...]
+        fields: 번역할 필드 목록 (기본값: 문제의 전체 번역 필드)
+    
+    Returns:
+        dict: 번역/건너뜀 건수
+    """
+    try:
+        from quiz.utils.translation_queue import translate_questions
+        
+        result = translate_questions(items, fields)
+        logger.info(f"[CELERY_TASK] 문제 번역 완료 - {len(items)}건 요청, 결과: {result}")
+        return result
+        
+    except Exception as e:
+        logger.error(f"[CELERY_TASK] 문제 번역 중 오류 - {len(items)}건, error: {str(e)}")
+        # 재시도
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, max_retries=1, default_retry_delay=30, ignore_result=True)
+def export_file_task(self, job_id, export_name, user_id, params=None):
+    """
+    대용량 엑셀 내보내기 파일을 생성하여 스토리지(MinIO 또는 로컬)에 저장하는 Celery 태스크.
+    
+    완료 후 작업 상태(export_job:<job_id>)에 파일 경로가 기록되며,
+    요청한 사용자는 /api/exports/<job_id>/download/ 로 내려받습니다.
+    
+    Args:
+        job_id: 내보내기 작업 ID
+        export_name: 내보내기 종류 (user_data, exams, study, users)
+        user_id: 요청한 사용자 ID
+        params: 내보내기 옵션 (언어, 스터디 ID 등)
+    
+    Returns:
+        dict: 작업 상태
+    """
+    try:
+        from quiz.utils.export_utils import run_export_job
+        
+        job = run_export_job(job_id, export_name, user_id, params or {})
+        logger.info(f"[CELERY_TASK] 내보내기 완료 - job_id: {job_id}, export: {export_name}")
+        return job
+        
+    except Exception as e:
+        logger.error(f"[CELERY_TASK] 내보내기 중 오류 - job_id: {job_id}, export: {export_name}, error: {str(e)}")
+        # 재시도
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True)
+def process_translation_job_task(self, job_id):
+    """
+    번역 작업(TranslationJob)의 항목을 배치 단위로 가져가 처리하는 Celery 태스크.
+    
+    여러 워커에서 동시에 실행할 수 있으며(select_for_update(skip_locked=True)로 항목 분배),
+    한 번에 WORKER_TIME_BUDGET_SECONDS 동안 처리한 뒤 남은 항목이 있으면 자신을 다시 전송합니다.
+    다른 워커가 처리 중인 항목만 남으면 가장 오래된 항목의 임대가 끝나는 시점에 작업당 한 번만
+    다시 확인하여(schedule_lease_recheck) 중단된 워커의 항목을 이어서 처리합니다.
+    
+    Args:
+        job_id: 번역 작업 ID
+    
+    Returns:
+        str: 워커 처리 결과 (done, continue, wait)
+    """
+    try:
+        from quiz.utils.translation_jobs import (
+            WORKER_RESULT_CONTINUE,
+            WORKER_RESULT_WAIT,
+            WORKER_TIME_BUDGET_SECONDS,
+            run_translation_worker,
+            schedule_lease_recheck,
+        )
+        
+        result = run_translation_worker(job_id, time_budget=WORKER_TIME_BUDGET_SECONDS)
+        if result == WORKER_RESULT_CONTINUE:
+            process_translation_job_task.delay(job_id)
+        elif result == WORKER_RESULT_WAIT:
+            schedule_lease_recheck(job_id)
+        logger.info(f"[CELERY_TASK] 번역 작업 처리 - job_id: {job_id}, 결과: {result}")
+        return result
+        
+    except Exception as e:
+        logger.error(f"[CELERY_TASK] 번역 작업 처리 중 오류 - job_id: {job_id}, error: {str(e)}")
+        # 재시도
+        raise self.retry(exc=e)
@@ -3,12 +3,13 @@ from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
 from .views.auth_views import get_translations, GoogleOAuthView, get_google_oauth_config, AppleOAuthView, register_user, login_user, logout_view, check_auth_status, get_csrf_token, test_csrf, test_redirect_response
 from .views.study_views import StudyViewSet, StudyTaskViewSet, MemberViewSet, download_study_excel, upload_study_excel, create_join_request, get_study_join_requests, respond_to_join_request, cancel_join_request, get_user_join_requests, delete_user_study_join_request, translate_text, update_user_language
-from .views.question_views import upload_questions, get_questions, get_question_statistics_by_title, bulk_update_question_group, get_ignored_questions, get_question, delete_question, get_question_original_exams, ignore_question, unignore_question, check_question_ignored, update_question, check_existing_file, text_to_questions
+from .views.question_views import upload_questions, get_questions, get_question_statistics_by_title, get_question_translation_status, bulk_update_question_group, get_ignored_questions, get_question, delete_question, get_question_original_exams, ignore_question, unignore_question, check_question_ignored, update_question, check_existing_file, text_to_questions
 from .views.study_progress_views import record_study_progress, get_study_progress_history, get_study_time_statistics
-from .views.user_data_views import export_user_data, list_question_files, download_question_file, delete_question_file, update_question_file, user_profile, change_language, UserCreateView, UserUpdateView, download_users_excel, upload_users_excel, delete_user, delete_users_bulk, delete_all_users, search_users, admin_change_user_password, fix_member_user_connections, create_random_recommendation_exam, get_random_recommendation_exam_questions, get_random_exam_email_users, get_users, get_user_profile, update_user_profile, send_email_verification_request, verify_email, manual_retention_cleanup, get_user_statistics_summary, reset_user_statistics, backup_user_statistics, delete_my_account, clear_all_cache, clear_study_cache
+from .views.user_data_views import export_user_data, get_export_job_status, download_export_file, list_question_files, download_question_file, delete_question_file, update_question_file, user_profile, change_language, UserCreateView, UserUpdateView, download_users_excel, upload_users_excel, delete_user, delete_users_bulk, delete_all_users, search_users, admin_change_user_password, fix_member_user_connections, create_random_recommendation_exam, get_random_recommendation_exam_questions, get_random_exam_email_users, get_users, get_user_profile, update_user_profile, send_email_verification_request, verify_email, manual_retention_cleanup, get_user_statistics_summary, reset_user_statistics, backup_user_statistics, delete_my_account, clear_all_cache, clear_study_cache
+from .views.translation_views import translation_jobs, get_translation_job_status, cancel_translation_job, resume_translation_job
 from .views.exam_views import create_single_question_exam, delete_question_results, delete_question_results_global, create_exam, get_exam, get_exam_questions, delete_exam, update_exam, update_exam_questions_from_excel, import_questions_from_connected_file, continue_exam, retake_exam, retake_wrong_questions, toggle_exam_original, add_question_to_exam, get_question_member_mappings, get_question_statistics, get_exam_list_for_move, move_questions_to_exam, create_question_member_mapping, get_exams, submit_exam, get_exam_results, exam_result_detail, save_random_practice_result, check_answer, download_exams_excel, upload_exams_excel, move_questions, copy_questions, delete_questions, get_or_create_favorite_exam, add_question_to_favorite, get_favorite_exam_questions, remove_question_from_favorite, get_or_create_daily_exam, adjust_question_accuracy, bulk_adjust_user_accuracy, adjust_single_question_accuracy, get_exam_results_summary, toggle_exam_subscription, bulk_toggle_exam_subscriptions, get_user_exam_subscriptions, get_user_my_exams, get_user_subscribed_exams, move_exams_to_subscribed, move_exams_to_my_exams, shuffle_subscribed_exams, get_exam_connected_studies, get_exam_tags, get_voice_interview_results, get_voice_interview_result_detail, share_voice_interview_result, delete_voice_interview_results, translate_exam, share_exam
 from .views.realtime_views import create_realtime_session, get_session_info, get_websocket_url, delete_realtime_session, handle_realtime_function_call, handle_webrtc_offer, handle_ice_candidate, request_speech, stop_speech, get_mandatory_rules_api, get_interview_prompt_template_api, chat_interview
-from .views.answer_evaluation_views import evaluate_answer
+from .views.answer_evaluation_views import evaluate_answer, answer_check_cache_stats
 from .views.health_views import health_check
 from .views.short_url_views import create_short_url_api, get_short_url_info, get_user_short_urls, delete_short_url, redirect_short_url
 from .views.leetcode_parser_views import parse_leetcode_problems, generate_questions_from_leetcode
@@ -28,6 +29,7 @@ urlpatterns = [
     path('questions/statistics-by-title/<str:title>/', get_question_statistics_by_title, name='get_question_statistics_by_title'),
     path('questions/bulk-update-group/', bulk_update_question_group, name='bulk_update_question_group'),
     path('questions/ignored/', get_ignored_questions, name='get_ignored_questions'),
+    path('questions/translation-status/', get_question_translation_status, name='get_question_translation_status'),
     path('questions/<str:question_id>/', get_question, name='get_question'),
     path('questions/<str:question_id>/update/', update_question, name='update_question'),
     path('questions/<str:question_id>/delete/', delete_question, name='delete_question'),
@@ -35,6 +37,12 @@ urlpatterns = [
     path('record-study-progress/', record_study_progress, name='record_study_progress'),
     path('study-progress-history/<int:study_id>/', get_study_progress_history, name='get_study_progress_history'),
     path('export-user-data/', export_user_data, name='export_user_data'),
+    path('exports/<str:job_id>/', get_export_job_status, name='get_export_job_status'),
+    path('exports/<str:job_id>/download/', download_export_file, name='download_export_file'),
+    path('translation-jobs/', translation_jobs, name='translation_jobs'),
+    path('translation-jobs/<uuid:job_id>/', get_translation_job_status, name='get_translation_job_status'),
+    path('translation-jobs/<uuid:job_id>/cancel/', cancel_translation_job, name='cancel_translation_job'),
+    path('translation-jobs/<uuid:job_id>/resume/', resume_translation_job, name='resume_translation_job'),
     path('study-time-statistics/<int:study_id>/', get_study_time_statistics, name='get_study_time_statistics'),
     path('create-single-question-exam/', create_single_question_exam, name='create_single_question_exam'),
     path('delete-question-results/', delete_question_results, name='delete_question_results'),
@@ -170,6 +178,7 @@ urlpatterns = [
     path('chat/interview/', chat_interview, name='chat_interview'),
     # 답변 평가 관련 URL
     path('evaluate-answer/', evaluate_answer, name='evaluate_answer'),
+    path('answer-check/cache-stats/', answer_check_cache_stats, name='answer_check_cache_stats'),
     # 단축 URL 관련 URL
     path('short-url/create/', create_short_url_api, name='create_short_url'),
     path('short-url/<str:short_code>/', get_short_url_info, name='get_short_url_info'),
@@ -0,0 +1,325 @@
+"""
+답안 판정 캐시 유틸리티
+
+check_answer_with_ai와 evaluate_answer가 정확히 일치하지 않는 답안마다 LLM을 호출하던 방식에
+판정 캐시와 유사도 사전 판정을 앞단에 둔다. (많은 학습자가 같은 문제에 거의 같은 답을 입력함)
+1. normalize_answer(): Unicode NFKC, 대소문자(casefold), 문장부호, 공백 차이를 정규화
+   - 의미가 있는 기호(C#, C++, 50%, 3.14 등)와 토큰 앞의 부호/부정 기호(-5, !flag, ~mask)는 유지
+2. 정규화한 답안이 같으면 바로 정답, 토큰별 철자 차이만 있으면(fuzzy_match) LLM 없이 정답으로 판정
+   - 토큰 수가 같고 각 토큰이 한 글자 이내 차이(오타/전치)인 경우만 해당
+   - 앞부분이 다른 토큰(synchronous/asynchronous, supervised/unsupervised 등 접두어 부정)은 제외
+   - 정답으로만 판정하며 숫자가 다르거나 짧은 답안, 엄격한 난이도(evaluate)는 LLM으로 넘김
+3. LLM 판정 결과(is_correct/confidence/reason/provider)는
+   (문제 ID, 정규화한 정답/문제 조건, 정규화한 사용자 답안, 언어)를 키로 캐시에 저장
+4. get_stats(): 조회/적중/미스/사전 판정 건수와 적중률
+
+설정 (settings, 선택):
+    ANSWER_CHECK_CACHE_TIMEOUT = 30일
+    ANSWER_CHECK_FUZZY_THRESHOLD = 0.92  # 0 또는 None이면 유사도 사전 판정 사용 안 함
+"""
+import difflib
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'answer_verdict'
+CACHE_VERSION_KEY = f'{CACHE_PREFIX}:version'
+STATS_KEY_PREFIX = f'{CACHE_PREFIX}:stats'
+DEFAULT_CACHE_TIMEOUT = 86400 * 30  # 30일
+DEFAULT_FUZZY_THRESHOLD = 0.92
+FUZZY_MIN_LENGTH = 8  # 이보다 짧은 답안은 한 글자 차이도 의미가 달라질 수 있으므로 유사도 판정 제외
+FUZZY_MIN_TOKEN_LENGTH = 5  # 이보다 짧은 토큰은 정확히 일치해야 함
+FUZZY_MAX_TOKEN_EDITS = 1  # 토큰별 허용 편집 거리 (삽입/삭제/치환/인접 전치)
+FUZZY_PREFIX_LENGTH = 2  # 접두어(un-, a-, de-, non-, in- 등) 차이를 막기 위해 일치해야 하는 앞 글자 수
+FUZZY_MAX_EXAM_DIFFICULTY = 6  # evaluate_answer: 엄격한 난이도(7 이상)에서는 철자 차이도 LLM이 판단
+
+KIND_CHECK = 'check'  # check_answer_with_ai
+KIND_EVALUATE = 'evaluate'  # evaluate_answer
+
+PROVIDER_EXACT_MATCH = 'exact_match'
+PROVIDER_FUZZY_MATCH = 'fuzzy_match'
+
+STAT_NAMES = ('lookups', 'hits', 'misses', 'stores', 'exact_matches', 'fuzzy_matches')
+
+# 문장부호 중 답안의 의미를 바꾸는 기호 (제거하지 않음)
+_SIGNIFICANT_PUNCTUATION = set('#%&@*/\\_')
+# 토큰 앞에 붙으면 부호/부정을 뜻하는 기호 (-5, -273.15, !flag, ~mask)
+_PREFIX_OPERATORS = set('-!~')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+(?:[.,]\d+)*')
+
+
+def normalize_answer(text) -> str:
+    """
+    답안을 비교/캐시 키용으로 정규화합니다.
+
+    NFKC 정규화 → casefold → 문장부호를 공백으로 (의미 있는 기호, 숫자 사이의 . , 와
+    토큰 앞의 - ! ~ 는 유지) → 공백 정리
+    """
+    if not isinstance(text, str):
+        return ''
+    text = unicodedata.normalize('NFKC', text).casefold()
+
+    chars = []
+    for index, char in enumerate(text):
+        if unicodedata.category(char).startswith('P') and char not in _SIGNIFICANT_PUNCTUATION:
+            previous = text[index - 1] if index > 0 else ''
+            following = text[index + 1:index + 3]
+            # 3.14, 1,000 처럼 숫자 사이의 소수점/자릿수 구분 기호와 -.5 의 소수점은 유지
+            is_numeric_separator = (
+                char in '.,'
+                and following[:1].isdigit()
+                and (previous.isdigit() or (char == '.' and previous in _PREFIX_OPERATORS and chars[-1:] == [previous]))
+            )
+            # -5 와 5, !flag 와 flag 는 다른 답이므로 토큰 앞의 부호/부정 기호는 유지
+            # (load-balancer 처럼 단어 사이의 하이픈은 공백으로 정규화)
+            is_prefix_operator = (
+                char in _PREFIX_OPERATORS
+                and not previous.isalnum()
+                and (following[:1].isalnum() or (following[:1] == '.' and following[1:].isdigit()))
+            )
+            if not (is_numeric_separator or is_prefix_operator):
+                chars.append(' ')
+                continue
+        chars.append(char)
+    return _WHITESPACE_RE.sub(' ', ''.join(chars)).strip()
+
+
+def token_set_similarity(normalized_a: str, normalized_b: str) -> float:
+    """
+    정규화한 두 답안의 토큰 집합 유사도 (0.0 ~ 1.0)
+
+    토큰 순서와 중복을 무시하고 정렬한 토큰 문자열을 비교한다.
+    한쪽 토큰이 다른 쪽에 모두 포함되는 경우("paris" / "not paris")를 일치로 보지 않도록
+    교집합만 비교하지 않고 전체 토큰 문자열끼리 비교한다.
+    """
+    tokens_a = ' '.join(sorted(set(normalized_a.split())))
+    tokens_b = ' '.join(sorted(set(normalized_b.split())))
+    if not tokens_a or not tokens_b:
+        return 0.0
+    if tokens_a == tokens_b:
+        return 1.0
+    return difflib.SequenceMatcher(None, tokens_a, tokens_b, autojunk=False).ratio()
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """인접 전치를 한 번의 편집으로 보는 편집 거리 (limit을 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def _is_token_typo(a: str, b: str) -> bool:
+    """
+    두 토큰이 같은 단어의 오타인지 확인
+
+    접두어 차이는 의미를 뒤집는 경우가 많으므로(asynchronous/synchronous, unsupervised/supervised,
+    deserialization/serialization, increment/decrement) 앞 글자가 다르면 오타로 보지 않는다.
+    """
+    if a == b:
+        return True
+    if min(len(a), len(b)) < FUZZY_MIN_TOKEN_LENGTH:
+        return False
+    if a[:FUZZY_PREFIX_LENGTH] != b[:FUZZY_PREFIX_LENGTH]:
+        return False
+    return _edit_distance(a, b, FUZZY_MAX_TOKEN_EDITS) <= FUZZY_MAX_TOKEN_EDITS
+
+
+def tokens_match_with_typos(normalized_a: str, normalized_b: str) -> bool:
+    """
+    두 답안의 토큰이 순서와 관계없이 1:1로 대응하고 각 쌍이 오타 수준 차이인지 확인
+
+    토큰 수가 다르면("paris" / "not paris") 일치로 보지 않는다.
+    """
+    tokens_a = sorted(set(normalized_a.split()))
+    tokens_b = sorted(set(normalized_b.split()))
+    if not tokens_a or len(tokens_a) != len(tokens_b):
+        return False
+
+    unmatched_b = [token for token in tokens_b if token not in tokens_a]
+    for token in (token for token in tokens_a if token not in tokens_b):
+        match = next((candidate for candidate in unmatched_b if _is_token_typo(token, candidate)), None)
+        if match is None:
+            return False
+        unmatched_b.remove(match)
+    return True
+
+
+def _get_fuzzy_threshold():
+    return getattr(settings, 'ANSWER_CHECK_FUZZY_THRESHOLD', DEFAULT_FUZZY_THRESHOLD)
+
+
+def precheck_answer(user_answer: str, correct_answer: str, kind: str = KIND_CHECK,
+                    allow_fuzzy: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    LLM 없이 판정할 수 있는 명백한 정답을 판정합니다.
+
+    Args:
+        allow_fuzzy: False면 정규화 후 정확히 일치하는 경우만 판정 (엄격한 난이도 평가 등)
+
+    Returns:
+        Dict: check_answer_with_ai와 같은 형식의 판정 (판정할 수 없으면 None - LLM으로 판단)
+    """
+    normalized_user = normalize_answer(user_answer)
+    normalized_correct = normalize_answer(correct_answer)
+    if not normalized_user or not normalized_correct:
+        return None
+
+    if normalized_user == normalized_correct:
+        record_stat(kind, 'exact_matches')
+        return {
+            'is_correct': True,
+            'confidence': 1.0,
+            'reason': '답안이 정확히 일치합니다.',
+            'provider': PROVIDER_EXACT_MATCH,
+        }
+
+    threshold = _get_fuzzy_threshold()
+    if not allow_fuzzy or not threshold or min(len(normalized_user), len(normalized_correct)) < FUZZY_MIN_LENGTH:
+        return None
+    # 숫자가 다르면 (연도, 수량 등) 철자 차이가 아니므로 LLM으로 판단
+    if _DIGITS_RE.findall(normalized_user) != _DIGITS_RE.findall(normalized_correct):
+        return None
+
+    similarity = token_set_similarity(normalized_user, normalized_correct)
+    if similarity < threshold or not tokens_match_with_typos(normalized_user, normalized_correct):
+        return None
+
+    record_stat(kind, 'fuzzy_matches')
+    return {
+        'is_correct': True,
+        'confidence': round(similarity, 3),
+        'reason': '답안이 정답과 거의 일치합니다. (철자/어순 차이)',
+        'provider': PROVIDER_FUZZY_MATCH,
+    }
+
+
+# ----- 판정 캐시 -----
+
+def _hash(*parts) -> str:
+    return hashlib.sha256('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def _get_cache_version() -> int:
+    try:
+        return cache.get(CACHE_VERSION_KEY) or 1
+    except Exception:
+        return 1
+
+
+def make_verdict_key(kind: str, user_answer: str, correct_answer: str, language: str,
+                     question_id=None, context=None) -> str:
+    """
+    판정 캐시 키
+
+    문제 ID와 함께 정규화한 정답(과 evaluate의 문제/난이도 같은 판정 조건)을 키에 포함하여
+    정답이 수정되면 이전 판정을 사용하지 않는다.
+    """
+    scope = _hash(kind, question_id or '', normalize_answer(correct_answer), context or '')
+    return (
+        f"{CACHE_PREFIX}:v{_get_cache_version()}:{kind}:{question_id or '-'}:{language}:"
+        f"{scope[:16]}:{_hash(normalize_answer(user_answer))}"
+    )
+
+
+def get_verdict(kind: str, user_answer: str, correct_answer: str, language: str,
+                question_id=None, context=None) -> Optional[Dict[str, Any]]:
+    """캐시된 판정 조회 (없으면 None)"""
+    record_stat(kind, 'lookups')
+    try:
+        verdict = cache.get(make_verdict_key(kind, user_answer, correct_answer, language, question_id, context))
+    except Exception as e:
+        logger.warning(f"[ANSWER_VERDICT_CACHE] 캐시 조회 실패: {e}")
+        verdict = None
+
+    record_stat(kind, 'hits' if verdict else 'misses')
+    if verdict:
+        return {**verdict, 'cached': True}
+    return None
+
+
+def set_verdict(kind: str, user_answer: str, correct_answer: str, language: str, verdict: Dict[str, Any],
+                question_id=None, context=None) -> None:
+    """LLM 판정 저장 (제공자 없이 실패한 판정은 저장하지 않음)"""
+    if not verdict or not verdict.get('provider'):
+        return
+    entry = {
+        'is_correct': bool(verdict.get('is_correct')),
+        'confidence': verdict.get('confidence'),
+        'reason': verdict.get('reason', ''),
+        'provider': verdict['provider'],
+    }
+    try:
+        cache.set(
+            make_verdict_key(kind, user_answer, correct_answer, language, question_id, context),
+            entry,
+            getattr(settings, 'ANSWER_CHECK_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT),
+        )
+        record_stat(kind, 'stores')
+    except Exception as e:
+        logger.warning(f"[ANSWER_VERDICT_CACHE] 캐시 저장 실패: {e}")
+
+
+def clear() -> None:
+    """캐시 버전을 올려 기존 판정을 모두 무효화하고 통계를 초기화합니다."""
+    try:
+        cache.set(CACHE_VERSION_KEY, _get_cache_version() + 1, None)
+        cache.delete_many([f'{STATS_KEY_PREFIX}:{kind}:{name}' for kind in (KIND_CHECK, KIND_EVALUATE) for name in STAT_NAMES])
+    except Exception as e:
+        logger.warning(f"[ANSWER_VERDICT_CACHE] 캐시 정리 실패: {e}")
+    logger.info("[ANSWER_VERDICT_CACHE] 답안 판정 캐시 정리")
+
+
+# ----- 적중률 통계 -----
+
+def record_stat(kind: str, name: str) -> None:
+    key = f'{STATS_KEY_PREFIX}:{kind}:{name}'
+    try:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+    except Exception:
+        pass
+
+
+def get_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    판정 종류별 캐시 통계
+
+    Returns:
+        Dict: {kind: {lookups, hits, misses, stores, exact_matches, fuzzy_matches,
+                      hit_rate(캐시 조회 중 적중 비율), llm_avoided_rate(전체 판정 중 LLM을 호출하지 않은 비율)}}
+    """
+    keys = [f'{STATS_KEY_PREFIX}:{kind}:{name}' for kind in (KIND_CHECK, KIND_EVALUATE) for name in STAT_NAMES]
+    try:
+        values = cache.get_many(keys)
+    except Exception:
+        values = {}
+
+    stats = {}
+    for kind in (KIND_CHECK, KIND_EVALUATE):
+        counts = {name: values.get(f'{STATS_KEY_PREFIX}:{kind}:{name}', 0) for name in STAT_NAMES}
+        prechecked = counts['exact_matches'] + counts['fuzzy_matches']
+        total = counts['lookups'] + prechecked
+        counts['hit_rate'] = round(counts['hits'] / counts['lookups'], 4) if counts['lookups'] else 0.0
+        counts['llm_avoided_rate'] = round((counts['hits'] + prechecked) / total, 4) if total else 0.0
+        stats[kind] = counts
+    return stats
@@ -8,35 +8,249 @@ Redis를 활용한 고급 캐싱 전략
 4. 스터디 생성/삭제/수정 시: invalidate_all_study_cache() 호출
 5. 특정 스터디 관련: invalidate_study_cache(study_id) 호출
 6. 사용자별 스터디: invalidate_user_study_cache(user_id) 호출
-7. 폴백 메커니즘: Redis 패턴 매칭 실패 시 로컬 캐시 클리어
+
+세대(generation) 카운터 기반 무효화:
+- 전체/사용자별/시험(스터디)별 버전 번호를 캐시 키에 포함
+- 무효화는 해당 버전 번호를 INCR 하는 O(1) 연산 (키스페이스 SCAN 없음)
+- 이전 버전 키는 더 이상 조회되지 않으며 TTL로 자연 만료
+
+스탬피드 방지 (SingleFlightCache):
+- 키별 락으로 한 요청만 다시 계산, 나머지는 이전 값(stale-while-revalidate) 또는 잠시 대기
+- 만료 전 확률적 조기 갱신(XFetch)으로 만료 시점 동시 재계산 완화
+
+2단계 캐시 (TwoTierCache):
+- 거의 바뀌지 않는 조회 값은 프로세스 내 LRU(TTL)가 Redis 앞단에서 응답
+- 삭제는 Redis pub/sub으로 모든 워커에 전파
 
 캐시 계층:
-- Redis 환경: delete_pattern을 사용한 효율적인 패턴 매칭
-- 로컬 환경: cache.clear()로 전체 캐시 클리어
+- Redis/로컬 메모리 캐시 모두 동일한 방식으로 동작
 - 타임아웃: 기본 5분, 상세 정보는 10분
 """
+import copy
 import json
 import hashlib
 from django.core.cache import cache
 from django.conf import settings
 from typing import Any, Dict, List, Optional, Union
 import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
 
+class CacheVersion:
+    """
+    세대(generation) 카운터 관리
+
+    범위(scope)별 버전 번호를 캐시에 저장하고, 캐시 키에 버전을 포함시켜
+    버전 증가만으로 해당 범위의 캐시를 무효화한다.
+    - 버전 키는 만료되지 않으며(timeout=None) 증가는 INCR 한 번
+    - 버전 키가 유실되면 현재 시각(ms)으로 다시 시작하여 이전 키와 겹치지 않음
+    """
+
+    KEY_PREFIX = "cache_version"
+
+    @classmethod
+    def _version_key(cls, scope: str) -> str:
+        return f"{cls.KEY_PREFIX}:{scope}"
+
+    @classmethod
+    def _initialize(cls, version_key: str) -> int:
+        """버전 키 초기화 (동시 초기화 시 먼저 저장된 값 사용)"""
+        initial = int(time.time() * 1000)
+        cache.add(version_key, initial, None)
+        current = cache.get(version_key)
+        return int(current) if current is not None else initial
+
+    @classmethod
+    def get_many(cls, scopes: List[str]) -> Dict[str, int]:
+        """여러 범위의 현재 버전을 한 번에 조회"""
+        version_keys = {cls._version_key(scope): scope for scope in scopes}
+        try:
+            found = cache.get_many(list(version_keys))
+        except Exception as e:
+            logger.warning(f"캐시 버전 조회 실패: {e}")
+            found = {}
+
+        versions = {}
+        for version_key, scope in version_keys.items():
+            version = found.get(version_key)
+            if version is None:
+                version = cls._initialize(version_key)
+            versions[scope] = int(version)
+        return versions
+
+    @classmethod
+    def get(cls, scope: str) -> int:
+        """범위의 현재 버전 조회"""
+        return cls.get_many([scope])[scope]
+
+    @classmethod
+    def bump(cls, scope: str) -> int:
+        """범위의 버전을 증가시켜 해당 범위의 캐시를 무효화"""
+        version_key = cls._version_key(scope)
+        try:
+            return cache.incr(version_key)
+        except ValueError:
+            # 버전 키가 없으면 초기화 후 증가
+            cls._initialize(version_key)
+            return cache.incr(version_key)
+
+    @staticmethod
+    def format(versions: Dict[str, int], scopes: List[str]) -> str:
+        """키에 포함할 버전 문자열 생성"""
+        return "v" + ".".join(str(versions[scope]) for scope in scopes)
+
+
+class SingleFlightCache:
+    """
+    캐시 스탬피드 방지 (single-flight)
+
+    캐시 값을 만료 정보와 함께 봉투(envelope)로 저장하고, 다시 계산할 때는 키별 락을
+    잡은 요청 하나만 계산하도록 한다.
+    - 만료 전: 확률적 조기 갱신(XFetch) - 만료가 가까울수록, 계산이 오래 걸릴수록
+      한 요청이 먼저 락을 잡고 갱신 (나머지는 기존 값 사용)
+    - 만료 후 STALE_TTL 동안: 락을 잡은 요청만 다시 계산하고 나머지는 이전 값 사용
+      (stale-while-revalidate)
+    - 값이 없을 때: 락을 잡은 요청만 계산하고 나머지는 WAIT_TIMEOUT 동안 채워지기를 기다림
+
+    lookup()이 None을 반환하면 호출자가 계산 후 store()를 호출해야 하며,
+    store()가 락을 해제한다. 저장하지 않고 끝나면(계산 실패, 잘못된 요청 등) release()를 호출한다.
+    (호출하지 않아도 락은 LOCK_TIMEOUT 후 자동 해제된다)
+    """
+
+    ENVELOPE_MARKER = '__single_flight__'
+    LOCK_TIMEOUT = 15     # 락 최대 유지 시간 (초)
+    STALE_TTL = 300       # 만료 후 이전 값을 제공할 수 있는 시간 (초)
+    WAIT_TIMEOUT = 2.0    # 값이 없을 때 다른 요청의 계산을 기다리는 최대 시간 (초)
+    WAIT_INTERVAL = 0.05  # 대기 중 캐시 재확인 간격 (초)
+    BETA = 1.0            # 조기 갱신 민감도 (클수록 일찍 갱신)
+
+    @staticmethod
+    def _lock_key(cache_key: str) -> str:
+        return f"{cache_key}:lock"
+
+    @classmethod
+    def _acquire(cls, cache_key: str) -> bool:
+        """키별 계산 락 획득 (값에는 획득 시각을 저장하여 계산 시간 측정에 사용)"""
+        return cache.add(cls._lock_key(cache_key), time.time(), cls.LOCK_TIMEOUT)
+
+    @classmethod
+    def _unwrap(cls, entry: Any):
+        """봉투에서 (값, 만료 시각, 계산 시간) 추출 (봉투가 아니면 만료 없는 값으로 취급)"""
+        if isinstance(entry, dict) and entry.get(cls.ENVELOPE_MARKER):
+            return entry.get('value'), entry.get('expires_at', 0), entry.get('delta', 0)
+        return entry, float('inf'), 0
+
+    @classmethod
+    def _should_refresh_early(cls, expires_at: float, delta: float, now: float) -> bool:
+        """XFetch: now - delta * beta * ln(rand) >= expires_at 이면 조기 갱신"""
+        if delta <= 0:
+            return now >= expires_at
+        return now - delta * cls.BETA * math.log(random.random() or 1e-12) >= expires_at
+
+    @classmethod
+    def lookup(cls, cache_key: str) -> Optional[Any]:
+        """
+        캐시 조회. None이면 호출자가 계산 후 store()를 호출해야 한다.
+        """
+        entry = cache.get(cache_key)
+        if entry is not None:
+            value, expires_at, delta = cls._unwrap(entry)
+            if not cls._should_refresh_early(expires_at, delta, time.time()):
+                return value
+            # 만료(또는 조기 갱신 대상): 락을 잡은 요청만 다시 계산하고 나머지는 이전 값 사용
+            if cls._acquire(cache_key):
+                logger.debug(f"캐시 갱신 락 획득 (stale/early refresh): {cache_key}")
+                return None
+            return value
+
+        if cls._acquire(cache_key):
+            return None
+
+        # 다른 요청이 계산 중이면 값이 채워질 때까지 잠시 대기
+        deadline = time.time() + cls.WAIT_TIMEOUT
+        while time.time() < deadline:
+            time.sleep(cls.WAIT_INTERVAL)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                return cls._unwrap(entry)[0]
+        logger.warning(f"캐시 계산 대기 시간 초과, 직접 계산: {cache_key}")
+        return None
+
+    @classmethod
+    def store(cls, cache_key: str, value: Any, timeout: int) -> None:
+        """값을 봉투로 저장하고 계산 락 해제"""
+        now = time.time()
+        lock_key = cls._lock_key(cache_key)
+        locked_at = cache.get(lock_key)
+        try:
+            delta = max(now - float(locked_at), 0) if locked_at is not None else 0
+        except (TypeError, ValueError):
+            delta = 0
+        envelope = {
+            cls.ENVELOPE_MARKER: 1,
+            'value': value,
+            'expires_at': now + timeout,
+            'delta': delta,
+        }
+        cache.set(cache_key, envelope, timeout + cls.STALE_TTL)
+        cache.delete(lock_key)
+
+    @classmethod
+    def release(cls, cache_key: str) -> None:
+        """값을 저장하지 않을 때 계산 락만 해제"""
+        cache.delete(cls._lock_key(cache_key))
+
+    @classmethod
+    def get_or_compute(cls, cache_key: str, compute, timeout: int) -> Any:
+        """조회 후 필요한 경우에만 계산하여 저장"""
+        value = cls.lookup(cache_key)
+        if value is not None:
+            return value
+        try:
+            value = compute()
+        except BaseException:
+            cls.release(cache_key)
+            raise
+        try:
+            cls.store(cache_key, value, timeout)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패: {e}")
+        return value
+
+
 class StudyCacheManager:
     """스터디 데이터 캐싱을 위한 전용 매니저"""
     
     CACHE_PREFIX = "study"
     CACHE_TIMEOUT = 300  # 5분
+
+    @classmethod
+    def _all_scope(cls) -> str:
+        return f"{cls.CACHE_PREFIX}:all"
+
+    @classmethod
+    def _user_scope(cls, user_id: Union[int, str]) -> str:
+        return f"{cls.CACHE_PREFIX}:user:{user_id}"
+
+    @classmethod
+    def _study_scope(cls, study_id: Union[int, str]) -> str:
+        return f"{cls.CACHE_PREFIX}:study:{study_id}"
     
     @classmethod
     def get_cache_key(cls, user_id: Union[int, str], **filters) -> str:
-        """캐시 키 생성"""
+        """캐시 키 생성 (전체/사용자 버전 포함)"""
         # 필터 파라미터를 정렬하여 일관된 키 생성
         filter_str = "_".join([f"{k}_{v}" for k, v in sorted(filters.items()) if v is not None])
-        return f"{cls.CACHE_PREFIX}_{user_id}_{filter_str}"
+        scopes = [cls._all_scope(), cls._user_scope(user_id)]
+        version = CacheVersion.format(CacheVersion.get_many(scopes), scopes)
+        return f"{cls.CACHE_PREFIX}_{user_id}_{version}_{filter_str}"
     
     @classmethod
     def get_study_list_cache_key(cls, user_id: Union[int, str], study_type: str = 'all', 
@@ -46,16 +260,25 @@ class StudyCacheManager:
     
     @classmethod
     def get_study_detail_cache_key(cls, study_id: int, user_id: Union[int, str]) -> str:
-        """스터디 상세 정보 캐시 키 생성"""
-        return f"{cls.CACHE_PREFIX}_detail_{study_id}_{user_id}"
-    
+        """스터디 상세 정보 캐시 키 생성 (전체/스터디/사용자 버전 포함)"""
+        scopes = [cls._all_scope(), cls._study_scope(study_id), cls._user_scope(user_id)]
+        version = CacheVersion.format(CacheVersion.get_many(scopes), scopes)
+        return f"{cls.CACHE_PREFIX}_detail_{study_id}_{user_id}_{version}"
+
+    @classmethod
+    def get_study_stats_cache_key(cls, study_id: int, user_id: Union[int, str], period: str = 'all') -> str:
+        """스터디 통계(진행률/공부시간) 캐시 키 생성 (전체/스터디/사용자 버전 포함)"""
+        scopes = [cls._all_scope(), cls._study_scope(study_id), cls._user_scope(user_id)]
+        version = CacheVersion.format(CacheVersion.get_many(scopes), scopes)
+        return f"{cls.CACHE_PREFIX}_stats_{study_id}_{user_id}_{version}_{period}"
+
     @classmethod
     def set_study_list_cache(cls, user_id: Union[int, str], data: Dict, 
                            study_type: str = 'all', is_public: str = 'all') -> bool:
         """스터디 목록 캐시 저장"""
         try:
             cache_key = cls.get_study_list_cache_key(user_id, study_type, is_public)
-            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            SingleFlightCache.store(cache_key, data, cls.CACHE_TIMEOUT)
             logger.info(f"스터디 목록 캐시 저장 성공: {cache_key}")
             return True
         except Exception as e:
@@ -68,8 +291,9 @@ class StudyCacheManager:
         """스터디 목록 캐시 조회"""
         try:
             cache_key = cls.get_study_list_cache_key(user_id, study_type, is_public)
-            cached_data = cache.get(cache_key)
-            if cached_data:
+            # 값이 없거나 갱신이 필요하면 락을 잡은 요청만 None을 받아 다시 계산
+            cached_data = SingleFlightCache.lookup(cache_key)
+            if cached_data is not None:
                 logger.info(f"스터디 목록 캐시 히트: {cache_key}")
                 return cached_data
             logger.debug(f"스터디 목록 캐시 미스: {cache_key}")
@@ -78,12 +302,34 @@ class StudyCacheManager:
             logger.error(f"스터디 목록 캐시 조회 실패: {e}")
             return None
     
+    @classmethod
+    def get_cache_by_key(cls, cache_key: str) -> Optional[Any]:
+        """get_cache_key로 만든 키로 캐시 조회 (StudyViewSet.list 등)"""
+        try:
+            cached_data = SingleFlightCache.lookup(cache_key)
+            if cached_data is not None:
+                logger.info(f"스터디 캐시 히트: {cache_key}")
+            return cached_data
+        except Exception as e:
+            logger.error(f"스터디 캐시 조회 실패: {e}")
+            return None
+    
+    @classmethod
+    def set_cache_by_key(cls, cache_key: str, data: Any, timeout: Optional[int] = None) -> bool:
+        """get_cache_key로 만든 키로 캐시 저장 (계산 락 해제 포함)"""
+        try:
+            SingleFlightCache.store(cache_key, data, timeout or cls.CACHE_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.error(f"스터디 캐시 저장 실패: {e}")
+            return False
+    
     @classmethod
     def set_study_detail_cache(cls, study_id: int, user_id: Union[int, str], data: Dict) -> bool:
         """스터디 상세 정보 캐시 저장"""
         try:
             cache_key = cls.get_study_detail_cache_key(study_id, user_id)
-            cache.set(cache_key, data, cls.CACHE_TIMEOUT * 2)  # 상세 정보는 더 오래 캐시
+            SingleFlightCache.store(cache_key, data, cls.CACHE_TIMEOUT * 2)  # 상세 정보는 더 오래 캐시
             logger.info(f"스터디 상세 정보 캐시 저장 성공: {cache_key}")
             return True
         except Exception as e:
@@ -95,8 +341,9 @@ class StudyCacheManager:
         """스터디 상세 정보 캐시 조회"""
         try:
             cache_key = cls.get_study_detail_cache_key(study_id, user_id)
-            cached_data = cache.get(cache_key)
-            if cached_data:
+            # 값이 없거나 갱신이 필요하면 락을 잡은 요청만 None을 받아 다시 계산
+            cached_data = SingleFlightCache.lookup(cache_key)
+            if cached_data is not None:
                 logger.info(f"스터디 상세 정보 캐시 히트: {cache_key}")
                 return cached_data
             logger.debug(f"스터디 상세 정보 캐시 미스: {cache_key}")
@@ -109,15 +356,8 @@ class StudyCacheManager:
     def invalidate_user_study_cache(cls, user_id: Union[int, str]) -> bool:
         """사용자의 모든 스터디 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 사용자 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                pattern = f"{cls.CACHE_PREFIX}_{user_id}_*"
-                cache.delete_pattern(pattern)
-                logger.info(f"사용자 스터디 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            version = CacheVersion.bump(cls._user_scope(user_id))
+            logger.info(f"사용자 스터디 캐시 무효화 성공: {cls._user_scope(user_id)} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"사용자 스터디 캐시 무효화 실패: {e}")
@@ -127,21 +367,10 @@ class StudyCacheManager:
     def invalidate_study_cache(cls, study_id: int) -> bool:
         """특정 스터디 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 스터디 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                # StudyViewSet에서 생성하는 캐시 키 패턴들
-                patterns = [
-                    "studies_*",  # StudyViewSet.list에서 생성하는 캐시
-                    f"{cls.CACHE_PREFIX}_*",  # StudyCacheManager에서 생성하는 캐시
-                ]
-                
-                for pattern in patterns:
-                    cache.delete_pattern(pattern)
-                    logger.info(f"스터디 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            # 스터디 상세 캐시와, 해당 스터디가 포함된 모든 목록 캐시 무효화
+            CacheVersion.bump(cls._study_scope(study_id))
+            version = CacheVersion.bump(cls._all_scope())
+            logger.info(f"스터디 캐시 무효화 성공: {cls._study_scope(study_id)}, {cls._all_scope()} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"스터디 캐시 무효화 실패: {e}")
@@ -151,21 +380,8 @@ class StudyCacheManager:
     def invalidate_all_study_cache(cls) -> bool:
         """모든 스터디 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 모든 스터디 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                # StudyViewSet에서 생성하는 캐시 키 패턴들
-                patterns = [
-                    "studies_*",  # StudyViewSet.list에서 생성하는 캐시
-                    f"{cls.CACHE_PREFIX}_*",  # StudyCacheManager에서 생성하는 캐시
-                ]
-                
-                for pattern in patterns:
-                    cache.delete_pattern(pattern)
-                    logger.debug(f"모든 스터디 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            version = CacheVersion.bump(cls._all_scope())
+            logger.debug(f"모든 스터디 캐시 무효화 성공: {cls._all_scope()} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"모든 스터디 캐시 무효화 실패: {e}")
@@ -177,13 +393,27 @@ class ExamCacheManager:
     
     CACHE_PREFIX = "exam"
     CACHE_TIMEOUT = 300  # 5분
+
+    @classmethod
+    def _all_scope(cls) -> str:
+        return f"{cls.CACHE_PREFIX}:all"
+
+    @classmethod
+    def _user_scope(cls, user_id: Union[int, str]) -> str:
+        return f"{cls.CACHE_PREFIX}:user:{user_id}"
+
+    @classmethod
+    def _exam_scope(cls, exam_id: str) -> str:
+        return f"{cls.CACHE_PREFIX}:exam:{exam_id}"
     
     @classmethod
     def get_cache_key(cls, user_id: Union[int, str], **filters) -> str:
-        """캐시 키 생성"""
+        """캐시 키 생성 (전체/사용자 버전 포함)"""
         # 필터 파라미터를 정렬하여 일관된 키 생성
         filter_str = "_".join([f"{k}_{v}" for k, v in sorted(filters.items()) if v is not None])
-        return f"{cls.CACHE_PREFIX}_{user_id}_{filter_str}"
+        scopes = [cls._all_scope(), cls._user_scope(user_id)]
+        version = CacheVersion.format(CacheVersion.get_many(scopes), scopes)
+        return f"{cls.CACHE_PREFIX}_{user_id}_{version}_{filter_str}"
     
     @classmethod
     def get_exam_list_cache_key(cls, user_id: Union[int, str], page: int = 1, 
@@ -193,8 +423,10 @@ class ExamCacheManager:
     
     @classmethod
     def get_exam_detail_cache_key(cls, exam_id: str, user_id: Union[int, str]) -> str:
-        """시험 상세 정보 캐시 키 생성"""
-        return f"{cls.CACHE_PREFIX}_detail_{exam_id}_{user_id}"
+        """시험 상세 정보 캐시 키 생성 (전체/시험/사용자 버전 포함)"""
+        scopes = [cls._all_scope(), cls._exam_scope(exam_id), cls._user_scope(user_id)]
+        version = CacheVersion.format(CacheVersion.get_many(scopes), scopes)
+        return f"{cls.CACHE_PREFIX}_detail_{exam_id}_{user_id}_{version}"
     
     @classmethod
     def set_exam_list_cache(cls, user_id: Union[int, str], data: Dict, 
@@ -202,21 +434,31 @@ class ExamCacheManager:
         """시험 목록 캐시 저장"""
         try:
             cache_key = cls.get_exam_list_cache_key(user_id, page, page_size, **filters)
-            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            SingleFlightCache.store(cache_key, data, cls.CACHE_TIMEOUT)
             logger.info(f"시험 목록 캐시 저장 성공: {cache_key}")
             return True
         except Exception as e:
             logger.error(f"시험 목록 캐시 저장 실패: {e}")
             return False
     
+    @classmethod
+    def release_exam_list_cache(cls, user_id: Union[int, str], page: int = 1,
+                               page_size: int = 20, **filters) -> None:
+        """캐시 미스 후 저장하지 않고 끝난 경우 계산 락 해제"""
+        try:
+            SingleFlightCache.release(cls.get_exam_list_cache_key(user_id, page, page_size, **filters))
+        except Exception as e:
+            logger.warning(f"시험 목록 캐시 락 해제 실패: {e}")
+
     @classmethod
     def get_exam_list_cache(cls, user_id: Union[int, str], page: int = 1, 
                            page_size: int = 20, **filters) -> Optional[Dict]:
         """시험 목록 캐시 조회"""
         try:
             cache_key = cls.get_exam_list_cache_key(user_id, page, page_size, **filters)
-            cached_data = cache.get(cache_key)
-            if cached_data:
+            # 값이 없거나 갱신이 필요하면 락을 잡은 요청만 None을 받아 다시 계산
+            cached_data = SingleFlightCache.lookup(cache_key)
+            if cached_data is not None:
                 logger.info(f"시험 목록 캐시 히트: {cache_key}")
                 return cached_data
             logger.debug(f"시험 목록 캐시 미스: {cache_key}")
@@ -230,7 +472,7 @@ class ExamCacheManager:
         """시험 상세 정보 캐시 저장"""
         try:
             cache_key = cls.get_exam_detail_cache_key(exam_id, user_id)
-            cache.set(cache_key, data, cls.CACHE_TIMEOUT * 2)  # 상세 정보는 더 오래 캐시
+            SingleFlightCache.store(cache_key, data, cls.CACHE_TIMEOUT * 2)  # 상세 정보는 더 오래 캐시
             logger.info(f"시험 상세 정보 캐시 저장 성공: {cache_key}")
             return True
         except Exception as e:
@@ -242,8 +484,9 @@ class ExamCacheManager:
         """시험 상세 정보 캐시 조회"""
         try:
             cache_key = cls.get_exam_detail_cache_key(exam_id, user_id)
-            cached_data = cache.get(cache_key)
-            if cached_data:
+            # 값이 없거나 갱신이 필요하면 락을 잡은 요청만 None을 받아 다시 계산
+            cached_data = SingleFlightCache.lookup(cache_key)
+            if cached_data is not None:
                 logger.info(f"시험 상세 정보 캐시 히트: {cache_key}")
                 return cached_data
             logger.debug(f"시험 상세 정보 캐시 미스: {cache_key}")
@@ -256,15 +499,8 @@ class ExamCacheManager:
     def invalidate_user_exam_cache(cls, user_id: Union[int, str]) -> bool:
         """사용자의 모든 시험 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 사용자 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                pattern = f"{cls.CACHE_PREFIX}_{user_id}_*"
-                cache.delete_pattern(pattern)
-                logger.info(f"사용자 시험 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            version = CacheVersion.bump(cls._user_scope(user_id))
+            logger.info(f"사용자 시험 캐시 무효화 성공: {cls._user_scope(user_id)} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"사용자 시험 캐시 무효화 실패: {e}")
@@ -274,15 +510,8 @@ class ExamCacheManager:
     def invalidate_exam_cache(cls, exam_id: str) -> bool:
         """특정 시험 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 시험 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                pattern = f"{cls.CACHE_PREFIX}_*_{exam_id}_*"
-                cache.delete_pattern(pattern)
-                logger.info(f"시험 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            version = CacheVersion.bump(cls._exam_scope(exam_id))
+            logger.info(f"시험 캐시 무효화 성공: {cls._exam_scope(exam_id)} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"시험 캐시 무효화 실패: {e}")
@@ -292,15 +521,8 @@ class ExamCacheManager:
     def invalidate_all_exam_cache(cls) -> bool:
         """모든 시험 관련 캐시 무효화"""
         try:
-            # Redis의 패턴 매칭을 사용하여 모든 시험 관련 캐시 삭제
-            if hasattr(cache, 'delete_pattern'):
-                pattern = f"{cls.CACHE_PREFIX}_*"
-                cache.delete_pattern(pattern)
-                logger.info(f"모든 시험 캐시 무효화 성공: {pattern}")
-            else:
-                # 로컬 캐시의 경우 전체 캐시 클리어
-                cache.clear()
-                logger.info(f"로컬 캐시 클리어 완료")
+            version = CacheVersion.bump(cls._all_scope())
+            logger.info(f"모든 시험 캐시 무효화 성공: {cls._all_scope()} -> v{version}")
             return True
         except Exception as e:
             logger.error(f"모든 시험 캐시 무효화 실패: {e}")
@@ -325,18 +547,22 @@ class CacheDecorator:
                     kwargs_str = "_".join([f"{k}_{v}" for k, v in sorted(kwargs.items())])
                     cache_key = f"{func_name}_{args_str}_{kwargs_str}"
                 
-                # 캐시에서 조회
-                cached_result = cache.get(cache_key)
+                # 캐시에서 조회 (값이 없거나 갱신이 필요하면 락을 잡은 요청만 계산)
+                cached_result = SingleFlightCache.lookup(cache_key)
                 if cached_result is not None:
                     logger.debug(f"캐시 히트: {cache_key}")
                     return cached_result
                 
-                # 함수 실행
-                result = func(*args, **kwargs)
+                # 함수 실행 (실패하면 다른 요청이 대기하지 않도록 계산 락 해제)
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException:
+                    SingleFlightCache.release(cache_key)
+                    raise
                 
-                # 결과 캐싱
+                # 결과 캐싱 (계산 락 해제 포함)
                 try:
-                    cache.set(cache_key, result, timeout)
+                    SingleFlightCache.store(cache_key, result, timeout)
                     logger.debug(f"캐시 저장: {cache_key}")
                 except Exception as e:
                     logger.warning(f"캐시 저장 실패: {e}")
@@ -346,6 +572,249 @@ class CacheDecorator:
         return decorator
 
 
+class TwoTierCache:
+    """
+    프로세스 내 LRU(TTL) 캐시 + Django 캐시(Redis) 2단계 캐시
+
+    거의 바뀌지 않는 조회 값(도메인 카테고리/태그 ID, 프롬프트 템플릿, 카테고리 하위 목록 등)을
+    워커 프로세스 메모리에 보관하여 요청마다 Redis를 거치지 않도록 한다.
+    - 로컬 캐시는 MAX_ENTRIES 개까지 LRU로 유지하며 항목별 TTL(LOCAL_TIMEOUT) 적용
+    - 삭제는 Redis pub/sub 채널로 전파되어 모든 gunicorn/daphne 워커가 로컬 사본을 폐기
+    - 적중/미스 카운터는 get_cache_stats()에서 확인 (프로세스별 값)
+    - 로컬 사본은 복사본으로 저장/반환하여 호출자가 값을 수정해도 캐시가 오염되지 않음 (Redis 조회와 같은 동작)
+    """
+
+    MAX_ENTRIES = 1024
+    LOCAL_TIMEOUT = 60  # 로컬 사본 유지 시간 (초)
+    CHANNEL = "local_cache_invalidate"
+    LISTEN_INTERVAL = 1.0  # pub/sub 메시지 대기 간격 (초)
+    RECONNECT_DELAY = 5    # pub/sub 연결 실패 시 재시도 간격 (초)
+
+    _entries: "OrderedDict[str, tuple]" = OrderedDict()
+    _lock = threading.RLock()
+    _listener_pid = None
+    _stats = {
+        'local_hits': 0,
+        'local_misses': 0,
+        'remote_hits': 0,
+        'remote_misses': 0,
+        'evictions': 0,
+        'invalidations': 0,
+    }
+
+    # ----- 로컬 계층 -----
+
+    @classmethod
+    def _count(cls, name: str) -> None:
+        cls._stats[name] += 1
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """변경 불가능한 값은 그대로, 그 외(list/dict/객체)는 깊은 복사"""
+        if value is None or isinstance(value, (str, bytes, int, float, bool)):
+            return value
+        return copy.deepcopy(value)
+
+    @classmethod
+    def _local_get(cls, key: str):
+        """로컬 캐시 조회 (없으면 (False, None))"""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del cls._entries[key]
+                return False, None
+            cls._entries.move_to_end(key)
+        return True, cls._copy(value)
+
+    @classmethod
+    def _local_set(cls, key: str, value: Any, local_timeout: Optional[int] = None) -> None:
+        value = cls._copy(value)
+        with cls._lock:
+            cls._entries[key] = (time.monotonic() + (local_timeout or cls.LOCAL_TIMEOUT), value)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+                cls._count('evictions')
+
+    @classmethod
+    def _local_drop(cls, keys: List[str] = (), prefixes: List[str] = (), drop_all: bool = False) -> int:
+        with cls._lock:
+            if drop_all:
+                dropped = len(cls._entries)
+                cls._entries.clear()
+                return dropped
+            targets = [key for key in keys if key in cls._entries]
+            if prefixes:
+                targets.extend(
+                    key for key in cls._entries
+                    if key.startswith(tuple(prefixes)) and key not in targets
+                )
+            for key in targets:
+                del cls._entries[key]
+            return len(targets)
+
+    # ----- pub/sub 무효화 전파 -----
+
+    @staticmethod
+    def _get_redis():
+        """pub/sub에 사용할 Redis 연결 (django-redis 백엔드가 아니면 None)"""
+        if not hasattr(cache, 'client'):
+            return None
+        try:
+            from django_redis import get_redis_connection
+            return get_redis_connection('default')
+        except Exception as e:
+            logger.debug(f"로컬 캐시 무효화 채널 연결 불가: {e}")
+            return None
+
+    @classmethod
+    def _channel(cls) -> str:
+        return f"{getattr(cache, 'key_prefix', '') or 'drillquiz'}:{cls.CHANNEL}"
+
+    @classmethod
+    def _ensure_listener(cls) -> None:
+        """현재 프로세스의 무효화 구독 스레드 시작 (fork 이후 워커마다 한 번)"""
+        pid = os.getpid()
+        if cls._listener_pid == pid:
+            return
+        with cls._lock:
+            if cls._listener_pid == pid:
+                return
+            cls._listener_pid = pid
+            # fork 이전 부모 프로세스의 사본은 무효화 메시지를 받지 못했을 수 있으므로 폐기
+            cls._entries.clear()
+            connection = cls._get_redis()
+            if connection is None:
+                return
+            threading.Thread(
+                target=cls._listen, args=(connection,),
+                name='local-cache-invalidation', daemon=True
+            ).start()
+
+    @classmethod
+    def _listen(cls, connection) -> None:
+        while True:
+            try:
+                pubsub = connection.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(cls._channel())
+                # 구독 전까지 놓쳤을 수 있는 무효화 대비
+                cls._local_drop(drop_all=True)
+                while True:
+                    message = pubsub.get_message(timeout=cls.LISTEN_INTERVAL)
+                    if message:
+                        cls._handle_message(message.get('data'))
+            except Exception as e:
+                logger.warning(f"로컬 캐시 무효화 구독 오류, {cls.RECONNECT_DELAY}초 후 재연결: {e}")
+                time.sleep(cls.RECONNECT_DELAY)
+
+    @classmethod
+    def _handle_message(cls, data) -> None:
+        try:
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            payload = json.loads(data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"로컬 캐시 무효화 메시지 해석 실패: {e}")
+            return
+        dropped = cls._local_drop(
+            keys=payload.get('keys', []),
+            prefixes=payload.get('prefixes', []),
+            drop_all=payload.get('all', False)
+        )
+        logger.debug(f"로컬 캐시 무효화 메시지 처리: {dropped}개 항목 폐기")
+
+    @classmethod
+    def _broadcast(cls, keys: List[str] = (), prefixes: List[str] = (), drop_all: bool = False) -> None:
+        """로컬 사본을 폐기하고 다른 워커에도 폐기 메시지 전파"""
+        cls._local_drop(keys=keys, prefixes=prefixes, drop_all=drop_all)
+        cls._count('invalidations')
+        connection = cls._get_redis()
+        if connection is None:
+            return
+        try:
+            connection.publish(cls._channel(), json.dumps({
+                'keys': list(keys), 'prefixes': list(prefixes), 'all': drop_all
+            }))
+        except Exception as e:
+            logger.warning(f"로컬 캐시 무효화 전파 실패: {e}")
+
+    # ----- 공개 API -----
+
+    @classmethod
+    def get(cls, key: str, default: Any = None, local_timeout: Optional[int] = None) -> Any:
+        """로컬 → Django 캐시 순서로 조회"""
+        cls._ensure_listener()
+        found, value = cls._local_get(key)
+        if found:
+            cls._count('local_hits')
+            return value
+        cls._count('local_misses')
+
+        value = cache.get(key)
+        if value is None:
+            cls._count('remote_misses')
+            return default
+        cls._count('remote_hits')
+        cls._local_set(key, value, local_timeout)
+        return value
+
+    @classmethod
+    def set(cls, key: str, value: Any, timeout: Optional[int] = None,
+            local_timeout: Optional[int] = None, local_only: bool = False) -> None:
+        """Django 캐시와 로컬 캐시에 저장 (local_only면 로컬에만 저장)"""
+        cls._ensure_listener()
+        if not local_only:
+            cache.set(key, value, timeout)
+        cls._local_set(key, value, local_timeout)
+
+    @classmethod
+    def get_or_set(cls, key: str, compute, timeout: Optional[int] = None,
+                   local_timeout: Optional[int] = None, local_only: bool = False) -> Any:
+        """조회 후 없으면 계산하여 저장 (None은 캐시하지 않음)"""
+        if local_only:
+            cls._ensure_listener()
+            found, value = cls._local_get(key)
+            cls._count('local_hits' if found else 'local_misses')
+        else:
+            value = cls.get(key, local_timeout=local_timeout)
+            found = value is not None
+        if found:
+            return value
+
+        value = compute()
+        if value is not None:
+            cls.set(key, value, timeout, local_timeout=local_timeout, local_only=local_only)
+        return value
+
+    @classmethod
+    def delete(cls, *keys: str) -> None:
+        """Django 캐시와 모든 워커의 로컬 사본에서 키 삭제"""
+        if not keys:
+            return
+        cache.delete_many(list(keys))
+        cls._broadcast(keys=keys)
+
+    @classmethod
+    def delete_local_prefix(cls, prefix: str) -> None:
+        """모든 워커의 로컬 사본에서 prefix로 시작하는 키 폐기 (Django 캐시는 TTL로 만료)"""
+        cls._broadcast(prefixes=[prefix])
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """현재 프로세스의 로컬 캐시 통계"""
+        with cls._lock:
+            stats = dict(cls._stats)
+            stats['entries'] = len(cls._entries)
+        lookups = stats['local_hits'] + stats['local_misses']
+        stats['local_hit_rate'] = round(stats['local_hits'] / lookups * 100, 2) if lookups else 0.0
+        stats['max_entries'] = cls.MAX_ENTRIES
+        stats['pid'] = os.getpid()
+        return stats
+
+
 class QueryOptimizer:
     """데이터베이스 쿼리 최적화 유틸리티"""
     
@@ -394,7 +863,7 @@ def get_cache_stats() -> Dict[str, Any]:
     try:
         if hasattr(cache, 'client'):
             # Redis 클라이언트 정보
-            client_info = cache.client.info()
+            client_info = cache.client.get_client().info()
             return {
                 'type': 'redis',
                 'connected_clients': client_info.get('connected_clients', 0),
@@ -402,13 +871,15 @@ def get_cache_stats() -> Dict[str, Any]:
                 'total_commands_processed': client_info.get('total_commands_processed', 0),
                 'keyspace_hits': client_info.get('keyspace_hits', 0),
                 'keyspace_misses': client_info.get('keyspace_misses', 0),
+                'local_cache': TwoTierCache.get_stats(),
             }
         else:
             # 로컬 캐시 정보
             return {
                 'type': 'local',
                 'backend': str(cache),
-                'note': '로컬 메모리 캐시 사용 중'
+                'note': '로컬 메모리 캐시 사용 중',
+                'local_cache': TwoTierCache.get_stats(),
             }
     except Exception as e:
         logger.error(f"캐시 통계 조회 실패: {e}")
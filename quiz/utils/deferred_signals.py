@@ -0,0 +1,163 @@
+"""
+시그널 후처리 일괄 실행 유틸리티
+
+ExamQuestion 저장/삭제마다 시험 문제 수를 다시 세고, 멤버/태스크마다 시험 구독을
+get_or_create하던 시그널 후처리를 모아서 한 번에 실행한다.
+1. deferred_signals() 블록 안에서는 시그널이 변경 대상(시험 ID, (사용자, 시험) 쌍)만 기록
+2. 가장 바깥 블록이 끝나면 트랜잭션 커밋 후(on_commit) 한 번에 처리
+   - 시험 문제 수: 대상 시험 전체를 한 번의 그룹 COUNT로 집계 후 시험별 update()
+   - 시험 구독: bulk_create(ignore_conflicts=True) 한 번 + 비활성 구독 활성화 update() 한 번
+3. 블록 밖에서는 기존처럼 즉시 처리 (구독은 한 건이어도 같은 일괄 처리 경로 사용)
+
+사용 예:
+    with deferred_signals():
+        ExamQuestion.objects.filter(exam=exam, question_id__in=ids).delete()
+        ExamQuestion.objects.bulk_create(links)
+        schedule_exam_question_count(exam.id)  # bulk_create는 시그널을 보내지 않음
+"""
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class _SignalBatch:
+    """deferred_signals 블록 동안 모은 후처리 대상"""
+
+    def __init__(self):
+        self.exam_ids = set()
+        self.subscriptions = set()  # {(user_id, exam_id), ...}
+
+    def __bool__(self):
+        return bool(self.exam_ids or self.subscriptions)
+
+
+def _current_batch():
+    return getattr(_local, 'batch', None)
+
+
+@contextmanager
+def deferred_signals():
+    """
+    블록 안에서 발생한 시험 문제 수 갱신/자동 구독을 모았다가 커밋 후 한 번에 처리합니다.
+
+    중첩해서 사용하면 가장 바깥 블록이 끝날 때 한 번만 처리한다.
+    트랜잭션 안에서 끝나면 커밋 후에 실행되고, 롤백되면 실행되지 않는다.
+    """
+    if _current_batch() is not None:
+        yield
+        return
+
+    batch = _local.batch = _SignalBatch()
+    try:
+        yield
+    finally:
+        _local.batch = None
+        if batch:
+            transaction.on_commit(lambda: flush_signal_batch(batch))
+
+
+def flush_signal_batch(batch):
+    """모은 후처리 대상을 일괄 처리"""
+    try:
+        if batch.exam_ids:
+            refresh_exam_question_counts(batch.exam_ids)
+        if batch.subscriptions:
+            subscribe_users_to_exams(batch.subscriptions)
+    except Exception as e:
+        logger.error(f"❌ 시그널 후처리 일괄 실행 실패: {e}")
+
+
+# ----- 시험 문제 수 -----
+
+def schedule_exam_question_count(*exam_ids):
+    """시험 문제 수 갱신 (deferred_signals 블록 안이면 모았다가 한 번에 처리)"""
+    exam_ids = {exam_id for exam_id in exam_ids if exam_id is not None}
+    if not exam_ids:
+        return
+    batch = _current_batch()
+    if batch is not None:
+        batch.exam_ids.update(exam_ids)
+        return
+    refresh_exam_question_counts(exam_ids)
+
+
+def refresh_exam_question_counts(exam_ids):
+    """
+    시험들의 total_questions를 한 번의 그룹 COUNT로 다시 계산하여 저장합니다.
+
+    Returns:
+        dict: {exam_id: 문제 수}
+    """
+    from quiz.models import Exam, ExamQuestion
+
+    exam_ids = list(exam_ids)
+    counts = dict.fromkeys(exam_ids, 0)
+    counts.update(
+        ExamQuestion.objects.filter(exam_id__in=exam_ids)
+        .values('exam_id')
+        .annotate(total=Count('id'))
+        .order_by()
+        .values_list('exam_id', 'total')
+    )
+
+    for exam_id, total in counts.items():
+        Exam.objects.filter(id=exam_id).exclude(total_questions=total).update(total_questions=total)
+
+    logger.info(f"🎯 시험 {len(counts)}개의 total_questions 일괄 업데이트")
+    return counts
+
+
+# ----- 시험 자동 구독 -----
+
+def schedule_exam_subscriptions(pairs):
+    """(user_id, exam_id) 쌍 자동 구독 (deferred_signals 블록 안이면 모았다가 한 번에 처리)"""
+    pairs = {(user_id, exam_id) for user_id, exam_id in pairs if user_id is not None and exam_id is not None}
+    if not pairs:
+        return
+    batch = _current_batch()
+    if batch is not None:
+        batch.subscriptions.update(pairs)
+        return
+    subscribe_users_to_exams(pairs)
+
+
+def subscribe_users_to_exams(pairs):
+    """
+    (user_id, exam_id) 쌍을 활성 구독 상태로 만듭니다.
+
+    없는 구독은 bulk_create(ignore_conflicts=True)로 생성하고,
+    비활성화된 기존 구독은 update() 한 번으로 다시 활성화한다.
+
+    Returns:
+        int: 다시 활성화한 구독 수
+    """
+    from quiz.models import ExamSubscription
+
+    pairs = set(pairs)
+    if not pairs:
+        return 0
+
+    ExamSubscription.objects.bulk_create(
+        [ExamSubscription(user_id=user_id, exam_id=exam_id, is_active=True) for user_id, exam_id in pairs],
+        ignore_conflicts=True,
+    )
+
+    # 시험별로 묶어서 (exam_id, user_id__in) 조건으로 필터
+    users_by_exam = defaultdict(set)
+    for user_id, exam_id in pairs:
+        users_by_exam[exam_id].add(user_id)
+    condition = Q()
+    for exam_id, user_ids in users_by_exam.items():
+        condition |= Q(exam_id=exam_id, user_id__in=user_ids)
+    activated = ExamSubscription.objects.filter(condition, is_active=False).update(is_active=True)
+
+    logger.info(f"🎯 시험 자동 구독 일괄 처리: {len(pairs)}건 요청, {activated}건 재활성화")
+    return activated
@@ -3,6 +3,7 @@
 """
 import logging
 from django.core.cache import cache
+from quiz.utils.cache_utils import TwoTierCache
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +42,8 @@ def get_devops_category_id():
     "IT 기술 > IT 기술" 카테고리 ID 반환 (캐싱)
     :return: int|None 카테고리 ID
     """
-    # 캐시에서 확인
-    category_id = cache.get(DEVOPS_CATEGORY_CACHE_KEY)
+    # 캐시에서 확인 (프로세스 내 캐시 → Redis)
+    category_id = TwoTierCache.get(DEVOPS_CATEGORY_CACHE_KEY)
     if category_id:
         return category_id
     
@@ -69,7 +70,7 @@ def get_devops_category_id():
         
         if it_tech_category:
             # 캐시에 저장
-            cache.set(DEVOPS_CATEGORY_CACHE_KEY, it_tech_category.id, CACHE_TIMEOUT)
+            TwoTierCache.set(DEVOPS_CATEGORY_CACHE_KEY, it_tech_category.id, CACHE_TIMEOUT)
             return it_tech_category.id
         else:
             logger.warning("⚠️ 2단계 'IT 기술' 카테고리를 찾을 수 없습니다.")
@@ -85,8 +86,8 @@ def get_devops_category_tag_ids():
     "IT 기술 > IT 기술" 카테고리에 속한 모든 태그 ID 반환 (캐싱)
     :return: list[int] 태그 ID 목록
     """
-    # 캐시에서 확인
-    tag_ids = cache.get(DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY)
+    # 캐시에서 확인 (프로세스 내 캐시 → Redis)
+    tag_ids = TwoTierCache.get(DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY)
     if tag_ids:
         return tag_ids
     
@@ -102,7 +103,7 @@ def get_devops_category_tag_ids():
         tag_ids = list(tags.values_list('id', flat=True))
         
         # 캐시에 저장
-        cache.set(DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY, tag_ids, CACHE_TIMEOUT)
+        TwoTierCache.set(DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY, tag_ids, CACHE_TIMEOUT)
         
         logger.info(f"✅ DevOps 카테고리 태그 ID 조회 완료: {len(tag_ids)}개")
         return tag_ids
@@ -125,8 +126,8 @@ def get_domain_tag_id(request, tag_name='DevOps'):
     # 캐시 키는 태그 이름별로 구분
     cache_key = f"{DEVOPS_TAG_ID_CACHE_KEY}_{tag_name}"
     
-    # 캐시에서 확인
-    tag_id = cache.get(cache_key)
+    # 캐시에서 확인 (프로세스 내 캐시 → Redis)
+    tag_id = TwoTierCache.get(cache_key)
     if tag_id:
         return tag_id
     
@@ -146,7 +147,7 @@ def get_domain_tag_id(request, tag_name='DevOps'):
         
         if tag:
             # 캐시에 저장
-            cache.set(cache_key, tag.id, CACHE_TIMEOUT)
+            TwoTierCache.set(cache_key, tag.id, CACHE_TIMEOUT)
             return tag.id
         else:
             logger.warning(f"⚠️ '{tag_name}' 태그를 찾을 수 없습니다.")
@@ -159,9 +160,16 @@ def get_domain_tag_id(request, tag_name='DevOps'):
 
 def clear_domain_cache():
     """
-    도메인 관련 캐시 모두 삭제
+    도메인 관련 캐시 모두 삭제 (모든 태그 이름의 태그 ID, 모든 워커의 프로세스 내 사본 포함)
     """
-    cache.delete(DEVOPS_CATEGORY_CACHE_KEY)
-    cache.delete(DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY)
-    cache.delete_many([key for key in cache.keys() if key.startswith(DEVOPS_TAG_ID_CACHE_KEY)])
-
+    TwoTierCache.delete(
+        DEVOPS_CATEGORY_CACHE_KEY,
+        DEVOPS_CATEGORY_TAG_IDS_CACHE_KEY,
+        f"{DEVOPS_TAG_ID_CACHE_KEY}_DevOps"
+    )
+    # 태그 이름별 캐시 키 (Redis의 경우 delete_pattern 지원)
+    if hasattr(cache, 'delete_pattern'):
+        cache.delete_pattern(f"{DEVOPS_TAG_ID_CACHE_KEY}_*")
+    elif hasattr(cache, 'keys'):
+        cache.delete_many([key for key in cache.keys(f"{DEVOPS_TAG_ID_CACHE_KEY}_*")])
+    TwoTierCache.delete_local_prefix(DEVOPS_TAG_ID_CACHE_KEY)
@@ -442,3 +442,102 @@ def get_gemini_safety_settings_by_age_rating(age_rating):
         logger.warning(f"[get_gemini_safety_settings] 안전 필터 설정 실패: {e}, None 반환 (기본 설정 사용)")
         return None
 
+
+
+def latest_results_per_group(queryset, group_fields=('exam_id',)):
+    """
+    쿼리셋에서 그룹(기본값: exam_id)별 가장 최근 결과만 조회합니다.
+
+    PostgreSQL은 DISTINCT ON, 윈도 함수를 지원하는 DB는 ROW_NUMBER()로
+    DB에서 한 행씩만 가져오고, 그 외에는 정렬된 결과를 순회하며 고른다.
+
+    Returns:
+        dict: 그룹 필드가 하나면 {값: ExamResult}, 여러 개면 {(값, ...): ExamResult}
+    """
+    from django.db import connections
+    from django.db.models import F, Window
+    from django.db.models.functions import RowNumber
+
+    group_fields = list(group_fields)
+    ordering = ('-completed_at', '-id')
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'postgresql':
+        rows = queryset.order_by(*group_fields, *ordering).distinct(*group_fields)
+    elif connection.features.supports_over_clause:
+        rows = queryset.annotate(
+            latest_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in group_fields],
+                order_by=[F('completed_at').desc(), F('id').desc()]
+            )
+        ).filter(latest_rank=1)
+    else:
+        rows = queryset.order_by(*group_fields, *ordering)
+
+    latest = {}
+    for result in rows:
+        values = tuple(getattr(result, field) for field in group_fields)
+        latest.setdefault(values[0] if len(values) == 1 else values, result)
+    return latest
+
+
+def get_latest_exam_results(exams, user=None, include_versions=False, fallback_to_original=False):
+    """
+    시험 목록의 최신 ExamResult를 한 번의 쿼리로 조회합니다.
+
+    Args:
+        exams: Exam 인스턴스 목록 (is_original, original_exam_id 사용)
+        user: 지정하면 해당 사용자의 결과만 대상으로 함
+        include_versions: 원본 시험은 복사본(versions)의 결과까지 포함하여 최신 결과 선택
+        fallback_to_original: 복사 시험에 결과가 없으면 원본 시험의 최신 결과 사용
+
+    Returns:
+        dict: {시험 ID(str): ExamResult 또는 None}
+    """
+    from django.db.models import F, Q
+    from quiz.models import ExamResult
+
+    exams = [exam for exam in exams if exam is not None]
+    if not exams:
+        return {}
+
+    exam_ids = {exam.id for exam in exams}
+    original_ids = {
+        exam.original_exam_id for exam in exams
+        if fallback_to_original and not exam.is_original and exam.original_exam_id
+    }
+
+    # 원본/복사본 매핑을 같은 쿼리 조건으로 포함
+    condition = Q(exam_id__in=exam_ids | original_ids)
+    if include_versions:
+        condition |= Q(exam__original_exam_id__in=exam_ids)
+
+    queryset = ExamResult.objects.filter(condition)
+    if user is not None:
+        queryset = queryset.filter(user=user)
+    if include_versions:
+        queryset = queryset.annotate(source_original_exam_id=F('exam__original_exam_id'))
+
+    latest_by_exam = latest_results_per_group(queryset)
+
+    latest_versions = {}
+    if include_versions:
+        for result in latest_by_exam.values():
+            original_exam_id = result.source_original_exam_id
+            if original_exam_id in exam_ids and result.exam_id != original_exam_id:
+                latest_versions.setdefault(original_exam_id, []).append(result)
+
+    latest_results = {}
+    for exam in exams:
+        candidates = [latest_by_exam.get(exam.id)]
+        if include_versions and exam.is_original:
+            candidates.extend(latest_versions.get(exam.id, []))
+        candidates = [result for result in candidates if result is not None]
+
+        result = max(candidates, key=lambda r: r.completed_at) if candidates else None
+        if result is None and fallback_to_original and not exam.is_original and exam.original_exam_id:
+            result = latest_by_exam.get(exam.original_exam_id)
+        latest_results[str(exam.id)] = result
+
+    return latest_results
@@ -0,0 +1,523 @@
+"""
+엑셀/CSV 스트리밍 내보내기 유틸리티
+
+전체 데이터를 pandas DataFrame과 메모리 내 BytesIO 워크북으로 만든 뒤 응답하던 방식을
+청크 단위 iterator()와 write-only openpyxl / 스트리밍 CSV로 대체한다.
+1. 내보내기는 ExportSheet(시트명, 헤더, 행 iterator) 목록으로 정의 (EXPORT_BUILDERS)
+2. xlsx: write-only 워크북을 임시 파일에 기록 후 FileResponse로 블록 단위 전송
+3. csv: 행을 생성하는 즉시 StreamingHttpResponse로 전송 (시트가 여럿이면 시트명 행으로 구분하여 이어 씀)
+4. 대용량은 비동기 작업으로 스토리지(MinIO/로컬)에 저장 후 다운로드 링크 반환
+   - 저장된 파일은 작업 상태와 같은 보관 시간(EXPORT_JOB_TIMEOUT)이 지나면
+     다음 내보내기 작업 때 cleanup_expired_exports()로 삭제
+"""
+import csv
+import logging
+import os
+import re
+import tempfile
+import uuid
+from datetime import timedelta
+from itertools import groupby
+
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Count
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+
+from quiz.utils.multilingual_utils import BASE_LANGUAGE, SUPPORTED_LANGUAGES, get_localized_field
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT_XLSX = 'xlsx'
+EXPORT_FORMAT_CSV = 'csv'
+EXPORT_FORMATS = (EXPORT_FORMAT_XLSX, EXPORT_FORMAT_CSV)
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+CSV_CONTENT_TYPE = 'text/csv; charset=utf-8'
+
+ITERATOR_CHUNK_SIZE = 2000
+FILE_BLOCK_SIZE = 64 * 1024
+
+EXPORT_JOB_KEY_PREFIX = 'export_job'
+EXPORT_JOB_TIMEOUT = 24 * 3600  # 작업 상태/파일 링크 보관 시간
+EXPORT_STORAGE_DIR = 'exports'
+EXPORT_CLEANUP_LOCK_KEY = f'{EXPORT_JOB_KEY_PREFIX}:cleanup_lock'
+EXPORT_CLEANUP_INTERVAL = 3600  # 만료 파일 정리 최소 간격 (초)
+
+# 엑셀 시트명에 사용할 수 없는 문자
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]\*\?/\\:]')
+
+
+class ExportSheet:
+    """내보낼 시트 하나 (rows는 행 값 목록을 생성하는 iterable)"""
+
+    def __init__(self, name, headers, rows, widths=None):
+        self.name = name
+        self.headers = headers
+        self.rows = rows
+        self.widths = widths
+
+
+class ExportDocument:
+    """내보낼 파일 (파일명은 확장자 제외, csv_sheets는 CSV로 내보낼 시트 - 기본값은 전체 시트)"""
+
+    def __init__(self, filename, sheets, csv_sheets=None):
+        self.filename = filename
+        self.sheets = sheets
+        self.csv_sheets = csv_sheets if csv_sheets is not None else sheets
+
+
+def safe_sheet_name(name):
+    """엑셀에서 허용하지 않는 시트명 문자를 제거"""
+    return _INVALID_SHEET_CHARS.sub('_', str(name)) or 'Sheet'
+
+
+def _cell_value(value):
+    """openpyxl이 직접 기록할 수 없는 값(UUID 등)은 문자열로 변환"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value
+    return str(value)
+
+
+def write_xlsx(document, fileobj):
+    """write-only 워크북으로 시트를 행 단위로 기록 (전체 행을 메모리에 올리지 않음)"""
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    for sheet in document.sheets:
+        worksheet = workbook.create_sheet(title=safe_sheet_name(sheet.name))
+        if sheet.widths:
+            for index, width in enumerate(sheet.widths, start=1):
+                worksheet.column_dimensions[get_column_letter(index)].width = width
+        worksheet.append(sheet.headers)
+        for row in sheet.rows:
+            worksheet.append([_cell_value(value) for value in row])
+    if not document.sheets:
+        workbook.create_sheet(title='Sheet')
+    workbook.save(fileobj)
+
+
+class _Echo:
+    """csv.writer가 기록한 한 줄을 그대로 반환하는 의사 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(sheets):
+    """
+    시트를 CSV 줄 단위로 생성 (엑셀에서 한글이 깨지지 않도록 BOM 포함)
+
+    시트가 여럿이면 두 번째 시트부터 빈 줄과 시트명 행 뒤에 헤더와 행을 이어 쓴다.
+    """
+    writer = csv.writer(_Echo())
+    yield '\ufeff'
+    for index, sheet in enumerate(sheets):
+        if index:
+            yield writer.writerow([])
+            yield writer.writerow([sheet.name])
+        yield writer.writerow(sheet.headers)
+        for row in sheet.rows:
+            yield writer.writerow(['' if value is None else value for value in row])
+
+
+def _content_disposition_filename(document, export_format):
+    return f"{document.filename}.{export_format}"
+
+
+def build_export_response(document, export_format=EXPORT_FORMAT_XLSX):
+    """내보내기 문서를 스트리밍 응답으로 변환"""
+    filename = _content_disposition_filename(document, export_format)
+    if export_format == EXPORT_FORMAT_CSV:
+        sheets = document.csv_sheets or [ExportSheet('Sheet', [], [])]
+        response = StreamingHttpResponse(iter_csv(sheets), content_type=CSV_CONTENT_TYPE)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    # 압축(zip) 형식인 xlsx는 임시 파일에 기록한 뒤 블록 단위로 전송
+    tmp = tempfile.TemporaryFile()
+    try:
+        write_xlsx(document, tmp)
+        tmp.seek(0)
+    except Exception:
+        tmp.close()
+        raise
+    response = FileResponse(tmp, as_attachment=True, filename=filename, content_type=XLSX_CONTENT_TYPE)
+    response.block_size = FILE_BLOCK_SIZE
+    return response
+
+
+def get_export_format(request):
+    """요청의 format 파라미터 (xlsx 기본)"""
+    export_format = (request.GET.get('export_format') or EXPORT_FORMAT_XLSX).lower()
+    return export_format if export_format in EXPORT_FORMATS else None
+
+
+def is_async_export_requested(request):
+    return str(request.GET.get('async', '')).lower() in ('1', 'true', 'yes')
+
+
+def handle_export_request(request, export_name, params=None):
+    """
+    내보내기 요청 공통 처리
+
+    - export_format=xlsx(기본)|csv: 요청 중 스트리밍 응답
+    - async=1: 워커에서 xlsx를 스토리지에 저장하고 작업 ID 반환 (202)
+      Celery 전송에 실패하거나 비로그인 요청이면 스트리밍으로 처리
+    """
+    export_format = get_export_format(request)
+    if export_format is None:
+        return JsonResponse({'error': f'지원하지 않는 형식입니다. ({", ".join(EXPORT_FORMATS)})'}, status=400)
+
+    if is_async_export_requested(request) and request.user.is_authenticated:
+        job_id = start_export_job(export_name, request.user, params)
+        if job_id:
+            return JsonResponse({
+                'job_id': job_id,
+                'status': 'pending',
+                'status_url': f'/api/exports/{job_id}/',
+                'download_url': f'/api/exports/{job_id}/download/',
+            }, status=202)
+
+    document = EXPORT_BUILDERS[export_name](request.user, params or {})
+    return build_export_response(document, export_format)
+
+
+# ----- 내보내기 정의 -----
+
+def build_user_data_export(user, params=None):
+    """사용자 본인 데이터 (사용자 정보 + 시험 결과)"""
+    from quiz.models import ExamResult
+
+    sheets = [ExportSheet(
+        '사용자 정보',
+        ['사용자명', '이메일', '이름', '성', '가입일'],
+        [[user.username, user.email, user.first_name, user.last_name, user.date_joined.strftime('%Y-%m-%d %H:%M:%S')]],
+    )]
+
+    exam_results = ExamResult.objects.filter(user=user).select_related('exam')
+    if exam_results.exists():
+        def result_rows():
+            for result in exam_results.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+                exam = result.exam
+                yield [
+                    get_localized_field(exam, 'title', getattr(exam, 'created_language', BASE_LANGUAGE), 'Unknown'),
+                    result.score,
+                    result.total_score,
+                    result.correct_count,
+                    result.wrong_count,
+                    result.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    result.elapsed_seconds,
+                ]
+
+        sheets.append(ExportSheet(
+            '시험 결과',
+            ['시험 제목', '점수', '총점', '정답 수', '오답 수', '완료일', '소요 시간(초)'],
+            result_rows(),
+        ))
+
+    return ExportDocument(f'user_data_{user.username}_{timezone.now().strftime("%Y%m%d_%H%M%S")}', sheets)
+
+
+def format_difficulty_for_excel(difficulty):
+    """엑셀 다운로드용 난이도 포맷팅"""
+    if not difficulty:
+        return ''
+
+    difficulty = str(difficulty).lower().strip()
+
+    if difficulty == 'easy':
+        return 'Easy'
+    elif difficulty == 'medium':
+        return 'Medium'
+    elif difficulty == 'hard':
+        return 'Hard'
+    else:
+        return difficulty.capitalize()
+
+
+def build_exams_export(user, params=None):
+    """
+    전체 시험 목록 + 시험별 문제 시트
+
+    시험 목록은 문제 수를 집계 쿼리로 함께 조회하고, 문제 시트는 ExamQuestion 전체를
+    시험 순서대로 한 번의 iterator로 읽어 시험별로 나눈다. (시험 수와 무관한 쿼리 수)
+    CSV 형식에서는 시험 목록 시트만 내보낸다.
+    """
+    from quiz.models import Exam, ExamQuestion
+
+    user_lang = (params or {}).get('language') or BASE_LANGUAGE
+    exams = Exam.objects.annotate(question_count=Count('examquestion')).order_by('-created_at', 'id')
+
+    def exam_rows():
+        for exam in exams.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            yield [
+                exam.id,
+                get_localized_field(exam, 'title', user_lang, 'Unknown'),
+                exam.question_count,
+                exam.file_name or '',
+                exam.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                '예' if exam.is_original else '아니오',
+            ]
+
+    sheets = [ExportSheet('시험목록', ['시험ID', '시험제목', '문제수', '연결된파일', '생성일', '원본여부'], exam_rows())]
+
+    question_headers = ['문제ID', '문제제목', '문제내용', '정답', '설명', '난이도', 'URL', '순서']
+    exam_questions = (
+        ExamQuestion.objects.select_related('exam', 'question')
+        .order_by('-exam__created_at', 'exam_id', 'order')
+        .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+    )
+
+    class _QuestionSheets:
+        """시험별 문제 시트를 순서대로 생성 (앞 시트를 다 쓴 뒤 다음 시트의 행을 읽음)"""
+
+        def __iter__(self):
+            for _, group in groupby(exam_questions, key=lambda eq: eq.exam_id):
+                first = next(group)
+                exam = first.exam
+                title = exam.title_ko or exam.title_en or 'Unknown'
+
+                def rows(first=first, group=group):
+                    yield _question_row(first, user_lang)
+                    for eq in group:
+                        yield _question_row(eq, user_lang)
+
+                yield ExportSheet(f'시험{exam.id}_{title[:20]}', question_headers, rows())
+
+    return ExportDocument('exams', _LazySheets(sheets, _QuestionSheets()), csv_sheets=sheets)
+
+
+def _question_row(eq, user_lang):
+    question = eq.question
+    return [
+        question.id,
+        get_localized_field(question, 'title', user_lang, '제목 없음'),
+        question.content_ko or question.content_en or '',
+        question.answer_ko or question.answer_en or '',
+        question.explanation_ko or question.explanation_en or '',
+        format_difficulty_for_excel(question.difficulty),
+        question.url or '',
+        eq.order,
+    ]
+
+
+class _LazySheets:
+    """고정 시트 뒤에 지연 생성 시트를 이어 붙인 시트 목록"""
+
+    def __init__(self, sheets, lazy_sheets):
+        self._sheets = sheets
+        self._lazy_sheets = lazy_sheets
+
+    def __iter__(self):
+        yield from self._sheets
+        yield from self._lazy_sheets
+
+    def __bool__(self):
+        return bool(self._sheets)
+
+
+def _localized_text(obj, field_prefix, user_lang):
+    """사용자 언어를 우선 사용, 없으면 기본 언어('en'), 그래도 없으면 다른 언어 중 하나"""
+    text = getattr(obj, f'{field_prefix}_{user_lang}', None)
+    if not text:
+        text = getattr(obj, f'{field_prefix}_{BASE_LANGUAGE}', None)
+        if not text:
+            for lang in SUPPORTED_LANGUAGES:
+                text = getattr(obj, f'{field_prefix}_{lang}', None)
+                if text:
+                    break
+    return text or 'Unknown'
+
+
+def build_study_export(user, params):
+    """스터디 Task 목록 + 스터디 정보"""
+    from quiz.models import Study
+
+    study = Study.objects.get(id=params['study_id'])
+    user_language = params.get('language') or BASE_LANGUAGE
+
+    def task_rows():
+        for task in study.tasks.select_related('exam').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            yield [
+                get_localized_field(task, 'name', user_language, '이름 없음'),
+                _localized_text(task.exam, 'title', user_language) if task.exam else 'Unknown',
+                task.progress,
+                task.exam.id if task.exam else '',
+                task.id,
+            ]
+
+    study_title = _localized_text(study, 'title', user_language)
+    study_goal = _localized_text(study, 'goal', user_language)
+
+    return ExportDocument(f'{study_title}_tasks', [
+        ExportSheet('Task목록', ['Task 이름', '연결된 시험', '진도율 (%)', '시험 ID', 'Task ID'], task_rows()),
+        ExportSheet(
+            '스터디정보',
+            ['스터디 제목', '스터디 목표', '시작일', '종료일', '전체 진행률'],
+            # Study 모델에 overall_progress 속성이 없으므로 기본값 사용
+            [[study_title, study_goal, study.start_date, study.end_date, '0%']],
+        ),
+    ])
+
+
+def build_users_export(user, params=None):
+    """전체 사용자 목록 (관리자용)"""
+    from django.contrib.auth import get_user_model
+    from quiz.models import UserProfile
+
+    User = get_user_model()
+
+    def user_rows():
+        for member in User.objects.select_related('profile').order_by('username').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            try:
+                role = member.profile.role
+            except UserProfile.DoesNotExist:
+                role = UserProfile.objects.create(user=member, role='user_role').role
+            yield [
+                member.id,
+                member.first_name or '',
+                member.username,
+                member.email or '',
+                role,
+                member.date_joined.strftime('%Y-%m-%d %H:%M:%S') if member.date_joined else '',
+                '활성' if member.is_active else '비활성',
+                '예' if member.is_staff else '아니오',
+                '예' if member.is_superuser else '아니오',
+            ]
+
+    return ExportDocument(f'users_{timezone.now().strftime("%Y%m%d_%H%M%S")}', [
+        ExportSheet(
+            '사용자목록',
+            ['ID', '이름', '사용자명', '이메일', '역할', '가입일', '활성화', '스태프', '슈퍼유저'],
+            user_rows(),
+            # write-only 모드는 데이터를 다시 읽어 너비를 맞출 수 없으므로 고정 너비 사용
+            widths=[8, 15, 20, 30, 18, 21, 8, 8, 10],
+        ),
+    ])
+
+
+EXPORT_BUILDERS = {
+    'user_data': build_user_data_export,
+    'exams': build_exams_export,
+    'study': build_study_export,
+    'users': build_users_export,
+}
+
+
+# ----- 비동기 내보내기 작업 -----
+
+def _job_key(job_id):
+    return f"{EXPORT_JOB_KEY_PREFIX}:{job_id}"
+
+
+def get_export_job(job_id):
+    return cache.get(_job_key(job_id))
+
+
+def start_export_job(export_name, user, params=None):
+    """
+    내보내기 작업을 Celery로 전송합니다.
+
+    Returns:
+        str: 작업 ID (전송 실패 시 None - 호출측에서 동기 스트리밍으로 폴백)
+    """
+    from quiz.tasks import export_file_task
+
+    job_id = uuid.uuid4().hex
+    cache.set(_job_key(job_id), {'status': 'pending', 'user_id': user.id, 'export': export_name}, EXPORT_JOB_TIMEOUT)
+    try:
+        export_file_task.delay(job_id, export_name, user.id, params or {})
+    except Exception as e:
+        logger.warning(f"[EXPORT] Celery 태스크 전송 실패, 동기 처리로 폴백: {e}")
+        cache.delete(_job_key(job_id))
+        return None
+    logger.info(f"[EXPORT] 내보내기 작업 시작: {export_name} job_id={job_id}")
+    return job_id
+
+
+def run_export_job(job_id, export_name, user_id, params):
+    """워커에서 xlsx를 생성하여 스토리지(MinIO 또는 로컬)에 저장하고 작업 상태를 갱신"""
+    from django.contrib.auth import get_user_model
+
+    job = get_export_job(job_id) or {'user_id': user_id, 'export': export_name}
+    try:
+        user = get_user_model().objects.get(id=user_id)
+        document = EXPORT_BUILDERS[export_name](user, params)
+        filename = _content_disposition_filename(document, EXPORT_FORMAT_XLSX)
+        with tempfile.TemporaryFile() as tmp:
+            write_xlsx(document, tmp)
+            tmp.seek(0)
+            path = default_storage.save(f'{EXPORT_STORAGE_DIR}/{job_id}/{filename}', File(tmp))
+        job.update({'status': 'completed', 'path': path, 'filename': filename})
+        logger.info(f"[EXPORT] 내보내기 작업 완료: {export_name} job_id={job_id} path={path}")
+    except Exception as e:
+        job.update({'status': 'failed', 'error': str(e)})
+        logger.error(f"[EXPORT] 내보내기 작업 실패: {export_name} job_id={job_id} error={e}")
+        cache.set(_job_key(job_id), job, EXPORT_JOB_TIMEOUT)
+        raise
+    cache.set(_job_key(job_id), job, EXPORT_JOB_TIMEOUT)
+
+    try:
+        cleanup_expired_exports()
+    except Exception as e:
+        logger.warning(f"[EXPORT] 만료된 내보내기 파일 정리 실패: {e}")
+    return job
+
+
+def cleanup_expired_exports(force=False):
+    """
+    보관 시간(EXPORT_JOB_TIMEOUT)이 지난 내보내기 파일을 스토리지에서 삭제합니다.
+
+    작업 상태 캐시가 만료되면 다운로드 링크도 사라지므로 파일도 같은 시간 이후 삭제한다.
+    내보내기 작업이 실행될 때마다 호출되며 EXPORT_CLEANUP_INTERVAL 간격으로 한 번만 정리한다.
+
+    Returns:
+        int: 삭제한 작업(디렉터리) 수
+    """
+    if not force and not cache.add(EXPORT_CLEANUP_LOCK_KEY, 1, EXPORT_CLEANUP_INTERVAL):
+        return 0
+
+    try:
+        job_dirs, _ = default_storage.listdir(EXPORT_STORAGE_DIR)
+    except (FileNotFoundError, NotImplementedError):
+        return 0
+
+    expires_before = timezone.now() - timedelta(seconds=EXPORT_JOB_TIMEOUT)
+    removed = 0
+    for job_dir in job_dirs:
+        job_path = f'{EXPORT_STORAGE_DIR}/{job_dir}'
+        _, filenames = default_storage.listdir(job_path)
+        paths = [f'{job_path}/{filename}' for filename in filenames]
+        if any(default_storage.get_modified_time(path) > expires_before for path in paths):
+            continue
+        for path in paths:
+            default_storage.delete(path)
+        # 로컬 파일 스토리지는 빈 디렉터리가 남으므로 함께 삭제 (MinIO/S3는 디렉터리가 없음)
+        try:
+            os.rmdir(default_storage.path(job_path))
+        except (NotImplementedError, OSError):
+            pass
+        cache.delete(_job_key(job_dir))
+        removed += 1
+
+    if removed:
+        logger.info(f"[EXPORT] 만료된 내보내기 파일 정리: {removed}개 작업")
+    return removed
+
+
+def open_export_file(job):
+    """완료된 작업의 파일을 스토리지에서 열어 FileResponse로 반환"""
+    response = FileResponse(
+        default_storage.open(job['path'], 'rb'),
+        as_attachment=True,
+        filename=job['filename'],
+        content_type=XLSX_CONTENT_TYPE,
+    )
+    response.block_size = FILE_BLOCK_SIZE
+    return response
@@ -44,11 +44,12 @@ from django.core.cache import cache
 import requests
 import json
 import time
-import gc
 import re
 import os
 import yaml
 
+from quiz.utils.translation_executor import PROVIDER_GEMINI, PROVIDER_OPENAI, provider_slot
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -104,6 +105,14 @@ BATCH_SIZE = 50  # OpenAI API 한 번에 처리할 수 있는 적절한 크기
 MAX_RETRIES = 3  # 최대 재시도 횟수
 RETRY_DELAY = 2  # 재시도 간격 (초)
 
+# 번역 요청 묶음(토큰 예산) 설정
+TRANSLATION_OUTPUT_TOKEN_LIMIT = 4096  # gpt-3.5-turbo 출력 토큰 제한
+TRANSLATION_PROMPT_OVERHEAD_TOKENS = 500  # 프롬프트/응답 형식 오버헤드
+TRANSLATION_BATCH_TOKEN_BUDGET = TRANSLATION_OUTPUT_TOKEN_LIMIT - TRANSLATION_PROMPT_OVERHEAD_TOKENS
+TRANSLATION_TOKENS_PER_CHAR = 2.0  # 한국어→영어 기준 번역 결과 토큰 수는 입력 글자 수의 약 2배
+TRANSLATION_PER_TEXT_OVERHEAD_TOKENS = 4  # JSON 배열 원소의 따옴표/구분자
+TRANSLATION_SPLIT_MAX_DEPTH = 3  # 전체 실패한 묶음을 반으로 나누어 재시도하는 최대 횟수
+
 def check_openai_availability() -> bool:
     """
     OpenAI API 사용 가능 여부를 Django 캐시와 전역 변수에서 확인합니다.
@@ -673,6 +682,13 @@ def translate_long_text_in_chunks(text: str, from_lang: str, to_lang: str, chunk
         str: 번역된 전체 텍스트, 실패 시 None
     """
     try:
+        # 전체 텍스트가 번역 메모리에 있으면 분할 번역 생략
+        from quiz.utils.translation_memory import get_translation, set_translation
+        remembered = get_translation(text, from_lang, to_lang)
+        if remembered:
+            logger.info(f"[CHUNK_TRANSLATE] 번역 메모리 적중 → 분할 번역 생략 ({len(text)}자)")
+            return remembered
+        
         # 섹션 기반 분할 (# 0), # 1), # 2) 등)
         import re
         sections = re.split(r'(\n#\s+\d+\))', text)
@@ -698,21 +714,22 @@ def translate_long_text_in_chunks(text: str, from_lang: str, to_lang: str, chunk
         
         logger.info(f"[CHUNK_TRANSLATE] 총 {len(chunks)}개 청크로 분할 (크기: {[len(c) for c in chunks]})")
         
-        # 각 청크를 개별적으로 번역
+        # 청크들을 한 번에 넘겨 토큰 예산별 요청으로 묶고 동시에 번역 (결과는 청크 순서대로)
+        results = batch_translate_texts(chunks, from_lang, to_lang)
+        
         translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"[CHUNK_TRANSLATE] 청크 {i+1}/{len(chunks)} 번역 중... ({len(chunk)}자)")
-            result = batch_translate_texts([chunk], from_lang, to_lang)
-            if result and result[0]:
-                translated_chunks.append(result[0])
-                logger.info(f"[CHUNK_TRANSLATE] 청크 {i+1} 번역 완료")
+        for i, result in enumerate(results):
+            if result:
+                translated_chunks.append(result)
+                logger.info(f"[CHUNK_TRANSLATE] 청크 {i+1}/{len(chunks)} 번역 완료")
             else:
-                logger.error(f"[CHUNK_TRANSLATE] 청크 {i+1} 번역 실패")
+                logger.error(f"[CHUNK_TRANSLATE] 청크 {i+1}/{len(chunks)} 번역 실패")
                 return None  # 하나라도 실패하면 전체 실패
         
         # 번역된 청크들을 합침
         final_text = ''.join(translated_chunks)
         logger.info(f"[CHUNK_TRANSLATE] 전체 번역 완료: {len(chunks)}개 청크 → {len(final_text)}자")
+        set_translation(text, final_text, from_lang, to_lang)
         return final_text
         
     except Exception as e:
@@ -723,8 +740,8 @@ def translate_long_text_in_chunks(text: str, from_lang: str, to_lang: str, chunk
 def batch_translate_texts(texts: List[str], from_language: str, to_language: str) -> List[Optional[str]]:
     """
     여러 텍스트를 한 번의 API 호출로 번역합니다.
-    OpenAI를 먼저 시도하고, 실패하면 Gemini로 fallback합니다.
-    OpenAI 실패 시 1시간간 캐시에 저장하여 이후 요청은 바로 Gemini를 사용합니다.
+    번역 메모리(translation_memory)에 있는 텍스트는 API를 호출하지 않고,
+    나머지만 중복을 제거하여 번역한 뒤 결과를 번역 메모리에 저장합니다.
     
     Args:
         texts: 번역할 텍스트 리스트
@@ -741,6 +758,138 @@ def batch_translate_texts(texts: List[str], from_language: str, to_language: str
         logger.warning(f"[BATCH_TRANSLATE] 지원하지 않는 번역 방향: {from_language} → {to_language}")
         return [None] * len(texts)
     
+    from quiz.utils.translation_memory import translate_with_memory
+    return translate_with_memory(
+        texts, from_language, to_language,
+        lambda missing_texts: _translate_packed_texts(missing_texts, from_language, to_language)
+    )
+
+
+def estimate_translation_tokens(text: str) -> int:
+    """번역 결과의 예상 토큰 수 (JSON 배열 원소 오버헤드 포함)"""
+    return int(len(text) * TRANSLATION_TOKENS_PER_CHAR) + TRANSLATION_PER_TEXT_OVERHEAD_TOKENS
+
+
+def pack_translation_batches(texts: List[str], token_budget: int = TRANSLATION_BATCH_TOKEN_BUDGET,
+                             max_texts: int = BATCH_SIZE) -> List[List[str]]:
+    """
+    텍스트들을 예상 토큰 수 기준으로 요청 단위 묶음으로 나눕니다. (입력 순서 유지)
+    
+    예산을 넘는 단일 텍스트는 단독 묶음이 됩니다.
+    
+    Returns:
+        List[List[str]]: 요청별 텍스트 묶음
+    """
+    batches = []
+    current, current_tokens = [], 0
+    for text in texts:
+        tokens = estimate_translation_tokens(text)
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_texts):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _translate_packed_texts(texts: List[str], from_language: str, to_language: str) -> List[Optional[str]]:
+    """
+    텍스트들을 토큰 예산별 묶음으로 나누어 동시에 번역하고 입력 순서대로 결과를 반환합니다.
+    (중복 제거와 번역 메모리 조회는 translate_with_memory에서 처리)
+    """
+    from quiz.utils.translation_executor import map_concurrently
+    
+    batches = pack_translation_batches(texts)
+    if len(batches) > 1:
+        logger.info(f"[BATCH_TRANSLATE] {len(texts)}개 텍스트를 토큰 예산 기준 {len(batches)}개 요청으로 분할 ({from_language} → {to_language})")
+    
+    batch_results = map_concurrently(
+        lambda batch: _retry_failed_translations(
+            batch, _call_translation_batch(batch, from_language, to_language), from_language, to_language
+        ),
+        batches
+    )
+    
+    results = []
+    for batch, batch_result in zip(batches, batch_results):
+        if isinstance(batch_result, Exception):
+            logger.error(f"[BATCH_TRANSLATE] 묶음 번역 중 오류: {batch_result}")
+            batch_result = [None] * len(batch)
+        results.extend(batch_result)
+    return results
+
+
+def _call_translation_batch(texts: List[str], from_language: str, to_language: str) -> List[Optional[str]]:
+    """한 묶음을 한 번의 LLM 요청으로 번역 (결과 개수가 맞지 않으면 전체 실패로 처리)"""
+    try:
+        results = _batch_translate_texts_with_llm(texts, from_language, to_language)
+    except Exception as e:
+        logger.error(f"[BATCH_TRANSLATE] 묶음 번역 요청 실패: {e}")
+        return [None] * len(texts)
+    if not isinstance(results, list) or len(results) != len(texts):
+        return [None] * len(texts)
+    return [result if isinstance(result, str) and result else None for result in results]
+
+
+def _retry_failed_translations(texts: List[str], results: List[Optional[str]], from_language: str, to_language: str,
+                               split_depth: int = 0) -> List[Optional[str]]:
+    """
+    실패한 슬라이스만 다시 번역합니다.
+    
+    - 일부만 실패: 실패한 텍스트들만 한 묶음으로 재시도
+    - 전체 실패(응답 파싱 실패 등): 묶음을 반으로 나누어 재시도 (최대 TRANSLATION_SPLIT_MAX_DEPTH번)
+      두 절반이 모두 실패하고 OpenAI가 사용 불가 상태로 마킹되었으면 제공자 장애로 보고 중단
+    """
+    failed_indexes = [i for i, result in enumerate(results) if not result]
+    if not failed_indexes or len(texts) == 1:
+        return results
+    
+    if len(failed_indexes) < len(texts):
+        logger.info(f"[BATCH_TRANSLATE] {len(texts)}개 중 실패한 {len(failed_indexes)}개만 재시도")
+        retry_texts = [texts[i] for i in failed_indexes]
+        retry_results = _retry_failed_translations(
+            retry_texts, _call_translation_batch(retry_texts, from_language, to_language), from_language, to_language,
+            split_depth
+        )
+        results = list(results)
+        for i, retry_result in zip(failed_indexes, retry_results):
+            results[i] = retry_result
+        return results
+    
+    if split_depth >= TRANSLATION_SPLIT_MAX_DEPTH:
+        logger.error(f"[BATCH_TRANSLATE] 묶음 분할 재시도 한도 도달, {len(texts)}개 번역 실패 ({from_language} → {to_language})")
+        return results
+    
+    middle = len(texts) // 2
+    halves = [texts[:middle], texts[middle:]]
+    logger.warning(f"[BATCH_TRANSLATE] {len(texts)}개 묶음 전체 실패 → {len(halves[0])}개/{len(halves[1])}개로 나누어 재시도")
+    half_results = [_call_translation_batch(half, from_language, to_language) for half in halves]
+    if not any(any(half_result) for half_result in half_results) and not check_openai_availability():
+        logger.error(f"[BATCH_TRANSLATE] 나눈 묶음도 모두 실패(제공자 장애)하여 재시도 중단 ({from_language} → {to_language})")
+        return [None] * len(texts)
+    
+    results = []
+    for half, half_result in zip(halves, half_results):
+        results.extend(_retry_failed_translations(half, half_result, from_language, to_language, split_depth + 1))
+    return results
+
+
+def _batch_translate_texts_with_llm(texts: List[str], from_language: str, to_language: str) -> List[Optional[str]]:
+    """
+    여러 텍스트를 한 번의 LLM API 호출로 번역합니다. (번역 메모리 미적용)
+    OpenAI를 먼저 시도하고, 실패하면 Gemini로 fallback합니다.
+    OpenAI 실패 시 1시간간 캐시에 저장하여 이후 요청은 바로 Gemini를 사용합니다.
+    
+    Args:
+        texts: 번역할 텍스트 리스트
+        from_language: 원본 언어
+        to_language: 대상 언어
+    
+    Returns:
+        List[Optional[str]]: 번역된 텍스트 리스트, 실패 시 None
+    """
     # OpenAI 사용 가능 여부 확인 (캐시 체크) - 함수 시작 시점에 먼저 체크
     openai_error = None
     logger.info(f"[BATCH_TRANSLATE] 🔍 캐시 확인 시작... ({from_language} → {to_language})")
@@ -804,10 +953,10 @@ RULES:
                         # 배치 크기와 텍스트 길이에 따라 토큰 수 조정
                         total_input_length = sum(len(t) for t in texts)
                         # 한국어→영어는 평균 2배, 프롬프트 오버헤드 500 토큰
-                        estimated_output_tokens = int(total_input_length * 2.0) + 500
+                        estimated_output_tokens = sum(estimate_translation_tokens(t) for t in texts) + TRANSLATION_PROMPT_OVERHEAD_TOKENS
                         model = 'gpt-3.5-turbo'
                         # gpt-3.5-turbo의 출력 토큰 제한: 최대 4096
-                        max_tokens = min(estimated_output_tokens, 4096)
+                        max_tokens = min(estimated_output_tokens, TRANSLATION_OUTPUT_TOKEN_LIMIT)
                         
                         logger.info(f"[BATCH_TRANSLATE] 토큰 계산: 입력 길이={total_input_length}, 예상 출력 토큰={estimated_output_tokens}, 실제 할당={max_tokens}, 모델={model}")
                         
@@ -830,12 +979,16 @@ RULES:
                         logger.info(f"[BATCH_TRANSLATE] OpenAI API 호출 시작 - 텍스트 수: {len(texts)}, max_tokens: {max_tokens}")
                         logger.debug(f"[BATCH_TRANSLATE] 요청 텍스트들: {[t[:100] + '...' if len(t) > 100 else t for t in texts]}")
                         
-                        response = requests.post(
-                            'https://api.openai.com/v1/chat/completions',
-                            headers=headers,
-                            json=payload,
-                            timeout=60  # 배치 번역이므로 타임아웃 증가
-                        )
+                        # 제공자별 동시 호출 수/호출 간격 제한 (동시 번역 시 대기 중 차단 상태가 되면 Gemini로 전환)
+                        with provider_slot(PROVIDER_OPENAI):
+                            if not check_openai_availability():
+                                raise requests.exceptions.RequestException("OpenAI가 캐시에서 사용 불가능 상태 (호출 대기 후 재확인)")
+                            response = requests.post(
+                                'https://api.openai.com/v1/chat/completions',
+                                headers=headers,
+                                json=payload,
+                                timeout=60  # 배치 번역이므로 타임아웃 증가
+                            )
                         
                         logger.info(f"[BATCH_TRANSLATE] OpenAI API 응답 상태: {response.status_code}")
                     
@@ -1057,49 +1210,50 @@ Translate these {len(texts)} {from_lang_name} text(s) to {to_lang_name}. Return
         
         # Gemini API 호출
         # estimated_output_tokens가 정의되지 않았을 경우를 대비
-        total_input_length = sum(len(t) for t in texts)
-        estimated_output_tokens = int(total_input_length * 2.0) + 500
+        estimated_output_tokens = sum(estimate_translation_tokens(t) for t in texts) + TRANSLATION_PROMPT_OVERHEAD_TOKENS
         gemini_max_tokens = max(estimated_output_tokens, 2000)
-        # 안전 필터 설정: 번역 콘텐츠를 위해 안전 필터 민감도 낮춤
-        try:
-            # Google Generative AI SDK에서 제공하는 enum 사용 시도
-            from google.generativeai.types import HarmCategory, HarmBlockThreshold
-            safety_settings = [
-                {
-                    "category": HarmCategory.HARM_CATEGORY_HARASSMENT,
-                    "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                    "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                    "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                    "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH  # 번역 콘텐츠 허용을 위해 낮춤
-                }
-            ]
-            response = model.generate_content(
-                gemini_prompt,
-                generation_config={
-                    'temperature': 0.3,
-                    'max_output_tokens': gemini_max_tokens,
-                },
-                safety_settings=safety_settings
-            )
-        except (ImportError, AttributeError, TypeError) as e:
-            # safety_settings 설정 실패 시 기본 설정으로 fallback
-            logger.debug(f"[BATCH_TRANSLATE] Gemini 안전 필터 설정 실패, 기본 설정 사용: {e}")
-            response = model.generate_content(
-                gemini_prompt,
-                generation_config={
-                    'temperature': 0.3,
-                    'max_output_tokens': gemini_max_tokens,
-                }
-            )
+        # 제공자별 동시 호출 수/호출 간격 제한
+        with provider_slot(PROVIDER_GEMINI):
+            # 안전 필터 설정: 번역 콘텐츠를 위해 안전 필터 민감도 낮춤
+            try:
+                # Google Generative AI SDK에서 제공하는 enum 사용 시도
+                from google.generativeai.types import HarmCategory, HarmBlockThreshold
+                safety_settings = [
+                    {
+                        "category": HarmCategory.HARM_CATEGORY_HARASSMENT,
+                        "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
+                    },
+                    {
+                        "category": HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+                        "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
+                    },
+                    {
+                        "category": HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+                        "threshold": HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE
+                    },
+                    {
+                        "category": HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+                        "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH  # 번역 콘텐츠 허용을 위해 낮춤
+                    }
+                ]
+                response = model.generate_content(
+                    gemini_prompt,
+                    generation_config={
+                        'temperature': 0.3,
+                        'max_output_tokens': gemini_max_tokens,
+                    },
+                    safety_settings=safety_settings
+                )
+            except (ImportError, AttributeError, TypeError) as e:
+                # safety_settings 설정 실패 시 기본 설정으로 fallback
+                logger.debug(f"[BATCH_TRANSLATE] Gemini 안전 필터 설정 실패, 기본 설정 사용: {e}")
+                response = model.generate_content(
+                    gemini_prompt,
+                    generation_config={
+                        'temperature': 0.3,
+                        'max_output_tokens': gemini_max_tokens,
+                    }
+                )
         
         # 응답 확인
         if not response or not response.candidates:
@@ -1153,9 +1307,103 @@ Translate these {len(texts)} {from_lang_name} text(s) to {to_lang_name}. Return
         logger.error(f"[BATCH_TRANSLATE] {error_msg}")
         return [None] * len(texts)
 
+QUESTION_TRANSLATION_FIELDS = ['title', 'content', 'answer', 'explanation']
+_QUESTION_TRANSLATION_DIRECTIONS = [
+    ('ko', 'en', '한국어→영어'),
+    ('en', 'ko', '영어→한국어'),
+]
+
+
+def _collect_question_translation_texts(questions: List, field_types: List[str]) -> Dict[Tuple[str, str], List[Tuple[str, Any, str]]]:
+    """
+    번역이 필요한 문제 필드를 번역 방향별로 모읍니다.
+    
+    Returns:
+        Dict: {(원본 언어, 대상 언어): [(필드 종류, 문제 ID, 원문), ...]}
+    """
+    texts = {(from_lang, to_lang): [] for from_lang, to_lang, _ in _QUESTION_TRANSLATION_DIRECTIONS}
+    for question in questions:
+        for field_type in field_types:
+            ko_value = getattr(question, f'{field_type}_ko', None)
+            en_value = getattr(question, f'{field_type}_en', None)
+            if ko_value and not en_value:
+                texts[('ko', 'en')].append((field_type, question.id, ko_value))
+            elif en_value and not ko_value:
+                texts[('en', 'ko')].append((field_type, question.id, en_value))
+    return texts
+
+
+def _translate_question_batches(batches: List[List], field_types: List[str], log_prefix: str) -> List[Dict[str, Any]]:
+    """
+    문제 배치들의 번역을 동시에 요청하고, 결과 적용/저장은 배치 순서대로 처리합니다.
+    
+    모든 (배치, 번역 방향) 요청을 translation_executor로 동시에 실행하여
+    배치/방향마다 LLM 응답을 순차로 기다리지 않는다. 저장은 요청 스레드에서 수행한다.
+    
+    Returns:
+        List[Dict]: 배치별 번역 결과 통계 (total, translated, failed, errors)
+    """
+    from quiz.utils.translation_executor import map_concurrently
+    
+    batch_texts = [_collect_question_translation_texts(batch, field_types) for batch in batches]
+    jobs = [
+        (batch_index, from_lang, to_lang)
+        for batch_index, texts in enumerate(batch_texts)
+        for from_lang, to_lang, _ in _QUESTION_TRANSLATION_DIRECTIONS
+        if texts[(from_lang, to_lang)]
+    ]
+    job_results = dict(zip(jobs, map_concurrently(
+        lambda job: batch_translate_texts(
+            [text for _, _, text in batch_texts[job[0]][(job[1], job[2])]], job[1], job[2]
+        ),
+        jobs
+    )))
+    
+    results = []
+    for batch_index, (batch, texts) in enumerate(zip(batches, batch_texts)):
+        questions_by_id = {question.id: question for question in batch}
+        translated_count = 0
+        failed_count = 0
+        errors = []
+        
+        for from_lang, to_lang, direction_label in _QUESTION_TRANSLATION_DIRECTIONS:
+            entries = texts[(from_lang, to_lang)]
+            if not entries:
+                continue
+            try:
+                translated_texts = job_results[(batch_index, from_lang, to_lang)]
+                if isinstance(translated_texts, Exception):
+                    raise translated_texts
+                
+                # 번역 결과를 각 문제에 적용
+                for i, (field_type, question_id, _) in enumerate(entries):
+                    if translated_texts[i]:
+                        question = questions_by_id[question_id]
+                        setattr(question, f'{field_type}_{to_lang}', translated_texts[i])
+                        question.save(update_fields=[f'{field_type}_{to_lang}'])
+                        translated_count += 1
+                    else:
+                        failed_count += 1
+                        errors.append(f"문제 {question_id}의 {field_type} 번역 실패")
+                        
+            except Exception as e:
+                logger.error(f"{log_prefix} {direction_label} 번역 실패: {e}")
+                failed_count += len(entries)
+                errors.append(f"{direction_label} 배치 번역 실패: {str(e)}")
+        
+        results.append({
+            'total': sum(len(entries) for entries in texts.values()),
+            'translated': translated_count,
+            'failed': failed_count,
+            'errors': errors
+        })
+    return results
+
+
 def batch_translate_questions(questions: List, user, max_retries: int = MAX_RETRIES) -> Dict[str, Any]:
     """
     여러 문제를 배치로 번역 처리합니다.
+    한국어→영어, 영어→한국어 요청은 동시에 실행됩니다.
     
     Args:
         questions: 번역할 문제 리스트
@@ -1174,92 +1422,10 @@ def batch_translate_questions(questions: List, user, max_retries: int = MAX_RETR
     
     logger.info(f"[BATCH_QUESTION_TRANSLATE] {len(questions)}개 문제 배치 번역 시작")
     
-    # 번역할 텍스트들을 언어별로 그룹화
-    ko_texts = []  # 한국어 → 영어 번역 대상
-    en_texts = []  # 영어 → 한국어 번역 대상
-    
-    for question in questions:
-        # 제목 번역
-        if hasattr(question, 'title_ko') and question.title_ko and not getattr(question, 'title_en', None):
-            ko_texts.append(('title', question.id, question.title_ko))
-        elif hasattr(question, 'title_en') and question.title_en and not getattr(question, 'title_ko', None):
-            en_texts.append(('title', question.id, question.title_en))
-        
-        # 내용 번역
-        if hasattr(question, 'content_ko') and question.content_ko and not getattr(question, 'content_en', None):
-            ko_texts.append(('content', question.id, question.content_ko))
-        elif hasattr(question, 'content_en') and question.content_en and not getattr(question, 'content_ko', None):
-            en_texts.append(('content', question.id, question.content_en))
-        
-        # 정답 번역
-        if hasattr(question, 'answer_ko') and question.answer_ko and not getattr(question, 'answer_en', None):
-            ko_texts.append(('answer', question.id, question.answer_ko))
-        elif hasattr(question, 'answer_en') and question.answer_en and not getattr(question, 'answer_ko', None):
-            en_texts.append(('answer', question.id, question.answer_en))
-        
-        # 설명 번역
-        if hasattr(question, 'explanation_ko') and question.explanation_ko and not getattr(question, 'explanation_en', None):
-            ko_texts.append(('explanation', question.id, question.explanation_ko))
-        elif hasattr(question, 'explanation_en') and question.explanation_en and not getattr(question, 'explanation_ko', None):
-            en_texts.append(('explanation', question.id, question.explanation_en))
-    
-    total_translations = len(ko_texts) + len(en_texts)
-    translated_count = 0
-    failed_count = 0
-    errors = []
-    
-    # 한국어 → 영어 배치 번역
-    if ko_texts:
-        try:
-            texts_to_translate = [text for _, _, text in ko_texts]
-            translated_texts = batch_translate_texts(texts_to_translate, 'ko', 'en')
-            
-            # 번역 결과를 각 문제에 적용
-            for i, (field_type, question_id, _) in enumerate(ko_texts):
-                if translated_texts[i]:
-                    question = next(q for q in questions if q.id == question_id)
-                    setattr(question, f'{field_type}_en', translated_texts[i])
-                    question.save(update_fields=[f'{field_type}_en'])
-                    translated_count += 1
-                else:
-                    failed_count += 1
-                    errors.append(f"문제 {question_id}의 {field_type} 번역 실패")
-                    
-        except Exception as e:
-            logger.error(f"[BATCH_QUESTION_TRANSLATE] 한국어→영어 번역 실패: {e}")
-            failed_count += len(ko_texts)
-            errors.append(f"한국어→영어 배치 번역 실패: {str(e)}")
-    
-    # 영어 → 한국어 배치 번역
-    if en_texts:
-        try:
-            texts_to_translate = [text for _, _, text in en_texts]
-            translated_texts = batch_translate_texts(texts_to_translate, 'en', 'ko')
-            
-            # 번역 결과를 각 문제에 적용
-            for i, (field_type, question_id, _) in enumerate(en_texts):
-                if translated_texts[i]:
-                    question = next(q for q in questions if q.id == question_id)
-                    setattr(question, f'{field_type}_ko', translated_texts[i])
-                    question.save(update_fields=[f'{field_type}_ko'])
-                    translated_count += 1
-                else:
-                    failed_count += 1
-                    errors.append(f"문제 {question_id}의 {field_type} 번역 실패")
-                    
-        except Exception as e:
-            logger.error(f"[BATCH_QUESTION_TRANSLATE] 영어→한국어 번역 실패: {e}")
-            failed_count += len(en_texts)
-            errors.append(f"영어→한국어 배치 번역 실패: {str(e)}")
-    
-    logger.info(f"[BATCH_QUESTION_TRANSLATE] 배치 번역 완료: {translated_count}/{total_translations} 성공, {failed_count} 실패")
+    result = _translate_question_batches([questions], QUESTION_TRANSLATION_FIELDS, '[BATCH_QUESTION_TRANSLATE]')[0]
     
-    return {
-        'total': total_translations,
-        'translated': translated_count,
-        'failed': failed_count,
-        'errors': errors
-    }
+    logger.info(f"[BATCH_QUESTION_TRANSLATE] 배치 번역 완료: {result['translated']}/{result['total']} 성공, {result['failed']} 실패")
+    return result
 
 def batch_translate_question_titles(questions: List, user, max_retries: int = MAX_RETRIES) -> Dict[str, Any]:
     """
@@ -1278,78 +1444,17 @@ def batch_translate_question_titles(questions: List, user, max_retries: int = MA
     
     logger.info(f"[BATCH_QUESTION_TITLE_TRANSLATE] {len(questions)}개 문제 제목 배치 번역 시작")
     
-    # 번역할 텍스트들을 언어별로 그룹화 (제목만)
-    ko_texts = []  # 한국어 → 영어 번역 대상
-    en_texts = []  # 영어 → 한국어 번역 대상
-    
-    for question in questions:
-        # 제목만 번역 (내용, 정답, 설명은 제외)
-        if hasattr(question, 'title_ko') and question.title_ko and not getattr(question, 'title_en', None):
-            ko_texts.append(('title', question.id, question.title_ko))
-        elif hasattr(question, 'title_en') and question.title_en and not getattr(question, 'title_ko', None):
-            en_texts.append(('title', question.id, question.title_en))
-    
-    total_translations = len(ko_texts) + len(en_texts)
-    translated_count = 0
-    failed_count = 0
-    errors = []
-    
-    # 한국어 → 영어 배치 번역
-    if ko_texts:
-        try:
-            texts_to_translate = [text for _, _, text in ko_texts]
-            translated_texts = batch_translate_texts(texts_to_translate, 'ko', 'en')
-            
-            # 번역 결과를 각 문제에 적용
-            for i, (field_type, question_id, _) in enumerate(ko_texts):
-                if translated_texts[i]:
-                    question = next(q for q in questions if q.id == question_id)
-                    setattr(question, f'{field_type}_en', translated_texts[i])
-                    question.save(update_fields=[f'{field_type}_en'])
-                    translated_count += 1
-                else:
-                    failed_count += 1
-                    errors.append(f"문제 {question_id}의 {field_type} 번역 실패")
-                    
-        except Exception as e:
-            logger.error(f"[BATCH_QUESTION_TITLE_TRANSLATE] 한국어→영어 번역 실패: {e}")
-            failed_count += len(ko_texts)
-            errors.append(f"한국어→영어 배치 번역 실패: {str(e)}")
+    # 제목만 번역 (내용, 정답, 설명은 제외)
+    result = _translate_question_batches([questions], ['title'], '[BATCH_QUESTION_TITLE_TRANSLATE]')[0]
     
-    # 영어 → 한국어 배치 번역
-    if en_texts:
-        try:
-            texts_to_translate = [text for _, _, text in en_texts]
-            translated_texts = batch_translate_texts(texts_to_translate, 'en', 'ko')
-            
-            # 번역 결과를 각 문제에 적용
-            for i, (field_type, question_id, _) in enumerate(en_texts):
-                if translated_texts[i]:
-                    question = next(q for q in questions if q.id == question_id)
-                    setattr(question, f'{field_type}_ko', translated_texts[i])
-                    question.save(update_fields=[f'{field_type}_ko'])
-                    translated_count += 1
-                else:
-                    failed_count += 1
-                    errors.append(f"문제 {question_id}의 {field_type} 번역 실패")
-                    
-        except Exception as e:
-            logger.error(f"[BATCH_QUESTION_TITLE_TRANSLATE] 영어→한국어 번역 실패: {e}")
-            failed_count += len(en_texts)
-            errors.append(f"영어→한국어 배치 번역 실패: {str(e)}")
-    
-    logger.info(f"[BATCH_QUESTION_TITLE_TRANSLATE] 제목 배치 번역 완료: {translated_count}/{total_translations} 성공, {failed_count} 실패")
-    
-    return {
-        'total': total_translations,
-        'translated': translated_count,
-        'failed': failed_count,
-        'errors': errors
-    }
+    logger.info(f"[BATCH_QUESTION_TITLE_TRANSLATE] 제목 배치 번역 완료: {result['translated']}/{result['total']} 성공, {result['failed']} 실패")
+    return result
 
 def process_large_question_batch(questions: List, user, batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
     """
     대량의 문제를 배치로 나누어 번역 처리합니다.
+    배치별 번역 요청은 동시에 실행하고(제공자별 동시 호출 수/호출 간격 제한 적용),
+    결과 적용은 배치 순서대로 처리합니다.
     
     Args:
         questions: 번역할 문제 리스트
@@ -1388,35 +1493,22 @@ def process_large_question_batch(questions: List, user, batch_size: int = BATCH_
     total_failed = 0
     all_errors = []
     
-    # 각 배치별로 번역 처리
-    for i, batch in enumerate(batches):
-        try:
-            logger.info(f"[LARGE_BATCH_TRANSLATE] 배치 {i+1}/{len(batches)} 처리 중 ({len(batch)}개 문제)")
-            
-            # 배치 번역 수행
-            result = batch_translate_questions(batch, user)
-            
-            total_translations += result['total']
-            total_successful += result['translated']
-            total_failed += result['failed']
-            all_errors.extend(result['errors'])
-            
-            # 진행률 표시
-            progress = ((i + 1) / len(batches)) * 100
-            logger.info(f"[LARGE_BATCH_TRANSLATE] 진행률: {progress:.1f}% ({i+1}/{len(batches)})")
-            
-            # 메모리 정리
-            gc.collect()
-            
-            # API 호출 간격 조절 (Rate Limiting 방지)
-            if i < len(batches) - 1:  # 마지막 배치가 아닌 경우
-                time.sleep(0.5)  # 0.5초 대기
-            
-        except Exception as e:
-            logger.error(f"[LARGE_BATCH_TRANSLATE] 배치 {i+1} 처리 실패: {e}")
-            all_errors.append(f"배치 {i+1} 처리 실패: {str(e)}")
-            # 실패한 배치는 건너뛰고 계속 진행
-            continue
+    try:
+        batch_results = _translate_question_batches(batches, QUESTION_TRANSLATION_FIELDS, '[LARGE_BATCH_TRANSLATE]')
+    except Exception as e:
+        logger.error(f"[LARGE_BATCH_TRANSLATE] 배치 번역 처리 실패: {e}")
+        batch_results = []
+        all_errors.append(f"배치 번역 처리 실패: {str(e)}")
+    
+    for i, result in enumerate(batch_results):
+        total_translations += result['total']
+        total_successful += result['translated']
+        total_failed += result['failed']
+        all_errors.extend(result['errors'])
+        
+        # 진행률 표시
+        progress = ((i + 1) / len(batches)) * 100
+        logger.info(f"[LARGE_BATCH_TRANSLATE] 진행률: {progress:.1f}% ({i+1}/{len(batches)})")
     
     logger.info(f"[LARGE_BATCH_TRANSLATE] 전체 배치 번역 완료: {total_successful}/{total_translations} 성공, {total_failed} 실패")
     
@@ -1429,6 +1521,18 @@ def process_large_question_batch(questions: List, user, batch_size: int = BATCH_
     }
 
 
+def _smart_translate_with_fallback(from_lang: str, to_lang: str, content: str) -> Optional[str]:
+    """스마트 번역(선택지 형식 보존), 실패 시 배치 번역으로 폴백"""
+    try:
+        # 스마트 번역으로 선택지 형식 보존 (원본 언어 정보 전달)
+        return smart_translate_content(content, to_lang, from_lang)
+    except Exception as e:
+        logger.warning(f"[MULTILINGUAL] 스마트 번역 실패, 기존 방식으로 폴백: {e}")
+        # 스마트 번역 실패 시 기존 배치 번역으로 폴백
+        fallback_result = batch_translate_texts([content], from_lang, to_lang)
+        return fallback_result[0] if fallback_result else None
+
+
 class MultilingualContentManager:
     """
     다국어 콘텐츠를 관리하는 공통 클래스
@@ -1531,6 +1635,17 @@ class MultilingualContentManager:
         if has_translation:
             logger.info(f"[MULTILINGUAL] 다국어 콘텐츠 업데이트 완료 (번역 작업 {len(translation_tasks)}개 실행)")
     
+    def apply_translation_tasks(self, translation_tasks: List[Tuple[str, str, str, str]]) -> None:
+        """
+        이미 식별된 번역 작업을 실행하고 완성도 상태를 갱신합니다. (백그라운드 번역 워커용)
+
+        Args:
+            translation_tasks: (필드명, 원본언어, 대상언어, 콘텐츠) 튜플의 리스트
+        """
+        self._execute_batch_translations(translation_tasks)
+        if not self.skip_completion_update:
+            self._update_language_completion_status()
+
     def _identify_translation_tasks(self) -> List[Tuple[str, str, str, str]]:
         """
         번역이 필요한 콘텐츠를 식별합니다.
@@ -1717,28 +1832,44 @@ class MultilingualContentManager:
                 language_groups[key] = []
             language_groups[key].append((field_name, content))
         
-        # 각 언어 그룹별로 배치 번역 수행
+        # 번역 메모리에 있는 필드는 언어 그룹별로 한 번에 조회하여 바로 사용
+        from quiz.utils.translation_memory import get_many as get_remembered_translations
+        remembered_by_group = {
+            (from_lang, to_lang): get_remembered_translations([content for _, content in tasks], from_lang, to_lang)
+            for (from_lang, to_lang), tasks in language_groups.items()
+        }
+        
+        # 나머지 필드는 대상 언어/필드별 요청을 동시에 번역 (스마트 번역으로 선택지 형식 보존)
+        pending = list(dict.fromkeys(
+            (from_lang, to_lang, content)
+            for (from_lang, to_lang), tasks in language_groups.items()
+            for _, content in tasks
+            if not remembered_by_group[(from_lang, to_lang)].get(content)
+        ))
+        from quiz.utils.translation_executor import map_concurrently
+        pending_results = dict(zip(pending, map_concurrently(lambda task: _smart_translate_with_fallback(*task), pending)))
+        
+        # 각 언어 그룹별로 번역 결과 적용 및 저장
         for (from_lang, to_lang), tasks in language_groups.items():
             try:
                 # 번역할 텍스트들 추출
                 texts = [content for _, content in tasks]
                 field_names = [field_name for field_name, _ in tasks]
                 
-                logger.info(f"[MULTILINGUAL] 배치 번역 시작: {len(texts)}개 텍스트 ({from_lang} → {to_lang})")
+                logger.info(f"[MULTILINGUAL] 배치 번역 결과 적용 시작: {len(texts)}개 텍스트 ({from_lang} → {to_lang})")
                 
-                # 스마트 번역 수행 (선택지 형식 보존)
+                remembered = remembered_by_group[(from_lang, to_lang)]
                 translated_texts = []
                 for i, content in enumerate(texts):
-                    try:
-                        # 스마트 번역으로 선택지 형식 보존 (원본 언어 정보 전달)
-                        translated_content = smart_translate_content(content, to_lang, from_lang)
-                        translated_texts.append(translated_content)
-                        logger.info(f"[MULTILINGUAL] 스마트 번역 완료: {field_names[i]} - 선택지 형식 보존")
-                    except Exception as e:
-                        logger.warning(f"[MULTILINGUAL] 스마트 번역 실패, 기존 방식으로 폴백: {e}")
-                        # 스마트 번역 실패 시 기존 배치 번역으로 폴백
-                        fallback_result = batch_translate_texts([content], from_lang, to_lang)
-                        translated_texts.append(fallback_result[0] if fallback_result else None)
+                    if remembered.get(content):
+                        translated_texts.append(remembered[content])
+                        logger.info(f"[MULTILINGUAL] 번역 메모리 적중: {field_names[i]}")
+                        continue
+                    translated_content = pending_results.get((from_lang, to_lang, content))
+                    if isinstance(translated_content, Exception):
+                        logger.warning(f"[MULTILINGUAL] {field_names[i]} 번역 중 오류: {translated_content}")
+                        translated_content = None
+                    translated_texts.append(translated_content)
                 
                 # 번역 결과 저장
                 logger.info(f"[MULTILINGUAL_SAVE] 번역 결과 저장 시작 - 인스턴스 ID: {self.instance.id}, skip_completion_update: {self.skip_completion_update}")
@@ -2367,22 +2498,27 @@ def load_answer_check_template():
         return _answer_check_template_cache
 
 
-def check_answer_with_ai(user_answer: str, correct_answer: str, language: str = 'en') -> Dict[str, Any]:
+def check_answer_with_ai(user_answer: str, correct_answer: str, language: str = 'en', question_id=None) -> Dict[str, Any]:
     """
     AI를 사용하여 사용자 답안이 정답과 의미적으로 일치하는지 판단합니다.
     OpenAI를 먼저 시도하고, 실패하면 Gemini로 fallback합니다.
     
+    정규화(NFKC/대소문자/문장부호/공백) 후 일치하거나 거의 일치하는 답안은 AI 없이 판정하고,
+    AI 판정은 (문제 ID, 정답, 정규화한 답안, 언어) 단위로 캐시합니다. (answer_verdict_cache)
+    
     Args:
         user_answer: 사용자가 입력한 답안
         correct_answer: 정답
         language: 답안의 언어 (기본값: 'en')
+        question_id: 문제 ID (선택, 판정 캐시 키에 사용)
     
     Returns:
         Dict: {
             'is_correct': bool,  # 정답 여부
             'confidence': float,  # 신뢰도 (0.0 ~ 1.0)
             'reason': str,  # 판단 이유
-            'provider': str  # 사용한 AI 제공자 ('openai' 또는 'gemini')
+            'provider': str,  # 판정 방식 ('exact_match', 'fuzzy_match', 'openai' 또는 'gemini')
+            'cached': bool  # 캐시된 판정인 경우에만 포함
         }
     """
     if not user_answer or not correct_answer:
@@ -2393,15 +2529,29 @@ def check_answer_with_ai(user_answer: str, correct_answer: str, language: str =
             'provider': None
         }
     
-    # 단순 문자열 비교로 정확히 일치하면 바로 반환 (AI 호출 불필요)
-    if user_answer.strip().lower() == correct_answer.strip().lower():
-        return {
-            'is_correct': True,
-            'confidence': 1.0,
-            'reason': '답안이 정확히 일치합니다.',
-            'provider': 'exact_match'
-        }
+    from quiz.utils import answer_verdict_cache
     
+    # 정확히/거의 일치하면 바로 반환 (AI 호출 불필요)
+    verdict = answer_verdict_cache.precheck_answer(user_answer, correct_answer)
+    if verdict:
+        return verdict
+    
+    verdict = answer_verdict_cache.get_verdict(
+        answer_verdict_cache.KIND_CHECK, user_answer, correct_answer, language, question_id
+    )
+    if verdict:
+        logger.info(f"[CHECK_ANSWER] 판정 캐시 적중 (question_id: {question_id}, provider: {verdict['provider']})")
+        return verdict
+    
+    verdict = _check_answer_with_llm(user_answer, correct_answer, language)
+    answer_verdict_cache.set_verdict(
+        answer_verdict_cache.KIND_CHECK, user_answer, correct_answer, language, verdict, question_id
+    )
+    return verdict
+
+
+def _check_answer_with_llm(user_answer: str, correct_answer: str, language: str) -> Dict[str, Any]:
+    """OpenAI → Gemini 순서로 답안 일치 여부를 판단 (모두 실패하면 provider None)"""
     # OpenAI 사용 가능 여부 확인
     openai_error = None
     is_openai_unavailable = not check_openai_availability()
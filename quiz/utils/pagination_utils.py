@@ -0,0 +1,122 @@
+"""
+목록 API 페이지네이션 유틸리티
+
+OFFSET 페이지네이션은 뒤 페이지로 갈수록 앞선 행을 모두 읽고 버려야 하므로,
+(created_at, id) 키셋 커서와 전체 개수 계산 생략/추정 옵션을 제공한다.
+1. encode_cursor / decode_cursor: 마지막 행의 (created_at, id)를 커서 문자열로 변환
+2. apply_created_at_cursor: created_at 인덱스를 사용하는 키셋 조건 적용
+3. get_total_count: exact(COUNT) / estimate(PostgreSQL 실행 계획 추정) / none(생략)
+"""
+import json
+import logging
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+COUNT_MODE_EXACT = 'exact'
+COUNT_MODE_ESTIMATE = 'estimate'
+COUNT_MODE_NONE = 'none'
+COUNT_MODES = (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATE, COUNT_MODE_NONE)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# 추정치가 이보다 작으면 정확한 COUNT도 충분히 싸므로 정확한 값을 사용
+ESTIMATE_EXACT_THRESHOLD = 1000
+
+
+class InvalidCursor(ValueError):
+    """잘못된 페이지네이션 커서"""
+
+
+def encode_cursor(created_at, pk):
+    """(created_at, id)를 URL에 안전한 커서 문자열(에포크 마이크로초_id)로 변환"""
+    if timezone.is_naive(created_at):
+        created_at = timezone.make_aware(created_at, dt_timezone.utc)
+    micros = (created_at - EPOCH) // timedelta(microseconds=1)
+    return f"{micros}_{pk}"
+
+
+def decode_cursor(cursor):
+    """
+    커서 문자열을 (created_at, id)로 변환합니다.
+
+    Raises:
+        InvalidCursor: 형식이 잘못된 경우
+    """
+    micros, _, pk = cursor.partition('_')
+    try:
+        created_at = EPOCH + timedelta(microseconds=int(micros))
+    except (ValueError, OverflowError) as e:
+        raise InvalidCursor(f'잘못된 커서입니다: {e}')
+    if not pk:
+        raise InvalidCursor('잘못된 커서입니다.')
+    if not settings.USE_TZ:
+        created_at = timezone.make_naive(created_at, dt_timezone.utc)
+    return created_at, pk
+
+
+def apply_created_at_cursor(queryset, cursor):
+    """
+    (-created_at, -id) 정렬 기준으로 커서 다음 행부터 조회하도록 조건을 추가합니다.
+
+    created_at <= c 범위 조건을 앞에 두어 created_at 인덱스 범위 스캔을 사용하고,
+    같은 created_at 안에서는 id로 순서를 이어간다.
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    if not cursor:
+        return queryset
+    created_at, pk = decode_cursor(cursor)
+    try:
+        pk = queryset.model._meta.pk.to_python(pk)
+    except ValidationError as e:
+        raise InvalidCursor(f'잘못된 커서입니다: {e}')
+    return queryset.filter(
+        Q(created_at__lte=created_at) & (Q(created_at__lt=created_at) | Q(id__lt=pk))
+    )
+
+
+def estimate_queryset_count(queryset):
+    """
+    PostgreSQL 실행 계획의 예상 행 수로 개수를 추정합니다.
+
+    PostgreSQL이 아니거나 추정에 실패하면 정확한 COUNT로 폴백한다.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    try:
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]['Plan']['Plan Rows'])
+    except Exception as e:
+        logger.warning(f"[PAGINATION] 개수 추정 실패, 정확한 COUNT로 폴백: {e}")
+        return queryset.count()
+
+    if estimate < ESTIMATE_EXACT_THRESHOLD:
+        return queryset.count()
+    return estimate
+
+
+def get_total_count(queryset, count_mode=COUNT_MODE_EXACT):
+    """
+    count_mode에 따라 전체 개수를 계산합니다.
+
+    Returns:
+        int 또는 None (count_mode가 none인 경우)
+    """
+    if count_mode == COUNT_MODE_NONE:
+        return None
+    if count_mode == COUNT_MODE_ESTIMATE:
+        return estimate_queryset_count(queryset)
+    return queryset.count()
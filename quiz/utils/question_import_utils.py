@@ -0,0 +1,198 @@
+"""
+문제 가져오기(import) 유틸리티
+
+파일의 행마다 Question/ExamQuestion을 create()/save()하고, 그때마다 ExamQuestion
+post_save 시그널이 시험의 문제 수를 다시 세던 방식을 청크 단위 일괄 처리로 대체한다.
+1. 행은 IMPORT_CHUNK_SIZE개씩 나누어 처리하고 청크마다 한 트랜잭션으로 저장
+2. 새 문제는 bulk_create, 기존 문제는 bulk_update, 시험 연결은 ExamQuestion bulk_create
+   (bulk 연산은 post_save 시그널을 보내지 않으므로 행마다 문제 수를 다시 세지 않음)
+3. 시험의 total_questions는 가져오기가 끝난 뒤 한 번만 갱신
+4. 청크 저장이 실패하면 해당 청크만 행 단위로 다시 저장하여 실패한 행 번호와 오류를 기록
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 500
+BULK_BATCH_SIZE = 100
+
+# 가져오기에서 갱신할 수 있는 Question 필드 (bulk_update 대상)
+QUESTION_IMPORT_FIELDS = [
+    f'{field_name}_{lang}'
+    for field_name in ('title', 'content', 'answer', 'explanation')
+    for lang in SUPPORTED_LANGUAGES
+] + [
+    'csv_id', 'source_id', 'difficulty', 'url', 'group_id', 'created_language',
+    *[f'is_{lang}_complete' for lang in SUPPORTED_LANGUAGES],
+    'title_group_key', 'updated_at',
+]
+
+
+def iter_row_chunks(df, chunk_size=IMPORT_CHUNK_SIZE):
+    """DataFrame 행을 [(index, row), ...] 청크로 나누어 반환 (iterrows와 같은 행 값)"""
+    for start in range(0, len(df), chunk_size):
+        yield list(df.iloc[start:start + chunk_size].iterrows())
+
+
+class QuestionImporter:
+    """
+    청크 단위 문제 가져오기
+
+    사용 예:
+        importer = QuestionImporter(exam)
+        for chunk in iter_row_chunks(df):
+            for index, row in chunk:
+                importer.create(Question(...), row_number=index + 2)
+            importer.flush()
+        importer.finish()
+
+    create()/update()/link()는 저장을 예약만 하고 flush()에서 한 번에 저장한다.
+    """
+
+    def __init__(self, exam=None):
+        self.exam = exam
+        self.created_count = 0
+        self.updated_count = 0
+        self.created_questions = []
+        self.updated_questions = []
+        self.errors = []  # [(행 번호, 오류 메시지), ...]
+
+        self._to_create = {}  # {question.id: (question, row_number)}
+        self._to_update = {}
+        self._links = []  # [(question, order, row_number), ...]
+        self._linked_ids = set()
+        self._next_order = None
+
+    # ----- 저장 예약 -----
+
+    def create(self, question, row_number=None, link=True):
+        """새 문제 생성 예약 (시험이 있으면 마지막 순서 뒤에 연결)"""
+        self._to_create[question.id] = (question, row_number)
+        self.created_count += 1
+        if link and self.exam is not None:
+            self.link(question, row_number=row_number)
+
+    def update(self, question, row_number=None):
+        """기존 문제 갱신 예약 (아직 저장 전인 새 문제는 생성 시 변경 내용이 함께 저장됨)"""
+        self.updated_count += 1
+        if question.id not in self._to_create:
+            self._to_update[question.id] = (question, row_number)
+
+    def link(self, question, order=None, row_number=None):
+        """시험-문제 연결 예약 (order 미지정 시 기존 최대 순서 다음 번호)"""
+        if order is None:
+            if self._next_order is None:
+                self._next_order = self._get_max_order() + 1
+            order = self._next_order
+            self._next_order += 1
+        self._links.append((question, order, row_number))
+        self._linked_ids.add(question.id)
+
+    def is_linked(self, question):
+        return question.id in self._linked_ids
+
+    def record_error(self, row_number, message):
+        self.errors.append((row_number, message))
+
+    def _get_max_order(self):
+        from quiz.models import ExamQuestion
+
+        return ExamQuestion.objects.filter(exam=self.exam).aggregate(Max('order'))['order__max'] or 0
+
+    # ----- 저장 -----
+
+    def flush(self):
+        """예약된 생성/갱신/연결을 한 트랜잭션으로 저장"""
+        if not (self._to_create or self._to_update or self._links):
+            return
+
+        to_create = list(self._to_create.values())
+        to_update = list(self._to_update.values())
+        links = self._links
+        self._to_create, self._to_update, self._links = {}, {}, []
+
+        now = timezone.now()
+        for question, _ in to_create + to_update:
+            question.refresh_derived_fields()
+            question.updated_at = now
+
+        try:
+            with transaction.atomic():
+                self._bulk_save(to_create, to_update, links)
+        except Exception as e:
+            logger.warning(f"[QUESTION_IMPORT] 청크 일괄 저장 실패, 행 단위로 재시도: {e}")
+            self._save_rows(to_create, to_update, links)
+            return
+
+        self.created_questions.extend(question for question, _ in to_create)
+        self.updated_questions.extend(question for question, _ in to_update)
+
+    def _bulk_save(self, to_create, to_update, links):
+        from quiz.models import ExamQuestion, Question
+
+        if to_create:
+            Question.objects.bulk_create([question for question, _ in to_create], batch_size=BULK_BATCH_SIZE)
+        if to_update:
+            Question.objects.bulk_update(
+                [question for question, _ in to_update], QUESTION_IMPORT_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+        if links:
+            ExamQuestion.objects.bulk_create(
+                [ExamQuestion(exam=self.exam, question=question, order=order) for question, order, _ in links],
+                batch_size=BULK_BATCH_SIZE,
+            )
+
+    def _save_rows(self, to_create, to_update, links):
+        """청크 저장 실패 시 행 단위로 저장하여 실패한 행만 오류로 기록"""
+        failed_ids = set()
+
+        for questions, is_new in ((to_create, True), (to_update, False)):
+            for question, row_number in questions:
+                try:
+                    with transaction.atomic():
+                        if is_new:
+                            self._bulk_save([(question, row_number)], [], [])
+                        else:
+                            self._bulk_save([], [(question, row_number)], [])
+                except Exception as e:
+                    failed_ids.add(question.id)
+                    self.record_error(row_number, str(e))
+                    if is_new:
+                        self.created_count -= 1
+                    else:
+                        self.updated_count -= 1
+                    continue
+                (self.created_questions if is_new else self.updated_questions).append(question)
+
+        for question, order, row_number in links:
+            if question.id in failed_ids:
+                continue
+            try:
+                with transaction.atomic():
+                    self._bulk_save([], [], [(question, order, row_number)])
+            except Exception as e:
+                self.record_error(row_number, str(e))
+
+    def finish(self):
+        """남은 예약을 저장하고 시험의 문제 수를 한 번만 갱신"""
+        self.flush()
+
+        if self.exam is not None:
+            from quiz.models import Exam
+            from quiz.utils.cache_utils import ExamCacheManager
+
+            self.exam.total_questions = self.exam.questions.count()
+            Exam.objects.filter(id=self.exam.id).update(total_questions=self.exam.total_questions)
+            ExamCacheManager.invalidate_exam_cache(self.exam.id)
+
+        logger.info(
+            f"[QUESTION_IMPORT] 가져오기 완료 - 생성 {self.created_count}개, "
+            f"업데이트 {self.updated_count}개, 오류 {len(self.errors)}개"
+        )
+        return self
@@ -56,14 +56,8 @@ def group_questions_by_title(questions):
     title_groups = {}
     
     for question in questions:
-        # 제목 결정 (title_en 우선, 없으면 title_ko)
-        title_key = None
-        if question.title_en and question.title_en.strip():
-            title_key = f"en:{question.title_en}"
-        elif question.title_ko and question.title_ko.strip():
-            title_key = f"ko:{question.title_ko}"
-        else:
-            title_key = f"id:{question.id}"  # 제목이 없으면 ID로 그룹화
+        # 제목 결정 (title_en 우선, 없으면 title_ko, 제목이 없으면 ID로 그룹화)
+        title_key = question.build_title_group_key()
         
         if title_key not in title_groups:
             title_groups[title_key] = []
@@ -74,21 +68,118 @@ def group_questions_by_title(questions):
 
 def get_all_questions_by_title_group(title_key):
     """
-    제목 그룹 키를 기반으로 동일한 제목의 모든 문제를 조회합니다.
+    제목 그룹 키를 기반으로 동일한 제목의 모든 문제를 조회합니다. (Question.title_group_key 인덱스 사용)
     
     Args:
-        title_key (str): 'en:title' 또는 'ko:title' 형태의 키
+        title_key (str): 'en:title', 'ko:title' 또는 'id:문제 ID' 형태의 키
     
     Returns:
         QuerySet: 동일한 제목의 모든 문제들
     """
-    if title_key.startswith('en:'):
-        title = title_key[3:]  # 'en:' 제거
-        return Question.objects.filter(title_en=title)
-    elif title_key.startswith('ko:'):
-        title = title_key[3:]  # 'ko:' 제거
-        return Question.objects.filter(title_ko=title)
-    else:
-        # ID로 그룹화된 경우는 해당 문제만
-        question_id = title_key[3:]  # 'id:' 제거
-        return Question.objects.filter(id=question_id)
+    return Question.objects.filter(title_group_key=title_key)
+
+
+def get_title_group_statistics(title_keys, user_id=None):
+    """
+    제목 그룹별 시도/정답 수를 한 번의 집계 쿼리로 계산합니다.
+
+    그룹 통계는 그룹 내 문제별 시도 수, 정답 수 각각의 최대값이다.
+
+    Args:
+        title_keys: 제목 그룹 키 목록 (group_questions_by_title의 키)
+        user_id: 지정하면 해당 사용자의 기록만 집계 (None이면 모든 사용자)
+
+    Returns:
+        dict: {title_key: (total_attempts, correct_attempts)} (기록이 없는 그룹은 (0, 0))
+    """
+    from quiz.models import ExamResultDetail
+
+    title_keys = list(title_keys)
+    group_stats = {title_key: (0, 0) for title_key in title_keys}
+    if not title_keys:
+        return group_stats
+
+    details = ExamResultDetail.objects.filter(question__title_group_key__in=title_keys)
+    if user_id is not None:
+        details = details.filter(result__user_id=user_id)
+
+    rows = details.values('question__title_group_key', 'question_id').annotate(
+        total_attempts=models.Count('id'),
+        correct_attempts=models.Count('id', filter=models.Q(is_correct=True)),
+    ).order_by()
+
+    for row in rows:
+        title_key = row['question__title_group_key']
+        total_attempts, correct_attempts = group_stats[title_key]
+        group_stats[title_key] = (
+            max(total_attempts, row['total_attempts']),
+            max(correct_attempts, row['correct_attempts']),
+        )
+    return group_stats
+
+
+def _question_id_filter(questions):
+    """QuerySet이면 서브쿼리로, 리스트면 ID 목록으로 문제 필터 값을 반환합니다."""
+    if isinstance(questions, models.QuerySet):
+        return questions.values('id')
+    return [question.id for question in questions]
+
+
+def filter_wrong_questions(questions):
+    """
+    한 번 이상 오답 기록이 있는 문제만 반환합니다 (모든 사용자 기준).
+
+    문제별 COUNT 대신 단일 DISTINCT 쿼리로 오답 문제 ID를 조회한다.
+
+    Args:
+        questions: Question QuerySet 또는 리스트
+
+    Returns:
+        list: 오답 기록이 있는 문제 (입력 순서 유지)
+    """
+    from quiz.models import ExamResultDetail
+
+    wrong_question_ids = set(
+        ExamResultDetail.objects.filter(
+            question_id__in=_question_id_filter(questions),
+            is_correct=False
+        ).values_list('question_id', flat=True).distinct()
+    )
+    return [question for question in questions if question.id in wrong_question_ids]
+
+
+def rank_most_wrong_questions(questions, user):
+    """
+    사용자의 시도 기록이 있는 문제를 '많이 틀린 순'으로 정렬하여 반환합니다.
+
+    점수 = 시도 횟수 * 오답률 (시도 횟수가 많고 오답률이 높을수록 높은 점수)
+    시도/오답 수는 문제 수와 무관하게 단일 GROUP BY 쿼리로 계산한다.
+    시도 기록이 없는 문제는 제외된다.
+
+    Args:
+        questions: Question QuerySet 또는 리스트
+        user: 대상 사용자
+
+    Returns:
+        list: [(question, score, total_attempts, wrong_count), ...] (점수 내림차순, 동점은 입력 순서 유지)
+    """
+    from quiz.models import ExamResultDetail
+
+    rows = ExamResultDetail.objects.filter(
+        question_id__in=_question_id_filter(questions),
+        result__user=user
+    ).values('question_id').annotate(
+        total_attempts=models.Count('id'),
+        wrong_count=models.Count('id', filter=models.Q(is_correct=False))
+    ).order_by()
+    stats = {row['question_id']: (row['total_attempts'], row['wrong_count']) for row in rows}
+
+    question_scores = []
+    for question in questions:
+        total_attempts, wrong_count = stats.get(question.id, (0, 0))
+        if total_attempts > 0:
+            score = total_attempts * (wrong_count / total_attempts)
+            question_scores.append((question, score, total_attempts, wrong_count))
+
+    question_scores.sort(key=lambda x: x[1], reverse=True)
+    return question_scores
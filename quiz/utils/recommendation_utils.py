@@ -0,0 +1,351 @@
+"""
+Today's Quizzes(일일 추천 시험) 문제 점수 계산 유틸리티
+
+집합 기반 점수 계산:
+1. 구독한 시험과 후보 문제(ExamQuestion)를 한 번에 조회
+2. 무시된 문제(IgnoredQuestion)는 사용자별로 한 번만 조회하여 제외
+3. 시도 횟수/오답 수는 사용자 단위 GROUP BY 집계 한 번으로 계산
+4. 시험별 우선순위 문제 선택은 메모리에서 수행
+
+문제 수와 무관하게 사용자(또는 사용자 묶음)당 고정된 개수의 쿼리만 실행되므로
+API(create_random_recommendation_exam, get_or_create_daily_exam)와
+일괄 생성 명령어(generate_daily_exams)에서 함께 사용한다.
+"""
+import logging
+from collections import defaultdict
+
+from django.db.models import Count, Q
+
+logger = logging.getLogger(__name__)
+
+DAILY_EXAM_TITLE_PREFIX = "Today's Quizzes for"
+UNATTEMPTED_QUESTION_SCORE = 1.0
+
+
+def get_daily_exam_title(user):
+    """사용자의 일일 추천 시험 제목을 반환합니다."""
+    return f"{DAILY_EXAM_TITLE_PREFIX} {user.username}"
+
+
+def calculate_question_score(attempts, wrong_count):
+    """
+    문제 우선순위 점수를 계산합니다.
+
+    - 미시도 문제: 1.0 (최고 우선순위)
+    - 시도한 문제: 오답 비율 + (1 / 시도 횟수)
+      오답 비율이 같으면 적게 풀어본 문제가 우선순위가 높다.
+    """
+    if attempts <= 0:
+        return UNATTEMPTED_QUESTION_SCORE
+    return (wrong_count / attempts) + (1.0 / attempts)
+
+
+def get_subscribed_exam_ids(user_ids):
+    """
+    사용자별 활성 구독 시험 ID 목록을 반환합니다 (문제가 있는 시험만).
+
+    Returns:
+        dict: {user_id: [exam_id, ...]}
+    """
+    from quiz.models import ExamSubscription
+
+    rows = ExamSubscription.objects.filter(
+        user_id__in=user_ids,
+        is_active=True,
+        exam__examquestion__isnull=False
+    ).values_list('user_id', 'exam_id').distinct()
+
+    exam_ids_by_user = defaultdict(list)
+    for user_id, exam_id in rows:
+        if exam_id not in exam_ids_by_user[user_id]:
+            exam_ids_by_user[user_id].append(exam_id)
+    return exam_ids_by_user
+
+
+def get_question_attempt_stats(user_ids, exam_ids):
+    """
+    시험 후보 문제에 대한 사용자별 시도/오답 수를 단일 집계 쿼리로 계산합니다.
+
+    Returns:
+        dict: {(user_id, question_id): (attempts, wrong_count)}
+    """
+    from quiz.models import ExamQuestion, ExamResultDetail
+
+    candidate_question_ids = ExamQuestion.objects.filter(
+        exam_id__in=exam_ids
+    ).values('question_id')
+
+    rows = ExamResultDetail.objects.filter(
+        result__user_id__in=user_ids,
+        question_id__in=candidate_question_ids
+    ).values('result__user_id', 'question_id').annotate(
+        attempts=Count('id'),
+        wrong_count=Count('id', filter=Q(is_correct=False))
+    ).order_by()
+
+    return {
+        (row['result__user_id'], row['question_id']): (row['attempts'], row['wrong_count'])
+        for row in rows
+    }
+
+
+def score_candidate_questions_bulk(user_ids, exam_ids_by_user=None):
+    """
+    여러 사용자의 후보 문제 점수를 한 번에 계산합니다.
+
+    Args:
+        user_ids: 대상 사용자 ID 목록
+        exam_ids_by_user: {user_id: [exam_id, ...]} (없으면 구독 시험 사용)
+
+    Returns:
+        dict: {user_id: {exam_id: [candidate, ...]}}
+            candidate = {'question', 'exam', 'score', 'attempts', 'wrong_count'}
+            각 시험의 후보 목록은 점수 내림차순으로 정렬되어 있다.
+    """
+    from quiz.models import Exam, ExamQuestion, IgnoredQuestion
+
+    user_ids = list(user_ids)
+    if exam_ids_by_user is None:
+        exam_ids_by_user = get_subscribed_exam_ids(user_ids)
+
+    all_exam_ids = {exam_id for exam_ids in exam_ids_by_user.values() for exam_id in exam_ids}
+    if not all_exam_ids:
+        return {user_id: {} for user_id in user_ids}
+
+    exams = Exam.objects.in_bulk(list(all_exam_ids))
+
+    # 시험별 문제 목록 (문제 생성일 역순: 기존 Question 기본 정렬과 동일한 동점 처리)
+    questions_by_exam = defaultdict(list)
+    seen_pairs = set()
+    exam_questions = ExamQuestion.objects.filter(
+        exam_id__in=all_exam_ids
+    ).select_related('question').order_by('exam_id', '-question__created_at')
+    for exam_question in exam_questions:
+        pair = (exam_question.exam_id, exam_question.question_id)
+        if pair in seen_pairs:
+            continue
+        seen_pairs.add(pair)
+        questions_by_exam[exam_question.exam_id].append(exam_question.question)
+
+    ignored_by_user = defaultdict(set)
+    for user_id, question_id in IgnoredQuestion.objects.filter(
+        user_id__in=user_ids
+    ).values_list('user_id', 'question_id'):
+        ignored_by_user[user_id].add(question_id)
+
+    stats = get_question_attempt_stats(user_ids, all_exam_ids)
+
+    scored = {}
+    for user_id in user_ids:
+        ignored_ids = ignored_by_user.get(user_id, set())
+        candidates_by_exam = {}
+        for exam_id in exam_ids_by_user.get(user_id, []):
+            exam = exams.get(exam_id)
+            if exam is None:
+                continue
+            candidates = []
+            for question in questions_by_exam.get(exam_id, []):
+                if question.id in ignored_ids:
+                    continue
+                attempts, wrong_count = stats.get((user_id, question.id), (0, 0))
+                candidates.append({
+                    'question': question,
+                    'exam': exam,
+                    'score': calculate_question_score(attempts, wrong_count),
+                    'attempts': attempts,
+                    'wrong_count': wrong_count
+                })
+            if candidates:
+                candidates.sort(key=lambda item: item['score'], reverse=True)
+                candidates_by_exam[exam_id] = candidates
+        scored[user_id] = candidates_by_exam
+
+    return scored
+
+
+def score_candidate_questions(user, exam_ids=None):
+    """
+    단일 사용자의 후보 문제 점수를 계산합니다.
+
+    Returns:
+        dict: {exam_id: [candidate, ...]} (점수 내림차순)
+    """
+    exam_ids_by_user = None
+    if exam_ids is not None:
+        exam_ids_by_user = {user.id: list(exam_ids)}
+    return score_candidate_questions_bulk([user.id], exam_ids_by_user).get(user.id, {})
+
+
+def select_top_questions(candidates_by_exam, per_exam=1, title_field='title_ko'):
+    """
+    시험 제목별로 점수가 높은 문제를 최대 per_exam개씩 선택합니다.
+
+    제목이 같은 시험들은 하나의 그룹으로 합쳐서 선택한다 (기존 시험 제목 기준 그룹화와 동일).
+
+    Args:
+        title_field: 그룹화에 사용할 시험 제목 속성 ('title_ko' 또는 현재 언어 제목 'title')
+
+    Returns:
+        list: 선택된 candidate 목록 (시험 순서 유지)
+    """
+    candidates_by_title = defaultdict(list)
+    for candidates in candidates_by_exam.values():
+        for candidate in candidates:
+            candidates_by_title[getattr(candidate['exam'], title_field)].append(candidate)
+
+    selected = []
+    for candidates in candidates_by_title.values():
+        # 정렬은 안정 정렬이므로 동점이면 시험/문제 순서 유지
+        candidates.sort(key=lambda item: item['score'], reverse=True)
+        selected.extend(candidates[:max(per_exam, 0)])
+    return selected
+
+
+def deduplicate_selected_questions(question_data_list):
+    """
+    선택된 문제 데이터에서 중복을 제거합니다.
+
+    1단계: 문제 ID 기준 중복 제거
+    2단계: group_id 기준 중복 제거 (같은 그룹에서는 최고 점수 문제만 유지)
+
+    Returns:
+        tuple: (ID 기준 중복 제거 결과, 그룹 기준 중복 제거 결과)
+    """
+    unique_by_id = []
+    seen_ids = set()
+    for question_data in question_data_list:
+        if question_data['id'] not in seen_ids:
+            unique_by_id.append(question_data)
+            seen_ids.add(question_data['id'])
+
+    unique_questions = []
+    best_by_group = {}
+    for question_data in unique_by_id:
+        group_id = question_data.get('group_id', '')
+        if not group_id or group_id.strip() == '':
+            unique_questions.append(question_data)
+            continue
+
+        existing = best_by_group.get(group_id)
+        if existing is None:
+            unique_questions.append(question_data)
+            best_by_group[group_id] = question_data
+        elif question_data.get('score', 0) > existing.get('score', 0):
+            unique_questions = [q for q in unique_questions if q['id'] != existing['id']]
+            unique_questions.append(question_data)
+            best_by_group[group_id] = question_data
+
+    return unique_by_id, unique_questions
+
+
+def assign_source_group_ids(selected_items):
+    """
+    group_id가 비어 있는 선택 문제에 소스 시험 제목(title_ko)을 설정합니다.
+
+    사용자가 이미 설정한 group_id는 보존하며, 소스 시험별로 한 번의 UPDATE만 실행한다.
+    """
+    from quiz.models import Question
+
+    question_ids_by_title = defaultdict(list)
+    for item in selected_items:
+        question = item['question']
+        if not question.group_id or question.group_id.strip() == '':
+            question.group_id = item['exam'].title_ko
+            question_ids_by_title[item['exam'].title_ko].append(question.id)
+
+    for title, question_ids in question_ids_by_title.items():
+        Question.objects.filter(id__in=question_ids).filter(
+            Q(group_id__isnull=True) | Q(group_id__regex=r'^\s*$')
+        ).update(group_id=title)
+
+
+def build_question_data(item):
+    """선택된 candidate를 응답/저장용 문제 데이터로 변환합니다."""
+    question = item['question']
+    exam = item['exam']
+    return {
+        'id': question.id,
+        'title': question.title_ko if question.title_ko else question.title_en or '제목 없음',
+        'source_exam': exam.title_ko,
+        'group_id': exam.title_ko,
+        'score': item['score'],
+        'attempts': item['attempts'],
+        'wrong_count': item['wrong_count']
+    }
+
+
+def save_daily_exam(user, question_data_list, is_public=False):
+    """
+    사용자의 일일 추천 시험을 생성하거나 기존 시험의 문제를 교체합니다.
+
+    ExamQuestion은 bulk_create로 저장하므로 post_save 시그널이 실행되지 않으며,
+    total_questions는 여기서 직접 갱신한다.
+
+    Returns:
+        tuple: (exam, is_new)
+    """
+    from django.db import transaction
+    from quiz.models import Exam, ExamQuestion
+
+    title = get_daily_exam_title(user)
+    with transaction.atomic():
+        exam = Exam.objects.filter(title_ko=title, created_by=user).first()
+        is_new = exam is None
+        if is_new:
+            exam = Exam.objects.create(
+                title_ko=title,
+                total_questions=len(question_data_list),
+                is_original=False,
+                is_public=is_public,
+                created_by=user
+            )
+        else:
+            ExamQuestion.objects.filter(exam=exam).delete()
+            exam.total_questions = len(question_data_list)
+            exam.save(update_fields=['total_questions'])
+
+        ExamQuestion.objects.bulk_create([
+            ExamQuestion(exam=exam, question_id=question_data['id'], order=i + 1)
+            for i, question_data in enumerate(question_data_list)
+        ])
+
+    return exam, is_new
+
+
+def generate_daily_exams_bulk(user_ids, per_exam=1, is_public=False):
+    """
+    여러 사용자의 일일 추천 시험을 한 번의 점수 계산으로 생성합니다.
+
+    Returns:
+        dict: {user_id: {'exam_id', 'is_new', 'question_count'} 또는 {'error'}}
+    """
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    users = User.objects.in_bulk(list(user_ids))
+    scored = score_candidate_questions_bulk(list(users.keys()))
+
+    results = {}
+    for user_id, candidates_by_exam in scored.items():
+        user = users[user_id]
+        try:
+            selected_items = select_top_questions(candidates_by_exam, per_exam=per_exam, title_field='title')
+            if not selected_items:
+                results[user_id] = {'error': 'no_questions'}
+                continue
+
+            assign_source_group_ids(selected_items)
+            _, unique_questions = deduplicate_selected_questions(
+                [build_question_data(item) for item in selected_items]
+            )
+            exam, is_new = save_daily_exam(user, unique_questions, is_public=is_public)
+            results[user_id] = {
+                'exam_id': str(exam.id),
+                'is_new': is_new,
+                'question_count': len(unique_questions)
+            }
+        except Exception as e:
+            logger.error(f"[DAILY_EXAM_BULK] 사용자 {user_id} 일일 시험 생성 실패: {e}")
+            results[user_id] = {'error': str(e)}
+
+    return results
@@ -0,0 +1,269 @@
+"""
+사용자별 문제 통계(UserQuestionStat) 유틸리티
+
+ExamResultDetail을 매번 집계하던 통계 조회를 UserQuestionStat 집계 테이블로 대체한다.
+1. 시험 제출 시 record_question_attempts로 증분 갱신
+2. 결과 삭제 등 이력이 바뀌는 경우 refresh_user_question_stats로 해당 범위만 재계산
+3. 조회는 get_user_question_stats_map으로 한 번의 쿼리로 수행
+4. (사용자, 시험) 단위 요약(UserExamProgress)은 위 1, 2와 함께 갱신되며
+   목록 화면은 prefetch_user_exam_progress로 한 번에 조회
+"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Q, Sum, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def record_question_attempts(user, exam, attempts, attempted_at=None):
+    """
+    제출된 답안을 UserQuestionStat에 증분 반영합니다.
+
+    Args:
+        user: 사용자 (비로그인 사용자는 무시)
+        exam: ExamResultDetail이 저장된 시험
+        attempts: [(question_id, is_correct), ...]
+        attempted_at: 시도 일시 (기본값: 현재 시간)
+    """
+    from quiz.models import UserQuestionStat
+
+    if not user or not getattr(user, 'is_authenticated', False) or exam is None:
+        return
+
+    deltas = defaultdict(lambda: [0, 0])
+    for question_id, is_correct in attempts:
+        if question_id is None:
+            continue
+        deltas[question_id][0] += 1
+        if is_correct:
+            deltas[question_id][1] += 1
+
+    if not deltas:
+        return
+
+    attempted_at = attempted_at or timezone.now()
+    exam_id = exam.id if hasattr(exam, 'id') else exam
+
+    with transaction.atomic():
+        # 없는 행은 0으로 먼저 생성하고 (동시 제출 시 중복은 무시) 증분은 F() UPDATE로 처리
+        UserQuestionStat.objects.bulk_create([
+            UserQuestionStat(user=user, exam_id=exam_id, question_id=question_id)
+            for question_id in deltas
+        ], ignore_conflicts=True)
+
+        # 같은 증분끼리 묶어 UPDATE (일반적으로 정답/오답 두 묶음)
+        question_ids_by_delta = defaultdict(list)
+        for question_id, (attempt_delta, correct_delta) in deltas.items():
+            question_ids_by_delta[(attempt_delta, correct_delta)].append(question_id)
+
+        for (attempt_delta, correct_delta), question_ids in question_ids_by_delta.items():
+            update_fields = {
+                'attempts': F('attempts') + attempt_delta,
+                'correct': F('correct') + correct_delta,
+                'last_attempt_at': attempted_at,
+                'updated_at': attempted_at,
+            }
+            if correct_delta:
+                update_fields['last_correct_at'] = attempted_at
+            UserQuestionStat.objects.filter(
+                user=user, exam_id=exam_id, question_id__in=question_ids
+            ).update(**update_fields)
+
+        # 이번 제출로 바뀐 (사용자, 시험) 요약만 다시 계산
+        refresh_user_exam_progress([user.id], exam_ids=[exam_id])
+
+
+def refresh_user_question_stats(user_ids, exam_ids=None, question_ids=None):
+    """
+    ExamResultDetail 이력으로 지정 범위의 UserQuestionStat을 다시 계산합니다.
+
+    결과 삭제/초기화처럼 이력이 줄어드는 경우와 백필에서 사용한다.
+
+    Returns:
+        int: 재생성된 통계 행 수
+    """
+    from quiz.models import ExamResultDetail, UserQuestionStat
+
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return 0
+
+    stat_filter = Q(user_id__in=user_ids)
+    detail_filter = Q(result__user_id__in=user_ids, question__isnull=False)
+    if exam_ids is not None:
+        stat_filter &= Q(exam_id__in=exam_ids)
+        detail_filter &= Q(result__exam_id__in=exam_ids)
+    if question_ids is not None:
+        stat_filter &= Q(question_id__in=question_ids)
+        detail_filter &= Q(question_id__in=question_ids)
+
+    rows = ExamResultDetail.objects.filter(detail_filter).values(
+        'result__user_id', 'result__exam_id', 'question_id'
+    ).annotate(
+        attempts=Count('id'),
+        correct=Count('id', filter=Q(is_correct=True)),
+        last_attempt_at=Max('result__completed_at'),
+        last_correct_at=Max(Case(When(is_correct=True, then=F('result__completed_at')))),
+    ).order_by()
+
+    stats = [
+        UserQuestionStat(
+            user_id=row['result__user_id'],
+            exam_id=row['result__exam_id'],
+            question_id=row['question_id'],
+            attempts=row['attempts'],
+            correct=row['correct'],
+            last_attempt_at=row['last_attempt_at'],
+            last_correct_at=row['last_correct_at'],
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        UserQuestionStat.objects.filter(stat_filter).delete()
+        UserQuestionStat.objects.bulk_create(stats, batch_size=1000)
+        # 문제 단위로 재계산한 경우에도 해당 사용자/시험의 요약은 전체를 다시 계산
+        refresh_user_exam_progress(user_ids, exam_ids=exam_ids)
+
+    return len(stats)
+
+
+def refresh_user_exam_progress(user_ids, exam_ids=None):
+    """
+    UserQuestionStat 합계와 최신 ExamResult로 지정 범위의 UserExamProgress를 다시 계산합니다.
+
+    Returns:
+        int: 갱신/생성된 요약 행 수
+    """
+    from quiz.models import ExamResult, UserExamProgress, UserQuestionStat
+    from quiz.utils.exam_utils import latest_results_per_group
+
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return 0
+
+    scope = Q(user_id__in=user_ids)
+    if exam_ids is not None:
+        scope &= Q(exam_id__in=exam_ids)
+
+    totals = {
+        (row['user_id'], row['exam_id']): row
+        for row in UserQuestionStat.objects.filter(scope).values('user_id', 'exam_id').annotate(
+            total_attempts=Sum('attempts'),
+            total_correct=Sum('correct'),
+            attempted_questions=Count('id', filter=Q(attempts__gt=0)),
+            correct_questions=Count('id', filter=Q(correct__gt=0)),
+        ).order_by()
+    }
+    latest_results = latest_results_per_group(
+        ExamResult.objects.filter(scope), group_fields=('user_id', 'exam_id')
+    )
+
+    now = timezone.now()
+    progress_fields = []
+    for user_id, exam_id in set(totals) | set(latest_results):
+        row = totals.get((user_id, exam_id), {})
+        result = latest_results.get((user_id, exam_id))
+        progress_fields.append(((user_id, exam_id), {
+            'attempts': row.get('total_attempts') or 0,
+            'correct': row.get('total_correct') or 0,
+            'attempted_questions': row.get('attempted_questions') or 0,
+            'correct_questions': row.get('correct_questions') or 0,
+            'latest_result': result,
+            'latest_score': result.score if result else None,
+            'latest_total_score': result.total_score if result else None,
+            'latest_correct_count': result.correct_count if result else None,
+            'latest_completed_at': result.completed_at if result else None,
+            'updated_at': now,
+        }))
+
+    # (user, exam)은 unique이므로 삭제 후 재삽입하지 않고 기존 행은 갱신, 없는 행만 생성한다
+    # (동시 제출이 같은 행을 다시 만들다 IntegrityError가 나지 않도록)
+    with transaction.atomic():
+        existing = {
+            (progress.user_id, progress.exam_id): progress
+            for progress in UserExamProgress.objects.filter(scope).select_for_update()
+        }
+        to_update = []
+        for key, fields in progress_fields:
+            progress = existing.pop(key, None)
+            if progress is None:
+                UserExamProgress.objects.update_or_create(user_id=key[0], exam_id=key[1], defaults=fields)
+                continue
+            for name, value in fields.items():
+                setattr(progress, name, value)
+            to_update.append(progress)
+        if to_update:
+            UserExamProgress.objects.bulk_update(to_update, list(progress_fields[0][1]), batch_size=1000)
+        # 이력이 모두 사라진 (사용자, 시험) 요약은 삭제
+        if existing:
+            UserExamProgress.objects.filter(pk__in=[progress.pk for progress in existing.values()]).delete()
+
+    return len(progress_fields)
+
+
+def prefetch_user_exam_progress(exams, user):
+    """
+    시험 목록의 사용자 진행 요약을 한 번의 쿼리로 조회하여 각 통계 대상 시험에 저장합니다.
+
+    이후 Exam.get_user_exam_progress(user) 및 이를 사용하는 통계 메서드는 추가 쿼리 없이 동작한다.
+    복사된 시험은 원본 시험(통계 대상 시험)의 요약을 사용한다.
+    """
+    from quiz.models import UserExamProgress
+
+    if not user or not getattr(user, 'is_authenticated', False):
+        return
+
+    targets = {}
+    for exam in exams:
+        if exam is None:
+            continue
+        target = exam._get_stat_target_exam()
+        targets.setdefault(target.id, []).append(target)
+    if not targets:
+        return
+
+    progresses = {
+        progress.exam_id: progress
+        for progress in UserExamProgress.objects.filter(user=user, exam_id__in=list(targets))
+    }
+    for exam_id, target_exams in targets.items():
+        for target in target_exams:
+            cached = getattr(target, '_user_exam_progress', None) or {}
+            cached[user.id] = progresses.get(exam_id)
+            target._user_exam_progress = cached
+
+
+def get_user_question_stats_map(user, question_ids=None, exam_ids=None):
+    """
+    사용자의 문제별 통계를 시험 구분 없이 합산하여 반환합니다.
+
+    Returns:
+        dict: {question_id: {'attempts': int, 'correct': int}}
+    """
+    from quiz.models import UserQuestionStat
+
+    if not user or not getattr(user, 'is_authenticated', False):
+        return {}
+
+    queryset = UserQuestionStat.objects.filter(user=user)
+    if question_ids is not None:
+        queryset = queryset.filter(question_id__in=question_ids)
+    if exam_ids is not None:
+        queryset = queryset.filter(exam_id__in=exam_ids)
+
+    rows = queryset.values('question_id').annotate(
+        total_attempts=Sum('attempts'),
+        total_correct=Sum('correct')
+    ).order_by()
+
+    return {
+        row['question_id']: {
+            'attempts': row['total_attempts'] or 0,
+            'correct': row['total_correct'] or 0
+        }
+        for row in rows
+    }
@@ -0,0 +1,154 @@
+"""
+스터디 단위 통계 집계 유틸리티
+
+태스크마다 시험 통계 메서드를 호출하고 ExamResultDetail을 한 행씩 합산하던 계산을
+고정된 수의 집계 쿼리로 대체한다.
+1. 태스크 조회 + UserExamProgress 일괄 조회로 태스크별 시도/정답 수 계산
+2. ExamResultDetail.elapsed_seconds를 시험별 Sum, 날짜별(TruncDate) Sum으로 한 번씩 집계
+3. 결과는 (스터디, 사용자, 기간) 단위로 캐시 (스터디/사용자 캐시 무효화 시 함께 만료)
+"""
+import logging
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db.models import Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from quiz.utils.cache_utils import SingleFlightCache, StudyCacheManager
+from quiz.utils.stats_utils import prefetch_user_exam_progress
+
+logger = logging.getLogger(__name__)
+
+# 기간 미지정 시 날짜별 공부시간은 최근 7일만 집계
+DEFAULT_DAILY_DAYS = 7
+
+
+def _percentage(numerator, denominator):
+    return (numerator / denominator) * 100 if denominator > 0 else 0
+
+
+def get_study_task_stats(tasks, user):
+    """
+    태스크별 사용자 시도/정답 수를 계산합니다. (UserExamProgress 한 번 조회)
+
+    Returns:
+        dict: {task_id: {'attempts', 'correct', 'total_questions', 'progress'}}
+              progress는 StudyTaskSerializer.correct_progress와 같은 정답/시도 비율
+    """
+    prefetch_user_exam_progress([task.exam for task in tasks], user)
+
+    task_stats = {}
+    for task in tasks:
+        if task.exam:
+            attempts = task.exam.get_total_attempted_questions_for_user(user)
+            correct = task.exam.get_total_correct_questions_for_user(user)
+            total_questions = task.exam.total_questions
+        else:
+            attempts = correct = total_questions = 0
+        task_stats[task.id] = {
+            'attempts': attempts,
+            'correct': correct,
+            'total_questions': total_questions,
+            'progress': _percentage(correct, attempts),
+        }
+    return task_stats
+
+
+def get_exam_study_seconds(user, exam_ids, start_date=None):
+    """
+    시험별 사용자 누적 소요시간(초)을 한 번의 집계 쿼리로 계산합니다.
+
+    Returns:
+        dict: {exam_id: seconds}
+    """
+    from quiz.models import ExamResultDetail
+
+    if not exam_ids:
+        return {}
+
+    details = ExamResultDetail.objects.filter(
+        result__user=user,
+        result__exam_id__in=exam_ids,
+        elapsed_seconds__gt=0,
+    )
+    if start_date is not None:
+        details = details.filter(result__completed_at__gte=start_date)
+
+    return {
+        row['result__exam_id']: row['seconds'] or 0
+        for row in details.values('result__exam_id').annotate(seconds=Sum('elapsed_seconds')).order_by()
+    }
+
+
+def get_daily_study_seconds(user, start_date):
+    """
+    날짜별(UTC) 사용자 누적 소요시간(초)을 한 번의 집계 쿼리로 계산합니다.
+
+    소요시간이 기록되지 않은 결과만 있는 날짜도 0초로 포함한다.
+
+    Returns:
+        dict: {'YYYY-MM-DD': seconds}
+    """
+    from quiz.models import ExamResult
+
+    rows = (
+        ExamResult.objects.filter(user=user, completed_at__gte=start_date)
+        .annotate(date=TruncDate('completed_at', tzinfo=dt_timezone.utc))
+        .values('date')
+        .annotate(seconds=Sum(
+            'examresultdetail__elapsed_seconds',
+            filter=Q(examresultdetail__elapsed_seconds__gt=0),
+        ))
+        .order_by()
+    )
+    return {row['date'].strftime('%Y-%m-%d'): row['seconds'] or 0 for row in rows}
+
+
+def compute_study_statistics(study, user, days=None):
+    """
+    스터디의 태스크별 진행률과 공부시간을 집계합니다. (캐시 없음)
+
+    Args:
+        days: 최근 N일만 집계 (None이면 태스크 공부시간은 전체, 날짜별 공부시간은 최근 7일)
+    """
+    tasks = list(study.tasks.select_related('exam__original_exam'))
+    task_stats = get_study_task_stats(tasks, user)
+
+    now = timezone.now()
+    start_date = now - timedelta(days=days) if days is not None else None
+    exam_seconds = get_exam_study_seconds(user, {task.exam_id for task in tasks if task.exam_id}, start_date)
+    daily_seconds = get_daily_study_seconds(user, start_date or now - timedelta(days=DEFAULT_DAILY_DAYS))
+
+    for task in tasks:
+        task_stats[task.id]['study_seconds'] = exam_seconds.get(task.exam_id, 0) if task.exam_id else 0
+
+    total_attempts = sum(stats['attempts'] for stats in task_stats.values())
+    total_correct = sum(stats['correct'] for stats in task_stats.values())
+    total_questions = sum(stats['total_questions'] for stats in task_stats.values())
+
+    return {
+        'task_stats': task_stats,
+        'attempted_progress': _percentage(total_attempts, total_questions),
+        'correct_progress': _percentage(total_correct, total_questions),
+        'daily_study_seconds': daily_seconds,
+    }
+
+
+def get_study_statistics(study, user, days=None):
+    """
+    (스터디, 사용자, 기간) 단위로 캐시된 스터디 통계를 반환합니다.
+
+    시험 제출 시 사용자 스터디 캐시가 무효화되므로 새 결과가 바로 반영된다.
+    """
+    period = f'{days}d' if days is not None else 'all'
+    try:
+        cache_key = StudyCacheManager.get_study_stats_cache_key(study.id, user.id, period)
+    except Exception as e:
+        logger.warning(f"[STUDY_STATS] 캐시 키 생성 실패, 캐시 없이 계산: {e}")
+        return compute_study_statistics(study, user, days)
+
+    return SingleFlightCache.get_or_compute(
+        cache_key,
+        lambda: compute_study_statistics(study, user, days),
+        StudyCacheManager.CACHE_TIMEOUT,
+    )
@@ -0,0 +1,277 @@
+"""
+시험 제출 후 통계 처리 유틸리티
+
+submit_exam 응답 경로에서 분리된 후처리:
+1. StudyTaskProgress 갱신 (시험과 연결된 스터디 Task별 진행률)
+2. StudyTask 전체 진행률 갱신 (사용자별 진행률 평균)
+3. StudyProgressRecord 생성 (시험 완료 기록)
+4. 시험 목록/스터디 캐시 무효화
+
+ExamResult 단위로 한 번만 처리되도록 stats_processed_at을 조건부 UPDATE로 선점하며,
+Celery 태스크(process_exam_submission_task)와 동기 폴백에서 함께 사용한다.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Avg, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def is_daily_exam(exam):
+    """추천 시험(Today's Quizzes) 여부"""
+    return (
+        (exam.title_ko and "Today's Quizzes for" in exam.title_ko) or
+        (exam.title_en and "Today's Quizzes for" in exam.title_en)
+    )
+
+
+def _is_same_exam_title(exam, other_exam):
+    """두 시험의 제목(ko/en)이 같은지 확인"""
+    return (
+        (other_exam.title_ko == exam.title_ko and exam.title_ko) or
+        (other_exam.title_en == exam.title_en and exam.title_en)
+    )
+
+
+def resolve_progress_target_exam(exam, user, question_ids=None):
+    """
+    진행률을 반영할 시험을 찾습니다. StudyTask에 연결된 시험을 우선한다.
+
+    1. 현재 시험이 StudyTask에 직접 연결되어 있으면 현재 시험
+    2. 복사 시험이면 original_exam, 추천 시험이면 문제 group_id의 원본 시험
+    3. 그래도 찾지 못하면 사용자가 속한 스터디의 Task 중 제목이 같은 시험
+    """
+    from quiz.models import Exam, Question, Study, StudyTask
+
+    target_exam = exam
+
+    connected = StudyTask.objects.filter(exam=exam).exists()
+    if connected:
+        logger.info(f"[SUBMIT_STATS] 현재 시험이 StudyTask에 직접 연결됨: {exam.id}")
+        return exam
+
+    if not exam.is_original:
+        if exam.original_exam:
+            target_exam = exam.original_exam
+            logger.info(f"[SUBMIT_STATS] original_exam 필드로 원본 시험 찾음: {target_exam.title_ko or target_exam.title_en or 'Unknown'}")
+        elif is_daily_exam(exam) and question_ids:
+            # 추천 시험인 경우 답안 순서대로 문제의 group_id로 원본 시험 찾기
+            questions = {
+                str(question_id): question
+                for question_id, question in Question.objects.in_bulk(question_ids).items()
+            }
+            for question_id in question_ids:
+                question = questions.get(str(question_id))
+                if question is None or not question.group_id:
+                    continue
+                original_exam = Exam.objects.filter(
+                    Q(title_ko=question.group_id) | Q(title_en=question.group_id)
+                ).first()
+                if original_exam:
+                    target_exam = original_exam
+                    logger.info(f"[SUBMIT_STATS] group_id로 원본 시험 찾음: {target_exam.title_ko or target_exam.title_en or 'Unknown'}")
+                    break
+
+    if target_exam == exam:
+        # 사용자가 속한 스터디의 Task 중에서 제목이 같은 시험 찾기
+        task = next((
+            task for task in StudyTask.objects.filter(
+                study__in=Study.objects.filter(members__user=user),
+                exam__isnull=False
+            ).select_related('exam')
+            if _is_same_exam_title(exam, task.exam)
+        ), None)
+
+        if task is not None:
+            target_exam = task.exam
+            logger.info(f"[SUBMIT_STATS] 일치하는 Task 발견: {task.name_ko or task.name_en} - {target_exam.title_ko or target_exam.title_en or 'Unknown'}")
+        else:
+            logger.warning(f"[SUBMIT_STATS] 대안 방법으로도 target_exam을 찾지 못함: {exam.id}")
+
+    return target_exam
+
+
+def _calculate_task_progress(exam, target_exam, correct_count):
+    """
+    제출 결과의 Task 진행률(%)을 계산합니다.
+
+    원본 시험은 시험 문제 수 기준, 사본/복사 시험은 원본 시험 문제 수 기준으로 환산한다.
+    예: 사본에서 3문제 맞춤, 원본이 10문제면 -> 30%
+    """
+    base_exam = exam if exam.is_original else target_exam
+    if base_exam.total_questions > 0:
+        return (correct_count / base_exam.total_questions) * 100
+    return 0
+
+
+def update_study_task_progress(user, exam, target_exam, correct_count):
+    """
+    target_exam과 연결된 StudyTask의 사용자 진행률과 Task 전체 진행률을 갱신합니다.
+
+    Returns:
+        list: 갱신한 StudyTask 목록
+    """
+    from quiz.models import Study, StudyTask, StudyTaskProgress
+
+    study_tasks = list(StudyTask.objects.filter(exam=target_exam))
+    if not study_tasks:
+        # 대안: 현재 사용자가 속한 스터디의 Task 중에서 제목이 같은 시험과 연결된 것 찾기
+        study_tasks = [
+            task for task in StudyTask.objects.filter(
+                study__in=Study.objects.filter(members__user=user),
+                exam__isnull=False
+            ).select_related('exam')
+            if _is_same_exam_title(target_exam, task.exam)
+        ]
+        if study_tasks:
+            logger.info(f"[SUBMIT_STATS] 대안 StudyTask {len(study_tasks)}개 발견")
+        else:
+            logger.warning(f"[SUBMIT_STATS] target_exam '{target_exam.title_ko or target_exam.title_en or 'Unknown'}'에 연결된 StudyTask가 없습니다")
+            return []
+
+    progress_percentage = _calculate_task_progress(exam, target_exam, correct_count)
+
+    for study_task in study_tasks:
+        progress_obj, created = StudyTaskProgress.objects.get_or_create(
+            user=user,
+            study_task=study_task,
+            defaults={'progress': progress_percentage}
+        )
+        # 기존 기록이 있으면 더 높은 값으로만 갱신
+        if not created and progress_percentage > progress_obj.progress:
+            progress_obj.progress = progress_percentage
+            progress_obj.save()
+
+        # StudyTask의 전체 진행률 업데이트 (사용자별 진행률의 평균)
+        avg_progress = StudyTaskProgress.objects.filter(study_task=study_task).aggregate(
+            avg=Avg('progress')
+        )['avg']
+        if avg_progress is not None:
+            study_task.progress = avg_progress
+            study_task.save()
+
+        logger.debug(f"[SUBMIT_STATS] StudyTaskProgress 갱신: {user.username} - {study_task.name_ko or study_task.name_en} - {progress_percentage:.1f}%")
+
+    return study_tasks
+
+
+def record_exam_completion_progress(user, target_exam):
+    """
+    target_exam이 포함된 사용자 스터디의 진행률 기록(StudyProgressRecord)을 생성합니다.
+
+    Returns:
+        StudyProgressRecord 또는 None
+    """
+    from quiz.models import Study, StudyProgressRecord, StudyTaskProgress
+
+    target_study = Study.objects.filter(
+        members__user=user,
+        tasks__exam=target_exam
+    ).first()
+    if target_study is None:
+        logger.warning("[SUBMIT_STATS] StudyProgressRecord 생성 건너뜀: target_exam과 연결된 스터디 없음")
+        return None
+
+    task_ids = list(target_study.tasks.values_list('id', flat=True))
+    progress_by_task = dict(
+        StudyTaskProgress.objects.filter(user=user, study_task_id__in=task_ids)
+        .values_list('study_task_id', 'progress')
+    )
+    task_progresses = {str(task_id): progress_by_task.get(task_id, 0) for task_id in task_ids}
+    overall_progress = sum(task_progresses.values()) / len(task_ids) if task_ids else 0
+
+    record = StudyProgressRecord.objects.create(
+        user=user,
+        study=target_study,
+        overall_progress=overall_progress,
+        task_progresses=task_progresses,
+        page_type='exam-completion'  # 시험 완료로 기록
+    )
+    study_title = target_study.title_ko if target_study.title_ko else target_study.title_en or '제목 없음'
+    logger.info(f"[SUBMIT_STATS] StudyProgressRecord 생성 완료: {user.username} - {study_title} - 전체 진행률: {overall_progress:.1f}%")
+    return record
+
+
+def _invalidate_submission_caches(user_id):
+    """통계 변경에 따른 시험 목록/스터디 캐시 무효화"""
+    from quiz.utils.cache_utils import ExamCacheManager, StudyCacheManager
+
+    try:
+        ExamCacheManager.invalidate_user_exam_cache(user_id)
+        StudyCacheManager.invalidate_user_study_cache(user_id)
+    except Exception as e:
+        logger.error(f"[SUBMIT_STATS] 캐시 무효화 중 오류: {e}")
+
+
+def process_exam_submission_stats(result_id, question_ids=None):
+    """
+    시험 제출 후 스터디 진행률/통계를 갱신합니다. ExamResult당 한 번만 실행된다.
+
+    Args:
+        result_id: 제출로 생성된 ExamResult ID
+        question_ids: 제출 답안의 문제 ID 목록 (추천 시험의 원본 시험 탐색용)
+
+    Returns:
+        bool: 이번 호출에서 처리했으면 True, 이미 처리된 결과면 False
+    """
+    from quiz.models import ExamResult
+
+    with transaction.atomic():
+        # 처리 선점 (재시도/중복 호출 시 한 번만 처리)
+        claimed = ExamResult.objects.filter(
+            id=result_id,
+            stats_processed_at__isnull=True
+        ).update(stats_processed_at=timezone.now())
+        if not claimed:
+            logger.info(f"[SUBMIT_STATS] 이미 처리된 결과 건너뜀: {result_id}")
+            return False
+
+        result = ExamResult.objects.select_related('exam', 'exam__original_exam', 'user').get(id=result_id)
+        user = result.user
+        if user is None:
+            return True
+
+        exam = result.exam
+        target_exam = resolve_progress_target_exam(exam, user, question_ids)
+
+        # 각 단계의 실패가 다른 단계에 영향을 주지 않도록 savepoint로 분리
+        try:
+            with transaction.atomic():
+                update_study_task_progress(user, exam, target_exam, result.correct_count)
+        except Exception as e:
+            logger.error(f"[SUBMIT_STATS] StudyTaskProgress 업데이트 중 오류: {e}")
+
+        try:
+            with transaction.atomic():
+                record_exam_completion_progress(user, target_exam)
+        except Exception as e:
+            logger.error(f"[SUBMIT_STATS] StudyProgressRecord 생성 중 오류: {e}")
+
+    _invalidate_submission_caches(user.id)
+    return True
+
+
+def schedule_exam_submission_stats(result_id, question_ids=None):
+    """
+    커밋 이후 시험 제출 후처리를 Celery 태스크로 전송합니다.
+
+    브로커가 없으면 Celery 설정에 따라 즉시 실행(eager)되며,
+    태스크 전송에 실패하면 동기 처리로 폴백한다.
+    """
+    question_ids = [str(question_id) for question_id in (question_ids or [])]
+
+    def dispatch():
+        try:
+            from quiz.tasks import process_exam_submission_task
+            process_exam_submission_task.delay(str(result_id), question_ids)
+            logger.info(f"[SUBMIT_STATS] 제출 후처리 Celery 태스크 전송 완료: {result_id}")
+        except Exception as e:
+            logger.warning(f"[SUBMIT_STATS] Celery 태스크 전송 실패, 동기 처리로 폴백: {e}")
+            try:
+                process_exam_submission_stats(result_id, question_ids)
+            except Exception as sync_error:
+                logger.error(f"[SUBMIT_STATS] 동기 처리 실패: {sync_error}")
+
+    transaction.on_commit(dispatch)
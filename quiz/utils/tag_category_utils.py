@@ -0,0 +1,117 @@
+"""
+태그 카테고리 트리 유틸리티
+
+카테고리 트리를 노드마다 하위 카테고리/태그 수를 조회하며 재귀로 구성하던 방식을
+한 번의 조회(카테고리 + 태그 수 집계)와 메모리 내 조립으로 대체하고,
+직렬화된 트리를 언어별 스냅샷으로 캐시한다.
+1. build_category_tree: 전체 카테고리를 한 번에 읽어 부모/자식 연결 후 직렬화
+2. get_category_tree: (표시 언어, 경로 언어)별 스냅샷 캐시 조회, root_id로 하위 트리만 반환
+3. clear_category_tree_cache: 카테고리/태그 연결 변경 시 모든 언어의 스냅샷 삭제
+"""
+import logging
+from collections import defaultdict
+
+from django.db.models import Count
+
+from quiz.utils.cache_utils import TwoTierCache
+from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+TREE_CACHE_KEY_PREFIX = 'tag_category_tree'
+TREE_CACHE_TIMEOUT = 3600  # 1시간
+
+
+def get_tree_cache_key(language, path_language):
+    """언어별 카테고리 트리 스냅샷 캐시 키"""
+    return f"{TREE_CACHE_KEY_PREFIX}_{language}_{path_language}"
+
+
+def clear_category_tree_cache():
+    """모든 언어 조합의 카테고리 트리 스냅샷 삭제 (Redis와 모든 워커의 로컬 사본)"""
+    TwoTierCache.delete(*[
+        get_tree_cache_key(language, path_language)
+        for language in SUPPORTED_LANGUAGES
+        for path_language in SUPPORTED_LANGUAGES
+    ])
+
+
+def load_categories():
+    """
+    전체 카테고리를 태그 수와 함께 한 번의 쿼리로 조회하고 메모리에서 부모/자식을 연결합니다.
+
+    각 카테고리에는 parent 객체와 children_total, tags_total이 채워져
+    직렬화 시 추가 쿼리가 발생하지 않는다.
+
+    Returns:
+        tuple: (정렬된 카테고리 목록, {parent_id: [하위 카테고리, ...]})
+    """
+    from quiz.models import TagCategory
+
+    categories = list(
+        TagCategory.objects.annotate(tags_total=Count('tags')).order_by('order', 'name_ko')
+    )
+    by_id = {category.id: category for category in categories}
+
+    children_map = defaultdict(list)
+    for category in categories:
+        children_map[category.parent_id].append(category)
+
+    for category in categories:
+        category.children_total = len(children_map.get(category.id, []))
+        if category.parent_id is not None and category.parent_id in by_id:
+            category.parent = by_id[category.parent_id]
+
+    return categories, children_map
+
+
+def build_category_tree(serializer_class, context):
+    """
+    전체 카테고리 트리를 직렬화된 dict 목록으로 구성합니다. (루트 카테고리 목록)
+
+    Args:
+        serializer_class: 노드 직렬화에 사용할 시리얼라이저 (TagCategorySerializer)
+        context: 시리얼라이저 context (다국어 처리를 위한 request 포함)
+    """
+    categories, children_map = load_categories()
+    serialized = serializer_class(categories, many=True, context=context).data
+    nodes = {category.id: dict(data) for category, data in zip(categories, serialized)}
+
+    def attach(category):
+        node = nodes[category.id]
+        node['children'] = [attach(child) for child in children_map.get(category.id, [])]
+        return node
+
+    return [attach(category) for category in children_map.get(None, [])]
+
+
+def find_subtree(tree, category_id):
+    """스냅샷에서 category_id 노드를 찾아 반환 (없으면 None)"""
+    stack = list(tree)
+    while stack:
+        node = stack.pop()
+        if node['id'] == category_id:
+            return node
+        stack.extend(node.get('children', []))
+    return None
+
+
+def get_category_tree(serializer_class, context, language, path_language, root_id=None):
+    """
+    캐시된 카테고리 트리 스냅샷을 반환합니다.
+
+    Args:
+        language: 카테고리명 표시 언어
+        path_language: 전체 경로(full_path) 표시 언어
+        root_id: 지정하면 해당 카테고리를 루트로 하는 하위 트리만 반환 (DevOps 도메인)
+    """
+    tree = TwoTierCache.get_or_set(
+        get_tree_cache_key(language, path_language),
+        lambda: build_category_tree(serializer_class, context),
+        TREE_CACHE_TIMEOUT,
+    )
+    if root_id is None:
+        return tree
+
+    node = find_subtree(tree, root_id)
+    return [node] if node is not None else []
@@ -0,0 +1,118 @@
+"""
+번역 동시 실행 유틸리티
+
+대상 언어/청크/배치별 번역 요청을 순차로 기다리지 않고 제한된 수의 스레드에서 동시에 실행한다.
+1. map_concurrently(): 독립적인 번역 요청을 스레드 풀에서 실행하고 입력 순서대로 결과를 반환
+   - 작업 중 발생한 예외는 해당 위치의 결과로 반환 (다른 작업은 계속 진행)
+   - 작업 스레드가 연 DB 연결은 작업이 끝나면 닫음
+2. provider_slot(): 제공자(OpenAI/Gemini)별 동시 호출 수 제한(semaphore)과 최소 호출 간격(rate limit)
+   - 실제 LLM HTTP 호출만 감싸므로 중첩된 map_concurrently 호출에서도 교착 없이 전체 호출 수가 제한됨
+3. OpenAI → Gemini fallback과 mark_openai_unavailable 차단 상태는 호출하는 쪽(batch_translate_texts 등)이 그대로 담당
+
+설정 (settings, 선택):
+    TRANSLATION_MAX_WORKERS = 4
+    TRANSLATION_PROVIDER_LIMITS = {'openai': {'concurrency': 4, 'min_interval': 0.1}, ...}
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, List
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_OPENAI = 'openai'
+PROVIDER_GEMINI = 'gemini'
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PROVIDER_LIMITS = {
+    PROVIDER_OPENAI: {'concurrency': 4, 'min_interval': 0.1},  # 최소 호출 간격 (초)
+    PROVIDER_GEMINI: {'concurrency': 2, 'min_interval': 0.2},
+}
+
+
+class _ProviderLimiter:
+    """제공자별 동시 호출 수 제한 + 최소 호출 간격 유지"""
+
+    def __init__(self, concurrency, min_interval):
+        self.semaphore = threading.BoundedSemaphore(max(1, concurrency))
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_call_at = 0.0
+
+    def wait_for_turn(self):
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call_at)
+            self._next_call_at = call_at + self.min_interval
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _get_limiter(provider):
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limits = {
+                **DEFAULT_PROVIDER_LIMITS.get(provider, {'concurrency': 1, 'min_interval': 0}),
+                **getattr(settings, 'TRANSLATION_PROVIDER_LIMITS', {}).get(provider, {}),
+            }
+            limiter = _limiters[provider] = _ProviderLimiter(limits['concurrency'], limits['min_interval'])
+        return limiter
+
+
+@contextmanager
+def provider_slot(provider):
+    """
+    LLM 제공자 호출 슬롯을 확보합니다.
+
+    사용 예:
+        with provider_slot(PROVIDER_OPENAI):
+            response = requests.post(...)
+    """
+    limiter = _get_limiter(provider)
+    with limiter.semaphore:
+        limiter.wait_for_turn()
+        yield
+
+
+def _run_with_db_cleanup(func, item):
+    try:
+        return func(item)
+    except Exception as e:
+        return e
+    finally:
+        # 작업 스레드가 연 DB 연결 정리 (메인 스레드 연결에는 영향 없음)
+        connections.close_all()
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable, max_workers: int = None) -> List[Any]:
+    """
+    items의 각 항목에 func를 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+
+    항목이 하나뿐이면 스레드 없이 바로 실행한다.
+
+    Returns:
+        List: 각 항목의 결과 (func에서 예외가 발생한 항목은 예외 객체)
+    """
+    items = list(items)
+    if not items:
+        return []
+    if len(items) == 1:
+        try:
+            return [func(items[0])]
+        except Exception as e:
+            return [e]
+
+    max_workers = min(len(items), max_workers or getattr(settings, 'TRANSLATION_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+    logger.info(f"[TRANSLATION_EXECUTOR] {len(items)}개 번역 작업 동시 실행 (workers={max_workers})")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='translation') as executor:
+        return list(executor.map(lambda item: _run_with_db_cleanup(func, item), items))
@@ -0,0 +1,728 @@
+"""
+번역 작업 큐 유틸리티
+
+translate_content / translate_all_categories 명령어와 카테고리 일괄 번역 API가 한 프로세스에서
+행마다 동기로 번역하던 방식을, 여러 워커가 나누어 처리하고 재시작 후에도 이어서 처리하는 작업 큐로 대체한다.
+1. create_translation_job(): 번역 대상을 조회하여 TranslationJobItem(객체 + 번역 방향)으로 미리 저장
+2. 워커는 claim_items()로 대기 항목을 select_for_update(skip_locked=True)로 배치 단위로 가져감
+   - 여러 워커가 같은 작업을 동시에 처리해도 항목이 겹치지 않음
+   - 처리 중 상태로 ITEM_LEASE_SECONDS 이상 남은 항목(중단된 워커의 항목)은 다시 가져감
+3. 배치는 (콘텐츠 종류, 번역 방향)별 batch_translate_texts 한 번으로 번역 후 저장하고,
+   항목 상태와 작업 카운터를 바로 기록 (체크포인트)
+   - 번역 메모리/토큰 기준 묶음/동시 실행 경로를 그대로 사용
+   - 이미 번역된 객체는 건너뛰므로 같은 항목을 다시 처리해도 LLM을 다시 호출하지 않음
+4. 실패한 항목은 MAX_ITEM_ATTEMPTS회까지 다시 대기 상태로 돌림
+5. get_job_progress(): 진행률, 처리 속도(분당 항목 수), 남은 시간 추정, 처리 중인 워커 수
+
+사용 예:
+    job = create_translation_job(TranslationJob.JOB_TYPE_CONTENT, {'content_type': 'all', 'direction': 'all'}, user)
+    if not start_translation_job(job, workers=4):
+        run_translation_worker(job.id)  # Celery 전송 실패 시 현재 프로세스에서 처리
+"""
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from quiz.utils.multilingual_utils import (
+    SUPPORTED_LANGUAGES,
+    LANGUAGE_KO,
+    LANGUAGE_EN,
+    LANGUAGE_ES,
+    LANGUAGE_ZH,
+    LANGUAGE_JA,
+    batch_translate_texts,
+)
+
+logger = logging.getLogger(__name__)
+
+ITEM_BATCH_SIZE = 50
+ITEM_CREATE_BATCH_SIZE = 1000
+ITEM_LEASE_SECONDS = 15 * 60  # 처리 중 항목을 다른 워커가 다시 가져가기까지의 시간
+MAX_ITEM_ATTEMPTS = 3
+WORKER_TIME_BUDGET_SECONDS = 10 * 60  # Celery 태스크 한 번의 처리 시간 (초과 시 태스크를 다시 전송)
+DEFAULT_WORKERS = 2
+
+# 콘텐츠 종류별 번역 필드 (필드명_언어코드)
+CONTENT_TRANSLATION_FIELDS = {
+    'study': ('title', 'goal'),
+    'exam': ('title', 'description'),
+    'question': ('title', 'explanation'),
+}
+CONTENT_TYPE_CATEGORY = 'category'
+
+TRANSLATION_DIRECTIONS = {
+    'ko_to_en': [(LANGUAGE_KO, LANGUAGE_EN)],
+    'en_to_ko': [(LANGUAGE_EN, LANGUAGE_KO)],
+    'both': [(LANGUAGE_KO, LANGUAGE_EN), (LANGUAGE_EN, LANGUAGE_KO)],
+    'all': [
+        (source_lang, target_lang)
+        for source_lang in SUPPORTED_LANGUAGES
+        for target_lang in SUPPORTED_LANGUAGES
+        if source_lang != target_lang
+    ],
+}
+
+# 카테고리 번역 대상 언어 (영어 이름 → 각 언어)
+CATEGORY_TARGET_LANGUAGES = [LANGUAGE_ES, LANGUAGE_ZH, LANGUAGE_JA]
+
+
+def _get_content_model(content_type):
+    from quiz.models import Exam, Question, Study, TagCategory
+
+    return {
+        'study': Study,
+        'exam': Exam,
+        'question': Question,
+        CONTENT_TYPE_CATEGORY: TagCategory,
+    }[content_type]
+
+
+def _is_blank(value):
+    return not (isinstance(value, str) and value.strip())
+
+
+def _blank_q(field_name):
+    return Q(**{f'{field_name}__isnull': True}) | Q(**{field_name: ''})
+
+
+# ----- 작업 항목 수집 -----
+
+def _collect_content_items(params):
+    """
+    번역이 필요한 스터디/시험/문제를 (콘텐츠 종류, 객체 ID, 원본 언어, 대상 언어)로 반환합니다.
+
+    대상 언어 제목이 비어 있고 원본 언어 제목이 있는 객체만 수집하며,
+    같은 객체/대상 언어는 SUPPORTED_LANGUAGES 순서상 첫 번째 원본 언어로 한 번만 수집한다.
+    """
+    content_type = params.get('content_type', 'all')
+    direction = params.get('direction', 'all')
+    limit = params.get('limit')
+
+    if content_type != 'all' and content_type not in CONTENT_TRANSLATION_FIELDS:
+        raise ValueError(f'지원하지 않는 콘텐츠 타입입니다: {content_type}')
+    if direction not in TRANSLATION_DIRECTIONS:
+        raise ValueError(f'지원하지 않는 번역 방향입니다: {direction}')
+
+    content_types = list(CONTENT_TRANSLATION_FIELDS) if content_type == 'all' else [content_type]
+    for current_type in content_types:
+        model = _get_content_model(current_type)
+        collected_ids = defaultdict(set)  # {대상 언어: {객체 ID, ...}}
+        count = 0
+        for source_lang, target_lang in TRANSLATION_DIRECTIONS[direction]:
+            source_field = f'title_{source_lang}'
+            target_field = f'title_{target_lang}'
+            if not hasattr(model, source_field) or not hasattr(model, target_field):
+                continue
+
+            object_ids = (
+                model.objects.exclude(_blank_q(source_field))
+                .filter(_blank_q(target_field))
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+            for object_id in object_ids.iterator():
+                object_id = str(object_id)
+                if object_id in collected_ids[target_lang]:
+                    continue
+                if limit and count >= limit:
+                    break
+                collected_ids[target_lang].add(object_id)
+                count += 1
+                yield current_type, object_id, source_lang, target_lang
+
+
+def _collect_category_items(params):
+    """번역할 언어가 비어 있는 카테고리를 (콘텐츠 종류, 객체 ID, '', '')로 반환합니다. (force면 전체)"""
+    from quiz.models import TagCategory
+
+    target_languages = params.get('target_languages') or CATEGORY_TARGET_LANGUAGES
+    unsupported = [lang for lang in target_languages if lang not in SUPPORTED_LANGUAGES or lang == LANGUAGE_EN]
+    if unsupported:
+        raise ValueError(f'지원하지 않는 대상 언어입니다: {", ".join(unsupported)}')
+
+    categories = TagCategory.objects.order_by('pk')
+    if not params.get('force'):
+        condition = _blank_q('name_en')
+        for lang in target_languages:
+            condition |= _blank_q(f'name_{lang}')
+        categories = categories.filter(condition)
+
+    for category_id in categories.values_list('pk', flat=True).iterator():
+        yield CONTENT_TYPE_CATEGORY, str(category_id), '', ''
+
+
+# ----- 항목 처리 -----
+
+def _translate_content_items(items, params):
+    """
+    스터디/시험/문제 항목을 (콘텐츠 종류, 번역 방향)별로 묶어 한 번에 번역하고 저장합니다.
+
+    Returns:
+        dict: {항목 ID: (상태, 오류 메시지)}
+    """
+    from quiz.models import TranslationJobItem
+
+    results = {}
+    groups = defaultdict(list)
+    for item in items:
+        groups[(item.content_type, item.source_language, item.target_language)].append(item)
+
+    for (content_type, source_lang, target_lang), group in groups.items():
+        model = _get_content_model(content_type)
+        fields = [
+            field for field in CONTENT_TRANSLATION_FIELDS[content_type]
+            if hasattr(model, f'{field}_{source_lang}') and hasattr(model, f'{field}_{target_lang}')
+        ]
+        objects = {str(pk): obj for pk, obj in model.objects.in_bulk([item.object_id for item in group]).items()}
+
+        pending = []
+        texts = []
+        for item in group:
+            obj = objects.get(item.object_id)
+            if obj is None:
+                results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '대상 객체가 삭제됨')
+            elif not _is_blank(getattr(obj, f'title_{target_lang}', None)):
+                results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '이미 번역됨')
+            elif _is_blank(getattr(obj, f'title_{source_lang}', None)):
+                results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '원본 제목이 없음')
+            else:
+                pending.append((item, obj))
+                texts.extend(getattr(obj, f'{field}_{source_lang}', None) or '' for field in fields)
+
+        if not pending:
+            continue
+
+        translations = batch_translate_texts(texts, source_lang, target_lang)
+        for index, (item, obj) in enumerate(pending):
+            translated = dict(zip(fields, translations[index * len(fields):(index + 1) * len(fields)]))
+            if _is_blank(translated.get('title')):
+                results[item.id] = (TranslationJobItem.STATUS_FAILED, '번역 결과 없음')
+                continue
+            for field, translated_text in translated.items():
+                if not _is_blank(translated_text):
+                    setattr(obj, f'{field}_{target_lang}', translated_text.strip())
+            try:
+                obj.save()
+                results[item.id] = (TranslationJobItem.STATUS_DONE, '')
+            except Exception as e:
+                results[item.id] = (TranslationJobItem.STATUS_FAILED, f'저장 실패: {e}')
+
+    return results
+
+
+def _translate_category_items(items, params):
+    """
+    카테고리 항목을 언어별로 묶어 번역하고 저장합니다.
+
+    영어 이름이 없으면 한국어 이름을 먼저 영어로 번역하고, 영어 이름을 대상 언어들로 번역한다.
+
+    Returns:
+        dict: {항목 ID: (상태, 오류 메시지)}
+    """
+    from quiz.models import TagCategory, TranslationJobItem
+
+    target_languages = params.get('target_languages') or CATEGORY_TARGET_LANGUAGES
+    force = params.get('force', False)
+    categories = {str(pk): obj for pk, obj in TagCategory.objects.in_bulk([item.object_id for item in items]).items()}
+    changed_ids = set()
+
+    # 한국어 → 영어
+    missing_english = [
+        category for category in categories.values()
+        if _is_blank(category.name_en) and not _is_blank(category.name_ko)
+    ]
+    if missing_english:
+        translations = batch_translate_texts([c.name_ko.strip() for c in missing_english], LANGUAGE_KO, LANGUAGE_EN)
+        for category, translated_name in zip(missing_english, translations):
+            if not _is_blank(translated_name):
+                category.name_en = translated_name.strip()
+                changed_ids.add(category.pk)
+
+    # 영어 → 대상 언어
+    for target_lang in target_languages:
+        name_field = f'name_{target_lang}'
+        targets = [
+            category for category in categories.values()
+            if not _is_blank(category.name_en) and (force or _is_blank(getattr(category, name_field, None)))
+        ]
+        if not targets:
+            continue
+        translations = batch_translate_texts([c.name_en.strip() for c in targets], LANGUAGE_EN, target_lang)
+        for category, translated_name in zip(targets, translations):
+            if not _is_blank(translated_name):
+                setattr(category, name_field, translated_name.strip())
+                changed_ids.add(category.pk)
+
+    results = {}
+    for item in items:
+        category = categories.get(item.object_id)
+        if category is None:
+            results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '대상 객체가 삭제됨')
+            continue
+        missing = [lang for lang in target_languages if _is_blank(getattr(category, f'name_{lang}', None))]
+        if category.pk in changed_ids:
+            try:
+                # save()에서 언어별 완성도 필드(is_*_complete)도 갱신됨
+                category.save()
+            except Exception as e:
+                results[item.id] = (TranslationJobItem.STATUS_FAILED, f'저장 실패: {e}')
+                continue
+            if missing:
+                results[item.id] = (TranslationJobItem.STATUS_FAILED, f'번역 결과 없음: {", ".join(missing)}')
+            else:
+                results[item.id] = (TranslationJobItem.STATUS_DONE, '')
+        elif _is_blank(category.name_en) and _is_blank(category.name_ko):
+            results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '번역할 원본 이름이 없음')
+        elif not missing and not force:
+            results[item.id] = (TranslationJobItem.STATUS_SKIPPED, '이미 번역됨')
+        else:
+            results[item.id] = (TranslationJobItem.STATUS_FAILED, f'번역 결과 없음: {", ".join(missing) or "en"}')
+
+    if changed_ids:
+        # 언어별 카테고리 트리 스냅샷에 번역된 이름이 반영되도록 배치당 한 번 삭제
+        from quiz.utils.tag_category_utils import clear_category_tree_cache
+        clear_category_tree_cache()
+
+    return results
+
+
+ITEM_COLLECTORS = {
+    'content': _collect_content_items,
+    'categories': _collect_category_items,
+}
+
+ITEM_HANDLERS = {
+    'content': _translate_content_items,
+    'categories': _translate_category_items,
+}
+
+
+# ----- 작업 생성/실행 -----
+
+def create_translation_job(job_type, params=None, user=None):
+    """
+    번역 작업과 작업 항목을 생성합니다.
+
+    Args:
+        job_type: 'content' (스터디/시험/문제) 또는 'categories' (카테고리)
+        params: 작업 옵션
+            content: content_type, direction, limit
+            categories: target_languages, force
+        user: 작업을 만든 사용자
+
+    Returns:
+        TranslationJob: 생성된 작업 (번역할 항목이 없으면 바로 완료 상태)
+
+    Raises:
+        ValueError: 지원하지 않는 작업 종류/옵션
+    """
+    from quiz.models import TranslationJob, TranslationJobItem
+
+    if job_type not in ITEM_COLLECTORS:
+        raise ValueError(f'지원하지 않는 번역 작업 종류입니다: {job_type}')
+    params = params or {}
+
+    with transaction.atomic():
+        job = TranslationJob.objects.create(job_type=job_type, params=params, created_by=user)
+        buffer = []
+        total = 0
+        for content_type, object_id, source_lang, target_lang in ITEM_COLLECTORS[job_type](params):
+            buffer.append(TranslationJobItem(
+                job=job,
+                content_type=content_type,
+                object_id=object_id,
+                source_language=source_lang,
+                target_language=target_lang,
+            ))
+            if len(buffer) >= ITEM_CREATE_BATCH_SIZE:
+                TranslationJobItem.objects.bulk_create(buffer)
+                total += len(buffer)
+                buffer = []
+        if buffer:
+            TranslationJobItem.objects.bulk_create(buffer)
+            total += len(buffer)
+
+        job.total_items = total
+        update_fields = ['total_items']
+        if not total:
+            job.status = TranslationJob.STATUS_COMPLETED
+            job.finished_at = timezone.now()
+            update_fields += ['status', 'finished_at']
+        job.save(update_fields=update_fields)
+
+    logger.info(f"[TRANSLATION_JOB] 번역 작업 생성: job_id={job.id}, 종류={job_type}, 항목 {total}개, 옵션={params}")
+    return job
+
+
+def start_translation_job(job, workers=None):
+    """
+    번역 작업을 처리할 Celery 태스크를 workers개 전송합니다.
+
+    Returns:
+        bool: 전송 성공 여부 (실패 또는 eager 모드면 False - 호출측에서 run_translation_worker로 직접 처리)
+    """
+    from quiz.tasks import process_translation_job_task
+
+    # 브로커가 없으면 Celery가 동기(eager)로 실행되어 요청 안에서 작업 전체를 처리하게 되므로 전송하지 않음
+    if process_translation_job_task.app.conf.task_always_eager:
+        logger.warning(f"[TRANSLATION_JOB] Celery 브로커 미설정(eager 모드) - 워커로 전송하지 않음: job_id={job.id}")
+        return False
+
+    workers = max(1, min(workers or DEFAULT_WORKERS, job.total_items or 1))
+    try:
+        for _ in range(workers):
+            process_translation_job_task.delay(str(job.id))
+    except Exception as e:
+        logger.warning(f"[TRANSLATION_JOB] Celery 태스크 전송 실패: job_id={job.id}, error={e}")
+        return False
+    logger.info(f"[TRANSLATION_JOB] 번역 작업 시작: job_id={job.id}, workers={workers}")
+    return True
+
+
+def make_worker_id():
+    """워커 식별자 (호스트:프로세스:임의값)"""
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def claim_items(job_id, worker, batch_size=ITEM_BATCH_SIZE):
+    """
+    대기 항목(또는 임대 시간이 지난 처리 중 항목)을 batch_size개까지 가져갑니다.
+
+    select_for_update(skip_locked=True)로 다른 워커가 잠근 행은 건너뛰므로
+    여러 워커가 동시에 호출해도 같은 항목을 가져가지 않는다.
+
+    Returns:
+        List[TranslationJobItem]: 가져간 항목 (처리 중 상태)
+    """
+    from quiz.models import TranslationJobItem
+
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=ITEM_LEASE_SECONDS)
+    with transaction.atomic():
+        items = list(
+            TranslationJobItem.objects.select_for_update(skip_locked=True)
+            .filter(job_id=job_id)
+            .filter(
+                Q(status=TranslationJobItem.STATUS_PENDING)
+                | Q(status=TranslationJobItem.STATUS_PROCESSING, claimed_at__lt=stale_before)
+            )
+            .order_by('id')[:batch_size]
+        )
+        if items:
+            TranslationJobItem.objects.filter(id__in=[item.id for item in items]).update(
+                status=TranslationJobItem.STATUS_PROCESSING,
+                worker=worker,
+                claimed_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+    for item in items:
+        item.status = TranslationJobItem.STATUS_PROCESSING
+        item.worker = worker
+        item.claimed_at = now
+        item.attempts += 1
+    return items
+
+
+def process_items(job, items, worker):
+    """
+    가져간 항목을 번역하고 결과를 기록합니다.
+
+    Returns:
+        dict: {'translated': n, 'skipped': n, 'failed': n, 'retry': n}
+    """
+    from quiz.models import TranslationJobItem
+
+    started = time.monotonic()
+    results = {}
+    workable = []
+    for item in items:
+        if item.attempts > MAX_ITEM_ATTEMPTS:
+            results[item.id] = (TranslationJobItem.STATUS_FAILED, '최대 시도 횟수 초과')
+        else:
+            workable.append(item)
+
+    if workable:
+        try:
+            results.update(ITEM_HANDLERS[job.job_type](workable, job.params or {}))
+        except Exception as e:
+            logger.error(f"[TRANSLATION_JOB] 배치 처리 실패: job_id={job.id}, 항목 {len(workable)}개, error={e}")
+            for item in workable:
+                results.setdefault(item.id, (TranslationJobItem.STATUS_FAILED, str(e)))
+
+    return _record_results(job, items, results, worker, time.monotonic() - started)
+
+
+def _record_results(job, items, results, worker, elapsed):
+    """항목 상태와 작업 카운터를 한 트랜잭션으로 기록 (체크포인트)"""
+    from quiz.models import TranslationJob, TranslationJobItem
+
+    counts = {'translated': 0, 'skipped': 0, 'failed': 0, 'retry': 0}
+    last_error = ''
+    now = timezone.now()
+
+    with transaction.atomic():
+        # 임대 시간이 지나 다른 워커가 다시 가져간 항목은 그 워커가 기록
+        owned_ids = set(
+            TranslationJobItem.objects.filter(
+                id__in=[item.id for item in items],
+                status=TranslationJobItem.STATUS_PROCESSING,
+                worker=worker,
+            ).values_list('id', flat=True)
+        )
+        to_update = []
+        for item in items:
+            if item.id not in owned_ids:
+                continue
+            item_status, error = results.get(item.id, (TranslationJobItem.STATUS_FAILED, '처리 결과 없음'))
+            if item_status == TranslationJobItem.STATUS_FAILED:
+                last_error = f'{item.content_type}:{item.object_id} {error}'
+            if item_status == TranslationJobItem.STATUS_FAILED and item.attempts < MAX_ITEM_ATTEMPTS:
+                item_status = TranslationJobItem.STATUS_PENDING
+                counts['retry'] += 1
+            elif item_status == TranslationJobItem.STATUS_DONE:
+                counts['translated'] += 1
+            elif item_status == TranslationJobItem.STATUS_SKIPPED:
+                counts['skipped'] += 1
+            else:
+                counts['failed'] += 1
+            item.status = item_status
+            item.error = error
+            item.updated_at = now
+            to_update.append(item)
+
+        if to_update:
+            TranslationJobItem.objects.bulk_update(to_update, ['status', 'error', 'updated_at'])
+
+        job_updates = {
+            'processed_items': F('processed_items') + counts['translated'] + counts['skipped'] + counts['failed'],
+            'translated_items': F('translated_items') + counts['translated'],
+            'skipped_items': F('skipped_items') + counts['skipped'],
+            'failed_items': F('failed_items') + counts['failed'],
+            'processing_seconds': F('processing_seconds') + elapsed,
+            'updated_at': now,
+        }
+        if last_error:
+            job_updates['last_error'] = last_error[:1000]
+        TranslationJob.objects.filter(id=job.id).update(**job_updates)
+
+    logger.info(
+        f"[TRANSLATION_JOB] 배치 완료: job_id={job.id}, worker={worker}, {elapsed:.1f}초, "
+        f"번역 {counts['translated']}개, 건너뜀 {counts['skipped']}개, 실패 {counts['failed']}개, 재시도 대기 {counts['retry']}개"
+    )
+    return counts
+
+
+def finish_job_if_done(job_id):
+    """대기/처리 중 항목이 남지 않았으면 작업을 완료 상태로 바꿉니다."""
+    from quiz.models import TranslationJob, TranslationJobItem
+
+    has_remaining = TranslationJobItem.objects.filter(
+        job_id=job_id,
+        status__in=[TranslationJobItem.STATUS_PENDING, TranslationJobItem.STATUS_PROCESSING],
+    ).exists()
+    if has_remaining:
+        return False
+
+    finished = TranslationJob.objects.filter(
+        id=job_id, status__in=[TranslationJob.STATUS_PENDING, TranslationJob.STATUS_RUNNING]
+    ).update(status=TranslationJob.STATUS_COMPLETED, finished_at=timezone.now())
+    if finished:
+        logger.info(f"[TRANSLATION_JOB] 번역 작업 완료: job_id={job_id}")
+    return True
+
+
+WORKER_RESULT_DONE = 'done'  # 작업 완료, 취소 또는 처리할 항목 없음
+WORKER_RESULT_CONTINUE = 'continue'  # 처리 시간 초과 - 대기 항목이 남아 있음
+WORKER_RESULT_WAIT = 'wait'  # 다른 워커가 처리 중인 항목만 남음 (임대 만료 후 다시 확인)
+
+
+def run_translation_worker(job_id, worker=None, batch_size=ITEM_BATCH_SIZE, time_budget=None, on_batch=None):
+    """
+    작업 항목을 배치 단위로 가져가 처리합니다. (Celery 태스크 또는 관리 명령어에서 호출)
+
+    Args:
+        time_budget: 최대 처리 시간(초) - 지나면 남은 항목을 두고 반환
+        on_batch: 배치마다 호출할 함수 (job, counts) - 진행 상황 출력용
+
+    Returns:
+        str: WORKER_RESULT_DONE / WORKER_RESULT_CONTINUE / WORKER_RESULT_WAIT
+    """
+    from quiz.models import TranslationJob
+
+    worker = worker or make_worker_id()
+    job = TranslationJob.objects.get(id=job_id)
+    if job.status in (TranslationJob.STATUS_COMPLETED, TranslationJob.STATUS_CANCELLED):
+        return WORKER_RESULT_DONE
+
+    TranslationJob.objects.filter(id=job.id, status=TranslationJob.STATUS_PENDING).update(
+        status=TranslationJob.STATUS_RUNNING, started_at=timezone.now()
+    )
+    deadline = time.monotonic() + time_budget if time_budget else None
+
+    while True:
+        job.refresh_from_db(fields=['status'])
+        if job.status == TranslationJob.STATUS_CANCELLED:
+            logger.info(f"[TRANSLATION_JOB] 취소된 작업 처리 중단: job_id={job.id}, worker={worker}")
+            return WORKER_RESULT_DONE
+        if deadline is not None and time.monotonic() >= deadline:
+            return WORKER_RESULT_CONTINUE
+
+        items = claim_items(job.id, worker, batch_size)
+        if not items:
+            break
+        counts = process_items(job, items, worker)
+        if on_batch:
+            on_batch(job, counts)
+
+    if finish_job_if_done(job.id):
+        return WORKER_RESULT_DONE
+    return WORKER_RESULT_WAIT
+
+
+def schedule_lease_recheck(job_id):
+    """
+    다른 워커가 처리 중인 항목만 남았을 때, 가장 오래된 항목의 임대가 끝나는 시점에 한 번 다시 확인합니다.
+
+    작업당 하나의 확인 태스크만 예약하므로(cache.add) 워커가 여럿 끝나도 중복 확인이 쌓이지 않는다.
+    확인 시점에 임대가 지난 항목(중단된 워커의 항목)이 있으면 claim_items로 가져가 처리하고,
+    아직 처리 중이면 다음 임대 만료 시점으로 다시 예약한다.
+
+    Returns:
+        bool: 예약 여부 (처리 중 항목이 없거나 이미 예약된 경우 False)
+    """
+    from django.core.cache import cache
+    from quiz.models import TranslationJobItem
+    from quiz.tasks import process_translation_job_task
+
+    oldest_claimed_at = TranslationJobItem.objects.filter(
+        job_id=job_id, status=TranslationJobItem.STATUS_PROCESSING
+    ).order_by('claimed_at').values_list('claimed_at', flat=True).first()
+    if oldest_claimed_at is None:
+        return False
+
+    expires_at = oldest_claimed_at + timedelta(seconds=ITEM_LEASE_SECONDS)
+    countdown = max(int((expires_at - timezone.now()).total_seconds()) + 1, 1)
+    if not cache.add(f'translation_job_recheck:{job_id}', 1, countdown):
+        return False
+    process_translation_job_task.apply_async(args=[str(job_id)], countdown=countdown)
+    logger.info(f"[TRANSLATION_JOB] 임대 만료 확인 예약: job_id={job_id}, {countdown}초 후")
+    return True
+
+
+def cancel_translation_job(job):
+    """작업을 취소합니다. 처리 중인 워커는 현재 배치를 마친 뒤 멈춥니다."""
+    from quiz.models import TranslationJob
+
+    cancelled = TranslationJob.objects.filter(
+        id=job.id, status__in=[TranslationJob.STATUS_PENDING, TranslationJob.STATUS_RUNNING]
+    ).update(status=TranslationJob.STATUS_CANCELLED, finished_at=timezone.now())
+    if cancelled:
+        logger.info(f"[TRANSLATION_JOB] 번역 작업 취소: job_id={job.id}")
+    return bool(cancelled)
+
+
+def resume_translation_job(job, retry_failed=False):
+    """
+    중단/취소된 작업을 다시 처리할 수 있는 상태로 되돌립니다.
+
+    처리 중 상태로 남은 항목은 임대 시간과 관계없이 대기 상태로 돌리고,
+    retry_failed면 실패한 항목도 시도 횟수를 초기화하여 다시 처리한다.
+    워커 전송은 호출측에서 start_translation_job으로 한다.
+
+    Returns:
+        TranslationJob: 갱신된 작업
+    """
+    from quiz.models import TranslationJob, TranslationJobItem
+
+    with transaction.atomic():
+        items = TranslationJobItem.objects.filter(job_id=job.id)
+        items.filter(status=TranslationJobItem.STATUS_PROCESSING).update(
+            status=TranslationJobItem.STATUS_PENDING, worker='', updated_at=timezone.now()
+        )
+        if retry_failed:
+            retried = items.filter(status=TranslationJobItem.STATUS_FAILED).update(
+                status=TranslationJobItem.STATUS_PENDING, attempts=0, error='', updated_at=timezone.now()
+            )
+            if retried:
+                TranslationJob.objects.filter(id=job.id).update(
+                    processed_items=F('processed_items') - retried,
+                    failed_items=F('failed_items') - retried,
+                )
+
+        has_pending = items.filter(status=TranslationJobItem.STATUS_PENDING).exists()
+        TranslationJob.objects.filter(id=job.id).update(
+            status=TranslationJob.STATUS_RUNNING if has_pending else TranslationJob.STATUS_COMPLETED,
+            finished_at=None if has_pending else timezone.now(),
+        )
+
+    job.refresh_from_db()
+    logger.info(f"[TRANSLATION_JOB] 번역 작업 재개: job_id={job.id}, 상태={job.status}")
+    return job
+
+
+# ----- 진행 상황 -----
+
+def get_job_progress(job, error_limit=10):
+    """
+    작업 진행 상황과 처리 속도를 반환합니다.
+
+    Returns:
+        dict: 항목 수, 진행률(%), 분당 처리 항목 수(전체/워커 처리 시간 기준), 남은 시간 추정(초),
+              처리 중인 워커 수, 최근 실패 항목
+    """
+    from quiz.models import TranslationJob, TranslationJobItem
+
+    now = timezone.now()
+    elapsed_seconds = ((job.finished_at or now) - job.started_at).total_seconds() if job.started_at else 0
+    remaining_items = max(job.total_items - job.processed_items, 0)
+    items_per_minute = job.processed_items / elapsed_seconds * 60 if elapsed_seconds > 0 else 0
+    worker_items_per_minute = job.processed_items / job.processing_seconds * 60 if job.processing_seconds > 0 else 0
+
+    eta_seconds = None
+    active_workers = 0
+    if job.status == TranslationJob.STATUS_RUNNING:
+        if items_per_minute:
+            eta_seconds = round(remaining_items / items_per_minute * 60)
+        active_workers = (
+            TranslationJobItem.objects.filter(job_id=job.id, status=TranslationJobItem.STATUS_PROCESSING)
+            .values('worker').distinct().count()
+        )
+
+    recent_errors = list(
+        TranslationJobItem.objects.filter(job_id=job.id, status=TranslationJobItem.STATUS_FAILED)
+        .order_by('-updated_at')
+        .values('content_type', 'object_id', 'source_language', 'target_language', 'attempts', 'error')[:error_limit]
+    )
+
+    return {
+        'job_id': str(job.id),
+        'job_type': job.job_type,
+        'status': job.status,
+        'params': job.params,
+        'total_items': job.total_items,
+        'processed_items': job.processed_items,
+        'translated_items': job.translated_items,
+        'skipped_items': job.skipped_items,
+        'failed_items': job.failed_items,
+        'remaining_items': remaining_items,
+        'progress_percent': round(job.processed_items / job.total_items * 100, 1) if job.total_items else 100.0,
+        'elapsed_seconds': round(elapsed_seconds),
+        'items_per_minute': round(items_per_minute, 2),
+        'worker_items_per_minute': round(worker_items_per_minute, 2),
+        'eta_seconds': eta_seconds,
+        'active_workers': active_workers,
+        'last_error': job.last_error,
+        'recent_errors': recent_errors,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
@@ -0,0 +1,238 @@
+"""
+번역 메모리 유틸리티
+
+모든 번역 경로(batch_translate_texts, translate_long_text_in_chunks, smart_translate_content,
+MultilingualContentManager, TranslationManager, 번역 API)가 LLM 호출 전에 거치는 공용 번역 저장소.
+1. (원문 sha256, 원본 언어, 대상 언어)를 키로 TranslationMemory 테이블에 영구 저장
+2. 앞단에 Django 캐시를 두고 get_many/set_many로 여러 텍스트를 한 번에 조회/저장
+   - 캐시 미스만 DB에서 한 번의 IN 쿼리로 조회 후 캐시에 채움
+3. 번역 메모리에 없는 텍스트만 중복 제거 후 LLM으로 번역 (translate_with_memory)
+4. clear()는 DB 행을 삭제하고 캐시 버전을 올려 기존 캐시 항목을 무효화
+
+사용 예:
+    translations = translate_with_memory(texts, 'ko', 'en', call_llm)
+"""
+import hashlib
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'translation_memory'
+CACHE_VERSION_KEY = f'{CACHE_PREFIX}:version'
+CACHE_TIMEOUT = 86400 * 7  # 7일 (영구 저장은 DB가 담당)
+DB_LOOKUP_BATCH_SIZE = 500
+
+
+def make_source_hash(text: str) -> str:
+    """원문 해시 (sha256)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _get_cache_version() -> int:
+    try:
+        return cache.get(CACHE_VERSION_KEY) or 1
+    except Exception:
+        return 1
+
+
+def _cache_key(version: int, source_hash: str, from_language: str, to_language: str) -> str:
+    return f"{CACHE_PREFIX}:v{version}:{from_language}:{to_language}:{source_hash}"
+
+
+def _is_translatable(text) -> bool:
+    return isinstance(text, str) and bool(text.strip())
+
+
+def get_many(texts: Iterable[str], from_language: str, to_language: str) -> Dict[str, str]:
+    """
+    번역 메모리에서 여러 텍스트의 번역을 한 번에 조회합니다.
+
+    Returns:
+        Dict[str, str]: {원문: 번역문} (번역 메모리에 있는 텍스트만 포함)
+    """
+    if from_language == to_language:
+        return {}
+
+    texts_by_hash = {make_source_hash(text): text for text in texts if _is_translatable(text)}
+    if not texts_by_hash:
+        return {}
+
+    version = _get_cache_version()
+    hashes_by_key = {
+        _cache_key(version, source_hash, from_language, to_language): source_hash
+        for source_hash in texts_by_hash
+    }
+
+    result = {}
+    try:
+        cached = cache.get_many(list(hashes_by_key))
+    except Exception as e:
+        logger.warning(f"[TRANSLATION_MEMORY] 캐시 조회 실패, DB에서 조회: {e}")
+        cached = {}
+    for key, translated_text in cached.items():
+        result[texts_by_hash[hashes_by_key[key]]] = translated_text
+
+    missing_hashes = [source_hash for key, source_hash in hashes_by_key.items() if key not in cached]
+    if missing_hashes:
+        from quiz.models import TranslationMemory
+
+        to_cache = {}
+        for start in range(0, len(missing_hashes), DB_LOOKUP_BATCH_SIZE):
+            rows = TranslationMemory.objects.filter(
+                source_hash__in=missing_hashes[start:start + DB_LOOKUP_BATCH_SIZE],
+                source_language=from_language,
+                target_language=to_language,
+            ).values_list('source_hash', 'source_text', 'translated_text')
+            for source_hash, source_text, translated_text in rows:
+                # 해시 충돌 방지: 원문까지 일치하는 경우만 사용
+                if texts_by_hash.get(source_hash) != source_text:
+                    continue
+                result[source_text] = translated_text
+                to_cache[_cache_key(version, source_hash, from_language, to_language)] = translated_text
+        if to_cache:
+            try:
+                cache.set_many(to_cache, CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"[TRANSLATION_MEMORY] 캐시 저장 실패: {e}")
+
+    if result:
+        logger.info(f"[TRANSLATION_MEMORY] {from_language} → {to_language}: {len(texts_by_hash)}개 중 {len(result)}개 적중")
+    return result
+
+
+def set_many(translations: Dict[str, str], from_language: str, to_language: str) -> int:
+    """
+    번역 결과를 번역 메모리에 한 번에 저장합니다. (이미 있으면 번역문 갱신)
+
+    Args:
+        translations: {원문: 번역문}
+
+    Returns:
+        int: 저장한 항목 수
+    """
+    from quiz.models import TranslationMemory
+
+    if from_language == to_language:
+        return 0
+
+    entries = {
+        make_source_hash(source_text): (source_text, translated_text)
+        for source_text, translated_text in translations.items()
+        if _is_translatable(source_text) and _is_translatable(translated_text)
+    }
+    if not entries:
+        return 0
+
+    try:
+        TranslationMemory.objects.bulk_create(
+            [
+                TranslationMemory(
+                    source_hash=source_hash,
+                    source_language=from_language,
+                    target_language=to_language,
+                    source_text=source_text,
+                    translated_text=translated_text,
+                )
+                for source_hash, (source_text, translated_text) in entries.items()
+            ],
+            batch_size=DB_LOOKUP_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['source_hash', 'source_language', 'target_language'],
+            update_fields=['translated_text', 'updated_at'],
+        )
+    except Exception as e:
+        logger.error(f"[TRANSLATION_MEMORY] 번역 메모리 저장 실패 ({from_language} → {to_language}): {e}")
+        return 0
+
+    version = _get_cache_version()
+    try:
+        cache.set_many(
+            {
+                _cache_key(version, source_hash, from_language, to_language): translated_text
+                for source_hash, (_, translated_text) in entries.items()
+            },
+            CACHE_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning(f"[TRANSLATION_MEMORY] 캐시 저장 실패: {e}")
+
+    logger.info(f"[TRANSLATION_MEMORY] {from_language} → {to_language}: {len(entries)}개 저장")
+    return len(entries)
+
+
+def get_translation(text: str, from_language: str, to_language: str) -> Optional[str]:
+    """단일 텍스트 번역 조회"""
+    return get_many([text], from_language, to_language).get(text)
+
+
+def set_translation(text: str, translated_text: str, from_language: str, to_language: str) -> None:
+    """단일 텍스트 번역 저장"""
+    set_many({text: translated_text}, from_language, to_language)
+
+
+def translate_with_memory(
+    texts: List[str],
+    from_language: str,
+    to_language: str,
+    translate_fn: Callable[[List[str]], List[Optional[str]]],
+) -> List[Optional[str]]:
+    """
+    번역 메모리에 없는 텍스트만 translate_fn으로 번역하고 결과를 저장합니다.
+
+    Args:
+        texts: 번역할 텍스트 리스트
+        translate_fn: 텍스트 리스트를 받아 같은 순서/길이의 번역 리스트를 반환하는 함수 (실패 항목은 None)
+
+    Returns:
+        List[Optional[str]]: texts와 같은 순서의 번역 결과 (실패 시 None)
+    """
+    translations = get_many(texts, from_language, to_language)
+
+    # 같은 텍스트는 한 번만 번역
+    missing = list(dict.fromkeys(
+        text for text in texts if _is_translatable(text) and text not in translations
+    ))
+    if missing:
+        translated = translate_fn(missing) or []
+        if len(translated) != len(missing):
+            logger.warning(f"[TRANSLATION_MEMORY] 번역 결과 개수 불일치: 요청 {len(missing)}개, 결과 {len(translated)}개")
+            translated = [None] * len(missing)
+        new_translations = {
+            text: translated_text
+            for text, translated_text in zip(missing, translated)
+            if _is_translatable(translated_text)
+        }
+        set_many(new_translations, from_language, to_language)
+        translations.update(new_translations)
+
+    return [translations.get(text) if isinstance(text, str) else None for text in texts]
+
+
+def clear(from_language: Optional[str] = None, to_language: Optional[str] = None) -> int:
+    """
+    번역 메모리를 정리합니다.
+
+    DB 행을 삭제하고 캐시 버전을 올려 기존 캐시 항목이 더 이상 조회되지 않도록 한다.
+
+    Returns:
+        int: 삭제한 항목 수
+    """
+    from quiz.models import TranslationMemory
+
+    queryset = TranslationMemory.objects.all()
+    if from_language:
+        queryset = queryset.filter(source_language=from_language)
+    if to_language:
+        queryset = queryset.filter(target_language=to_language)
+    deleted_count = queryset.delete()[0]
+
+    try:
+        cache.set(CACHE_VERSION_KEY, _get_cache_version() + 1, None)
+    except Exception as e:
+        logger.warning(f"[TRANSLATION_MEMORY] 캐시 버전 갱신 실패: {e}")
+
+    logger.info(f"[TRANSLATION_MEMORY] 번역 메모리 정리: {from_language or '*'} → {to_language or '*'}, {deleted_count}개 삭제")
+    return deleted_count
@@ -0,0 +1,176 @@
+"""
+문제 자동 번역 백그라운드 큐 유틸리티
+
+시험 조회(ExamSerializer.get_questions) 응답 경로에서 번역을 분리한다.
+1. 조회 시에는 누락된 번역만 메모리에서 일괄 판단 (LLM 호출/추가 쿼리 없음)
+2. (문제, 대상 언어) 단위 pending 키로 중복 요청을 막고 Celery 태스크 하나로 전송
+3. 응답은 현재 있는 언어 필드(폴백)로 즉시 반환하고, 클라이언트는
+   get_question_translation_status 로 완료 여부와 번역 결과를 폴링한다
+"""
+import logging
+
+from django.core.cache import cache
+
+from quiz.utils.multilingual_utils import (
+    BASE_LANGUAGE,
+    get_user_language,
+    is_auto_translation_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+QUESTION_TRANSLATION_FIELDS = ['title', 'content', 'answer', 'explanation']
+PENDING_KEY_PREFIX = "translation_pending:question"
+PENDING_TIMEOUT = 600  # 워커가 실패해도 10분 뒤에는 다시 요청 가능
+
+
+def _pending_key(question_id, to_lang):
+    return f"{PENDING_KEY_PREFIX}:{question_id}:{to_lang}"
+
+
+def get_question_translation_direction(question, user_language):
+    """
+    MultilingualContentManager._identify_translation_tasks와 같은 규칙으로 번역 방향을 결정합니다.
+
+    Returns:
+        (from_lang, to_lang) 또는 번역이 필요 없는 경우 None
+    """
+    if user_language == BASE_LANGUAGE:
+        created_language = getattr(question, 'created_language', None) or BASE_LANGUAGE
+        if created_language == BASE_LANGUAGE:
+            return None
+        return created_language, BASE_LANGUAGE
+    return user_language, BASE_LANGUAGE
+
+
+def get_question_translation_tasks(question, from_lang, to_lang, fields=None):
+    """
+    원본 언어 필드에 내용이 있고 대상 언어 필드가 비어 있는 번역 작업 목록
+
+    Args:
+        fields: 번역할 필드 목록 (기본값: QUESTION_TRANSLATION_FIELDS)
+
+    Returns:
+        List[Tuple]: (필드명, 원본언어, 대상언어, 콘텐츠) 튜플의 리스트
+    """
+    tasks = []
+    for field_name in fields or QUESTION_TRANSLATION_FIELDS:
+        source_content = getattr(question, f"{field_name}_{from_lang}", None)
+        if not source_content or (isinstance(source_content, str) and not source_content.strip()):
+            continue
+        if not getattr(question, f"{field_name}_{to_lang}", None):
+            tasks.append((field_name, from_lang, to_lang, source_content))
+    return tasks
+
+
+def get_pending_question_ids(question_ids, to_lang=BASE_LANGUAGE):
+    """번역 대기 중인 문제 ID 집합 (get_many 한 번으로 조회)"""
+    keys = {_pending_key(question_id, to_lang): str(question_id) for question_id in question_ids}
+    if not keys:
+        return set()
+    return {keys[key] for key in cache.get_many(list(keys))}
+
+
+def release_pending_translations(question_ids, to_lang=BASE_LANGUAGE):
+    """번역 대기 표시 해제"""
+    if question_ids:
+        cache.delete_many([_pending_key(question_id, to_lang) for question_id in question_ids])
+
+
+def queue_missing_question_translations(questions, user, fields=None):
+    """
+    누락된 문제 번역을 찾아 Celery 번역 워커로 전송합니다. 조회 경로에서 호출되며 DB를 변경하지 않는다.
+
+    이미 다른 요청이 전송한 (문제, 대상 언어)는 다시 전송하지 않으며,
+    태스크 전송에 실패하면 동기 번역 대신 대기 표시만 해제한다 (다음 조회에서 재시도).
+
+    Args:
+        questions: 이미 로드된 Question 인스턴스 목록
+        user: 요청 사용자 (익명 사용자 포함)
+        fields: 번역할 필드 목록 (기본값: QUESTION_TRANSLATION_FIELDS)
+
+    Returns:
+        set: 번역 대기 중인 문제 ID(str) 집합
+    """
+    if not is_auto_translation_enabled(user):
+        return set()
+
+    user_language = get_user_language(user)
+    candidates = {}
+    for question in questions:
+        direction = get_question_translation_direction(question, user_language)
+        if direction and get_question_translation_tasks(question, *direction, fields=fields):
+            candidates[str(question.id)] = direction
+
+    if not candidates:
+        return set()
+
+    items = []
+    for question_id, (from_lang, to_lang) in candidates.items():
+        # cache.add는 키가 없을 때만 성공하므로 (문제, 대상 언어)당 한 번만 전송됨
+        if cache.add(_pending_key(question_id, to_lang), from_lang, PENDING_TIMEOUT):
+            items.append([question_id, from_lang, to_lang])
+
+    if items:
+        try:
+            from quiz.tasks import translate_questions_task
+            translate_questions_task.delay(items, fields)
+            logger.info(f"[TRANSLATION_QUEUE] 문제 번역 {len(items)}건 Celery 태스크 전송 (대기 {len(candidates)}건)")
+        except Exception as e:
+            logger.warning(f"[TRANSLATION_QUEUE] Celery 태스크 전송 실패, 대기 표시 해제: {e}")
+            cache.delete_many([_pending_key(question_id, to_lang) for question_id, _, to_lang in items])
+            sent = {question_id for question_id, _, _ in items}
+            return set(candidates) - sent
+
+    return set(candidates)
+
+
+def translate_questions(items, fields=None):
+    """
+    대기 중인 문제 번역을 실행하고 결과를 저장합니다. (Celery 워커에서 실행)
+
+    Args:
+        items: [[question_id, from_lang, to_lang], ...]
+        fields: 번역할 필드 목록 (기본값: QUESTION_TRANSLATION_FIELDS)
+
+    Returns:
+        dict: {'translated': 번역한 문제 수, 'skipped': 이미 번역되어 건너뛴 문제 수}
+    """
+    from quiz.models import ExamQuestion, Question
+    from quiz.utils.cache_utils import ExamCacheManager
+    from quiz.utils.multilingual_utils import MultilingualContentManager
+
+    questions = Question.objects.in_bulk([question_id for question_id, _, _ in items])
+    questions = {str(question_id): question for question_id, question in questions.items()}
+    translated_ids = []
+    skipped = 0
+
+    try:
+        for question_id, from_lang, to_lang in items:
+            question = questions.get(str(question_id))
+            if question is None:
+                continue
+
+            # 전송 이후 다른 경로에서 이미 번역되었을 수 있으므로 다시 확인
+            tasks = get_question_translation_tasks(question, from_lang, to_lang, fields=fields)
+            if not tasks:
+                skipped += 1
+                continue
+
+            # 동기 저장 + 완성도 상태 갱신 (skip_completion_update=False)
+            manager = MultilingualContentManager(question, None, fields or QUESTION_TRANSLATION_FIELDS)
+            manager.apply_translation_tasks(tasks)
+            translated_ids.append(question.id)
+    finally:
+        for question_id, _, to_lang in items:
+            release_pending_translations([question_id], to_lang)
+
+    if translated_ids:
+        exam_ids = set(
+            ExamQuestion.objects.filter(question_id__in=translated_ids).values_list('exam_id', flat=True)
+        )
+        for exam_id in exam_ids:
+            ExamCacheManager.invalidate_exam_cache(exam_id)
+
+    logger.info(f"[TRANSLATION_QUEUE] 문제 번역 완료: {len(translated_ids)}건 번역, {skipped}건 건너뜀")
+    return {'translated': len(translated_ids), 'skipped': skipped}
@@ -8,7 +8,6 @@ import logging
 import requests
 from typing import Dict, List, Optional, Tuple
 from django.conf import settings
-from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +17,6 @@ class TranslationManager:
     Bulk 번역을 통해 API 호출을 최소화하고 캐싱을 활용합니다.
     """
     
-    CACHE_PREFIX = "translation"
-    CACHE_TIMEOUT = 86400 * 30  # 30일
-    
     @classmethod
     def translate_bulk_to_english(cls, texts_dict: Dict[str, str]) -> Dict[str, str]:
         """
@@ -37,11 +33,10 @@ class TranslationManager:
             logger.info("번역할 텍스트가 없습니다.")
             return {}
         
-        # 캐시에서 먼저 확인
+        # 번역 메모리에서 먼저 확인 (일부만 있으면 나머지만 번역)
         cached_results = cls._get_cached_translations(texts_dict, 'ko_to_en')
         if cached_results:
-            logger.info(f"[BULK_TRANSLATION] 캐시에서 {len(cached_results)}개 번역 결과 로드")
-            return cached_results
+            logger.info(f"[BULK_TRANSLATION] 번역 메모리에서 {len(cached_results)}개 번역 결과 로드")
         
         # 번역이 필요한 텍스트만 필터링
         texts_to_translate = {k: v for k, v in texts_dict.items() if v and k not in cached_results}
@@ -80,11 +75,10 @@ class TranslationManager:
             logger.info("번역할 텍스트가 없습니다.")
             return {}
         
-        # 캐시에서 먼저 확인
+        # 번역 메모리에서 먼저 확인 (일부만 있으면 나머지만 번역)
         cached_results = cls._get_cached_translations(texts_dict, 'en_to_ko')
         if cached_results:
-            logger.info(f"[BULK_TRANSLATION] 캐시에서 {len(cached_results)}개 번역 결과 로드")
-            return cached_results
+            logger.info(f"[BULK_TRANSLATION] 번역 메모리에서 {len(cached_results)}개 번역 결과 로드")
         
         # 번역이 필요한 텍스트만 필터링
         texts_to_translate = {k: v for k, v in texts_dict.items() if v and k not in cached_results}
@@ -152,8 +146,7 @@ class TranslationManager:
             cached_results = cls._get_cached_translations(texts_dict, 'en_to_es')
         
         if cached_results:
-            logger.info(f"[BULK_TRANSLATION] 캐시에서 {len(cached_results)}개 번역 결과 로드")
-            return cached_results
+            logger.info(f"[BULK_TRANSLATION] 번역 메모리에서 {len(cached_results)}개 번역 결과 로드")
         
         # 번역이 필요한 텍스트만 필터링
         texts_to_translate = {k: v for k, v in texts_dict.items() if v and k not in cached_results}
@@ -217,8 +210,7 @@ class TranslationManager:
             cached_results = cls._get_cached_translations(texts_dict, 'en_to_ja')
         
         if cached_results:
-            logger.info(f"[BULK_TRANSLATION] 캐시에서 {len(cached_results)}개 번역 결과 로드")
-            return cached_results
+            logger.info(f"[BULK_TRANSLATION] 번역 메모리에서 {len(cached_results)}개 번역 결과 로드")
         
         # 번역이 필요한 텍스트만 필터링
         texts_to_translate = {k: v for k, v in texts_dict.items() if v and k not in cached_results}
@@ -282,8 +274,7 @@ class TranslationManager:
             cached_results = cls._get_cached_translations(texts_dict, 'en_to_zh')
         
         if cached_results:
-            logger.info(f"[BULK_TRANSLATION] 캐시에서 {len(cached_results)}개 번역 결과 로드")
-            return cached_results
+            logger.info(f"[BULK_TRANSLATION] 번역 메모리에서 {len(cached_results)}개 번역 결과 로드")
         
         # 번역이 필요한 텍스트만 필터링
         texts_to_translate = {k: v for k, v in texts_dict.items() if v and k not in cached_results}
@@ -421,12 +412,15 @@ class TranslationManager:
         }
         
         try:
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            # 제공자별 동시 호출 수/호출 간격 제한
+            from quiz.utils.translation_executor import PROVIDER_OPENAI, provider_slot
+            with provider_slot(PROVIDER_OPENAI):
+                response = requests.post(
+                    'https://api.openai.com/v1/chat/completions',
+                    headers=headers,
+                    json=payload,
+                    timeout=30
+                )
         except Exception as e:
             logger.error(f"[TranslationManager._call_openai_api] OpenAI API 요청 실패: {e}")
             mark_openai_unavailable()
@@ -525,53 +519,50 @@ class TranslationManager:
             return {}
     
     @classmethod
-    def _get_cache_key(cls, text: str, direction: str) -> str:
-        """캐시 키를 생성합니다."""
-        import hashlib
-        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
-        return f"{cls.CACHE_PREFIX}:{direction}:{text_hash}"
+    def _parse_direction(cls, direction: str) -> Tuple[str, str]:
+        """'ko_to_en' 형식의 번역 방향을 (원본 언어, 대상 언어)로 변환합니다."""
+        from_language, _, to_language = direction.partition('_to_')
+        return from_language, to_language
     
     @classmethod
     def _get_cached_translations(cls, texts_dict: Dict[str, str], direction: str) -> Dict[str, str]:
-        """캐시된 번역 결과를 가져옵니다."""
-        cached_results = {}
-        
-        for key, text in texts_dict.items():
-            if text:
-                cache_key = cls._get_cache_key(text, direction)
-                cached_text = cache.get(cache_key)
-                if cached_text:
-                    cached_results[key] = cached_text
+        """번역 메모리에서 번역 결과를 한 번에 가져옵니다."""
+        from quiz.utils.translation_memory import get_many
         
-        return cached_results
+        from_language, to_language = cls._parse_direction(direction)
+        remembered = get_many(texts_dict.values(), from_language, to_language)
+        return {key: remembered[text] for key, text in texts_dict.items() if text in remembered}
     
     @classmethod
     def _cache_translations(cls, original_dict: Dict[str, str], translated_dict: Dict[str, str], direction: str):
-        """번역 결과를 캐시에 저장합니다."""
-        for key, original_text in original_dict.items():
-            if key in translated_dict and translated_dict[key]:
-                cache_key = cls._get_cache_key(original_text, direction)
-                cache.set(cache_key, translated_dict[key], cls.CACHE_TIMEOUT)
+        """번역 결과를 번역 메모리에 한 번에 저장합니다."""
+        from quiz.utils.translation_memory import set_many
+        
+        from_language, to_language = cls._parse_direction(direction)
+        set_many(
+            {original_text: translated_dict[key] for key, original_text in original_dict.items() if translated_dict.get(key)},
+            from_language, to_language
+        )
     
     @classmethod
     def clear_cache(cls, direction: Optional[str] = None):
         """
-        번역 캐시를 정리합니다.
+        번역 메모리를 정리합니다.
         
         Args:
             direction: 정리할 번역 방향 ('ko_to_en', 'en_to_ko', None=전체)
         """
+        from quiz.utils import translation_memory
+        
         if direction:
-            # 특정 방향의 캐시만 정리
-            pattern = f"{cls.CACHE_PREFIX}:{direction}:*"
-            # Django의 cache.delete_pattern은 지원하지 않으므로 개별 삭제
+            # 특정 방향의 번역만 정리
+            from_language, to_language = cls._parse_direction(direction)
+            translation_memory.clear(from_language, to_language)
             logger.info(f"번역 캐시 정리: {direction}")
         else:
-            # 전체 번역 캐시 정리
+            # 전체 번역 정리
+            translation_memory.clear()
             logger.info("전체 번역 캐시 정리")
-        
-        # 실제 구현에서는 더 정교한 캐시 정리 로직이 필요할 수 있음
-        # 현재는 로그만 출력
 
 class BulkTranslationMixin:
     """
@@ -8,12 +8,13 @@ import os
 import yaml
 import openai
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
 from django.utils import timezone
 from quiz.utils.multilingual_utils import LANGUAGE_KO, LANGUAGE_EN, LANGUAGE_ES, LANGUAGE_ZH, LANGUAGE_JA, BASE_LANGUAGE, SUPPORTED_LANGUAGES
+from quiz.utils import answer_verdict_cache
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,7 @@ def evaluate_answer(request):
         correct_answer = request.data.get('correct_answer')
         language = request.data.get('language', BASE_LANGUAGE)
         exam_difficulty = request.data.get('exam_difficulty', 5)  # 기본값 5
+        question_id = request.data.get('question_id')  # 선택 - 판정 캐시 키에 사용
         
         if not all([question, user_answer, correct_answer]):
             return Response({
@@ -77,6 +79,24 @@ def evaluate_answer(request):
             exam_difficulty = 5
             logger.warning(f"잘못된 exam_difficulty 값, 기본값 5 사용: {request.data.get('exam_difficulty')}")
         
+        # 정확히/거의 일치하는 답안은 OpenAI 없이 판정하고, 같은 조건의 이전 판정이 있으면 재사용
+        # (엄격한 난이도에서는 철자 차이도 OpenAI가 판단하도록 정확히 일치하는 경우만 사전 판정)
+        verdict_context = f"{answer_verdict_cache.normalize_answer(question)}|{exam_difficulty}"
+        verdict = answer_verdict_cache.precheck_answer(
+            user_answer, correct_answer, answer_verdict_cache.KIND_EVALUATE,
+            allow_fuzzy=exam_difficulty <= answer_verdict_cache.FUZZY_MAX_EXAM_DIFFICULTY
+        ) or answer_verdict_cache.get_verdict(
+            answer_verdict_cache.KIND_EVALUATE, user_answer, correct_answer, language, question_id, verdict_context
+        )
+        if verdict:
+            logger.info(f"[evaluate_answer] LLM 없이 판정: provider={verdict['provider']}, cached={verdict.get('cached', False)}")
+            return Response({
+                'is_correct': verdict['is_correct'],
+                'reason': verdict['reason'],
+                'user_answer': user_answer,
+                'correct_answer': correct_answer
+            })
+        
         # 난이도에 따른 평가 가이드라인 가져오기
         from quiz.views.realtime_views import _get_evaluation_guideline
         evaluation_guideline = _get_evaluation_guideline(exam_difficulty, language)
@@ -161,6 +181,11 @@ def evaluate_answer(request):
             result = json.loads(result_text)
             is_correct = result.get('is_correct', False)
             reason = result.get('reason', '')
+            answer_verdict_cache.set_verdict(
+                answer_verdict_cache.KIND_EVALUATE, user_answer, correct_answer, language,
+                {'is_correct': is_correct, 'confidence': result.get('confidence'), 'reason': reason, 'provider': 'openai'},
+                question_id, verdict_context
+            )
         except json.JSONDecodeError:
             # JSON 파싱 실패 시 텍스트에서 true/false 추출
             is_correct = 'true' in result_text.lower()
@@ -191,3 +216,17 @@ def evaluate_answer(request):
     except Exception as e:
         logger.error(f"답변 평가 실패: {e}")
         return Response({'error': '답변 평가 중 오류가 발생했습니다.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def answer_check_cache_stats(request):
+    """
+    답안 판정 캐시 통계 조회(GET) / 캐시와 통계 초기화(DELETE) (관리자만)
+
+    check(check_answer_with_ai), evaluate(evaluate_answer)별로 조회/적중/미스/저장 건수,
+    LLM 없이 판정한 건수(exact_matches, fuzzy_matches), 적중률(hit_rate), LLM 호출 회피율(llm_avoided_rate)을 반환합니다.
+    """
+    if request.method == 'DELETE':
+        answer_verdict_cache.clear()
+    return Response({'stats': answer_verdict_cache.get_stats()})
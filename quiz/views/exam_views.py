@@ -20,6 +20,7 @@ from rest_framework import status
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from functools import wraps
+from collections import defaultdict
 import uuid
 import logging
 import random
@@ -34,13 +35,19 @@ from django.conf import settings
 from io import BytesIO
 from django.contrib.auth import get_user_model
 from ..utils.cache_utils import ExamCacheManager, QueryOptimizer
+from ..utils.stats_utils import prefetch_user_exam_progress, record_question_attempts, refresh_user_question_stats
+from ..utils.submission_utils import is_daily_exam, schedule_exam_submission_stats
+from ..utils.deferred_signals import deferred_signals, schedule_exam_question_count
+from ..utils.export_utils import handle_export_request
+from ..utils.question_import_utils import QuestionImporter, iter_row_chunks
+from ..utils.translation_queue import queue_missing_question_translations
 from ..utils.multilingual_utils import get_user_language
 
 User = get_user_model()
 from ..models import Question, Exam, ExamQuestion, ExamResult, ExamResultDetail, Member, StudyTask, StudyTaskProgress, IgnoredQuestion, QuestionMemberMapping, Study, AccuracyAdjustmentHistory, ExamSubscription, Tag
 from ..serializers import ExamSerializer, QuestionSerializer, CreateExamSerializer, ExamResultSerializer, QuestionMemberMappingSerializer, CreateQuestionMemberMappingSerializer, ExamListSerializer, TagSerializer
 from quiz.utils.multilingual_utils import (
-    LANGUAGE_EN, LANGUAGE_KO, LANGUAGE_ES, LANGUAGE_ZH, LANGUAGE_JA, BASE_LANGUAGE,
+    LANGUAGE_EN, LANGUAGE_KO, LANGUAGE_ES, LANGUAGE_ZH, LANGUAGE_JA, BASE_LANGUAGE, SUPPORTED_LANGUAGES,
     get_localized_field, get_user_language
 )
 
@@ -69,23 +76,6 @@ def normalize_difficulty(difficulty):
         return 'Medium'
 
 
-def format_difficulty_for_excel(difficulty):
-    """엑셀 다운로드용 난이도 포맷팅"""
-    if not difficulty:
-        return ''
-    
-    difficulty = str(difficulty).lower().strip()
-    
-    if difficulty == 'easy':
-        return 'Easy'
-    elif difficulty == 'medium':
-        return 'Medium'
-    elif difficulty == 'hard':
-        return 'Hard'
-    else:
-        return difficulty.capitalize()
-
-
 def calculate_difficulty_distribution(exam_difficulty, question_count):
     """
     시험 난이도에 따라 문제 난이도 분배를 계산합니다.
@@ -493,6 +483,14 @@ def delete_question_results(request):
 
         print(f"총 삭제된 답안 수: {deleted_count}")
 
+        # 사용자별 문제 통계(UserQuestionStat) 재계산
+        if current_user.is_authenticated:
+            refresh_user_question_stats(
+                [current_user.id],
+                exam_ids=[exam_id],
+                question_ids=None if delete_all else question_uuids
+            )
+
         # ========================================
         # 🔄 REDIS 캐시 무효화 (중요!)
         # ========================================
@@ -623,6 +621,10 @@ def delete_question_results_global(request):
 
         print(f"총 삭제된 답안 수: {deleted_count}")
 
+        # 사용자별 문제 통계(UserQuestionStat) 재계산
+        if current_user.is_authenticated:
+            refresh_user_question_stats([current_user.id], question_ids=question_uuids)
+
         # ========================================
         # 🔄 REDIS 캐시 무효화 (중요!)
         # ========================================
@@ -854,16 +856,9 @@ def create_exam(request):
                     else:
                         # 옵션별 문제 선택 로직
                         if random_option == 'wrong_only':
-                            # 틀린 문제만 추출
-                            wrong_questions = []
-                            for question in questions:
-                                # 해당 문제의 최근 시험 결과에서 틀린 횟수 확인
-                                wrong_count = ExamResultDetail.objects.filter(
-                                    question=question,
-                                    is_correct=False
-                                ).count()
-                                if wrong_count > 0:
-                                    wrong_questions.append(question)
+                            # 틀린 문제만 추출 (단일 쿼리로 오답 기록이 있는 문제 조회)
+                            from ..utils.question_utils import filter_wrong_questions
+                            wrong_questions = filter_wrong_questions(questions)
 
                             # 틀린 문제 수가 요청한 문제 수보다 적으면 자동으로 조정
                             if len(wrong_questions) < question_count:
@@ -875,7 +870,6 @@ def create_exam(request):
 
                         elif random_option == 'most_wrong':
                             # 많이 틀린 문제 추출 (시도 횟수 많고 오답률 높은 순)
-                            question_scores = []
                             user = request.user
 
                             # 익명 사용자인 경우 빈 결과 반환
@@ -884,41 +878,10 @@ def create_exam(request):
                                     'error': '로그인이 필요한 기능입니다.'
                                 }, status=status.HTTP_401_UNAUTHORIZED)
 
-                            print(f"[most_wrong] 사용자: {user.username}")
-                            print(f"[most_wrong] 총 문제 수: {len(questions)}")
-
-                            for question in questions:
-                                # 해당 문제의 총 시험 횟수 (현재 사용자만)
-                                total_attempts = ExamResultDetail.objects.filter(
-                                    question=question,
-                                    result__user=user
-                                ).count()
-
-                                if question:
-                                    question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                                    print(f"[most_wrong] 문제 {question.id} ({question_title}): 시도 횟수 = {total_attempts}")
-                                else:
-                                    print(f"[most_wrong] 문제 {question.id} (제목 없음): 시도 횟수 = {total_attempts}")
-
-                                if total_attempts > 0:
-                                    # 틀린 횟수 (현재 사용자만)
-                                    wrong_count = ExamResultDetail.objects.filter(
-                                        question=question,
-                                        result__user=user,
-                                        is_correct=False
-                                    ).count()
-                                    # 오답률 계산
-                                    wrong_rate = wrong_count / total_attempts
-                                    # 점수 계산: 시도 횟수 * 오답률 (시도 횟수가 많고 오답률이 높을수록 높은 점수)
-                                    score = total_attempts * wrong_rate
-                                    question_scores.append((question, score, total_attempts, wrong_count))
-                                    print(f"[most_wrong] 문제 {question.id} 추가됨: 점수={score}, 시도={total_attempts}, 틀린={wrong_count}")
-                                else:
-                                    print(f"[most_wrong] 문제 {question.id} 제외됨: 시도 횟수 0")
-                                    # 시도 횟수가 0인 문제는 제외
-
-                            # 점수 높은 순으로 정렬 (시도 횟수 많고 오답률 높은 순)
-                            question_scores.sort(key=lambda x: x[1], reverse=True)
+                            # 시도/오답 수를 단일 집계 쿼리로 계산하여 많이 틀린 순으로 정렬
+                            from ..utils.question_utils import rank_most_wrong_questions
+                            question_scores = rank_most_wrong_questions(questions, user)
+                            logger.debug(f"[most_wrong] 사용자: {user.username}, 총 문제 수: {len(questions)}, 시도 기록이 있는 문제 수: {len(question_scores)}")
 
                             # 상위 문제들 중에서 요청한 수만큼 선택
                             available_questions = [q for q, _, _, _ in question_scores]
@@ -1590,16 +1553,9 @@ def create_exam(request):
                 selected_questions = []
             # 옵션별 문제 추출 로직
             elif random_option == 'wrong_only':
-                # 틀린 문제만 추출
-                wrong_questions = []
-                for question in questions:
-                    # 해당 문제의 최근 시험 결과에서 틀린 횟수 확인
-                    wrong_count = ExamResultDetail.objects.filter(
-                        question=question,
-                        is_correct=False
-                    ).count()
-                    if wrong_count > 0:
-                        wrong_questions.append(question)
+                # 틀린 문제만 추출 (단일 쿼리로 오답 기록이 있는 문제 조회)
+                from ..utils.question_utils import filter_wrong_questions
+                wrong_questions = filter_wrong_questions(questions)
 
                 # 틀린 문제 수가 요청한 문제 수보다 적으면 자동으로 조정
                 if len(wrong_questions) < question_count:
@@ -1611,7 +1567,6 @@ def create_exam(request):
 
             elif random_option == 'most_wrong':
                 # 많이 틀린 문제 추출 (시도 횟수 많고 오답률 높은 순)
-                question_scores = []
                 user = request.user
 
                 # 익명 사용자인 경우 빈 결과 반환
@@ -1620,42 +1575,10 @@ def create_exam(request):
                         'error': '로그인이 필요한 기능입니다.'
                     }, status=status.HTTP_401_UNAUTHORIZED)
 
-                print(f"[most_wrong] 사용자: {user.username}")
-                print(f"[most_wrong] 총 문제 수: {len(questions)}")
-                user_lang = get_user_language(request)
-
-                for question in questions:
-                    # 해당 문제의 총 시험 횟수 (현재 사용자만)
-                    total_attempts = ExamResultDetail.objects.filter(
-                        question=question,
-                        result__user=user
-                    ).count()
-
-                    if question:
-                        question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                        print(f"[most_wrong] 문제 {question.id} ({question_title}): 시도 횟수 = {total_attempts}")
-                    else:
-                        print(f"[most_wrong] 문제 {question.id} (제목 없음): 시도 횟수 = {total_attempts}")
-
-                    if total_attempts > 0:
-                        # 틀린 횟수 (현재 사용자만)
-                        wrong_count = ExamResultDetail.objects.filter(
-                            question=question,
-                            result__user=user,
-                            is_correct=False
-                        ).count()
-                        # 오답률 계산
-                        wrong_rate = wrong_count / total_attempts
-                        # 점수 계산: 시도 횟수 * 오답률 (시도 횟수가 많고 오답률이 높을수록 높은 점수)
-                        score = total_attempts * wrong_rate
-                        question_scores.append((question, score, total_attempts, wrong_count))
-                        print(f"[most_wrong] 문제 {question.id} 추가됨: 점수={score}, 시도={total_attempts}, 틀린={wrong_count}")
-                    else:
-                        print(f"[most_wrong] 문제 {question.id} 제외됨: 시도 횟수 0")
-                    # 시도 횟수가 0인 문제는 제외
-
-                # 점수 높은 순으로 정렬 (시도 횟수 많고 오답률 높은 순)
-                question_scores.sort(key=lambda x: x[1], reverse=True)
+                # 시도/오답 수를 단일 집계 쿼리로 계산하여 많이 틀린 순으로 정렬
+                from ..utils.question_utils import rank_most_wrong_questions
+                question_scores = rank_most_wrong_questions(questions, user)
+                logger.debug(f"[most_wrong] 사용자: {user.username}, 총 문제 수: {len(questions)}, 시도 기록이 있는 문제 수: {len(question_scores)}")
 
                 # 상위 문제들 중에서 요청한 수만큼 선택
                 available_questions = [q for q, _, _, _ in question_scores]
@@ -3380,8 +3303,10 @@ def update_exam_questions_from_excel(request, exam_id):
                 'available_columns': list(df.columns)
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # 시험에 속한 문제들만 가져오기
-        exam_questions = Question.objects.filter(examquestion__exam=exam)
+        # 시험에 속한 문제들을 한 번에 가져와 문제 ID(csv_id)별로 매핑 (행마다 조회하지 않음)
+        exam_questions_by_csv_id = defaultdict(list)
+        for question in Question.objects.filter(examquestion__exam=exam):
+            exam_questions_by_csv_id[question.csv_id].append(question)
 
         stats = {
             'total_rows': len(df),
@@ -3391,236 +3316,220 @@ def update_exam_questions_from_excel(request, exam_id):
             'error_details': []
         }
 
-        for index, row in df.iterrows():
-            try:
-                # 컬럼명이 다를 수 있으므로 위치 기반으로도 처리
-                csv_id = None
-                title = None
-                content = None
-                answer = None
-                explanation = None
-                difficulty = None
-                url = None
-                group_id = None
-
-                # 컬럼명으로 찾기 시도
-                if '문제id' in df.columns:
-                    csv_id = str(row['문제id'])
-                elif '문제ID' in df.columns:
-                    csv_id = str(row['문제ID'])
-                elif 'ID' in df.columns:
-                    csv_id = str(row['ID'])
-                else:
-                    # 첫 번째 컬럼을 문제 ID로 가정
-                    csv_id = str(row.iloc[0])
+        importer = QuestionImporter(exam)
+        for chunk in iter_row_chunks(df):
+            for index, row in chunk:
+                try:
+                    # 컬럼명이 다를 수 있으므로 위치 기반으로도 처리
+                    csv_id = None
+                    title = None
+                    content = None
+                    answer = None
+                    explanation = None
+                    difficulty = None
+                    url = None
+                    group_id = None
 
-                if '제목' in df.columns:
-                    title = str(row['제목']).strip()
-                elif 'Title' in df.columns:
-                    title = str(row['Title']).strip()
-                else:
-                    # 두 번째 컬럼을 제목으로 가정
-                    title = str(row.iloc[1]).strip()
+                    # 컬럼명으로 찾기 시도
+                    if '문제id' in df.columns:
+                        csv_id = str(row['문제id'])
+                    elif '문제ID' in df.columns:
+                        csv_id = str(row['문제ID'])
+                    elif 'ID' in df.columns:
+                        csv_id = str(row['ID'])
+                    else:
+                        # 첫 번째 컬럼을 문제 ID로 가정
+                        csv_id = str(row.iloc[0])
 
-                if '문제 내용' in df.columns:
-                    content = str(row['문제 내용'])
-                elif 'Content' in df.columns:
-                    content = str(row['Content'])
-                else:
-                    # 세 번째 컬럼을 내용으로 가정
-                    content = str(row.iloc[2])
+                    if '제목' in df.columns:
+                        title = str(row['제목']).strip()
+                    elif 'Title' in df.columns:
+                        title = str(row['Title']).strip()
+                    else:
+                        # 두 번째 컬럼을 제목으로 가정
+                        title = str(row.iloc[1]).strip()
 
-                if '정답' in df.columns:
-                    answer = str(row['정답'])
-                elif 'Answer' in df.columns:
-                    answer = str(row['Answer'])
-                else:
-                    # 네 번째 컬럼을 정답으로 가정
-                    answer = str(row.iloc[3])
-
-                # 선택적 필드들 컬럼명 기반 처리
-                if '설명' in df.columns and pd.notna(row['설명']):
-                    explanation = str(row['설명'])
-                elif 'Explanation' in df.columns and pd.notna(row['Explanation']):
-                    explanation = str(row['Explanation'])
-                elif len(row) > 4 and pd.notna(row.iloc[4]):
-                    explanation = str(row.iloc[4])
-                
-                # 난이도 처리 - Excel의 난이도가 최신 정보로 우선시됨
-                difficulty = None
-                if '난이도' in df.columns:
-                    if pd.notna(row['난이도']):
-                        difficulty = str(row['난이도']).strip()
-                        # 빈 문자열이면 None으로 설정
-                        if difficulty == "":
-                            difficulty = None
-                    # pd.notna()가 False면 이미 None이므로 그대로 유지
-                elif 'Difficulty' in df.columns:
-                    if pd.notna(row['Difficulty']):
-                        difficulty = str(row['Difficulty']).strip()
-                        if difficulty == "":
-                            difficulty = None
-                elif len(row) > 5:
-                    if pd.notna(row.iloc[5]):
-                        difficulty = str(row.iloc[5]).strip()
-                        if difficulty == "":
-                            difficulty = None
-                
-                # URL 처리 - 다양한 컬럼명과 위치 기반 처리
-                url = None
-                
-                # 컬럼명 기반 URL 찾기 (대소문자 구분 없이)
-                url_found = False
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'url' in col_lower or 'link' in col_lower or '링크' in col:
-                        col_value = row[col]
-                        if pd.notna(col_value) and str(col_value).strip():
-                            url = str(col_value).strip()
-                            url_found = True
-                            break
-                
-                # 컬럼명으로 찾지 못한 경우 위치 기반으로 찾기
-                if not url_found:
-                    if len(row) > 5:
-                        for i in range(5, min(len(row), 10)):  # 5번째부터 9번째까지 확인
-                            potential_url = row.iloc[i]
-                            if pd.notna(potential_url) and str(potential_url).strip():
-                                potential_url_str = str(potential_url).strip()
-                                # URL 패턴 확인 (http로 시작하는지)
-                                if potential_url_str.startswith('http'):
-                                    url = potential_url_str
-                                    break
-                
-                # URL이 비어있거나 'nan'인 경우 None으로 설정
-                if url and (url == '' or url.lower() == 'nan' or url.lower() == 'none' or url.lower() == 'null'):
-                    url = None
-                
-                # URL이 유효한지 확인 (http 또는 https로 시작하는지)
-                if url and not (url.startswith('http://') or url.startswith('https://')):
-                    logger.warning(f"[UPDATE_EXAM_EXCEL] 유효하지 않은 URL 형식: {url}")
-                    # URL이 유효하지 않아도 저장은 하되 경고 로그 남김
-                
-                # 그룹ID 처리 - 컬럼명 우선, 위치 기반 후순위
-                group_id = None
-                if '그룹ID' in df.columns and pd.notna(row['그룹ID']):
-                    group_id = str(row['그룹ID']).strip()
-                    if group_id == "":
-                        group_id = None
-                elif 'Group ID' in df.columns and pd.notna(row['Group ID']):
-                    group_id = str(row['Group ID']).strip()
-                    if group_id == "":
-                        group_id = None
-                elif len(row) > 7 and pd.notna(row.iloc[7]):
-                    group_id = str(row.iloc[7]).strip()
-                    if group_id == "":
-                        group_id = None
-
-                # 문제 ID를 기준으로 찾기 (해당 시험에 속한 문제들만)
-                exam_questions = Question.objects.filter(examquestion__exam=exam, csv_id=csv_id)
-                if exam_questions.exists():
-                    for question in exam_questions:
-                        # Excel의 정보가 최신이므로 우선시하여 업데이트
-                        # 백업용 title 필드는 더 이상 사용하지 않음
-                        # question.title = title  # 제거 예정
-                        # 다국어 필드 사용 (기존 필드는 제거 예정)
-                        question.content_ko = content
-                        question.answer_ko = answer
-                        # 난이도는 Excel에 있으면 무조건 업데이트 (기존 값 무시)
-                        if difficulty is not None:
-                            question.difficulty = normalize_difficulty(difficulty)
-                        elif difficulty == "":  # 빈 문자열인 경우 명시적으로 None으로 설정
-                            question.difficulty = None
-                        # difficulty가 None인 경우는 업데이트하지 않음 (기존 값 유지)
-                        # 설명과 URL은 Excel에 있으면 업데이트
-                        if explanation:
-                            question.explanation_ko = explanation
-                            logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 설명 업데이트: {explanation}")
-                        
-                        # URL 업데이트 전후 로깅
-                        old_url = question.url
-                        if url:
-                            question.url = url
-                            logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 URL 업데이트: {old_url} -> {url}")
-                        else:
-                            logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 URL이 비어있음 (기존: {old_url})")
-                        # group_id는 항상 엑셀 값으로 강제 덮어쓰기
-                        question.group_id = group_id
-                        question.save()
-                        
-                        # 번역은 나중에 배치로 처리하므로 여기서는 건너뛰기
-                        logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id} 업데이트 완료 (번역은 배치로 처리 예정)")
+                    if '문제 내용' in df.columns:
+                        content = str(row['문제 내용'])
+                    elif 'Content' in df.columns:
+                        content = str(row['Content'])
+                    else:
+                        # 세 번째 컬럼을 내용으로 가정
+                        content = str(row.iloc[2])
+
+                    if '정답' in df.columns:
+                        answer = str(row['정답'])
+                    elif 'Answer' in df.columns:
+                        answer = str(row['Answer'])
+                    else:
+                        # 네 번째 컬럼을 정답으로 가정
+                        answer = str(row.iloc[3])
+
+                    # 선택적 필드들 컬럼명 기반 처리
+                    if '설명' in df.columns and pd.notna(row['설명']):
+                        explanation = str(row['설명'])
+                    elif 'Explanation' in df.columns and pd.notna(row['Explanation']):
+                        explanation = str(row['Explanation'])
+                    elif len(row) > 4 and pd.notna(row.iloc[4]):
+                        explanation = str(row.iloc[4])
                     
-                    stats['error_details'].append(f'행 {index + 2}: 시험에 속한 기존 문제 {exam_questions.count()}개를 Excel 정보로 업데이트했습니다. (ID: {csv_id}, 제목: {title})')
-                else:
-                    # 없으면 새로 생성 (Excel 정보를 우선시)
-                    normalized_difficulty = None
-                    if difficulty is not None:
-                        normalized_difficulty = normalize_difficulty(difficulty)
-                    elif difficulty == "":  # 빈 문자열인 경우 명시적으로 None으로 설정
-                        normalized_difficulty = None
+                    # 난이도 처리 - Excel의 난이도가 최신 정보로 우선시됨
+                    difficulty = None
+                    if '난이도' in df.columns:
+                        if pd.notna(row['난이도']):
+                            difficulty = str(row['난이도']).strip()
+                            # 빈 문자열이면 None으로 설정
+                            if difficulty == "":
+                                difficulty = None
+                        # pd.notna()가 False면 이미 None이므로 그대로 유지
+                    elif 'Difficulty' in df.columns:
+                        if pd.notna(row['Difficulty']):
+                            difficulty = str(row['Difficulty']).strip()
+                            if difficulty == "":
+                                difficulty = None
+                    elif len(row) > 5:
+                        if pd.notna(row.iloc[5]):
+                            difficulty = str(row.iloc[5]).strip()
+                            if difficulty == "":
+                                difficulty = None
                     
-                    # URL 디버깅 로그
-                    logger.info(f"[UPDATE_EXAM_EXCEL] 새 문제 생성 - csv_id: {csv_id}, 제목: {title}, URL: {url}")
+                    # URL 처리 - 다양한 컬럼명과 위치 기반 처리
+                    url = None
                     
-                    question = Question.objects.create(
-                        csv_id=csv_id,
-                        # title, content, answer, explanation은 다국어 필드로 설정 (기존 필드는 제거 예정)
-                        difficulty=normalized_difficulty,
-                        url=url,
-                        group_id=group_id
-                    )
+                    # 컬럼명 기반 URL 찾기 (대소문자 구분 없이)
+                    url_found = False
+                    for col in df.columns:
+                        col_lower = col.lower()
+                        if 'url' in col_lower or 'link' in col_lower or '링크' in col:
+                            col_value = row[col]
+                            if pd.notna(col_value) and str(col_value).strip():
+                                url = str(col_value).strip()
+                                url_found = True
+                                break
                     
-                    # 생성된 문제의 URL 확인
-                    logger.info(f"[UPDATE_EXAM_EXCEL] 새 문제 {question.id} 생성 완료 - 저장된 URL: {question.url}")
+                    # 컬럼명으로 찾지 못한 경우 위치 기반으로 찾기
+                    if not url_found:
+                        if len(row) > 5:
+                            for i in range(5, min(len(row), 10)):  # 5번째부터 9번째까지 확인
+                                potential_url = row.iloc[i]
+                                if pd.notna(potential_url) and str(potential_url).strip():
+                                    potential_url_str = str(potential_url).strip()
+                                    # URL 패턴 확인 (http로 시작하는지)
+                                    if potential_url_str.startswith('http'):
+                                        url = potential_url_str
+                                        break
                     
-                    # 다국어 필드 설정 (한국어 사용자이므로 한국어 필드에 값 설정)
-                    question.title_ko = title
-                    question.content_ko = content
-                    question.answer_ko = answer
-                    if explanation:
-                        question.explanation_ko = explanation
-                    question.save()
+                    # URL이 비어있거나 'nan'인 경우 None으로 설정
+                    if url and (url == '' or url.lower() == 'nan' or url.lower() == 'none' or url.lower() == 'null'):
+                        url = None
                     
-                    # 번역은 나중에 배치로 처리하므로 여기서는 건너뛰기
-                    logger.info(f"[UPDATE_EXAM_EXCEL] 새 문제 {question.id} 생성 완료 (번역은 배치로 처리 예정)")
+                    # URL이 유효한지 확인 (http 또는 https로 시작하는지)
+                    if url and not (url.startswith('http://') or url.startswith('https://')):
+                        logger.warning(f"[UPDATE_EXAM_EXCEL] 유효하지 않은 URL 형식: {url}")
+                        # URL이 유효하지 않아도 저장은 하되 경고 로그 남김
                     
-                    max_order = ExamQuestion.objects.filter(exam=exam).aggregate(models.Max('order'))['order__max'] or 0
-                    ExamQuestion.objects.create(exam=exam, question=question, order=max_order + 1)
-                    stats['error_details'].append(f'행 {index + 2}: 새로운 문제가 추가되었습니다. (ID: {csv_id}, 제목: {title})')
-                stats['updated'] += 1
+                    # 그룹ID 처리 - 컬럼명 우선, 위치 기반 후순위
+                    group_id = None
+                    if '그룹ID' in df.columns and pd.notna(row['그룹ID']):
+                        group_id = str(row['그룹ID']).strip()
+                        if group_id == "":
+                            group_id = None
+                    elif 'Group ID' in df.columns and pd.notna(row['Group ID']):
+                        group_id = str(row['Group ID']).strip()
+                        if group_id == "":
+                            group_id = None
+                    elif len(row) > 7 and pd.notna(row.iloc[7]):
+                        group_id = str(row.iloc[7]).strip()
+                        if group_id == "":
+                            group_id = None
+
+                    # 문제 ID를 기준으로 찾기 (해당 시험에 속한 문제들만)
+                    exam_questions = exam_questions_by_csv_id.get(csv_id, [])
+                    if exam_questions:
+                        for question in exam_questions:
+                            # Excel의 정보가 최신이므로 우선시하여 업데이트
+                            # 백업용 title 필드는 더 이상 사용하지 않음
+                            # question.title = title  # 제거 예정
+                            # 다국어 필드 사용 (기존 필드는 제거 예정)
+                            question.content_ko = content
+                            question.answer_ko = answer
+                            # 난이도는 Excel에 있으면 무조건 업데이트 (기존 값 무시)
+                            if difficulty is not None:
+                                question.difficulty = normalize_difficulty(difficulty)
+                            elif difficulty == "":  # 빈 문자열인 경우 명시적으로 None으로 설정
+                                question.difficulty = None
+                            # difficulty가 None인 경우는 업데이트하지 않음 (기존 값 유지)
+                            # 설명과 URL은 Excel에 있으면 업데이트
+                            if explanation:
+                                question.explanation_ko = explanation
+                                logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 설명 업데이트: {explanation}")
+                            
+                            # URL 업데이트 전후 로깅
+                            old_url = question.url
+                            if url:
+                                question.url = url
+                                logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 URL 업데이트: {old_url} -> {url}")
+                            else:
+                                logger.info(f"[UPDATE_EXAM_EXCEL] 문제 {question.id}의 URL이 비어있음 (기존: {old_url})")
+                            # group_id는 항상 엑셀 값으로 강제 덮어쓰기
+                            question.group_id = group_id
+                            importer.update(question, row_number=index + 2)
+                        
+                        stats['error_details'].append(f'행 {index + 2}: 시험에 속한 기존 문제 {len(exam_questions)}개를 Excel 정보로 업데이트했습니다. (ID: {csv_id}, 제목: {title})')
+                    else:
+                        # 없으면 새로 생성 (Excel 정보를 우선시)
+                        normalized_difficulty = None
+                        if difficulty is not None:
+                            normalized_difficulty = normalize_difficulty(difficulty)
+                        elif difficulty == "":  # 빈 문자열인 경우 명시적으로 None으로 설정
+                            normalized_difficulty = None
+                        
+                        # URL 디버깅 로그
+                        logger.info(f"[UPDATE_EXAM_EXCEL] 새 문제 생성 - csv_id: {csv_id}, 제목: {title}, URL: {url}")
+                        
+                        question = Question(
+                            csv_id=csv_id,
+                            # title, content, answer, explanation은 다국어 필드로 설정 (기존 필드는 제거 예정)
+                            difficulty=normalized_difficulty,
+                            url=url,
+                            group_id=group_id
+                        )
+                        
+                        # 다국어 필드 설정 (한국어 사용자이므로 한국어 필드에 값 설정)
+                        question.title_ko = title
+                        question.content_ko = content
+                        question.answer_ko = answer
+                        if explanation:
+                            question.explanation_ko = explanation
+                        
+                        # 시험의 마지막 순서 뒤에 연결 (같은 문제 ID의 이후 행은 이 문제를 업데이트)
+                        importer.create(question, row_number=index + 2)
+                        exam_questions_by_csv_id[csv_id].append(question)
+                        stats['error_details'].append(f'행 {index + 2}: 새로운 문제가 추가되었습니다. (ID: {csv_id}, 제목: {title})')
+                    stats['updated'] += 1
 
-            except Exception as e:
-                stats['errors'] += 1
-                stats['error_details'].append(f'행 {index + 2}: {str(e)}')
-                continue
+                except Exception as e:
+                    stats['errors'] += 1
+                    stats['error_details'].append(f'행 {index + 2}: {str(e)}')
+                    continue
 
-        # 시험의 총 문제 수 업데이트
-        exam.total_questions = ExamQuestion.objects.filter(exam=exam).count()
-        exam.save()
+            importer.flush()
+
+        # 시험의 총 문제 수는 마지막에 한 번만 업데이트
+        importer.finish()
+        for row_number, error in importer.errors:
+            stats['updated'] -= 1
+            stats['errors'] += 1
+            stats['error_details'].append(f'행 {row_number}: {error}')
         
-        # 모든 문제 업데이트 완료 후 배치 번역 처리
+        # 모든 문제 업데이트 완료 후 누락된 번역은 백그라운드 번역 큐로 전송
         try:
-            from ..utils.multilingual_utils import process_large_question_batch
-            
-            # 시험에 속한 모든 문제 가져오기
-            exam_questions = Question.objects.filter(examquestion__exam=exam)
-            
-            if exam_questions.exists():
-                logger.info(f"[UPDATE_EXAM_EXCEL] {len(exam_questions)}개 문제 배치 번역 시작")
-                
-                # 배치 번역 수행
-                translation_result = process_large_question_batch(exam_questions, request.user)
-                
-                logger.info(f"[UPDATE_EXAM_EXCEL] 배치 번역 완료: {translation_result['successful']}/{translation_result['total_translations']} 성공")
-                
-                if translation_result['errors']:
-                    logger.warning(f"[UPDATE_EXAM_EXCEL] 번역 중 일부 오류 발생: {len(translation_result['errors'])}개")
-                    for error in translation_result['errors'][:5]:  # 처음 5개만 로그
-                        logger.warning(f"[UPDATE_EXAM_EXCEL] 번역 오류: {error}")
-                        
+            exam_questions = list(Question.objects.filter(examquestion__exam=exam))
+            if exam_questions:
+                pending_ids = queue_missing_question_translations(exam_questions, request.user)
+                logger.info(f"[UPDATE_EXAM_EXCEL] {len(exam_questions)}개 문제 중 {len(pending_ids)}개 번역 대기")
         except Exception as e:
-            logger.error(f"[UPDATE_EXAM_EXCEL] 배치 번역 처리 실패: {e}")
+            logger.error(f"[UPDATE_EXAM_EXCEL] 번역 요청 실패: {e}")
             # 번역 실패해도 시험 업데이트는 계속 진행
 
         return Response({
@@ -3789,244 +3698,212 @@ def import_questions_from_connected_file(request, exam_id):
             'error_details': []
         }
 
-        for index, row in df.iterrows():
-            try:
-                # 컬럼명으로 찾기 시도
-                csv_id = None
-                title = None
-                content = None
-                answer = None
-                explanation = None
-                difficulty = None
-                url = None
-                group_id = None
-
-                # csv_id 설정 (엑셀의 문제 순서 번호)
-                problem_order = None
-                if '문제id' in df.columns:
-                    problem_order = str(row['문제id'])
-                elif '문제ID' in df.columns:
-                    problem_order = str(row['문제ID'])
-                elif 'ID' in df.columns:
-                    problem_order = str(row['ID'])
-                elif 'Question ID' in df.columns:
-                    problem_order = str(row['Question ID'])
-                else:
-                    # 첫 번째 컬럼을 문제 순서로 가정
-                    problem_order = str(row.iloc[0])
-                
-                csv_id = problem_order  # 엑셀의 문제 순서 번호
-                
-                # source_id 설정 (엑셀 파일명으로 출처 기록)
-                source_id = exam.file_name
-                
-                # 제목 추출 (한국어/영어) - 언어별로 처리
-                title_ko = None
-                title_en = None
-                
-                if '제목' in df.columns:
-                    title_ko = str(row['제목']).strip()
-                if 'Title' in df.columns:
-                    title_en = str(row['Title']).strip()
-                
-                # null string 체크: 빈 문자열이나 공백만 있는 경우 None으로 설정
-                if title_ko and not title_ko.strip():
-                    title_ko = None
-                if title_en and not title_en.strip():
-                    title_en = None
-                
-                # 동일한 출처 + 동일한 제목인 기존 문제 찾기 (재가져오기 시 중복 방지)
-                existing_question_info = None
-                if title_ko:
-                    key = f"{source_id}:{title_ko}"
-                    if key in existing_questions_by_source_and_title:
-                        existing_question_info = existing_questions_by_source_and_title[key]
-                elif title_en:
-                    key = f"{source_id}:{title_en}"
-                    if key in existing_questions_by_source_and_title:
-                        existing_question_info = existing_questions_by_source_and_title[key]
-
-                if '제목' in df.columns:
-                    title = str(row['제목']).strip()
-                elif 'Title' in df.columns:
-                    title = str(row['Title']).strip()
-                else:
-                    # 두 번째 컬럼을 제목으로 가정
-                    title = str(row.iloc[1]).strip()
-
-                if '문제 내용' in df.columns:
-                    content = str(row['문제 내용'])
-                elif 'Content' in df.columns:
-                    content = str(row['Content'])
-                else:
-                    # 세 번째 컬럼을 내용으로 가정
-                    content = str(row.iloc[2])
+        importer = QuestionImporter(exam)
+        for chunk in iter_row_chunks(df):
+            for index, row in chunk:
+                try:
+                    # 컬럼명으로 찾기 시도
+                    csv_id = None
+                    title = None
+                    content = None
+                    answer = None
+                    explanation = None
+                    difficulty = None
+                    url = None
+                    group_id = None
 
-                if '정답' in df.columns:
-                    answer = str(row['정답'])
-                elif 'Answer' in df.columns:
-                    answer = str(row['Answer'])
-                else:
-                    # 네 번째 컬럼을 정답으로 가정
-                    answer = str(row.iloc[3])
-
-                # 선택적 필드들 컬럼명 기반 처리
-                if '설명' in df.columns and pd.notna(row['설명']):
-                    explanation = str(row['설명'])
-                elif 'Explanation' in df.columns and pd.notna(row['Explanation']):
-                    explanation = str(row['Explanation'])
-                elif len(row) > 4 and pd.notna(row.iloc[4]):
-                    explanation = str(row.iloc[4])
-
-                # 난이도 처리
-                if '난이도' in df.columns and pd.notna(row['난이도']):
-                    difficulty = str(row['난이도']).strip()
-                    if difficulty == "":
-                        difficulty = None
-                elif 'Difficulty' in df.columns and pd.notna(row['Difficulty']):
-                    difficulty = str(row['Difficulty']).strip()
-                    if difficulty == "":
-                        difficulty = None
-                elif len(row) > 5 and pd.notna(row.iloc[5]):
-                    difficulty = str(row.iloc[5]).strip()
-                    if difficulty == "":
-                        difficulty = None
-
-                if 'URL' in df.columns and pd.notna(row['URL']):
-                    url = str(row['URL'])
-                elif len(row) > 6 and pd.notna(row.iloc[6]):
-                    url = str(row.iloc[6])
-
-                # 그룹ID 처리
-                if '그룹ID' in df.columns and pd.notna(row['그룹ID']):
-                    group_id = str(row['그룹ID']).strip()
-                    if group_id == "":
-                        group_id = None
-                elif 'Group ID' in df.columns and pd.notna(row['Group ID']):
-                    group_id = str(row['Group ID']).strip()
-                    if group_id == "":
-                        group_id = None
-                elif len(row) > 7 and pd.notna(row.iloc[7]):
-                    group_id = str(row.iloc[7]).strip()
-                    if group_id == "":
-                        group_id = None
-
-                # 기존 문제 업데이트 또는 새 문제 생성
-                if existing_question_info:
-                    # 동일한 파일 + 동일한 제목인 경우 → 기존 문제 업데이트
-                    question = existing_question_info['question']
+                    # csv_id 설정 (엑셀의 문제 순서 번호)
+                    problem_order = None
+                    if '문제id' in df.columns:
+                        problem_order = str(row['문제id'])
+                    elif '문제ID' in df.columns:
+                        problem_order = str(row['문제ID'])
+                    elif 'ID' in df.columns:
+                        problem_order = str(row['ID'])
+                    elif 'Question ID' in df.columns:
+                        problem_order = str(row['Question ID'])
+                    else:
+                        # 첫 번째 컬럼을 문제 순서로 가정
+                        problem_order = str(row.iloc[0])
                     
-                    # 문제 내용 업데이트
-                    if title_ko:
-                        question.title_ko = title_ko
-                    if title_en:
-                        question.title_en = title_en
-                    if content:
-                        question.content_ko = content
-                    if answer:
-                        question.answer_ko = answer
-                    if explanation:
-                        question.explanation_ko = explanation
+                    csv_id = problem_order  # 엑셀의 문제 순서 번호
                     
-                    # 난이도, URL, 그룹ID 업데이트
-                    if difficulty is not None:
-                        question.difficulty = normalize_difficulty(difficulty)
-                    if url:
-                        question.url = url
-                    if group_id:
-                        question.group_id = group_id
+                    # source_id 설정 (엑셀 파일명으로 출처 기록)
+                    source_id = exam.file_name
                     
-                    question.save()
+                    # 제목 추출 (한국어/영어) - 언어별로 처리
+                    title_ko = None
+                    title_en = None
                     
-                    logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 기존 문제 업데이트 완료: {question.id} (제목: {title})")
-                    stats['updated'] += 1
+                    if '제목' in df.columns:
+                        title_ko = str(row['제목']).strip()
+                    if 'Title' in df.columns:
+                        title_en = str(row['Title']).strip()
                     
-                else:
-                    # 새로운 문제인 경우 → 새로 생성
-                    normalized_difficulty = None
-                    if difficulty is not None:
-                        normalized_difficulty = normalize_difficulty(difficulty)
+                    # null string 체크: 빈 문자열이나 공백만 있는 경우 None으로 설정
+                    if title_ko and not title_ko.strip():
+                        title_ko = None
+                    if title_en and not title_en.strip():
+                        title_en = None
+                    
+                    # 동일한 출처 + 동일한 제목인 기존 문제 찾기 (재가져오기 시 중복 방지)
+                    existing_question_info = None
+                    if title_ko:
+                        key = f"{source_id}:{title_ko}"
+                        if key in existing_questions_by_source_and_title:
+                            existing_question_info = existing_questions_by_source_and_title[key]
+                    elif title_en:
+                        key = f"{source_id}:{title_en}"
+                        if key in existing_questions_by_source_and_title:
+                            existing_question_info = existing_questions_by_source_and_title[key]
 
-                    question = Question.objects.create(
-                        csv_id=csv_id,      # 엑셀의 문제 순서 번호
-                        source_id=source_id, # 엑셀 파일명 (출처 식별용)
-                        difficulty=normalized_difficulty,
-                        url=url,
-                        group_id=group_id
-                    )
+                    if '제목' in df.columns:
+                        title = str(row['제목']).strip()
+                    elif 'Title' in df.columns:
+                        title = str(row['Title']).strip()
+                    else:
+                        # 두 번째 컬럼을 제목으로 가정
+                        title = str(row.iloc[1]).strip()
 
-                    # 다국어 필드 설정 (한국어 사용자이므로 한국어 필드에 값 설정)
-                    if title_ko:
-                        question.title_ko = title_ko
-                    if title_en:
-                        question.title_en = title_en
-                    if content:
-                        question.content_ko = content
-                    if answer:
-                        question.answer_ko = answer
-                    if explanation:
-                        question.explanation_ko = explanation
-                    
-                    question.save()
+                    if '문제 내용' in df.columns:
+                        content = str(row['문제 내용'])
+                    elif 'Content' in df.columns:
+                        content = str(row['Content'])
+                    else:
+                        # 세 번째 컬럼을 내용으로 가정
+                        content = str(row.iloc[2])
+
+                    if '정답' in df.columns:
+                        answer = str(row['정답'])
+                    elif 'Answer' in df.columns:
+                        answer = str(row['Answer'])
+                    else:
+                        # 네 번째 컬럼을 정답으로 가정
+                        answer = str(row.iloc[3])
+
+                    # 선택적 필드들 컬럼명 기반 처리
+                    if '설명' in df.columns and pd.notna(row['설명']):
+                        explanation = str(row['설명'])
+                    elif 'Explanation' in df.columns and pd.notna(row['Explanation']):
+                        explanation = str(row['Explanation'])
+                    elif len(row) > 4 and pd.notna(row.iloc[4]):
+                        explanation = str(row.iloc[4])
+
+                    # 난이도 처리
+                    if '난이도' in df.columns and pd.notna(row['난이도']):
+                        difficulty = str(row['난이도']).strip()
+                        if difficulty == "":
+                            difficulty = None
+                    elif 'Difficulty' in df.columns and pd.notna(row['Difficulty']):
+                        difficulty = str(row['Difficulty']).strip()
+                        if difficulty == "":
+                            difficulty = None
+                    elif len(row) > 5 and pd.notna(row.iloc[5]):
+                        difficulty = str(row.iloc[5]).strip()
+                        if difficulty == "":
+                            difficulty = None
+
+                    if 'URL' in df.columns and pd.notna(row['URL']):
+                        url = str(row['URL'])
+                    elif len(row) > 6 and pd.notna(row.iloc[6]):
+                        url = str(row.iloc[6])
+
+                    # 그룹ID 처리
+                    if '그룹ID' in df.columns and pd.notna(row['그룹ID']):
+                        group_id = str(row['그룹ID']).strip()
+                        if group_id == "":
+                            group_id = None
+                    elif 'Group ID' in df.columns and pd.notna(row['Group ID']):
+                        group_id = str(row['Group ID']).strip()
+                        if group_id == "":
+                            group_id = None
+                    elif len(row) > 7 and pd.notna(row.iloc[7]):
+                        group_id = str(row.iloc[7]).strip()
+                        if group_id == "":
+                            group_id = None
+
+                    # 기존 문제 업데이트 또는 새 문제 생성
+                    if existing_question_info:
+                        # 동일한 파일 + 동일한 제목인 경우 → 기존 문제 업데이트
+                        question = existing_question_info['question']
+                        
+                        # 문제 내용 업데이트
+                        if title_ko:
+                            question.title_ko = title_ko
+                        if title_en:
+                            question.title_en = title_en
+                        if content:
+                            question.content_ko = content
+                        if answer:
+                            question.answer_ko = answer
+                        if explanation:
+                            question.explanation_ko = explanation
+                        
+                        # 난이도, URL, 그룹ID 업데이트
+                        if difficulty is not None:
+                            question.difficulty = normalize_difficulty(difficulty)
+                        if url:
+                            question.url = url
+                        if group_id:
+                            question.group_id = group_id
+                        
+                        importer.update(question, row_number=index + 2)
+                        
+                        logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 기존 문제 업데이트: {question.id} (제목: {title})")
+                        
+                    else:
+                        # 새로운 문제인 경우 → 새로 생성
+                        normalized_difficulty = None
+                        if difficulty is not None:
+                            normalized_difficulty = normalize_difficulty(difficulty)
+
+                        question = Question(
+                            csv_id=csv_id,      # 엑셀의 문제 순서 번호
+                            source_id=source_id, # 엑셀 파일명 (출처 식별용)
+                            difficulty=normalized_difficulty,
+                            url=url,
+                            group_id=group_id
+                        )
 
-                    # 번역은 나중에 배치로 처리하므로 여기서는 건너뛰기
-                    logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 새 문제 생성 완료: {question.id} (제목: {title}, 번역은 배치로 처리 예정)")
+                        # 다국어 필드 설정 (한국어 사용자이므로 한국어 필드에 값 설정)
+                        if title_ko:
+                            question.title_ko = title_ko
+                        if title_en:
+                            question.title_en = title_en
+                        if content:
+                            question.content_ko = content
+                        if answer:
+                            question.answer_ko = answer
+                        if explanation:
+                            question.explanation_ko = explanation
 
-                    # 시험에 문제 추가
-                    max_order = ExamQuestion.objects.filter(exam=exam).aggregate(models.Max('order'))['order__max'] or 0
-                    ExamQuestion.objects.create(exam=exam, question=question, order=max_order + 1)
+                        # 시험의 마지막 순서 뒤에 추가 (번역은 가져오기 완료 후 백그라운드로 처리)
+                        importer.create(question, row_number=index + 2)
 
-                    stats['imported'] += 1
+                except Exception as e:
+                    stats['errors'] += 1
+                    stats['error_details'].append(f'행 {index + 2}: {str(e)}')
+                    continue
 
-            except Exception as e:
-                stats['errors'] += 1
-                stats['error_details'].append(f'행 {index + 2}: {str(e)}')
-                continue
+            importer.flush()
 
-        # 시험의 총 문제 수 업데이트
-        exam.total_questions = ExamQuestion.objects.filter(exam=exam).count()
-        exam.save()
+        # 시험의 총 문제 수는 마지막에 한 번만 업데이트
+        importer.finish()
+        stats['imported'] = importer.created_count
+        stats['updated'] = importer.updated_count
+        for row_number, error in importer.errors:
+            stats['errors'] += 1
+            stats['error_details'].append(f'행 {row_number}: {error}')
         
-        # 번역이 필요한 문제들만 선별하여 번역 처리
+        # 새로 추가된 문제들의 번역은 백그라운드 번역 큐로 전송
         try:
-            from ..utils.multilingual_utils import process_large_question_batch
-            
-            # 번역이 필요한 문제들만 선별
-            questions_needing_translation = []
-            
-            # 새로 추가된 문제들 (번역 필요)
-            if stats['imported'] > 0:
-                new_questions = Question.objects.filter(
-                    examquestion__exam=exam,
-                    source_id=source_id  # 현재 파일에서 추가된 문제들
-                ).order_by('-id')[:stats['imported']]
-                questions_needing_translation.extend(new_questions)
-                logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 새로 추가된 {len(new_questions)}개 문제 번역 대상")
-            
-            # 업데이트된 문제들 중 번역이 필요한 경우 (내용이 변경된 경우)
-            if stats['updated'] > 0:
-                # 업데이트된 문제들은 이미 existing_questions에 있음
-                # 여기서는 간단히 처리하고, 필요시 더 정교한 로직 추가 가능
-                logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 업데이트된 {stats['updated']}개 문제는 번역 상태 확인 필요")
-            
-            # 번역이 필요한 문제가 있는 경우에만 번역 수행
-            if questions_needing_translation:
-                logger.info(f"[IMPORT_FROM_CONNECTED_FILE] {len(questions_needing_translation)}개 문제 배치 번역 시작")
-                
-                # 배치 번역 수행
-                translation_result = process_large_question_batch(questions_needing_translation, request.user)
-                
-                logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 배치 번역 완료: {translation_result['successful']}/{translation_result['total_translations']} 성공")
-                
-                if translation_result['errors']:
-                    logger.warning(f"[IMPORT_FROM_CONNECTED_FILE] 번역 중 일부 오류 발생: {len(translation_result['errors'])}개")
-                    for error in translation_result['errors'][:5]:  # 처음 5개만 로그
-                        logger.warning(f"[IMPORT_FROM_CONNECTED_FILE] 번역 오류: {error}")
+            if importer.created_questions:
+                pending_ids = queue_missing_question_translations(importer.created_questions, request.user)
+                logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 새로 추가된 {len(importer.created_questions)}개 문제 중 {len(pending_ids)}개 번역 대기")
             else:
                 logger.info(f"[IMPORT_FROM_CONNECTED_FILE] 번역이 필요한 문제가 없습니다.")
-                        
         except Exception as e:
-            logger.error(f"[IMPORT_FROM_CONNECTED_FILE] 배치 번역 처리 실패: {e}")
+            logger.error(f"[IMPORT_FROM_CONNECTED_FILE] 번역 요청 실패: {e}")
             # 번역 실패해도 문제 가져오기는 계속 진행
 
         # 최종 결과 로그 및 응답
@@ -4085,6 +3962,7 @@ def continue_exam(request, exam_id):
         # 기존 결과에 남은 문제들 추가
         new_answers = request.data.get('answers', [])
         correct_count = previous_result.correct_count
+        stat_attempts = []
         total_score = previous_result.total_score + len(new_answers)
 
         # 새로운 답안들 처리
@@ -4176,6 +4054,7 @@ def continue_exam(request, exam_id):
                     user_answer=user_answer,
                     is_correct=is_correct
                 )
+                stat_attempts.append((question.id, is_correct))
 
             except Question.DoesNotExist:
                 continue
@@ -4188,6 +4067,11 @@ def continue_exam(request, exam_id):
         previous_result.completed_at = timezone.now()  # 완료 시간을 현재 시간으로 업데이트
         previous_result.save()
 
+        # 사용자별 문제 통계(UserQuestionStat) 증분 갱신
+        # (UserExamProgress 요약이 최신 결과의 점수를 읽으므로 결과 저장 후 호출)
+        record_question_attempts(previous_result.user, previous_result.exam_id, stat_attempts,
+                                 attempted_at=previous_result.completed_at)
+
         # 로그인한 사용자인 경우 StudyTaskProgress 업데이트
         if request.user.is_authenticated:
             try:
@@ -4359,34 +4243,266 @@ def retake_wrong_questions(request, exam_id):
         return Response({'error': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
 
-@api_view(['POST'])
-def submit_exam(request):
+def _grade_submitted_answer(question, user_answer, user_language):
     """
-    시험 제출
-    
-    핵심 원칙: 모든 문제 통계와 공부시간 통계는 End 버튼을 눌러 통계가 잡힐 때 처리되어야 한다
-    - 화면를 열 때마다 통계를 계산하는 것은 비정상적인 접근
-    - 시험 완료 시에만 통계 데이터를 생성하고 업데이트
-    - StudyTaskProgress, StudyProgressRecord 등 모든 통계 테이블은 이 시점에서 처리
+    제출 답안의 정답 여부를 판정합니다.
+
+    정답 필드는 사용자 언어 → 기본 언어 → 다른 지원 언어 순으로 선택한다.
+
+    Returns:
+        tuple: (정답 여부, 비교에 사용한 정답)
     """
-    import traceback
-    logger.info(f"[SUBMIT_EXAM] 시험 제출 시작")
-    logger.info(f"[SUBMIT_EXAM] 요청 데이터: {request.data}")
-    
-    try:
-        exam_id = request.data.get('exam_id')
-        answers = request.data.get('answers', [])
-        
-        # answers가 문자열인 경우 JSON 파싱
-        if isinstance(answers, str):
-            import json
-            try:
-                answers = json.loads(answers)
-            except json.JSONDecodeError:
-                return Response({'error': '답안 데이터 형식이 올바르지 않습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    correct_answer = None
+
+    # 사용자 언어 필드 확인
+    if hasattr(question, f'answer_{user_language}'):
+        answer_value = getattr(question, f'answer_{user_language}', None)
+        if answer_value:
+            correct_answer = answer_value.lower().strip()
+
+    # 사용자 언어 필드가 없으면 기본 언어 필드 확인
+    if not correct_answer and hasattr(question, f'answer_{BASE_LANGUAGE}'):
+        answer_value = getattr(question, f'answer_{BASE_LANGUAGE}', None)
+        if answer_value:
+            correct_answer = answer_value.lower().strip()
+
+    # 기본 언어도 없으면 다른 언어 중 하나라도 사용
+    if not correct_answer:
+        for lang in SUPPORTED_LANGUAGES:
+            if hasattr(question, f'answer_{lang}'):
+                answer_value = getattr(question, f'answer_{lang}', None)
+                if answer_value:
+                    correct_answer = answer_value.lower().strip()
+                    break
 
-        if not exam_id:
-            return Response({'error': '시험 ID가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    if not correct_answer:
+        correct_answer = ''
+
+    user_answer_clean = user_answer.lower().strip()
+
+    # 빈 답안은 오답으로 처리
+    if user_answer_clean == '':
+        return False, correct_answer
+
+    # Y/N 문제인 경우 정답과 사용자 답안을 직접 비교
+    if correct_answer in ['y', 'n'] and user_answer_clean in ['y', 'n']:
+        return correct_answer == user_answer_clean, correct_answer
+
+    # 정확한 일치 확인
+    if correct_answer == user_answer_clean:
+        return True, correct_answer
+
+    # 여러 줄 정답 중 하나라도 일치하거나 부분 일치하는지 확인
+    correct_answers = [ans.strip() for ans in correct_answer.split('\n') if ans.strip()]
+    for correct_ans in correct_answers:
+        if correct_ans == user_answer_clean:
+            return True, correct_answer
+        if correct_ans in user_answer_clean or user_answer_clean in correct_ans:
+            return True, correct_answer
+
+    return False, correct_answer
+
+
+def _is_other_exam(exam, other_exam):
+    """현재 시험과 다른 시험인지 확인 (제목 기준)"""
+    return (
+        (other_exam.title_ko != exam.title_ko and exam.title_ko) or
+        (other_exam.title_en != exam.title_en and exam.title_en)
+    )
+
+
+def _find_copy_source_exam(exam, question, user_language, lookup_cache):
+    """
+    복사/추천 시험 답안을 저장할 원본 시험을 찾습니다.
+
+    1. original_exam 필드
+    2. 추천 시험인 경우 문제의 group_id(원본 시험 제목)
+    3. 문제가 속한 다른 시험 (원본 → 추천 시험이 아닌 시험 → 첫 번째 다른 시험)
+
+    group_id 조회 결과는 lookup_cache에 저장하여 같은 요청 내에서 재사용한다.
+    """
+    if exam.original_exam:
+        original_exam = exam.original_exam
+        original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
+        logger.info(f"[SUBMIT_EXAM] original_exam 필드로 원본 시험 찾음: {original_title}")
+        return original_exam
+
+    if not is_daily_exam(exam):
+        return None
+
+    original_exam = None
+
+    # 문제의 group_id를 통해 원본 시험 찾기 시도
+    if question.group_id:
+        cache_key = ('copy_source', question.group_id)
+        try:
+            if cache_key in lookup_cache:
+                original_exam = lookup_cache[cache_key]
+            elif "Today's Quizzes for" in question.group_id:
+                # "Today's Quizzes for" 시험인 경우 현재 사용자의 시험만 찾기
+                username = question.group_id.replace("Today's Quizzes for ", "")
+                original_exam = Exam.objects.filter(
+                    title=question.group_id,
+                    created_by__username=username
+                ).order_by('-created_at').first()
+                lookup_cache[cache_key] = original_exam
+            else:
+                # 일반적인 경우 - group_id가 원본 시험 제목인 경우
+                # 예: "NeetCode 150", "LeetCode Dev", "Staff_Leadership" 등
+                original_exam = Exam.objects.filter(
+                    title_ko=question.group_id,
+                    is_original=True
+                ).first()
+
+                if not original_exam:
+                    original_exam = Exam.objects.filter(
+                        title_en=question.group_id,
+                        is_original=True
+                    ).first()
+                lookup_cache[cache_key] = original_exam
+
+            if original_exam:
+                original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
+                logger.info(f"[SUBMIT_EXAM] group_id '{question.group_id}'로 원본 시험 찾음: {original_title}")
+        except Exception as e:
+            logger.error(f"[SUBMIT_EXAM] group_id로 원본 시험 찾기 실패: {e}")
+
+    if original_exam:
+        return original_exam
+
+    # group_id로 찾지 못한 경우, 문제가 속한 다른 시험들 중에서 찾기 (prefetch된 examquestion_set 사용)
+    other_exams = [
+        exam_question.exam for exam_question in question.examquestion_set.all()
+        if _is_other_exam(exam, exam_question.exam)
+    ]
+
+    # 1. 원본 시험(is_original=True)을 우선 찾기
+    for other_exam in other_exams:
+        if other_exam.is_original:
+            original_title = get_localized_field(other_exam, 'title', user_language, 'Unknown')
+            logger.info(f"[SUBMIT_EXAM] is_original=True인 원본 시험 찾음: {original_title}")
+            return other_exam
+
+    # 2. 원본 시험이 없으면 추천 시험이 아닌 시험 찾기
+    for other_exam in other_exams:
+        if not is_daily_exam(other_exam):
+            original_title = get_localized_field(other_exam, 'title', user_language, 'Unknown')
+            logger.info(f"[SUBMIT_EXAM] 추천 시험이 아닌 원본 시험 찾음: {original_title}")
+            return other_exam
+
+    # 3. 여전히 찾지 못한 경우, 첫 번째 다른 시험을 선택
+    if other_exams:
+        original_title = get_localized_field(other_exams[0], 'title', user_language, 'Unknown')
+        logger.info(f"[SUBMIT_EXAM] 첫 번째 다른 시험을 원본으로 선택: {original_title}")
+        return other_exams[0]
+
+    return None
+
+
+def _find_individual_source_exam(exam, question, lookup_cache):
+    """
+    원본 시험을 찾지 못한 답안에 대해 문제별로 원본 시험을 다시 찾습니다.
+
+    1. 문제의 group_id와 제목이 같은 원본 시험
+    2. 문제가 속한 다른 원본 시험
+    """
+    individual_original_exam = None
+
+    if question.group_id:
+        cache_key = ('individual_source', question.group_id)
+        try:
+            if cache_key not in lookup_cache:
+                lookup_cache[cache_key] = Exam.objects.filter(
+                    Q(title_ko=question.group_id) | Q(title_en=question.group_id),
+                    is_original=True
+                ).first()
+            individual_original_exam = lookup_cache[cache_key]
+            if individual_original_exam:
+                logger.info(f"[SUBMIT_EXAM] 문제별 group_id '{question.group_id}'로 원본 시험 찾음: {individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}")
+        except Exception as e:
+            logger.error(f"[SUBMIT_EXAM] 문제별 group_id로 원본 시험 찾기 실패: {e}")
+
+    if not individual_original_exam:
+        for exam_question in question.examquestion_set.all():
+            if exam_question.exam.is_original and _is_other_exam(exam, exam_question.exam):
+                individual_original_exam = exam_question.exam
+                logger.info(f"[SUBMIT_EXAM] 문제별 examquestion_set으로 원본 시험 찾음: {individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}")
+                break
+
+    return individual_original_exam
+
+
+def _get_or_create_source_result(source_exam, user, source_results):
+    """
+    원본 시험에 답안을 누적할 ExamResult(가장 최근 결과)를 찾거나 생성합니다.
+
+    요청 내에서는 source_results에 캐시하며, 요약 필드는 호출한 쪽에서
+    누적한 뒤 마지막에 한 번만 저장한다.
+    """
+    if source_exam.id in source_results:
+        return source_results[source_exam.id]
+
+    source_result = ExamResult.objects.filter(
+        exam=source_exam,
+        user=user
+    ).order_by('-completed_at').first()
+
+    if not source_result:
+        source_result = ExamResult.objects.create(
+            exam=source_exam,
+            user=user,
+            score=0,
+            total_score=0,
+            correct_count=0,
+            wrong_count=0,
+            elapsed_seconds=0,
+            completed_at=timezone.now()
+        )
+        logger.info(f"[SUBMIT_EXAM] 원본 시험 '{source_exam.title_ko or source_exam.title_en or 'Unknown'}'에 새 결과 생성")
+    else:
+        logger.info(f"[SUBMIT_EXAM] 원본 시험 '{source_exam.title_ko or source_exam.title_en or 'Unknown'}'의 기존 결과 사용: {source_result.id}")
+
+    source_results[source_exam.id] = source_result
+    return source_result
+
+
+def _add_to_source_result(source_result, is_correct):
+    """원본 시험 ExamResult 요약 필드에 답안 하나를 누적합니다."""
+    if is_correct:
+        source_result.correct_count += 1
+    source_result.total_score += 1
+    source_result.score = source_result.correct_count
+    source_result.wrong_count = source_result.total_score - source_result.correct_count
+
+
+@api_view(['POST'])
+def submit_exam(request):
+    """
+    시험 제출
+    
+    핵심 원칙: 모든 문제 통계와 공부시간 통계는 End 버튼을 눌러 통계가 잡힐 때 처리되어야 한다
+    - 화면를 열 때마다 통계를 계산하는 것은 비정상적인 접근
+    - 시험 완료 시에만 통계 데이터를 생성하고 업데이트
+    - StudyTaskProgress, StudyProgressRecord 등 모든 통계 테이블은 이 시점에서 처리
+    """
+    import traceback
+    logger.info(f"[SUBMIT_EXAM] 시험 제출 시작")
+    logger.info(f"[SUBMIT_EXAM] 요청 데이터: {request.data}")
+    
+    try:
+        exam_id = request.data.get('exam_id')
+        answers = request.data.get('answers', [])
+        
+        # answers가 문자열인 경우 JSON 파싱
+        if isinstance(answers, str):
+            import json
+            try:
+                answers = json.loads(answers)
+            except json.JSONDecodeError:
+                return Response({'error': '답안 데이터 형식이 올바르지 않습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not exam_id:
+            return Response({'error': '시험 ID가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             exam = Exam.objects.get(id=exam_id)
@@ -4446,378 +4562,142 @@ def submit_exam(request):
             except Exception as e2:
                 logger.error(f"[SUBMIT_EXAM] 폴백 캐시 무효화도 실패: {e2}")
 
-        # 각 답안 처리
+        # 사용자의 언어 설정은 답안마다가 아니라 한 번만 확인
+        user_language = BASE_LANGUAGE  # 기본값
+        if request.user.is_authenticated and hasattr(request.user, 'profile'):
+            user_language = request.user.profile.language or BASE_LANGUAGE
+        result_user = request.user if request.user.is_authenticated else None
+
+        # 답안의 문제들을 한 번에 조회 (원본이 아닌 시험은 원본 시험 탐색용 ExamQuestion도 함께 조회)
+        answer_question_ids = []
         for answer_data in answers:
-            question_id = answer_data.get('question_id')
+            try:
+                answer_question_ids.append(uuid.UUID(str(answer_data.get('question_id'))))
+            except (TypeError, ValueError):
+                answer_question_ids.append(None)
+        question_queryset = Question.objects.all()
+        if not exam.is_original:
+            question_queryset = question_queryset.prefetch_related('examquestion_set__exam')
+        questions_by_id = question_queryset.in_bulk([qid for qid in answer_question_ids if qid])
+
+        # 결과 상세는 메모리에 모아 bulk_create로 한 번에 저장
+        pending_details = []
+        # 원본 시험별 누적 ExamResult (요약 필드는 마지막에 한 번만 저장)
+        source_results = {}
+        # 요청 내 원본 시험 조회 캐시
+        source_exam_lookup_cache = {}
+        # UserQuestionStat 증분 갱신용: {통계가 저장되는 시험 ID: [(문제 ID, 정답 여부), ...]}
+        stat_attempts_by_exam = defaultdict(list)
+
+        def add_detail(result, question, user_answer, is_correct, elapsed_seconds, evaluation):
+            detail = ExamResultDetail(
+                result=result,
+                question=question,
+                user_answer=user_answer,
+                is_correct=is_correct,
+                elapsed_seconds=elapsed_seconds,  # 소요시간 추가
+                evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
+            )
+            detail.fill_question_snapshot()
+            pending_details.append(detail)
+            stat_attempts_by_exam[result.exam_id].append((question.id, is_correct))
+
+        # 각 답안 처리
+        for question_id, answer_data in zip(answer_question_ids, answers):
+            question = questions_by_id.get(question_id)
+            if question is None:
+                continue
+
             user_answer = answer_data.get('answer', '')
             elapsed_seconds = answer_data.get('elapsed_seconds', 0)  # 문제별 소요시간 추가
             evaluation = answer_data.get('evaluation', '')  # Voice Interview 평가 내용
 
-            try:
-                question = Question.objects.get(id=question_id)
+            # 정답 판정 - 사용자 언어에 맞는 정답 필드 사용
+            is_correct, correct_answer = _grade_submitted_answer(question, user_answer, user_language)
 
-                # 정답 판정 로직 개선 - 사용자 언어에 맞는 정답 필드 사용
-                # 사용자의 언어 설정 확인
-                from quiz.utils.multilingual_utils import BASE_LANGUAGE
-                user_language = BASE_LANGUAGE  # 기본값
-                if request.user.is_authenticated and hasattr(request.user, 'profile'):
-                    user_language = request.user.profile.language or BASE_LANGUAGE
-                
-                # 언어에 맞는 정답 필드 선택 (폴백 포함) - 모든 언어 동일하게 처리
-                from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
-                correct_answer = None
-                
-                # 사용자 언어 필드 확인
-                if hasattr(question, f'answer_{user_language}'):
-                    answer_value = getattr(question, f'answer_{user_language}', None)
-                    if answer_value:
-                        correct_answer = answer_value.lower().strip()
-                
-                # 사용자 언어 필드가 없으면 기본 언어 필드 확인
-                if not correct_answer:
-                    from quiz.utils.multilingual_utils import BASE_LANGUAGE
-                    if hasattr(question, f'answer_{BASE_LANGUAGE}'):
-                        answer_value = getattr(question, f'answer_{BASE_LANGUAGE}', None)
-                        if answer_value:
-                            correct_answer = answer_value.lower().strip()
-                
-                # 기본 언어도 없으면 다른 언어 중 하나라도 사용
-                if not correct_answer:
-                    for lang in SUPPORTED_LANGUAGES:
-                        if hasattr(question, f'answer_{lang}'):
-                            answer_value = getattr(question, f'answer_{lang}', None)
-                            if answer_value:
-                                correct_answer = answer_value.lower().strip()
-                                break
-                
-                if not correct_answer:
-                    correct_answer = ''
-                
-                user_answer_clean = user_answer.lower().strip()
+            # 디버깅 로그 추가 (로거 사용)
+            question_title = get_localized_field(question, 'title', user_language, 'Unknown')
+            logger.debug(f"정답 판정: 문제={question_title}, 사용자언어={user_language}, 선택된정답필드='{correct_answer}', 원본정답_ko='{question.answer_ko}', 원본정답_en='{question.answer_en}', 사용자답안='{user_answer}', 정답여부={is_correct}, 소요시간={elapsed_seconds}초")
 
-                # is_correct 변수 초기화
-                is_correct = False
+            if is_correct:
+                correct_count += 1
 
-                # 빈 답안은 오답으로 처리
-                if user_answer_clean == '':
-                    is_correct = False
-                else:
-                    # Y/N 문제인지 확인
-                    if correct_answer in ['y', 'n'] and user_answer_clean in ['y', 'n']:
-                        # Y/N 문제인 경우 정답과 사용자 답안을 직접 비교
-                        is_correct = (correct_answer == user_answer_clean)
-                    else:
-                        # 일반 문제 처리
-                        # 여러 줄 정답 처리
-                        correct_answers = [ans.strip() for ans in correct_answer.split('\n') if ans.strip()]
+            # 원본이 아닌 시험인 경우 소스 시험에만 저장 (중복 방지)
+            if not exam.is_original:
+                exam_title = get_localized_field(exam, 'title', user_language, 'Unknown')
+                logger.info(f"[SUBMIT_EXAM] 복사한 시험 '{exam_title}' - 소스 시험에도 결과 반영")
 
-                        # 정확한 일치 또는 부분 일치 확인
-                        if correct_answer == user_answer_clean:
-                            is_correct = True
-                        else:
-                            # 여러 줄 정답 중 하나라도 일치하는지 확인
-                            for correct_ans in correct_answers:
-                                if correct_ans == user_answer_clean:
-                                    is_correct = True
-                                    break
-                                # 부분 일치도 확인 (정답의 일부가 포함되어 있는지)
-                                elif correct_ans in user_answer_clean or user_answer_clean in correct_ans:
-                                    is_correct = True
-                                    break
+                # 해당 문제의 원본 시험 찾기
+                original_exam = _find_copy_source_exam(exam, question, user_language, source_exam_lookup_cache)
 
-                # 디버깅 로그 추가 (로거 사용)
-                if question:
-                    question_title = get_localized_field(question, 'title', user_language, 'Unknown')
-                    logger.debug(f"정답 판정: 문제={question_title}, 사용자언어={user_language}, 선택된정답필드='{correct_answer}', 원본정답_ko='{question.answer_ko}', 원본정답_en='{question.answer_en}', 사용자답안='{user_answer}', 정답여부={is_correct}, 소요시간={elapsed_seconds}초")
+                if original_exam:
+                    # 원본 시험의 ExamResult 찾기 (중복 방지)
+                    try:
+                        original_result = _get_or_create_source_result(original_exam, result_user, source_results)
+                    except Exception as e:
+                        logger.error(f"[SUBMIT_EXAM] ExamResult 처리 중 오류: {str(e)}")
+                        # 오류 발생 시 새로 생성
+                        original_result = ExamResult.objects.create(
+                            exam=original_exam,
+                            user=result_user,
+                            score=0,
+                            total_score=0,
+                            correct_count=0,
+                            wrong_count=0,
+                            elapsed_seconds=0,
+                            completed_at=timezone.now()
+                        )
+                        source_results[original_exam.id] = original_result
+
+                    # 원본 시험에도 동일한 결과 상세 저장 및 요약 필드 누적
+                    add_detail(original_result, question, user_answer, is_correct, elapsed_seconds, evaluation)
+                    _add_to_source_result(original_result, is_correct)
+
+                    original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
+                    logger.info(f"[SUBMIT_EXAM] 문제 {question_title}의 결과를 원본 시험 '{original_title}'에도 반영")
                 else:
-                    logger.debug(f"정답 판정: 문제=제목 없음, 사용자언어={user_language}, 선택된정답필드='{correct_answer}', 원본정답_ko='None', 원본정답_en='None', 사용자답안='{user_answer}', 정답여부={is_correct}, 소요시간={elapsed_seconds}초")
+                    logger.warning(f"[SUBMIT_EXAM] 문제 {question_title}의 원본 시험을 찾을 수 없음")
 
-                if is_correct:
-                    correct_count += 1
+                    # 원본 시험을 찾지 못한 경우, 문제별로 개별적으로 원본 시험 찾기 시도
+                    individual_original_exam = _find_individual_source_exam(exam, question, source_exam_lookup_cache)
 
-                # 원본이 아닌 시험인 경우 소스 시험에만 저장 (중복 방지)
-                if not exam.is_original:
-                    exam_title = get_localized_field(exam, 'title', user_language, 'Unknown')
-                    logger.info(f"[SUBMIT_EXAM] 복사한 시험 '{exam_title}' - 소스 시험에도 결과 반영")
-                    
-                    # 해당 문제의 원본 시험 찾기
-                    original_exam = None
-                    
-                    # 1. 복사한 시험의 경우 original_exam 필드 사용
-                    if exam.original_exam:
-                        original_exam = exam.original_exam
-                        original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                        logger.info(f"[SUBMIT_EXAM] original_exam 필드로 원본 시험 찾음: {original_title}")
-                    else:
-                        # 2. 추천 시험인 경우 기존 로직 사용
-                        if (
-            (exam.title_ko and "Today's Quizzes for" in exam.title_ko) or
-            (exam.title_en and "Today's Quizzes for" in exam.title_en)
-        ):
-                            # 문제의 group_id를 통해 원본 시험 찾기 시도
-                            if question.group_id:
-                                try:
-                                    # "Today's Quizzes for" 시험인 경우 현재 사용자의 시험만 찾기
-                                    if "Today's Quizzes for" in question.group_id:
-                                        username = question.group_id.replace("Today's Quizzes for ", "")
-                                        original_exam = Exam.objects.filter(
-                                            title=question.group_id,
-                                            created_by__username=username
-                                        ).order_by('-created_at').first()
-                                    else:
-                                        # 일반적인 경우 - group_id가 원본 시험 제목인 경우
-                                        # 예: "NeetCode 150", "LeetCode Dev", "Staff_Leadership" 등
-                                        original_exam = Exam.objects.filter(
-                                            title_ko=question.group_id,
-                                            is_original=True
-                                        ).first()
-                                        
-                                        if not original_exam:
-                                            original_exam = Exam.objects.filter(
-                                                title_en=question.group_id,
-                                                is_original=True
-                                            ).first()
-                                    
-                                    if original_exam:
-                                        original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                        logger.info(f"[SUBMIT_EXAM] group_id '{question.group_id}'로 원본 시험 찾음: {original_title}")
-                                except Exception as e:
-                                    logger.error(f"[SUBMIT_EXAM] group_id로 원본 시험 찾기 실패: {e}")
-                                    pass
-                            
-                            # group_id로 찾지 못한 경우, 문제가 속한 다른 시험들 중에서 찾기
-                            if not original_exam:
-                                # 1. 원본 시험(is_original=True)을 우선 찾기
-                                for exam_question in question.examquestion_set.all():
-                                    if (
-                                        (exam_question.exam.title_ko != exam.title_ko and exam.title_ko) or
-                                        (exam_question.exam.title_en != exam.title_en and exam.title_en)
-                                    ):  # 현재 시험이 아닌 다른 시험
-                                        if exam_question.exam.is_original:
-                                            original_exam = exam_question.exam
-                                            original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                            logger.info(f"[SUBMIT_EXAM] is_original=True인 원본 시험 찾음: {original_title}")
-                                            break
-                                
-                                # 2. 원본 시험이 없으면 추천 시험이 아닌 시험 찾기
-                                if not original_exam:
-                                    for exam_question in question.examquestion_set.all():
-                                        if (
-                                            (exam_question.exam.title_ko != exam.title_ko and exam.title_ko) or
-                                            (exam_question.exam.title_en != exam.title_en and exam.title_en)
-                                        ):  # 현재 시험이 아닌 다른 시험
-                                            if not (
-            (exam_question.exam.title_ko and "Today's Quizzes for" in exam_question.exam.title_ko) or
-            (exam_question.exam.title_en and "Today's Quizzes for" in exam_question.exam.title_en)
-        ):
-                                                original_exam = exam_question.exam
-                                                original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                                logger.info(f"[SUBMIT_EXAM] 추천 시험이 아닌 원본 시험 찾음: {original_title}")
-                                                break
-                                
-                                # 3. 여전히 찾지 못한 경우, 첫 번째 다른 시험을 선택
-                                if not original_exam:
-                                    for exam_question in question.examquestion_set.all():
-                                        if (
-                                            (exam_question.exam.title_ko != exam.title_ko and exam.title_ko) or
-                                            (exam_question.exam.title_en != exam.title_en and exam.title_en)
-                                        ):
-                                            original_exam = exam_question.exam
-                                            original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                            logger.info(f"[SUBMIT_EXAM] 첫 번째 다른 시험을 원본으로 선택: {original_title}")
-                                            break
-                    
-                    if original_exam:
-                        # 원본 시험의 ExamResult 찾기 (중복 방지)
+                    # 개별 원본 시험을 찾은 경우 해당 시험에 결과 저장
+                    if individual_original_exam:
                         try:
-                            # 가장 최근 결과를 가져오기
-                            original_result = ExamResult.objects.filter(
-                                exam=original_exam,
-                                user=request.user if request.user.is_authenticated else None
-                            ).order_by('-completed_at').first()
-                            
-                            if not original_result:
-                                # 결과가 없으면 새로 생성
-                                original_result = ExamResult.objects.create(
-                                    exam=original_exam,
-                                    user=request.user if request.user.is_authenticated else None,
-                                    score=0,
-                                    total_score=0,
-                                    correct_count=0,
-                                    wrong_count=0,
-                                    elapsed_seconds=0,
-                                    completed_at=timezone.now()
-                                )
-                                original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                logger.info(f"[SUBMIT_EXAM] 원본 시험 '{original_title}'에 새 결과 생성")
-                            else:
-                                original_title = get_localized_field(original_exam, 'title', user_language, 'Unknown')
-                                logger.info(f"[SUBMIT_EXAM] 원본 시험 '{original_title}'의 기존 결과 사용: {original_result.id}")
-                                
+                            individual_result = _get_or_create_source_result(individual_original_exam, result_user, source_results)
                         except Exception as e:
-                            logger.error(f"[SUBMIT_EXAM] ExamResult 처리 중 오류: {str(e)}")
-                            # 오류 발생 시 새로 생성
-                            original_result = ExamResult.objects.create(
-                                exam=original_exam,
-                                user=request.user if request.user.is_authenticated else None,
-                                score=0,
-                                total_score=0,
-                                correct_count=0,
-                                wrong_count=0,
-                                elapsed_seconds=0,
-                                completed_at=timezone.now()
-                            )
-                        
-                        # 원본 시험에도 동일한 결과 상세 저장
-                        ExamResultDetail.objects.create(
-                            result=original_result,
-                            question=question,
-                            user_answer=user_answer,
-                            is_correct=is_correct,
-                            elapsed_seconds=elapsed_seconds,  # 소요시간 추가
-                            evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
-                        )
-                        
-                        # 원본 시험의 ExamResult 요약 필드들 업데이트
-                        if is_correct:
-                            original_result.correct_count += 1
-                        original_result.total_score += 1
-                        original_result.score = original_result.correct_count
-                        original_result.wrong_count = original_result.total_score - original_result.correct_count
-                        original_result.save()
-                        
-                        if question:
-                            question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                            original_title = get_localized_field(original_exam, 'title', user_lang, 'Unknown')
-                            logger.info(f"[SUBMIT_EXAM] 문제 {question_title}의 결과를 원본 시험 '{original_title}'에도 반영 (요약 필드 업데이트 완료)")
-                        else:
-                            logger.info(f"[SUBMIT_EXAM] 문제 (제목 없음)의 결과를 원본 시험 '{original_exam.title_ko or original_exam.title_en or 'Unknown'}'에도 반영 (요약 필드 업데이트 완료)")
-                    else:
-                        if question:
-                            question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                            logger.warning(f"[SUBMIT_EXAM] 문제 {question_title}의 원본 시험을 찾을 수 없음")
-                        else:
-                            logger.warning(f"[SUBMIT_EXAM] 문제 (제목 없음)의 원본 시험을 찾을 수 없음")
-                        
-                        # 원본 시험을 찾지 못한 경우, 문제별로 개별적으로 원본 시험 찾기 시도
-                        individual_original_exam = None
-                        
-                        # 1. 문제의 group_id를 통해 원본 시험 찾기
-                        if question.group_id:
-                            try:
-                                individual_original_exam = Exam.objects.filter(
-                                    Q(title_ko=question.group_id) | Q(title_en=question.group_id),
-                                    is_original=True
-                                ).first()
-                                if individual_original_exam:
-                                    logger.info(f"[SUBMIT_EXAM] 문제별 group_id '{question.group_id}'로 원본 시험 찾음: {individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}")
-                            except Exception as e:
-                                logger.error(f"[SUBMIT_EXAM] 문제별 group_id로 원본 시험 찾기 실패: {e}")
-                        
-                        # 2. 문제가 속한 다른 원본 시험들 중에서 찾기
-                        if not individual_original_exam:
-                            for exam_question in question.examquestion_set.all():
-                                if exam_question.exam.is_original and (
-                                    (exam_question.exam.title_ko != exam.title_ko and exam.title_ko) or
-                                    (exam_question.exam.title_en != exam.title_en and exam.title_en)
-                                ):
-                                    individual_original_exam = exam_question.exam
-                                    logger.info(f"[SUBMIT_EXAM] 문제별 examquestion_set으로 원본 시험 찾음: {individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}")
-                                    break
-                        
-                        # 개별 원본 시험을 찾은 경우 해당 시험에 결과 저장
-                        if individual_original_exam:
-                            try:
-                                # 개별 원본 시험의 ExamResult 찾기 또는 생성
-                                individual_result = ExamResult.objects.filter(
-                                    exam=individual_original_exam,
-                                    user=request.user if request.user.is_authenticated else None
-                                ).order_by('-completed_at').first()
-                                
-                                if not individual_result:
-                                    individual_result = ExamResult.objects.create(
-                                        exam=individual_original_exam,
-                                        user=request.user if request.user.is_authenticated else None,
-                                        score=0,
-                                        total_score=0,
-                                        correct_count=0,
-                                        wrong_count=0,
-                                        elapsed_seconds=0,
-                                        completed_at=timezone.now()
-                                    )
-                                    logger.info(f"[SUBMIT_EXAM] 개별 원본 시험 '{individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}'에 새 결과 생성")
-                                
-                                # 개별 원본 시험에 결과 상세 저장
-                                ExamResultDetail.objects.create(
-                                    result=individual_result,
-                                    question=question,
-                                    user_answer=user_answer,
-                                    is_correct=is_correct,
-                                    elapsed_seconds=elapsed_seconds,
-                                    evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
-                                )
-                                
-                                # 개별 원본 시험의 ExamResult 업데이트
-                                if is_correct:
-                                    individual_result.correct_count += 1
-                                individual_result.total_score += 1
-                                individual_result.score = individual_result.correct_count
-                                individual_result.wrong_count = individual_result.total_score - individual_result.correct_count
-                                individual_result.save()
-                                
-                                if question:
-                                    user_lang = get_user_language(request)
-                                    question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                                    original_title = get_localized_field(individual_original_exam, 'title', user_lang, 'Unknown')
-                                    logger.info(f"[SUBMIT_EXAM] 문제 {question_title}의 결과를 개별 원본 시험 '{original_title}'에 반영")
-                                else:
-                                    logger.info(f"[SUBMIT_EXAM] 문제 (제목 없음)의 결과를 개별 원본 시험 '{individual_original_exam.title_ko or individual_original_exam.title_en or 'Unknown'}'에 반영")
-                                
-                            except Exception as e:
-                                logger.error(f"[SUBMIT_EXAM] 개별 원본 시험 결과 저장 중 오류: {str(e)}")
-                                # 오류 발생 시 현재 시험에 저장
-                                if exam_result:
-                                    ExamResultDetail.objects.create(
-                                        result=exam_result,
-                                        question=question,
-                                        user_answer=user_answer,
-                                        is_correct=is_correct,
-                                        elapsed_seconds=elapsed_seconds,
-                                        evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
-                                    )
-                                    logger.info(f"[SUBMIT_EXAM] 개별 원본 시험 저장 실패로 현재 시험에 저장")
-                        else:
-                            # 모든 방법으로 원본 시험을 찾지 못한 경우 현재 시험에 결과 저장
-                            if exam_result:
-                                ExamResultDetail.objects.create(
-                                    result=exam_result,
-                                    question=question,
-                                    user_answer=user_answer,
-                                    is_correct=is_correct,
-                                    elapsed_seconds=elapsed_seconds,
-                                    evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
-                                )
-                                logger.info(f"[SUBMIT_EXAM] 모든 방법으로 원본 시험을 찾지 못해 현재 시험에 저장")
-                else:
-                    # 일반 시험인 경우 현재 시험에만 저장
-                    logger.info(f"[SUBMIT_EXAM] ExamResultDetail 생성 시작: exam_id={exam_id}, question_id={question.id if question else 'None'}, user_answer={user_answer}, is_correct={is_correct}")
-                    try:
-                        ExamResultDetail.objects.create(
-                            result=exam_result,
-                            question=question,
-                            user_answer=user_answer,
-                            is_correct=is_correct,
-                            elapsed_seconds=elapsed_seconds,  # 소요시간 추가
-                            evaluation=evaluation if is_voice_interview else ''  # Voice Interview 평가 내용
-                        )
-                        logger.info(f"[SUBMIT_EXAM] ExamResultDetail 생성 완료: result_id={exam_result.id}, question_id={question.id if question else 'None'}")
-                    except Exception as e:
-                        logger.error(f"[SUBMIT_EXAM] ExamResultDetail 생성 실패: {str(e)}")
-                        logger.error(f"[SUBMIT_EXAM] 상세 오류: {traceback.format_exc()}")
-                        raise
+                            logger.error(f"[SUBMIT_EXAM] 개별 원본 시험 결과 저장 중 오류: {str(e)}")
+                            individual_result = None
+
+                        if individual_result:
+                            add_detail(individual_result, question, user_answer, is_correct, elapsed_seconds, evaluation)
+                            _add_to_source_result(individual_result, is_correct)
+                            original_title = get_localized_field(individual_original_exam, 'title', user_language, 'Unknown')
+                            logger.info(f"[SUBMIT_EXAM] 문제 {question_title}의 결과를 개별 원본 시험 '{original_title}'에 반영")
+                        elif exam_result:
+                            # 오류 발생 시 현재 시험에 저장
+                            add_detail(exam_result, question, user_answer, is_correct, elapsed_seconds, evaluation)
+                            logger.info(f"[SUBMIT_EXAM] 개별 원본 시험 저장 실패로 현재 시험에 저장")
+                    elif exam_result:
+                        # 모든 방법으로 원본 시험을 찾지 못한 경우 현재 시험에 결과 저장
+                        add_detail(exam_result, question, user_answer, is_correct, elapsed_seconds, evaluation)
+                        logger.info(f"[SUBMIT_EXAM] 모든 방법으로 원본 시험을 찾지 못해 현재 시험에 저장")
+            else:
+                # 일반 시험인 경우 현재 시험에만 저장
+                add_detail(exam_result, question, user_answer, is_correct, elapsed_seconds, evaluation)
 
-            except Question.DoesNotExist:
-                continue
+        # 결과 상세 일괄 저장
+        try:
+            ExamResultDetail.objects.bulk_create(pending_details, batch_size=500)
+            logger.info(f"[SUBMIT_EXAM] ExamResultDetail {len(pending_details)}개 일괄 생성 완료: result_id={exam_result.id}")
+        except Exception as e:
+            logger.error(f"[SUBMIT_EXAM] ExamResultDetail 생성 실패: {str(e)}")
+            logger.error(f"[SUBMIT_EXAM] 상세 오류: {traceback.format_exc()}")
+            raise
+
+        # 원본 시험 ExamResult 요약 필드 저장 (결과별 한 번)
+        for source_result in source_results.values():
+            source_result.save()
 
         # 결과 업데이트 (추천 시험이 아닌 경우에만)
         if exam_result:
@@ -4826,261 +4706,20 @@ def submit_exam(request):
             exam_result.score = correct_count
             exam_result.save()
 
-        # 로그인한 사용자인 경우 StudyTaskProgress 업데이트
-        # 핵심 원칙: 모든 문제 통계와 공부시간 통계는 End 버튼을 눌러 통계가 잡힐 때 처리되어야 한다
-        logger.info(f"[SUBMIT_EXAM] 사용자 인증 상태: {request.user.is_authenticated}")
-        logger.info(f"[SUBMIT_EXAM] 사용자: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
-        
+        # 사용자별 문제 통계(UserQuestionStat) 증분 갱신
+        # (UserExamProgress 요약이 최신 결과의 점수를 읽으므로 결과 저장 후 호출)
         if request.user.is_authenticated:
             try:
-                logger.info(f"[SUBMIT_EXAM] StudyTaskProgress 업데이트 시작")
-                # 원본 시험 찾기 - StudyTask에 연결된 시험을 우선적으로 찾기
-                target_exam = exam
-                
-                # 1. 먼저 현재 시험이 어떤 StudyTask에 직접 연결되어 있는지 확인
-                connected_study_tasks = StudyTask.objects.filter(exam=exam)
-                if connected_study_tasks.exists():
-                    logger.info(f"[SUBMIT_EXAM] 현재 시험이 {connected_study_tasks.count()}개의 StudyTask에 직접 연결됨")
-                    # 현재 시험을 그대로 사용 (StudyTask에 연결되어 있음)
-                    target_exam = exam
-                elif not exam.is_original:
-                    # 사본/복사 시험인 경우 원본 시험 찾기
-                    if exam.original_exam:
-                        target_exam = exam.original_exam
-                        logger.info(f"[SUBMIT_EXAM] original_exam 필드로 원본 시험 찾음: {target_exam.title_ko or target_exam.title_en or 'Unknown'}")
-                    elif (
-            (exam.title_ko and "Today's Quizzes for" in exam.title_ko) or
-            (exam.title_en and "Today's Quizzes for" in exam.title_en)
-        ):
-                        # 추천 시험인 경우 원본 시험 찾기
-                        for answer_data in answers:
-                            question_id = answer_data.get('question_id')
-                            try:
-                                question = Question.objects.get(id=question_id)
-                                if question.group_id:
-                                    try:
-                                        target_exam = Exam.objects.get(
-                                            Q(title_ko=question.group_id) | Q(title_en=question.group_id)
-                                        )
-                                        logger.info(f"[SUBMIT_EXAM] group_id로 원본 시험 찾음: {target_exam.title_ko or target_exam.title_en or 'Unknown'}")
-                                        break
-                                    except Exam.DoesNotExist:
-                                        pass
-                            except Question.DoesNotExist:
-                                continue
-                
-                # 2. 만약 여전히 target_exam이 현재 시험이고, StudyTask에 연결되지 않았다면
-                # 현재 사용자가 속한 스터디의 Task 중에서 해당 시험과 연결된 것 찾기
-                if target_exam == exam and not connected_study_tasks.exists():
-                    logger.info(f"[SUBMIT_EXAM] 현재 시험이 StudyTask에 직접 연결되지 않음. 대안 방법으로 찾기 시도")
-                    
-                    # 현재 사용자가 속한 스터디들 확인
-                    user_studies = Study.objects.filter(members__user=request.user)
-                    logger.info(f"[SUBMIT_EXAM] 사용자가 속한 스터디 수: {user_studies.count()}")
-                    
-                    for user_study in user_studies:
-                        study_title = user_study.title_ko if user_study.title_ko else user_study.title_en or '제목 없음'
-                        logger.debug(f"[SUBMIT_EXAM] 스터디 확인: {study_title} (ID: {user_study.id})")
-                        for task in user_study.tasks.all():
-                            logger.debug(f"[SUBMIT_EXAM]   Task: {task.name} (Exam: {task.exam.title_ko or task.exam.title_en or 'Unknown' if task.exam else 'No Exam'})")
-                            if task.exam and (
-            (task.exam.title_ko == exam.title_ko and exam.title_ko) or
-            (task.exam.title_en == exam.title_en and exam.title_en)
-        ):
-                                logger.info(f"[SUBMIT_EXAM] 일치하는 Task 발견: {task.name} - {task.exam.title_ko or task.exam.title_en or 'Unknown'}")
-                                target_exam = task.exam
-                                break
-                        if target_exam != exam:
-                            break
-                    
-                    if target_exam != exam:
-                        logger.info(f"[SUBMIT_EXAM] target_exam을 '{target_exam.title_ko or target_exam.title_en or 'Unknown'}' (ID: {target_exam.id})로 변경")
-                    else:
-                        logger.warning(f"[SUBMIT_EXAM] 대안 방법으로도 target_exam을 찾지 못함")
-                
-                # 원본 시험과 연결된 모든 StudyTask 찾기
-                study_tasks = StudyTask.objects.filter(exam=target_exam)
-                logger.info(f"[SUBMIT_EXAM] target_exam: {target_exam.title_ko or target_exam.title_en or 'Unknown'} (ID: {target_exam.id})")
-                logger.info(f"[SUBMIT_EXAM] 연결된 StudyTask 수: {study_tasks.count()}")
-                
-                if study_tasks.exists():
-                    for study_task in study_tasks:
-                        logger.debug(f"[SUBMIT_EXAM] StudyTask: {study_task.name} (ID: {study_task.id})")
-                else:
-                    logger.warning(f"[SUBMIT_EXAM] target_exam '{target_exam.title_ko or target_exam.title_en or 'Unknown'}'에 연결된 StudyTask가 없습니다!")
-                    # 대안: 현재 사용자가 속한 스터디의 Task 중에서 해당 시험과 연결된 것 찾기
-                    user_studies = Study.objects.filter(members__user=request.user)
-                    alternative_tasks = []
-                    for user_study in user_studies:
-                        for task in user_study.tasks.all():
-                            if task.exam and (
-                                (task.exam.title_ko == target_exam.title_ko and target_exam.title_ko) or
-                                (task.exam.title_en == target_exam.title_en and target_exam.title_en)
-                            ):
-                                alternative_tasks.append(task)
-                    
-                    if alternative_tasks:
-                        logger.info(f"[SUBMIT_EXAM] 대안 StudyTask {len(alternative_tasks)}개 발견:")
-                        for task in alternative_tasks:
-                            study_title = task.study.title_ko if task.study.title_ko else task.study.title_en or '제목 없음'
-                            logger.debug(f"[SUBMIT_EXAM]   - {study_title} - {task.name}")
-                        study_tasks = alternative_tasks
-                    else:
-                        logger.warning(f"[SUBMIT_EXAM] 대안 StudyTask도 찾을 수 없습니다!")
-
-                for study_task in study_tasks:
-                    # 진행률 계산
-                    logger.debug(f"[SUBMIT_EXAM] 진행률 계산 시작 - exam.is_original: {exam.is_original}")
-                    logger.debug(f"[SUBMIT_EXAM] correct_count: {correct_count}, total_questions: {total_questions}")
-                    
-                    if exam.is_original:
-                        # 원본 시험인 경우 직접 계산
-                        if exam.total_questions > 0:
-                            progress_percentage = (correct_count / exam.total_questions) * 100
-                            logger.debug(f"[SUBMIT_EXAM] 원본 시험 진행률: {correct_count}/{exam.total_questions} = {progress_percentage:.1f}%")
-                        else:
-                            progress_percentage = 0
-                            logger.debug(f"[SUBMIT_EXAM] 원본 시험 total_questions가 0입니다")
-                    else:
-                        # 사본/복사 시험인 경우 원본 시험 기준으로 계산
-                        logger.debug(f"[SUBMIT_EXAM] 사본 시험 - target_exam.total_questions: {target_exam.total_questions}")
-                        if target_exam.total_questions > 0:
-                            # 사본 시험의 정답률을 원본 시험 기준으로 변환
-                            # 예: 사본에서 3/5 맞춤, 원본이 10문제면 -> (3/5) * (5/10) * 100 = 30%
-                            progress_percentage = (correct_count / total_questions) * (total_questions / target_exam.total_questions) * 100
-                            logger.debug(f"[SUBMIT_EXAM] 사본 시험 진행률: ({correct_count}/{total_questions}) * ({total_questions}/{target_exam.total_questions}) * 100 = {progress_percentage:.1f}%")
-                        else:
-                            progress_percentage = 0
-                            logger.debug(f"[SUBMIT_EXAM] target_exam.total_questions가 0입니다")
-                    
-                    logger.debug(f"[SUBMIT_EXAM] 최종 계산된 진행률: {progress_percentage:.1f}%")
-
-                    # StudyTaskProgress 업데이트 또는 생성
-                    # 핵심 원칙: 모든 문제 통계와 공부시간 통계는 End 버튼을 눌러 통계가 잡힐 때 처리되어야 한다
-                    # - 화면를 열 때마다 통계를 계산하는 것은 비정상적인 접근
-                    # - 시험 완료 시에만 통계 데이터를 생성하고 업데이트
-                    logger.info(f"[SUBMIT_EXAM] StudyTaskProgress 생성/업데이트 시작")
-                    logger.info(f"[SUBMIT_EXAM] 사용자: {request.user.username}, Task: {study_task.name}, 진행률: {progress_percentage:.1f}%")
-                    
-                    try:
-                        progress_obj, created = StudyTaskProgress.objects.get_or_create(
-                            user=request.user,
-                            study_task=study_task,
-                            defaults={'progress': progress_percentage}
-                        )
-                        
-                        if created:
-                            logger.info(f"[SUBMIT_EXAM] StudyTaskProgress 새로 생성됨: {progress_percentage:.1f}%")
-                        else:
-                            logger.debug(f"[SUBMIT_EXAM] 기존 StudyTaskProgress 발견: {progress_obj.progress:.1f}%")
-                            # 기존 기록이 있으면 진행률 업데이트 (더 높은 값으로)
-                            if progress_percentage > progress_obj.progress:
-                                progress_obj.progress = progress_percentage
-                                progress_obj.save()
-                                logger.info(f"[SUBMIT_EXAM] StudyTaskProgress 업데이트됨: {progress_percentage:.1f}%")
-                            else:
-                                logger.debug(f"[SUBMIT_EXAM] 기존 진행률이 더 높아서 업데이트하지 않음")
-                        
-                        logger.debug(f"[SUBMIT_EXAM] StudyTaskProgress 최종 상태: {progress_obj.progress:.1f}%")
-                        
-                    except Exception as e:
-                        logger.error(f"[SUBMIT_EXAM] StudyTaskProgress 생성/업데이트 실패: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # StudyTask의 전체 진행률도 업데이트 (사용자별 진행률의 평균)
-                    try:
-                        # 해당 Task의 모든 사용자 진행률 평균 계산
-                        all_user_progress = StudyTaskProgress.objects.filter(study_task=study_task)
-                        if all_user_progress.exists():
-                            avg_progress = sum([p.progress for p in all_user_progress]) / all_user_progress.count()
-                            study_task.progress = avg_progress
-                            study_task.save()
-                            logger.debug(f"StudyTask 전체 진행률 업데이트: {study_task.name} - {avg_progress:.1f}%")
-                    except Exception as e:
-                        logger.error(f"StudyTask 전체 진행률 업데이트 중 오류: {str(e)}")
-
+                for stat_exam_id, stat_attempts in stat_attempts_by_exam.items():
+                    record_question_attempts(request.user, stat_exam_id, stat_attempts, attempted_at=exam_result.completed_at)
             except Exception as e:
-                logger.error(f"StudyTaskProgress 업데이트 중 오류 (submit): {str(e)}")
+                logger.error(f"[SUBMIT_EXAM] UserQuestionStat 갱신 실패: {e}")
 
-        # StudyProgressRecord 생성 - Task별 진행률을 포함한 기록 저장
+        # 스터디 진행률/통계 후처리 (StudyTaskProgress, StudyProgressRecord, 캐시 무효화)
         # 핵심 원칙: 모든 문제 통계와 공부시간 통계는 End 버튼을 눌러 통계가 잡힐 때 처리되어야 한다
-        try:
-            from quiz.models import StudyProgressRecord
-            
-            # 현재 사용자가 속한 스터디들 중에서 target_exam과 연결된 Task가 있는 스터디 찾기
-            user_studies = Study.objects.filter(members__user=request.user)
-            target_study = None
-            
-            for user_study in user_studies:
-                for task in user_study.tasks.all():
-                    if task.exam and task.exam.id == target_exam.id:
-                        target_study = user_study
-                        study_title = target_study.title_ko if target_study.title_ko else target_study.title_en or '제목 없음'
-                        print(f"[SUBMIT_EXAM] StudyProgressRecord용 스터디 발견: {study_title}")
-                        break
-                if target_study:
-                    break
-            
-            if target_study:
-                # 현재 사용자의 모든 Task 진행률 수집
-                task_progresses = {}
-                overall_progress = 0
-                total_tasks = 0
-                
-                for study_task in target_study.tasks.all():
-                    try:
-                        progress_obj = StudyTaskProgress.objects.get(user=request.user, study_task=study_task)
-                        task_progress = progress_obj.progress
-                    except StudyTaskProgress.DoesNotExist:
-                        task_progress = 0
-                    
-                    task_progresses[str(study_task.id)] = task_progress
-                    overall_progress += task_progress
-                    total_tasks += 1
-                
-                # 전체 진행률 계산 (평균)
-                if total_tasks > 0:
-                    overall_progress = overall_progress / total_tasks
-                
-                # StudyProgressRecord 생성
-                StudyProgressRecord.objects.create(
-                    user=request.user,
-                    study=target_study,
-                    overall_progress=overall_progress,
-                    task_progresses=task_progresses,
-                    page_type='exam-completion'  # 시험 완료로 기록
-                )
-                
-                study_title = target_study.title_ko if target_study.title_ko else target_study.title_en or '제목 없음'
-                logger.info(f"StudyProgressRecord 생성 완료: {request.user.username} - {study_title} - 전체 진행률: {overall_progress:.1f}%")
-            else:
-                logger.warning(f"[SUBMIT_EXAM] StudyProgressRecord 생성 실패: target_exam과 연결된 스터디를 찾을 수 없음")
-            
-        except Exception as e:
-            logger.error(f"StudyProgressRecord 생성 중 오류 (submit): {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-        # 시험 결과 관련 캐시 무효화
-        try:
-            from django.core.cache import cache
-            # 모든 exams 관련 캐시 삭제 (통계가 변경되었으므로)
-            cache.delete_pattern("exams_*")
-        except AttributeError:
-            # 다른 캐시 백엔드의 경우 개별 키 삭제
-            cache.delete("exams_anonymous")
-            cache.delete("exams_anonymous_true")
-            cache.delete("exams_anonymous_false")
-            cache.delete("exams_anonymous_all")
-            # 관리자 사용자 캐시도 삭제
-            cache.delete("exams_1")
-            cache.delete("exams_1_true")
-            cache.delete("exams_1_false")
-            cache.delete("exams_1_all")
-            logger.info("시험 제출 후 캐시 무효화 완료 (개별 키 삭제)")
-        except Exception as e:
-            logger.error(f"시험 제출 후 캐시 무효화 중 오류: {e}")
+        # - 결과와 상세가 커밋된 뒤 Celery 태스크로 처리하여 응답을 지연시키지 않는다 (결과 ID 기준 1회 처리)
+        if request.user.is_authenticated:
+            schedule_exam_submission_stats(exam_result.id, [qid for qid in answer_question_ids if qid])
 
         # 프론트엔드 캐시 무효화를 위한 응답 헤더 추가
         response_data = {
@@ -6140,6 +5779,7 @@ def delete_voice_interview_results(request):
         
         deleted_count = 0
         failed_results = []
+        affected_stats = defaultdict(set)
 
         for result in results:
             can_delete = False
@@ -6166,11 +5806,17 @@ def delete_voice_interview_results(request):
                     can_delete = True
 
             if can_delete:
+                if result.user_id:
+                    affected_stats[result.user_id].add(result.exam_id)
                 result.delete()
                 deleted_count += 1
             else:
                 failed_results.append(str(result.id))
 
+        # 삭제된 결과의 사용자별 문제 통계(UserQuestionStat) 재계산
+        for affected_user_id, affected_exam_ids in affected_stats.items():
+            refresh_user_question_stats([affected_user_id], exam_ids=list(affected_exam_ids))
+
         if failed_results:
             return Response({
                 'success': True,
@@ -6407,10 +6053,10 @@ def get_question_statistics(request, exam_id):
                     logger.warning(f"[QUESTION_STATS] 인증된 사용자가 비공개 시험에 접근 시도 (exam_id: {exam_id}) - 403 FORBIDDEN")
                     return Response({'error': '이 시험에 접근할 권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
         
-        exam_questions = Question.objects.filter(examquestion__exam=exam).select_related()
+        exam_questions = list(Question.objects.filter(examquestion__exam=exam))
 
         logger.info(f"[QUESTION_STATS] 시험 정보: {exam.title_ko or exam.title_en or 'Unknown'} (ID: {exam.id})")
-        logger.info(f"[QUESTION_STATS] 시험에 포함된 문제 수: {exam_questions.count()}")
+        logger.info(f"[QUESTION_STATS] 시험에 포함된 문제 수: {len(exam_questions)}")
 
         # 사용자 ID 또는 username 쿼리 파라미터 확인
         user_id_param = request.GET.get('user_id')
@@ -6418,116 +6064,32 @@ def get_question_statistics(request, exam_id):
         
         logger.info(f"[QUESTION_STATS] 쿼리 파라미터 - user_id: {user_id_param}, username: {username_param}")
 
-        # 성능 최적화: 같은 제목의 문제들을 그룹화하여 통계 계산
-        statistics = []
-        
-        # 문제들을 제목별로 그룹화 (시험에 포함된 문제들의 제목을 기준으로)
-        from ..utils.question_utils import group_questions_by_title, get_all_questions_by_title_group
+        # 통계 대상 사용자 결정: admin은 모든 사용자, 일반 사용자는 본인,
+        # 익명 사용자는 통계 없음 (다른 사용자의 개인 통계 노출 금지 - user_id 파라미터 무시)
+        stats_user_id = None
+        include_stats = True
+        if user.is_authenticated:
+            if not (hasattr(user, 'profile') and user.profile.role == 'admin_role'):
+                stats_user_id = user.id
+        else:
+            include_stats = False
+
+        # 성능 최적화: 같은 제목의 문제들을 그룹화하고, 전체 그룹의 통계를 한 번의 집계 쿼리로 계산
+        # (동일한 제목의 모든 문제 기록을 Question.title_group_key로 합산)
+        from ..utils.question_utils import group_questions_by_title, get_title_group_statistics
         title_groups = group_questions_by_title(exam_questions)
         
         logger.info(f"[QUESTION_STATS] 제목별 그룹 수: {len(title_groups)}")
         
-        # 각 제목 그룹별로 통계 계산
+        if include_stats:
+            group_stats = get_title_group_statistics(title_groups.keys(), user_id=stats_user_id)
+        else:
+            group_stats = {}
+        
+        # 그룹 내 모든 문제에 동일한 통계 적용
+        statistics = []
         for title_key, questions_in_group in title_groups.items():
-            # 시험에 포함된 문제들의 ID
-            exam_question_ids = [q.id for q in questions_in_group]
-            
-            # 동일한 제목의 모든 문제를 찾아서 통합 통계 계산
-            all_questions = get_all_questions_by_title_group(title_key)
-            all_question_ids = [q.id for q in all_questions]
-            logger.info(f"[QUESTION_STATS] 그룹 {title_key}: 시험 문제 {len(exam_question_ids)}개, 전체 문제 {len(all_question_ids)}개")
-            
-            # 인증된 사용자인 경우
-            if user.is_authenticated:
-                # admin 사용자는 모든 사용자의 통계를 볼 수 있음
-                if hasattr(user, 'profile') and user.profile.role == 'admin_role':
-                    logger.info(f"[QUESTION_STATS] Admin 사용자 처리 - 그룹: {title_key}")
-                    
-                    # 전체 시도 횟수 조회 (동일한 제목의 모든 문제)
-                    total_attempts_data = ExamResultDetail.objects.filter(
-                        question_id__in=all_question_ids
-                    ).values('question_id').annotate(
-                        total_attempts=Count('id')
-                    )
-                    
-                    # 정답 횟수 조회 (동일한 제목의 모든 문제)
-                    correct_attempts_data = ExamResultDetail.objects.filter(
-                        question_id__in=all_question_ids,
-                        is_correct=True
-                    ).values('question_id').annotate(
-                        correct_attempts=Count('id')
-                    )
-                    
-                    # 그룹 내 최대값 계산
-                    total_attempts = max([item['total_attempts'] for item in total_attempts_data], default=0)
-                    correct_attempts = max([item['correct_attempts'] for item in correct_attempts_data], default=0)
-                    
-                else:
-                    logger.info(f"[QUESTION_STATS] 일반 사용자 처리 - 그룹: {title_key}")
-                    
-                    # 사용자의 전체 시도 횟수 조회 (동일한 제목의 모든 문제)
-                    total_attempts_data = ExamResultDetail.objects.filter(
-                        question_id__in=all_question_ids,
-                        result__user_id=user.id
-                    ).values('question_id').annotate(
-                        total_attempts=Count('id')
-                    )
-                    
-                    # 사용자의 정답 횟수 조회 (동일한 제목의 모든 문제)
-                    correct_attempts_data = ExamResultDetail.objects.filter(
-                        question_id__in=all_question_ids,
-                        result__user_id=user.id,
-                        is_correct=True
-                    ).values('question_id').annotate(
-                        correct_attempts=Count('id')
-                    )
-                    
-                    # 그룹 내 최대값 계산
-                    total_attempts = max([item['total_attempts'] for item in total_attempts_data], default=0)
-                    correct_attempts = max([item['correct_attempts'] for item in correct_attempts_data], default=0)
-                    
-            else:
-                logger.info(f"[QUESTION_STATS] 익명 사용자 처리 - 그룹: {title_key}")
-                # 익명 사용자의 경우
-                if user_id_param:
-                    logger.info(f"[QUESTION_STATS] user_id 파라미터로 처리: {user_id_param}")
-                    try:
-                        user_id = int(user_id_param)
-                        
-                        # question_ids는 이전에 정의되어 있어야 함
-                        # 지정된 사용자의 전체 시도 횟수 조회
-                        all_question_ids = list(Question.objects.filter(
-                            title_ko__icontains=title_key
-                        ).values_list('id', flat=True))
-                        total_attempts_data = ExamResultDetail.objects.filter(
-                            question_id__in=all_question_ids,
-                            result__user_id=user_id
-                        ).values('question_id').annotate(
-                            total_attempts=Count('id')
-                        )
-                        
-                        # 지정된 사용자의 정답 횟수 조회
-                        correct_attempts_data = ExamResultDetail.objects.filter(
-                            question_id__in=all_question_ids,
-                            result__user_id=user_id,
-                            is_correct=True
-                        ).values('question_id').annotate(
-                            correct_attempts=Count('id')
-                        )
-                        
-                        # 그룹 내 최대값 계산
-                        total_attempts = max([item['total_attempts'] for item in total_attempts_data], default=0)
-                        correct_attempts = max([item['correct_attempts'] for item in correct_attempts_data], default=0)
-                        
-                    except ValueError:
-                        logger.error(f"[QUESTION_STATS] 잘못된 user_id 파라미터: {user_id_param}")
-                        return Response({'error': '잘못된 user_id 파라미터입니다.'}, status=status.HTTP_400_BAD_REQUEST)
-                else:
-                    logger.info(f"[QUESTION_STATS] 익명 사용자 - 기본 통계 (0으로 설정)")
-                    total_attempts = 0
-                    correct_attempts = 0
-            
-            # 그룹 내 모든 문제에 동일한 통계 적용
+            total_attempts, correct_attempts = group_stats.get(title_key, (0, 0))
             for question in questions_in_group:
                 statistics.append({
                     'question_id': question.id,
@@ -6716,6 +6278,19 @@ def create_question_member_mapping(request):
 @permission_classes([AllowAny])
 def get_exams(request):
     """최적화된 시험 목록 조회 API (페이지네이션, 캐싱, 필드 선택 지원)"""
+    # 캐시 미스로 계산 락을 잡은 뒤 저장 없이 끝나면(잘못된 커서, 예외 등) 락을 바로 해제
+    # (해제하지 않으면 같은 요청이 LOCK_TIMEOUT 동안 대기하게 됨)
+    cache_state = {}
+    try:
+        return _get_exams(request, cache_state)
+    finally:
+        if 'lock_params' in cache_state and not cache_state.get('stored'):
+            user_id, cache_key_params = cache_state['lock_params']
+            ExamCacheManager.release_exam_list_cache(user_id, **cache_key_params)
+
+
+def _get_exams(request, cache_state):
+    """get_exams 본문 (캐시 미스로 락을 잡으면 cache_state['lock_params'], 저장하면 cache_state['stored'] 기록)"""
     import time
     from django.db import connection
     
@@ -6727,6 +6302,17 @@ def get_exams(request):
     page = int(request.GET.get('page', 1))
     page_size = int(request.GET.get('page_size', 20))
     
+    # 커서 페이지네이션: cursor 파라미터가 있으면 (created_at, id) 키셋으로 조회 (빈 값이면 첫 페이지)
+    # count 파라미터: exact(기본값) / estimate(추정치) / none(전체 개수 생략)
+    from quiz.utils.pagination_utils import (
+        COUNT_MODE_EXACT, COUNT_MODES, InvalidCursor, apply_created_at_cursor, encode_cursor, get_total_count
+    )
+    cursor = request.GET.get('cursor')
+    use_cursor = cursor is not None
+    count_mode = request.GET.get('count', COUNT_MODE_EXACT)
+    if count_mode not in COUNT_MODES:
+        return Response({'error': f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+    
     # 필요한 필드만 선택적으로 반환 (select 파라미터)
     select_fields_raw = request.GET.get('select', '').strip()
     if select_fields_raw:
@@ -6812,14 +6398,19 @@ def get_exams(request):
         'search_title': search_title,
         'select_fields': ','.join(select_fields) if select_fields else 'all',
         'tags': ','.join(tag_ids) if tag_ids else 'all',
-        'age_rating': age_rating if age_rating else 'all'
+        'age_rating': age_rating if age_rating else 'all',
+        # 기본값(offset 페이지네이션, exact count)은 키에서 제외되어 기존 캐시 키와 같음
+        'cursor': cursor if use_cursor else None,
+        'count': count_mode if count_mode != COUNT_MODE_EXACT else None
     }
     
     # 강제 새로고침이 아닌 경우에만 캐시에서 조회
     if not (force_refresh or cache_param or refresh_param):
+        # 만료/무효화 직후에는 한 요청만 다시 계산하고 나머지는 이전 값 또는 대기 후 결과 사용
         cached_data = ExamCacheManager.get_exam_list_cache(user_id, **cache_key_params)
-        if cached_data:
+        if cached_data is not None:
             return Response(cached_data)
+        cache_state['lock_params'] = (user_id, cache_key_params)
     
     # 쿼리셋 최적화
     base_queryset = QueryOptimizer.optimize_exam_queryset(
@@ -7117,11 +6708,10 @@ def get_exams(request):
     # 정렬 전에 distinct()를 적용하여 페이지네이션 문제 방지
     if tag_ids:
         base_queryset = base_queryset.distinct()
-        logger.info(f"[GET_EXAMS] 태그 필터 적용 후 distinct() 호출, 쿼리셋 개수: {base_queryset.count()}")
+        logger.info(f"[GET_EXAMS] 태그 필터 적용 후 distinct() 호출")
     
-    # 정렬
-    base_queryset = base_queryset.order_by('-created_at')
-    logger.info(f"[GET_EXAMS] 정렬 적용 후 쿼리셋 개수: {base_queryset.count()}")
+    # 정렬 (같은 created_at 안에서도 순서가 고정되도록 id를 보조 정렬 키로 사용)
+    base_queryset = base_queryset.order_by('-created_at', '-id')
     
     # 전체 개수 계산 (annotate() 전에 수행하여 distinct()가 제대로 작동하도록 함)
     # distinct()가 적용되었는지 확인
@@ -7131,10 +6721,11 @@ def get_exams(request):
     count_start = time.time()
     count_queries_before = len(connection.queries)
     # annotate() 전에 total_count 계산 (distinct()가 제대로 작동하도록)
-    total_count = base_queryset.count()
+    # count=none이면 None, count=estimate이면 PostgreSQL 실행 계획 추정치
+    total_count = get_total_count(base_queryset, count_mode)
     count_time = time.time() - count_start
     count_queries_after = len(connection.queries)
-    logger.info(f"[GET_EXAMS] total_count 계산: {count_queries_after - count_queries_before}개 쿼리, {count_time:.3f}초, 결과: {total_count}개, page: {page}, page_size: {page_size}, distinct 적용: {has_distinct}")
+    logger.info(f"[GET_EXAMS] total_count 계산({count_mode}): {count_queries_after - count_queries_before}개 쿼리, {count_time:.3f}초, 결과: {total_count}개, page: {page}, page_size: {page_size}, distinct 적용: {has_distinct}")
     
     # ExamListSerializer를 사용하는 경우 최적화 적용
     # 모든 권한에 대해 일관되게 적용
@@ -7156,15 +6747,36 @@ def get_exams(request):
         base_queryset = base_queryset.distinct()
         logger.info(f"[GET_EXAMS] 페이지네이션 전 distinct() 재적용 (태그 필터 있음)")
     
-    start_index = (page - 1) * page_size
-    end_index = start_index + page_size
-    logger.info(f"[GET_EXAMS] 페이지네이션 범위: start_index={start_index}, end_index={end_index}, total_count={total_count}")
     pagination_start = time.time()
     pagination_queries_before = len(connection.queries)
-    paginated_exams = base_queryset[start_index:end_index]
+    next_cursor = None
+    if use_cursor:
+        # 한 행을 더 읽어 다음 페이지 존재 여부를 COUNT 없이 판단
+        try:
+            paginated_exams = list(apply_created_at_cursor(base_queryset, cursor)[:page_size + 1])
+        except InvalidCursor as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        has_next = len(paginated_exams) > page_size
+        paginated_exams = paginated_exams[:page_size]
+        if has_next:
+            last_exam = paginated_exams[-1]
+            next_cursor = encode_cursor(last_exam.created_at, last_exam.id)
+        logger.info(f"[GET_EXAMS] 커서 페이지네이션: cursor={cursor or '(첫 페이지)'}, page_size={page_size}, has_next={has_next}")
+    else:
+        start_index = (page - 1) * page_size
+        end_index = start_index + page_size
+        logger.info(f"[GET_EXAMS] 페이지네이션 범위: start_index={start_index}, end_index={end_index}, total_count={total_count}")
+        if total_count is None:
+            # 전체 개수를 생략한 경우에도 한 행을 더 읽어 다음 페이지 존재 여부 판단
+            paginated_exams = list(base_queryset[start_index:end_index + 1])
+            has_next = len(paginated_exams) > page_size
+            paginated_exams = paginated_exams[:page_size]
+        else:
+            paginated_exams = list(base_queryset[start_index:end_index])
+            has_next = end_index < total_count
     pagination_time = time.time() - pagination_start
     pagination_queries_after = len(connection.queries)
-    paginated_count = len(list(paginated_exams))
+    paginated_count = len(paginated_exams)
     logger.info(f"[GET_EXAMS] 페이지네이션 쿼리: {pagination_queries_after - pagination_queries_before}개 쿼리, {pagination_time:.3f}초, 결과 개수: {paginated_count}")
     
     # ExamListSerializer를 사용하는 경우 사용자별 최신 결과 및 통계를 미리 조회
@@ -7183,125 +6795,25 @@ def get_exams(request):
     logger.debug(f"[GET_EXAMS] 사용자 권한: {user_role}, 인증 여부: {request.user.is_authenticated}, my_exams: {my_exams_param}, is_public: {is_public_param}")
     
     if select_fields and 'questions' not in select_fields and 'versions' not in select_fields and request.user.is_authenticated:
-        # 페이지네이션된 시험 ID를 가져와서 한 번에 조회
-        exam_ids = [str(exam.id) for exam in paginated_exams]
-        # 원본 시험 ID도 포함
-        original_exam_ids = [str(exam.original_exam_id) for exam in paginated_exams if not exam.is_original and exam.original_exam_id]
-        all_exam_ids = list(set([uuid.UUID(eid) for eid in exam_ids] + [uuid.UUID(eid) for eid in original_exam_ids if eid]))
-        
-        if all_exam_ids:
-            # 각 시험의 최신 결과를 한 번에 조회
-            # UUID 타입에는 Max()를 사용할 수 없으므로 completed_at 기준으로 정렬하여 최신 결과 선택
-            from django.db.models import Max
-            # completed_at이 최대인 결과를 찾기 위해 서브쿼리 사용
-            latest_completed_at_dict = {}
-            latest_completed_at_queryset = ExamResult.objects.filter(
-                exam_id__in=all_exam_ids,
-                user=request.user
-            ).values('exam_id').annotate(
-                latest_completed_at=Max('completed_at')
+        # 페이지네이션된 시험의 최신 결과와 통계를 한 번에 조회
+        if paginated_exams:
+            # 각 시험의 최신 결과를 한 번의 쿼리로 조회 (PostgreSQL: DISTINCT ON, 그 외: 윈도 함수)
+            # 복사된 시험에 결과가 없으면 원본 시험의 결과를 사용하며, 결과가 없는 시험은 None으로 표시되어
+            # 시리얼라이저의 fallback 쿼리를 방지함
+            from quiz.utils.exam_utils import get_latest_exam_results
+            user_latest_results_dict = get_latest_exam_results(
+                paginated_exams, user=request.user, fallback_to_original=True
             )
             
-            # exam_id -> latest_completed_at 딕셔너리 생성
-            for item in latest_completed_at_queryset:
-                latest_completed_at_dict[item['exam_id']] = item['latest_completed_at']
-            
-            # 각 exam_id별로 최신 completed_at에 해당하는 결과를 한 번에 조회
-            # 여러 결과가 같은 completed_at을 가질 수 있으므로, 추가로 id를 기준으로 정렬
-            latest_results = ExamResult.objects.none()  # 빈 queryset으로 초기화
-            if latest_completed_at_dict:
-                # Q 객체를 사용하여 모든 조건을 OR로 연결 (Q는 파일 상단에서 이미 import됨)
-                q_objects = Q()
-                for exam_id, latest_at in latest_completed_at_dict.items():
-                    q_objects |= Q(exam_id=exam_id, completed_at=latest_at)
-                
-                # 모든 최신 결과를 한 번에 가져오기 (completed_at 내림차순, id 내림차순)
-                latest_results = ExamResult.objects.filter(
-                    q_objects,
-                    user=request.user
-                ).select_related('exam').order_by('-completed_at', '-id')
-            
-            # 딕셔너리로 변환 (exam_id -> result, UUID를 문자열로 변환)
-            # 같은 exam_id에 대해 여러 결과가 있을 수 있으므로, completed_at이 최신인 것만 선택
-            for result in latest_results:
-                exam_id = str(result.exam_id)
-                # 같은 시험에 여러 결과가 있으면 가장 최신 것만 사용
-                if exam_id not in user_latest_results_dict:
-                    user_latest_results_dict[exam_id] = result
-                elif result.completed_at > user_latest_results_dict[exam_id].completed_at:
-                    user_latest_results_dict[exam_id] = result
-                elif result.completed_at == user_latest_results_dict[exam_id].completed_at:
-                    # completed_at이 같으면 id가 더 큰(최신) 것을 선택
-                    if result.id > user_latest_results_dict[exam_id].id:
-                        user_latest_results_dict[exam_id] = result
+            logger.debug(f"[GET_EXAMS] user_latest_results_dict 크기: {len(user_latest_results_dict)}개, exam_ids: {list(user_latest_results_dict.keys())[:5]}...")
             
-            # 페이지네이션된 모든 시험 ID를 딕셔너리에 추가 (결과가 없는 경우 None으로 표시)
-            # 이렇게 하면 fallback 쿼리를 방지할 수 있음
+            # 모든 시험의 사용자 진행 요약(UserExamProgress)을 한 번에 조회 (N+1 쿼리 방지)
+            # 복사된 시험은 원본 시험의 요약을 사용하며, 아래 메서드들은 미리 조회된 요약을 읽음
+            prefetch_user_exam_progress(paginated_exams, request.user)
             for exam in paginated_exams:
                 exam_id_str = str(exam.id)
-                if exam_id_str not in user_latest_results_dict:
-                    # 결과가 없는 시험도 딕셔너리에 추가 (None으로)
-                    user_latest_results_dict[exam_id_str] = None
-                # 복사된 시험의 경우 원본 시험 ID도 확인
-                if not exam.is_original and exam.original_exam_id:
-                    original_exam_id_str = str(exam.original_exam_id)
-                    if original_exam_id_str in user_latest_results_dict and exam_id_str not in user_latest_results_dict:
-                        # 원본 시험의 결과를 복사된 시험 ID로도 매핑
-                        user_latest_results_dict[exam_id_str] = user_latest_results_dict[original_exam_id_str]
-            
-            logger.debug(f"[GET_EXAMS] user_latest_results_dict 크기: {len(user_latest_results_dict)}개, exam_ids: {list(user_latest_results_dict.keys())[:5]}...")
-            
-            # 모든 시험의 통계를 한 번에 조회 (N+1 쿼리 방지)
-            # Count는 이미 상단에서 import됨
-            from ..models import ExamResultDetail
-            
-            # 각 시험별 정답 시도 수 계산
-            correct_counts = ExamResultDetail.objects.filter(
-                result__exam_id__in=all_exam_ids,
-                result__user=request.user,
-                is_correct=True
-            ).values('result__exam_id').annotate(
-                correct_count=Count('id')
-            )
-            
-            # 각 시험별 전체 시도 수 계산
-            total_counts = ExamResultDetail.objects.filter(
-                result__exam_id__in=all_exam_ids,
-                result__user=request.user
-            ).values('result__exam_id').annotate(
-                total_count=Count('id')
-            )
-            
-            # 딕셔너리로 변환
-            correct_counts_dict = {str(item['result__exam_id']): item['correct_count'] for item in correct_counts}
-            total_counts_dict = {str(item['result__exam_id']): item['total_count'] for item in total_counts}
-            
-            # 원본 시험 ID 매핑 생성 (복사된 시험 -> 원본 시험)
-            # 이미 가져온 exam_ids를 활용하여 매핑 생성 (추가 쿼리 방지)
-            exam_to_original = {}
-            copied_exams_for_mapping = base_queryset.filter(
-                is_original=False, 
-                original_exam_id__isnull=False
-            ).values_list('id', 'original_exam_id')
-            for exam_id, original_exam_id in copied_exams_for_mapping:
-                exam_to_original[str(exam_id)] = str(original_exam_id)
-            
-            # 각 시험의 통계 계산 (원본 시험 우선)
-            # ⚠️ 주의: total_count 변수명을 exam_total_count로 변경하여 페이지네이션의 total_count와 충돌 방지
-            for exam_id in all_exam_ids:
-                exam_id_str = str(exam_id)
-                # 복사된 시험인 경우 원본 시험 ID 사용
-                target_exam_id_str = exam_to_original.get(exam_id_str, exam_id_str)
-                
-                correct_count = correct_counts_dict.get(target_exam_id_str, 0)
-                exam_total_count = total_counts_dict.get(target_exam_id_str, 0)  # 변수명 변경: total_count -> exam_total_count
-                
-                user_correct_questions_dict[exam_id_str] = correct_count
-                
-                if exam_total_count > 0:
-                    user_accuracy_percentage_dict[exam_id_str] = (correct_count / exam_total_count) * 100
-                else:
-                    user_accuracy_percentage_dict[exam_id_str] = None
+                user_correct_questions_dict[exam_id_str] = exam.get_total_correct_questions_for_user(request.user)
+                user_accuracy_percentage_dict[exam_id_str] = exam.get_accuracy_percentage_for_user(request.user)
     
     # 시리얼라이저 선택 및 직렬화 (성능 측정)
     serializer_start = time.time()
@@ -7380,26 +6892,33 @@ def get_exams(request):
         logger.debug("[GET_EXAMS] 익명 사용자이므로 구독 정보 추가하지 않음")
     
     # total_pages 계산 (올림 처리)
-    # total_count가 0이면 total_pages도 0이어야 함
-    if total_count == 0:
+    # total_count가 0이면 total_pages도 0이어야 하고, 개수를 생략한 경우 None
+    if total_count is None:
+        total_pages = None
+    elif total_count == 0:
         total_pages = 0
     else:
         total_pages = (total_count + page_size - 1) // page_size
-    has_next = end_index < total_count
-    has_previous = page > 1
+    has_previous = bool(cursor) if use_cursor else page > 1
     
     logger.info(f"[GET_EXAMS] 페이지네이션 최종 정보: page={page}, total_count={total_count}, page_size={page_size}, total_pages={total_pages}, has_next={has_next}, has_previous={has_previous}, results_count={len(serializer_data)}")
     
+    pagination_data = {
+        'page': None if use_cursor else page,
+        'page_size': page_size,
+        'total_count': total_count,
+        'total_pages': total_pages,
+        'has_next': has_next,
+        'has_previous': has_previous
+    }
+    if use_cursor:
+        pagination_data['next_cursor'] = next_cursor
+    if count_mode != COUNT_MODE_EXACT:
+        pagination_data['count_mode'] = count_mode
+    
     response_data = {
         'results': serializer_data,
-        'pagination': {
-            'page': page,
-            'page_size': page_size,
-            'total_count': total_count,
-            'total_pages': total_pages,
-            'has_next': has_next,
-            'has_previous': has_previous
-        },
+        'pagination': pagination_data,
         'filters': {
             'is_public': is_public_param,
             'my_exams': my_exams_param,
@@ -7411,6 +6930,8 @@ def get_exams(request):
     
     # 캐시에 저장 (비동기 처리로 성능 개선)
     cache_start = time.time()
+    # 저장(비동기 포함)이 락을 해제하므로 get_exams에서 해제하지 않음
+    cache_state['stored'] = True
     try:
         # Celery 태스크로 비동기 저장
         from quiz.tasks import save_exam_list_cache
@@ -7505,6 +7026,36 @@ def save_random_practice_result(request):
             elapsed_seconds=elapsed_seconds
         )
 
+        # 문제별 결과가 전달된 경우 상세 저장 및 사용자별 문제 통계(UserQuestionStat) 갱신
+        # answers: [{'question_id': str, 'answer': str, 'is_correct': bool}, ...]
+        answers = request.data.get('answers') or []
+        if answers:
+            try:
+                answer_question_ids = []
+                for answer_data in answers:
+                    try:
+                        answer_question_ids.append(uuid.UUID(str(answer_data.get('question_id'))))
+                    except (TypeError, ValueError):
+                        answer_question_ids.append(None)
+                questions = Question.objects.in_bulk([qid for qid in answer_question_ids if qid])
+
+                stat_attempts = []
+                for question_id, answer_data in zip(answer_question_ids, answers):
+                    question = questions.get(question_id)
+                    if question is None:
+                        continue
+                    is_correct = bool(answer_data.get('is_correct', False))
+                    ExamResultDetail.objects.create(
+                        result=result,
+                        question=question,
+                        user_answer=answer_data.get('answer', ''),
+                        is_correct=is_correct
+                    )
+                    stat_attempts.append((question.id, is_correct))
+                record_question_attempts(request.user, exam, stat_attempts, attempted_at=result.completed_at)
+            except Exception as e:
+                logger.error(f"[RANDOM_PRACTICE] 문제별 결과 저장 실패: {e}")
+
         # 랜덤 연습 결과에 대한 StudyTaskProgress 업데이트
         if request.user.is_authenticated:
             try:
@@ -7558,6 +7109,7 @@ def check_answer(request):
         user_answer = request.data.get('user_answer', '').strip()
         correct_answer = request.data.get('correct_answer', '').strip()
         language = request.data.get('language', 'en')
+        question_id = request.data.get('question_id')  # 선택 - 판정 캐시 키에 사용
         
         if not user_answer or not correct_answer:
             return Response({
@@ -7565,7 +7117,7 @@ def check_answer(request):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         from quiz.utils.multilingual_utils import check_answer_with_ai
-        result = check_answer_with_ai(user_answer, correct_answer, language)
+        result = check_answer_with_ai(user_answer, correct_answer, language, question_id=question_id)
         
         return Response(result, status=status.HTTP_200_OK)
         
@@ -7578,68 +7130,9 @@ def check_answer(request):
 
 @api_view(['GET'])
 def download_exams_excel(request):
-    """시험 정보를 Excel 파일로 다운로드합니다."""
+    """시험 정보를 Excel(또는 ?export_format=csv) 파일로 다운로드합니다. (?async=1: 백그라운드 생성)"""
     try:
-        user_lang = get_user_language(request)
-        # 모든 시험 정보 조회
-        exams = Exam.objects.all().order_by('-created_at')
-
-        # Excel 파일 생성
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # 시험 기본 정보
-            exam_data = []
-            for exam in exams:
-                exam_data.append({
-                    '시험ID': exam.id,
-                    '시험제목': get_localized_field(exam, 'title', user_lang, 'Unknown'),
-                    '문제수': ExamQuestion.objects.filter(exam=exam).count(),
-                    '연결된파일': exam.file_name or '',
-                    '생성일': exam.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    '원본여부': '예' if exam.is_original else '아니오'
-                })
-
-            exam_df = pd.DataFrame(exam_data)
-            exam_df.to_excel(writer, sheet_name='시험목록', index=False)
-
-            # 시험별 문제 상세 정보
-            for exam in exams:
-                exam_questions = ExamQuestion.objects.filter(exam=exam).select_related('question').order_by('order')
-
-                question_data = []
-                for eq in exam_questions:
-                    question = eq.question
-                    question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                    question_data.append({
-                        '문제ID': question.id,
-                        '문제제목': question_title,
-                                        '문제내용': question.content_ko or question.content_en or '',
-                '정답': question.answer_ko or question.answer_en or '',
-                '설명': question.explanation_ko or question.explanation_en or '',
-                        '난이도': format_difficulty_for_excel(question.difficulty),
-                        'URL': question.url or '',
-                        '순서': eq.order
-                    })
-
-                if question_data:
-                    question_df = pd.DataFrame(question_data)
-                    # 시트명 생성 (안전한 방식)
-                    title = exam.title_ko or exam.title_en or "Unknown"
-                    sheet_name = f'시험{exam.id}_{title[:20]}'  # 시트명 길이 제한
-                    question_df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        output.seek(0)
-
-        # 파일명 생성
-        filename = 'exams.xlsx'
-
-        response = HttpResponse(
-            output.getvalue(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-        return response
+        return handle_export_request(request, 'exams', {'language': get_user_language(request)})
 
     except Exception as e:
         import traceback; traceback.print_exc()
@@ -7677,6 +7170,15 @@ def upload_exams_excel(request):
         if '시험목록' in excel_file.sheet_names:
             try:
                 exam_list_df = pd.read_excel(file, sheet_name='시험목록')
+                user_lang = get_user_language(request)
+
+                # 이미 있는 시험 제목을 한 번에 조회 (행마다 조회하지 않음)
+                exam_titles = [str(title) for title in exam_list_df.get('시험제목', pd.Series(dtype=object)).dropna()]
+                existing_titles = set()
+                for title_ko, title_en in Exam.objects.filter(
+                    Q(title_ko__in=exam_titles) | Q(title_en__in=exam_titles)
+                ).values_list('title_ko', 'title_en'):
+                    existing_titles.update([title_ko, title_en])
 
                 for index, row in exam_list_df.iterrows():
                     try:
@@ -7690,23 +7192,26 @@ def upload_exams_excel(request):
                             continue
 
                         # 기존 시험 확인 (제목으로)
-                        existing_exam = Exam.objects.filter(title=exam_title).first()
-                        if existing_exam:
+                        exam_title = str(exam_title)
+                        if exam_title in existing_titles:
                             stats['skipped'] += 1
                             continue
 
                         # 새 시험 생성
+                        has_file = file_name is not None and not pd.isna(file_name) and bool(file_name)
                         exam = Exam.objects.create(
-                            title=exam_title,
+                            **{f'title_{user_lang}': exam_title},
+                            created_language=user_lang,
                             is_original=True,
-                            file_name=file_name,
-                            total_questions=total_questions
+                            file_name=file_name if has_file else None,
+                            total_questions=int(total_questions) if pd.notna(total_questions) else 0
                         )
+                        existing_titles.add(exam_title)
                         stats['created'] += 1
                         stats['total_exams'] += 1
 
                         # 연결된 파일에서 문제 읽어와 시험에 연결
-                        if file_name and not pd.isna(file_name):
+                        if has_file:
                             try:
                                 file_path = os.path.join(QUESTION_FILES_DIR, file_name)
                                 if os.path.exists(file_path):
@@ -7724,41 +7229,36 @@ def upload_exams_excel(request):
                                         else:
                                             df = pd.read_excel(file_path, engine='xlrd')
 
+                                    # 제목이 같은 기존 문제를 한 번에 조회 (한국어와 영어 제목 모두, 최신 문제 우선)
+                                    question_titles = [str(title) for title in df.get('제목', pd.Series(dtype=object)).dropna() if title]
+                                    questions_by_title = {}
+                                    for question in Question.objects.filter(
+                                        Q(title_ko__in=question_titles) | Q(title_en__in=question_titles)
+                                    ):
+                                        for title in (question.title_ko, question.title_en):
+                                            if title:
+                                                questions_by_title.setdefault(title, question)
+
                                     # 문제 수만큼 문제 찾아서 시험에 연결
                                     questions_to_add = []
-                                    for _, q_row in df.iterrows():
-                                        try:
-                                            question_title = q_row.get('제목')
-                                            if pd.isna(question_title) or not question_title:
-                                                continue
-
-                                            # 기존 문제 확인 (한국어와 영어 제목 모두에서 검색)
-                                            question = Question.objects.filter(
-                                                models.Q(title_ko=question_title) | models.Q(title_en=question_title)
-                                            ).first()
-                                            if question:
-                                                questions_to_add.append(question)
-
-                                                # 문제 수에 도달하면 중단
-                                                if len(questions_to_add) >= total_questions:
-                                                    break
-
-                                        except Exception as e:
-                                            continue
-
-                                    # 시험에 문제 추가
+                                    for question_title in question_titles:
+                                        question = questions_by_title.get(question_title)
+                                        if question:
+                                            questions_to_add.append(question)
+
+                                            # 문제 수에 도달하면 중단
+                                            if pd.notna(total_questions) and len(questions_to_add) >= total_questions:
+                                                break
+
+                                    # 시험에 문제 추가 (일괄 저장 후 실제 연결된 문제 수로 total_questions 한 번만 업데이트)
+                                    importer = QuestionImporter(exam)
                                     for i, question in enumerate(questions_to_add):
-                                        if not ExamQuestion.objects.filter(exam=exam, question=question).exists():
-                                            ExamQuestion.objects.create(
-                                                exam=exam,
-                                                question=question,
-                                                order=i + 1
-                                            )
-
-                                    # 실제 연결된 문제 수로 total_questions 업데이트
-                                    actual_count = ExamQuestion.objects.filter(exam=exam).count()
-                                    exam.total_questions = actual_count
-                                    exam.save()
+                                        if not importer.is_linked(question):
+                                            importer.link(question, order=i + 1)
+                                    importer.finish()
+                                    for row_number, error in importer.errors:
+                                        stats['errors'] += 1
+                                        stats['error_details'].append(f'행 {index + 2}: 문제 연결 오류: {error}')
 
                                 else:
                                     stats['errors'] += 1
@@ -7866,26 +7366,21 @@ def move_questions(request):
 
         print(f"to_exam에 이미 존재하는 문제 수: {len(target_existing)}")
 
-        # 기존 문제들을 삭제 (덮어쓰기)
-        target_existing.delete()
-
-        # from_exam에서 제거
-        ExamQuestion.objects.filter(exam=from_exam, question_id__in=question_ids).delete()
+        # 삭제/추가마다 문제 수를 다시 세지 않고 두 시험의 총 문제 수를 마지막에 한 번만 업데이트
+        with deferred_signals():
+            # 기존 문제들을 삭제 (덮어쓰기)
+            target_existing.delete()
 
-        # to_exam에 추가 (order는 마지막+1로)
-        current_count = ExamQuestion.objects.filter(exam=to_exam).count()
-        for idx, qid in enumerate(question_ids):
-            ExamQuestion.objects.create(
-                exam=to_exam,
-                question_id=qid,
-                order=current_count + idx + 1
-            )
+            # from_exam에서 제거
+            ExamQuestion.objects.filter(exam=from_exam, question_id__in=question_ids).delete()
 
-        # 시험의 총 문제 수 업데이트
-        from_exam.total_questions = ExamQuestion.objects.filter(exam=from_exam).count()
-        to_exam.total_questions = ExamQuestion.objects.filter(exam=to_exam).count()
-        from_exam.save()
-        to_exam.save()
+            # to_exam에 추가 (order는 마지막+1로)
+            current_count = ExamQuestion.objects.filter(exam=to_exam).count()
+            ExamQuestion.objects.bulk_create([
+                ExamQuestion(exam=to_exam, question_id=qid, order=current_count + idx + 1)
+                for idx, qid in enumerate(question_ids)
+            ])
+            schedule_exam_question_count(from_exam.id, to_exam.id)
 
         return Response({'success': True}, status=status.HTTP_200_OK)
     except Exception as e:
@@ -7951,18 +7446,13 @@ def copy_questions(request):
         if existing_questions.exists():
             return Response({'error': '일부 문제가 이미 타겟 시험에 존재합니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # to_exam에 추가 (order는 마지막+1로)
+        # to_exam에 추가 (order는 마지막+1로) 후 시험의 총 문제 수 업데이트
         current_count = ExamQuestion.objects.filter(exam=to_exam).count()
-        for idx, qid in enumerate(question_ids):
-            ExamQuestion.objects.create(
-                exam=to_exam,
-                question_id=qid,
-                order=current_count + idx + 1
-            )
-
-        # 시험의 총 문제 수 업데이트
-        to_exam.total_questions = ExamQuestion.objects.filter(exam=to_exam).count()
-        to_exam.save()
+        ExamQuestion.objects.bulk_create([
+            ExamQuestion(exam=to_exam, question_id=qid, order=current_count + idx + 1)
+            for idx, qid in enumerate(question_ids)
+        ])
+        schedule_exam_question_count(to_exam.id)
 
         return Response({'success': True}, status=status.HTTP_200_OK)
     except Exception as e:
@@ -8045,15 +7535,12 @@ def delete_questions(request):
         if is_copy_exam and current_exam:
             print(f"[DELETE_QUESTIONS] 복사본 시험에서 문제 제거: 시험-문제 연결만 삭제")
             
-            # 현재 시험에서 선택된 문제들의 연결만 제거
-            removed_count = ExamQuestion.objects.filter(
-                exam=current_exam,
-                question_id__in=question_ids
-            ).delete()[0]
-            
-            # 시험의 총 문제 수 업데이트
-            current_exam.total_questions = ExamQuestion.objects.filter(exam=current_exam).count()
-            current_exam.save()
+            # 현재 시험에서 선택된 문제들의 연결만 제거 (시험의 총 문제 수는 마지막에 한 번만 업데이트)
+            with deferred_signals():
+                removed_count = ExamQuestion.objects.filter(
+                    exam=current_exam,
+                    question_id__in=question_ids
+                ).delete()[0]
             
             print(f"[DELETE_QUESTIONS] 복사본 시험에서 {removed_count}개 문제 연결 제거 완료")
             
@@ -8065,7 +7552,9 @@ def delete_questions(request):
         else:
             # 원본 시험이거나 시험 ID가 없는 경우: 문제를 실제로 삭제
             print(f"[DELETE_QUESTIONS] 원본 시험에서 문제 삭제: 문제 자체를 삭제")
-            deleted_count = Question.objects.filter(id__in=question_ids).delete()[0]
+            # 연결된 ExamQuestion이 함께 삭제되므로 시험별 문제 수는 마지막에 한 번만 업데이트
+            with deferred_signals():
+                deleted_count = Question.objects.filter(id__in=question_ids).delete()[0]
             
             return Response({
                 'message': f'{deleted_count}개의 문제가 삭제되었습니다.',
@@ -8673,108 +8162,41 @@ def get_or_create_daily_exam(request):
                             'error': 'home.dailyExam.noAccessibleExams'
                         }, status=status.HTTP_400_BAD_REQUEST)
                 
-                # 모든 시험에서 문제 수집
-                all_exam_questions = []
-                
-                for exam in accessible_exams:
-                    # 시험의 문제들 조회 (무시된 문제 제외)
-                    exam_questions = Question.objects.filter(
-                        examquestion__exam=exam
-                    ).distinct()
-                    
-                    # 무시된 문제 제외
-                    ignored_question_ids = set(
-                        IgnoredQuestion.objects.filter(user=user)
-                        .values_list('question_id', flat=True)
-                    )
-                    exam_questions = [q for q in exam_questions if q.id not in ignored_question_ids]
-                    
-                    if not exam_questions:
-                        continue
-                    
-                    # 문제 통계 조회
-                    for question in exam_questions:
-                        total_attempts = ExamResultDetail.objects.filter(
-                            question=question,
-                            result__user=user
-                        ).count()
-                        
-                        if total_attempts > 0:
-                            wrong_count = ExamResultDetail.objects.filter(
-                                question=question,
-                                result__user=user,
-                                is_correct=False
-                            ).count()
-                            wrong_rate = wrong_count / total_attempts
-                            score = wrong_rate + (1.0 / total_attempts)
-                        else:
-                            score = 1.0
-                        
-                        all_exam_questions.append({
-                            'question': question,
-                            'exam': exam,
-                            'score': score,
-                            'attempts': total_attempts,
-                            'wrong_count': wrong_count if total_attempts > 0 else 0
-                        })
+                # 모든 시험의 후보 문제 점수를 집합 기반으로 계산 (고정 쿼리 수)
+                from ..utils.recommendation_utils import score_candidate_questions, select_top_questions
+                candidates_by_exam = score_candidate_questions(
+                    user,
+                    exam_ids=list(accessible_exams.values_list('id', flat=True))
+                )
                 
-                # 시험별로 그룹화
-                exam_questions_map = {}
-                for item in all_exam_questions:
-                    exam_title = item['exam'].title
-                    if exam_title not in exam_questions_map:
-                        exam_questions_map[exam_title] = []
-                    exam_questions_map[exam_title].append(item)
+                # 같은 제목의 시험은 하나로 묶어 제목별 상위 questions_per_exam 개수만큼 선택 (부족하면 있는 만큼만)
+                selected_items = select_top_questions(candidates_by_exam, per_exam=questions_per_exam, title_field='title')
                 
-                # 각 시험에서 questions_per_exam 개수만큼 문제 선택 (부족하면 있는 만큼만)
                 all_questions = []
-                
-                # 시험별로 문제를 그룹화
-                exam_questions_map = {}
-                for item in all_exam_questions:
-                    exam_title = item['exam'].title
-                    if exam_title not in exam_questions_map:
-                        exam_questions_map[exam_title] = []
-                    exam_questions_map[exam_title].append(item)
-                
-                # 각 시험에서 상위 questions_per_exam 개수만큼 선택
-                total_selected = 0
-                for exam_title, exam_questions in exam_questions_map.items():
-                    # 해당 시험의 문제들을 점수 순으로 정렬
-                    sorted_exam_questions = sorted(exam_questions, key=lambda x: x['score'], reverse=True)
-                    
-                    # 상위 questions_per_exam 개수만큼 선택 (부족하면 있는 만큼만)
-                    available_count = min(questions_per_exam, len(sorted_exam_questions))
-                    selected_from_exam = sorted_exam_questions[:available_count]
+                user_lang = get_user_language(request)
+                for item in selected_items:
+                    question = item['question']
+                    exam = item['exam']
                     
-                    print(f"[DAILY_EXAM] 시험 '{exam_title}'에서 {len(selected_from_exam)}개 문제 선택 (요청: {questions_per_exam}개, 가용: {len(sorted_exam_questions)}개)")
+                    # group_id에 소스 시험 이름 설정
+                    # 단, 사용자가 이미 설정한 group_id가 있으면 보존 (빈 문자열이 아닌 경우)
+                    if not question.group_id or question.group_id.strip() == '':
+                        question.group_id = get_localized_field(exam, 'title', user_lang, 'Unknown')
+                        question.save(update_fields=['group_id'])
                     
-                    user_lang = get_user_language(request)
-                    for item in selected_from_exam:
-                        question = item['question']
-                        exam = item['exam']
-                        
-                        # group_id에 소스 시험 이름 설정
-                        # 단, 사용자가 이미 설정한 group_id가 있으면 보존 (빈 문자열이 아닌 경우)
-                        if not question.group_id or question.group_id.strip() == '':
-                            question.group_id = get_localized_field(exam, 'title', user_lang, 'Unknown')
-                            question.save()
-                        
-                        question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
-                        exam_title = get_localized_field(exam, 'title', user_lang, 'Unknown')
-                        all_questions.append({
-                            'id': question.id,
-                            'title': question_title,
-                            'source_exam': exam_title,
-                            'group_id': exam_title,
-                            'score': item['score'],
-                            'attempts': item['attempts'],
-                            'wrong_count': item['wrong_count']
-                        })
-                    
-                    total_selected += len(selected_from_exam)
+                    question_title = get_localized_field(question, 'title', user_lang, '제목 없음')
+                    exam_title = get_localized_field(exam, 'title', user_lang, 'Unknown')
+                    all_questions.append({
+                        'id': question.id,
+                        'title': question_title,
+                        'source_exam': exam_title,
+                        'group_id': exam_title,
+                        'score': item['score'],
+                        'attempts': item['attempts'],
+                        'wrong_count': item['wrong_count']
+                    })
                 
-                print(f"[DAILY_EXAM] 총 {total_selected}개 문제 선택 완료")
+                logger.info(f"[DAILY_EXAM] 총 {len(selected_items)}개 문제 선택 완료")
                 
                 # 중복 제거
                 unique_questions = []
@@ -8842,14 +8264,11 @@ def get_or_create_daily_exam(request):
                 )
                 print(f"[DAILY_EXAM] 시험 생성 완료: id={exam.id}, created_by={exam.created_by}, created_at={exam.created_at}")
                 
-                # 시험에 문제 추가
-                for i, question_data in enumerate(unique_questions):
-                    question = Question.objects.get(id=question_data['id'])
-                    ExamQuestion.objects.create(
-                        exam=exam,
-                        question=question,
-                        order=i + 1
-                    )
+                # 시험에 문제 추가 (일괄 생성, total_questions는 시험 생성 시 설정됨)
+                ExamQuestion.objects.bulk_create([
+                    ExamQuestion(exam=exam, question_id=question_data['id'], order=i + 1)
+                    for i, question_data in enumerate(unique_questions)
+                ])
                 
                 # 시험 관련 캐시 무효화
                 try:
@@ -39,6 +39,9 @@ from django.utils import timezone
 from io import BytesIO
 from ..models import Question, Exam, ExamResult, ExamResultDetail, Study, StudyTask, Member, ExamQuestion, QuestionMemberMapping, UserProfile, StudyTaskProgress, StudyProgressRecord, IgnoredQuestion
 from ..utils.multilingual_utils import get_localized_field, get_user_language
+from ..utils.stats_utils import refresh_user_question_stats
+from ..utils.question_import_utils import QuestionImporter, iter_row_chunks
+from ..utils.translation_queue import queue_missing_question_translations
 from ..serializers import (
     QuestionSerializer, ExamSerializer, ExamResultSerializer, ExamResultDetailSerializer,
     CreateExamSerializer, SubmitExamSerializer, StudySerializer, StudyTaskSerializer, StudyTaskUpdateSerializer,
@@ -540,200 +543,138 @@ def upload_questions(request):
             update_mode = False
             print(f"[upload_questions] 같은 파일명 + 제목의 기존 문제 없음 - 신규 생성 모드")
         
-        # 실제 문제 생성
-        for index, row in df.iterrows():
-            # 이미 검증된 데이터만 처리
-            title = str(row[actual_columns['제목']]).strip()
-            content = str(row[actual_columns['문제 내용']]).strip()
-            answer = str(row[actual_columns['정답']]).strip()
-            csv_id = str(row[actual_columns['문제id']]).strip()
-            
-            # 필수 필드 재검증
-            if not title or title.lower() in ['nan', 'none', '']:
-                continue
-            if not content or content.lower() in ['nan', 'none', '']:
-                continue
-            if not answer or answer.lower() in ['nan', 'none', '']:
-                continue
-            
-            # 중복 재검증
-            data_key = (csv_id, title, content, answer)
-            if data_key not in unique_data:
-                continue
-            
-            print(f"처리 중인 행 {index + 1}: {title[:50]}...")
-            
-            # csv_id 설정 (엑셀의 문제 순서 번호)
-            csv_id = str(row[actual_columns['문제id']]).strip()
-            
-            # source_id 설정 (엑셀 파일명으로 출처 기록)
-            source_id = file.name
-            
-            # 기본 필드들 (csv_id와 source_id만 설정, content/answer는 다국어 필드로 직접 설정)
-            defaults = {
-                'csv_id': csv_id,      # 엑셀의 문제 순서 번호
-                'source_id': source_id # 엑셀 파일명 (출처 식별용)
-            }
-            
-            # 선택적 필드들 (CSV에 있는 경우에만)
-            explanation = None
-            if '설명' in actual_columns:
-                explanation = str(row[actual_columns['설명']]).strip()
-                if explanation and explanation.lower() not in ['nan', 'none', '']:
-                    # explanation은 다국어 필드로 직접 설정하므로 defaults에 추가하지 않음
-                    pass
-            if '난이도' in actual_columns:
-                difficulty_value = row[actual_columns['난이도']]
-                if pd.notna(difficulty_value) and str(difficulty_value).strip() not in ['nan', 'none', '']:
-                    print(f"  -> 난이도 값: {difficulty_value} (타입: {type(difficulty_value)})")
-                    defaults['difficulty'] = str(difficulty_value).strip()
-            if 'URL' in actual_columns:
-                url = str(row[actual_columns['URL']]).strip()
-                if url and url.lower() not in ['nan', 'none', '']:
-                    defaults['url'] = url
-            if 'Group ID' in actual_columns:
-                group_id = str(row[actual_columns['Group ID']]).strip()
-                if group_id and group_id.lower() not in ['nan', 'none', '']:
-                    defaults['group_id'] = group_id
-            
-            try:
-                # 기존 문제가 있는지 확인 (업데이트 모드)
-                if update_mode and title in existing_map:
-                    # 기존 문제 업데이트
-                    question = existing_map[title]
-                    # 백업용 title 필드는 더 이상 사용하지 않음
-                    # question.title = title  # 제거 예정
-                    # 다국어 필드 사용 (기존 필드는 제거 예정)
-                    question.content_ko = content
-                    question.answer_ko = answer
-                    if explanation:
-                        question.explanation_ko = explanation
-                    if 'difficulty' in defaults:
-                        question.difficulty = defaults['difficulty']
-                    if 'url' in defaults:
-                        question.url = defaults['url']
-                    if 'group_id' in defaults:
-                        question.group_id = defaults['group_id']
-                    
-                    # =============================================================================
-                    # 🎯 다국어 필드 업데이트 - 사용자 프로필 언어 기반
-                    # =============================================================================
-                    # 중요: 무조건 사용자의 프로필 언어를 기준으로 모든 처리가 이루어져야 함
-                    # - 영어 사용자: title_en, content_en, answer_en, explanation_en 필드에 저장
-                    # - 한국어 사용자: title_ko, content_ko, answer_ko, explanation_ko 필드에 저장
-                    # - created_language, is_ko_complete, is_en_complete 자동 설정
-                    # =============================================================================
-                    
-                    # 사용자 프로필 언어 확인 (기본값: ko)
-                    from quiz.utils.multilingual_utils import BASE_LANGUAGE
-                    user_language = BASE_LANGUAGE
-                    try:
-                        if hasattr(request.user, 'userprofile'):
-                            user_language = request.user.userprofile.language
-                        elif hasattr(request.user, 'profile'):
-                            user_language = request.user.profile.language
-                        logger.info(f"[upload_questions] 사용자 언어 감지: {request.user.username} -> {user_language}")
-                    except Exception as e:
-                        logger.warning(f"[upload_questions] 사용자 언어 감지 실패: {e}, 기본값 'en' 사용")
+        # =============================================================================
+        # 🎯 다국어 필드 설정 - 사용자 프로필 언어 기반
+        # =============================================================================
+        # 중요: 무조건 사용자의 프로필 언어를 기준으로 모든 처리가 이루어져야 함
+        # - 영어 사용자: title_en, content_en, answer_en, explanation_en 필드에 저장
+        # - 한국어 사용자: title_ko, content_ko, answer_ko, explanation_ko 필드에 저장
+        # - created_language, is_ko_complete, is_en_complete 자동 설정
+        # =============================================================================
+        
+        # 사용자 프로필 언어 확인 (기본값: ko)
+        from quiz.utils.multilingual_utils import BASE_LANGUAGE
+        user_language = BASE_LANGUAGE
+        try:
+            if hasattr(request.user, 'userprofile'):
+                user_language = request.user.userprofile.language
+            elif hasattr(request.user, 'profile'):
+                user_language = request.user.profile.language
+            logger.info(f"[upload_questions] 사용자 언어 감지: {request.user.username} -> {user_language}")
+        except Exception as e:
+            logger.warning(f"[upload_questions] 사용자 언어 감지 실패: {e}, 기본값 'en' 사용")
+        
+        # Question 모델에 해당 언어 필드가 없으면 BASE_LANGUAGE로 폴백
+        if not hasattr(Question, f'title_{user_language}'):
+            user_language = BASE_LANGUAGE
+        
+        # 실제 문제 생성 (청크 단위 일괄 저장)
+        importer = QuestionImporter()
+        for chunk in iter_row_chunks(df):
+            for index, row in chunk:
+                # 이미 검증된 데이터만 처리
+                title = str(row[actual_columns['제목']]).strip()
+                content = str(row[actual_columns['문제 내용']]).strip()
+                answer = str(row[actual_columns['정답']]).strip()
+                csv_id = str(row[actual_columns['문제id']]).strip()
+                
+                # 필수 필드 재검증
+                if not title or title.lower() in ['nan', 'none', '']:
+                    continue
+                if not content or content.lower() in ['nan', 'none', '']:
+                    continue
+                if not answer or answer.lower() in ['nan', 'none', '']:
+                    continue
+                
+                # 중복 재검증
+                data_key = (csv_id, title, content, answer)
+                if data_key not in unique_data:
+                    continue
+                
+                # source_id 설정 (엑셀 파일명으로 출처 기록)
+                source_id = file.name
+                
+                # 기본 필드들 (csv_id와 source_id만 설정, content/answer는 다국어 필드로 직접 설정)
+                defaults = {
+                    'csv_id': csv_id,      # 엑셀의 문제 순서 번호
+                    'source_id': source_id # 엑셀 파일명 (출처 식별용)
+                }
+                
+                # 선택적 필드들 (CSV에 있는 경우에만)
+                explanation = None
+                if '설명' in actual_columns:
+                    explanation = str(row[actual_columns['설명']]).strip()
+                if '난이도' in actual_columns:
+                    difficulty_value = row[actual_columns['난이도']]
+                    if pd.notna(difficulty_value) and str(difficulty_value).strip() not in ['nan', 'none', '']:
+                        defaults['difficulty'] = str(difficulty_value).strip()
+                if 'URL' in actual_columns:
+                    url = str(row[actual_columns['URL']]).strip()
+                    if url and url.lower() not in ['nan', 'none', '']:
+                        defaults['url'] = url
+                if 'Group ID' in actual_columns:
+                    group_id = str(row[actual_columns['Group ID']]).strip()
+                    if group_id and group_id.lower() not in ['nan', 'none', '']:
+                        defaults['group_id'] = group_id
+                
+                try:
+                    # 기존 문제가 있는지 확인 (업데이트 모드)
+                    if update_mode and title in existing_map:
+                        # 기존 문제 업데이트
+                        question = existing_map[title]
+                        question.content_ko = content
+                        question.answer_ko = answer
+                        if explanation:
+                            question.explanation_ko = explanation
+                        if 'difficulty' in defaults:
+                            question.difficulty = defaults['difficulty']
+                        if 'url' in defaults:
+                            question.url = defaults['url']
+                        if 'group_id' in defaults:
+                            question.group_id = defaults['group_id']
+                    else:
+                        # 새로운 문제 생성
+                        question = Question(**defaults)
                     
                     # 사용자 언어에 맞는 필드에 동적으로 저장
-                    # Question 모델에 해당 언어 필드가 있는지 확인
-                    title_field = f'title_{user_language}'
-                    if not hasattr(question, title_field):
-                        # 필드가 없으면 BASE_LANGUAGE로 폴백
-                        user_language = BASE_LANGUAGE
-                    
-                    # 동적으로 필드 설정
                     setattr(question, f'title_{user_language}', title)
                     setattr(question, f'content_{user_language}', content)
                     setattr(question, f'answer_{user_language}', answer)
                     if explanation:
                         setattr(question, f'explanation_{user_language}', explanation)
-                    
-                    # 완성도 필드 업데이트 (동적으로 처리)
-                    # Question 모델에 존재하는 모든 완성도 필드를 동적으로 확인
-                    completion_field_name = f'is_{user_language}_complete'
-                    if hasattr(question, completion_field_name):
-                        setattr(question, completion_field_name, True)
-                    
                     question.created_language = user_language
-                    question.save()
-                    
-                    print(f"  -> 기존 문제 업데이트됨: {title[:30]}")
-                    updated_count += 1
-                else:
-                    # 새로운 문제 생성
-                    # 백업용 title 필드는 더 이상 사용하지 않음
-                    # question = Question.objects.create(title=title, **defaults)  # 제거 예정
-                    question = Question.objects.create(**defaults)
-                    
-                    # =============================================================================
-                    # 🎯 다국어 필드 설정 - 사용자 프로필 언어 기반
-                    # =============================================================================
-                    # 중요: 무조건 사용자의 프로필 언어를 기준으로 모든 처리가 이루어져야 함
-                    # - 영어 사용자: title_en, content_en, answer_en, explanation_en 필드에 저장
-                    # - 한국어 사용자: title_ko, content_ko, answer_ko, explanation_ko 필드에 저장
-                    # - created_language, is_ko_complete, is_en_complete 자동 설정
-                    # =============================================================================
-                    
-                    # 사용자 프로필 언어 확인 (기본값: ko)
-                    from quiz.utils.multilingual_utils import BASE_LANGUAGE
-                    user_language = BASE_LANGUAGE
-                    try:
-                        if hasattr(request.user, 'userprofile'):
-                            user_language = request.user.userprofile.language
-                        elif hasattr(request.user, 'profile'):
-                            user_language = request.user.profile.language
-                        logger.info(f"[upload_questions] 사용자 언어 감지: {request.user.username} -> {user_language}")
-                    except Exception as e:
-                        logger.warning(f"[upload_questions] 사용자 언어 감지 실패: {e}, 기본값 'en' 사용")
-                    
-                    # 사용자 언어에 맞는 필드에 동적으로 저장
-                    # Question 모델에 해당 언어 필드가 있는지 확인
-                    title_field = f'title_{user_language}'
-                    if not hasattr(question, title_field):
-                        # 필드가 없으면 BASE_LANGUAGE로 폴백
-                        user_language = BASE_LANGUAGE
-                    
-                    # 동적으로 필드 설정
-                    setattr(question, f'title_{user_language}', title)
-                    setattr(question, f'content_{user_language}', content)
-                    setattr(question, f'answer_{user_language}', answer)
-                    if explanation:
-                        setattr(question, f'explanation_{user_language}', explanation)
                     
-                    # 완성도 필드 업데이트 (동적으로 처리)
-                    # Question 모델에 존재하는 모든 완성도 필드를 동적으로 확인
-                    completion_field_name = f'is_{user_language}_complete'
-                    if hasattr(question, completion_field_name):
-                        setattr(question, completion_field_name, True)
+                    if update_mode and title in existing_map:
+                        importer.update(question, row_number=index + 1)
+                    else:
+                        importer.create(question, row_number=index + 1)
                     
-                    question.created_language = user_language
-                    question.save()
+                    # unique_data에서 처리된 항목 제거 (중복 방지)
+                    unique_data.discard(data_key)
                     
-                    print(f"  -> 새 문제 생성됨: {title[:30]}")
-                    created_count += 1
-                
-                # 문제 생성/업데이트 후 자동 번역 처리 (content는 선택지이므로 번역 제외)
-                try:
-                    from ..utils.multilingual_utils import MultilingualContentManager
-                    # 번역 처리 (title, answer, explanation 필드만 번역, content는 제외)
-                    # 생성/업데이트 시에는 완성도 상태 업데이트 필요 (skip_completion_update=False, 기본값)
-                    manager = MultilingualContentManager(question, request.user, ['title', 'answer', 'explanation'])
-                    manager.handle_multilingual_update()
-                    # 번역 후 문제 다시 조회
-                    question.refresh_from_db()
-                    logger.info(f"[UPLOAD_QUESTIONS] 문제 {question.id} 자동 번역 완료 (content 제외)")
                 except Exception as e:
-                    logger.warning(f"[UPLOAD_QUESTIONS] 문제 {question.id} 자동 번역 실패: {str(e)}")
-                
-                # unique_data에서 처리된 항목 제거 (중복 방지)
-                unique_data.discard(data_key)
-                
-            except Exception as e:
-                failed_count += 1
-                print(f"  -> 행 {index + 1} 처리 중 오류: {e}")
-                continue
+                    importer.record_error(index + 1, str(e))
+                    continue
+            
+            importer.flush()
+        
+        importer.finish()
+        created_count = importer.created_count
+        updated_count = importer.updated_count
+        failed_count += len(importer.errors)
+        for row_number, error in importer.errors:
+            print(f"  -> 행 {row_number} 처리 중 오류: {error}")
+        
+        # 문제 생성/업데이트 후 자동 번역은 백그라운드 번역 큐로 전송 (행마다 동기 번역하지 않음)
+        # content는 선택지이므로 번역 제외
+        try:
+            queue_missing_question_translations(
+                importer.created_questions + importer.updated_questions,
+                request.user,
+                fields=['title', 'answer', 'explanation'],
+            )
+        except Exception as e:
+            logger.warning(f"[UPLOAD_QUESTIONS] 자동 번역 요청 실패: {str(e)}")
         
         print(f"[upload_questions] 처리 결과 요약:")
         print(f"  - 총 행 수: {total_rows}개")
@@ -829,7 +770,8 @@ def upload_questions(request):
             'file_question_count': question_count,
             'created_count': created_count,
             'skipped_count': skipped_count,
-            'failed_count': failed_count
+            'failed_count': failed_count,
+            'error_details': [f'행 {row_number}: {error}' for row_number, error in importer.errors]
         })
     
     except Exception as e:
@@ -847,6 +789,58 @@ def get_questions(request):
     return Response(serializer.data)
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_question_translation_status(request):
+    """
+    시험 조회 시 백그라운드로 요청된 문제 번역의 진행 상태를 조회합니다.
+
+    Query params:
+        ids: 쉼표로 구분된 문제 ID 목록 (최대 200개)
+        lang: 번역 대상 언어 (기본값: BASE_LANGUAGE)
+
+    번역이 끝난 문제(pending=False)는 대상 언어 필드와 완성도를 함께 반환한다.
+    """
+    from quiz.utils.multilingual_utils import BASE_LANGUAGE, SUPPORTED_LANGUAGES
+    from quiz.utils.translation_queue import QUESTION_TRANSLATION_FIELDS, get_pending_question_ids
+
+    question_ids = [question_id.strip() for question_id in request.GET.get('ids', '').split(',') if question_id.strip()]
+    if not question_ids:
+        return Response({'error': 'ids 파라미터가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(question_ids) > 200:
+        return Response({'error': '한 번에 최대 200개 문제까지 조회할 수 있습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    language = request.GET.get('lang', BASE_LANGUAGE)
+    if language not in SUPPORTED_LANGUAGES:
+        return Response({'error': f'지원하지 않는 언어입니다: {language}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        uuid_ids = [uuid.UUID(question_id) for question_id in question_ids]
+    except ValueError:
+        return Response({'error': '잘못된 문제 ID 형식입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    pending_ids = get_pending_question_ids(question_ids, language)
+    translated_fields = [f'{field_name}_{language}' for field_name in QUESTION_TRANSLATION_FIELDS]
+    completion_field = f'is_{language}_complete'
+    questions = Question.objects.filter(id__in=uuid_ids).only('id', completion_field, *translated_fields)
+
+    results = []
+    for question in questions:
+        pending = str(question.id) in pending_ids
+        item = {'id': question.id, 'pending': pending}
+        if not pending:
+            for field_name in translated_fields:
+                item[field_name] = getattr(question, field_name)
+            item[completion_field] = getattr(question, completion_field, False)
+        results.append(item)
+
+    return Response({
+        'language': language,
+        'pending_count': len(pending_ids),
+        'results': results
+    })
+
+
 @api_view(['GET'])
 def get_question_statistics_by_title(request, title):
     """제목 기반으로 문제 통계를 취합하여 반환합니다."""
@@ -1335,6 +1329,14 @@ def delete_question_results(request):
         
         print(f"총 삭제된 답안 수: {deleted_count}")
         
+        # 사용자별 문제 통계(UserQuestionStat) 재계산
+        if current_user.is_authenticated:
+            refresh_user_question_stats(
+                [current_user.id],
+                exam_ids=[exam_id],
+                question_ids=None if delete_all else question_uuids
+            )
+        
         # ========================================
         # 🔄 REDIS 캐시 무효화 (중요!)
         # ========================================
@@ -1438,6 +1440,7 @@ def delete_question_results_global(request):
         
         # 현재 사용자의 해당 문제들의 모든 풀이 결과 삭제
         deleted_count = 0
+        deleted_question_ids = []
         
         for question_id in question_uuids:
             # 해당 문제의 제목 찾기
@@ -1462,6 +1465,7 @@ def delete_question_results_global(request):
                 
                 # 같은 제목의 모든 문제에 대한 풀이 결과 삭제
                 for same_question in same_title_questions:
+                    deleted_question_ids.append(same_question.id)
                     details_to_delete = ExamResultDetail.objects.filter(
                         question=same_question,
                         result__user=current_user
@@ -1489,6 +1493,10 @@ def delete_question_results_global(request):
         
         print(f"총 삭제된 답안 수: {deleted_count}")
         
+        # 사용자별 문제 통계(UserQuestionStat) 재계산
+        if current_user.is_authenticated and deleted_question_ids:
+            refresh_user_question_stats([current_user.id], question_ids=deleted_question_ids)
+        
         # 캐시 무효화 (ExamCacheManager 사용)
         try:
             from ..utils.cache_utils import ExamCacheManager
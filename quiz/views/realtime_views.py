@@ -17,6 +17,7 @@ from django.conf import settings
 from django.core.cache import cache
 from ..models import Exam, Question
 from ..utils.multilingual_utils import get_user_language
+from ..utils.cache_utils import TwoTierCache
 
 # Gemini 지원 확인
 try:
@@ -49,18 +50,11 @@ def load_mandatory_rules():
         logger.error(f"❌ 필수 프롬프트 YAML 파일 로드 실패: {e}", exc_info=True)
         return None
 
-# 필수 프롬프트 캐싱 (성능 최적화)
-_mandatory_rules_cache = None
-_exam_context_template_cache = None
-_interview_prompt_template_cache = None
-_evaluation_guideline_template_cache = None
+# 프롬프트 템플릿 캐싱 (성능 최적화): 워커 프로세스 메모리에 보관하고 주기적으로 다시 읽음
+PROMPT_TEMPLATE_CACHE_TIMEOUT = 300  # 5분
 
-def load_exam_context_template():
+def _read_exam_context_template():
     """ai/prompts/exam_context_template.yaml 파일을 로드합니다."""
-    global _exam_context_template_cache
-    if _exam_context_template_cache is not None:
-        return _exam_context_template_cache
-    
     try:
         base_dir = settings.BASE_DIR
         yaml_path = os.path.join(base_dir, 'ai', 'prompts', 'exam_context_template.yaml')
@@ -68,48 +62,48 @@ def load_exam_context_template():
         if not os.path.exists(yaml_path):
             logger.warning(f"⚠️ 시험 컨텍스트 템플릿 YAML 파일을 찾을 수 없습니다: {yaml_path}")
             from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
-            _exam_context_template_cache = {lang: {'template': ''} for lang in SUPPORTED_LANGUAGES}
-            return _exam_context_template_cache
+            return {lang: {'template': ''} for lang in SUPPORTED_LANGUAGES}
         
         with open(yaml_path, 'r', encoding='utf-8') as f:
             templates = yaml.safe_load(f)
         
         from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
         default_templates = {lang: {'template': ''} for lang in SUPPORTED_LANGUAGES}
-        _exam_context_template_cache = templates or default_templates
+        templates_data = templates or default_templates
         logger.info(f"✅ 시험 컨텍스트 템플릿 YAML 파일 로드 성공: {yaml_path}")
-        return _exam_context_template_cache
+        return templates_data
     except Exception as e:
         logger.error(f"❌ 시험 컨텍스트 템플릿 YAML 파일 로드 실패: {e}", exc_info=True)
         from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
-        _exam_context_template_cache = {lang: {'template': ''} for lang in SUPPORTED_LANGUAGES}
-        return _exam_context_template_cache
+        return {lang: {'template': ''} for lang in SUPPORTED_LANGUAGES}
 
-def load_interview_prompt_template():
+def load_exam_context_template():
+    """ai/prompts/exam_context_template.yaml 템플릿을 반환합니다. (프로세스 내 캐시, PROMPT_TEMPLATE_CACHE_TIMEOUT마다 다시 로드)"""
+    return TwoTierCache.get_or_set(
+        'prompt_template:exam_context_template', _read_exam_context_template,
+        local_timeout=PROMPT_TEMPLATE_CACHE_TIMEOUT, local_only=True
+    )
+
+def _read_interview_prompt_template():
     """ai/prompts/interview_prompt_template.yaml 파일을 로드합니다."""
-    global _interview_prompt_template_cache
-    if _interview_prompt_template_cache is not None:
-        return _interview_prompt_template_cache
-    
     try:
         base_dir = settings.BASE_DIR
         yaml_path = os.path.join(base_dir, 'ai', 'prompts', 'interview_prompt_template.yaml')
         
         if not os.path.exists(yaml_path):
             logger.warning(f"⚠️ 인터뷰 프롬프트 템플릿 YAML 파일을 찾을 수 없습니다: {yaml_path}")
-            _interview_prompt_template_cache = {
+            return {
                 'ko': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
                 'en': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
                 'es': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
                 'zh': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
                 'ja': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''}
             }
-            return _interview_prompt_template_cache
         
         with open(yaml_path, 'r', encoding='utf-8') as f:
             templates = yaml.safe_load(f)
         
-        _interview_prompt_template_cache = templates or {
+        templates_data = templates or {
             'ko': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'en': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'es': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
@@ -117,29 +111,35 @@ def load_interview_prompt_template():
             'ja': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''}
         }
         logger.info(f"✅ 인터뷰 프롬프트 템플릿 YAML 파일 로드 성공: {yaml_path}")
-        return _interview_prompt_template_cache
+        return templates_data
     except Exception as e:
         logger.error(f"❌ 인터뷰 프롬프트 템플릿 YAML 파일 로드 실패: {e}", exc_info=True)
-        _interview_prompt_template_cache = {
+        return {
             'ko': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'en': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'es': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'zh': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''},
             'ja': {'base_template': '', 'question_restriction': '', 'mandatory_rules_marker': ''}
         }
-        return _interview_prompt_template_cache
+
+def load_interview_prompt_template():
+    """ai/prompts/interview_prompt_template.yaml 템플릿을 반환합니다. (프로세스 내 캐시, PROMPT_TEMPLATE_CACHE_TIMEOUT마다 다시 로드)"""
+    return TwoTierCache.get_or_set(
+        'prompt_template:interview_prompt_template', _read_interview_prompt_template,
+        local_timeout=PROMPT_TEMPLATE_CACHE_TIMEOUT, local_only=True
+    )
 
 def get_mandatory_rules(language=None):
     from quiz.utils.multilingual_utils import BASE_LANGUAGE
     if language is None:
         language = BASE_LANGUAGE
     """언어별 필수 프롬프트를 반환합니다."""
-    global _mandatory_rules_cache
-    
-    if _mandatory_rules_cache is None:
-        _mandatory_rules_cache = load_mandatory_rules()
+    mandatory_rules = TwoTierCache.get_or_set(
+        'prompt_template:mandatory_rules', load_mandatory_rules,
+        local_timeout=PROMPT_TEMPLATE_CACHE_TIMEOUT, local_only=True
+    )
     
-    if _mandatory_rules_cache is None:
+    if mandatory_rules is None:
         # YAML 파일 로드 실패 시 기본값 반환
         logger.warning("⚠️ YAML 파일 로드 실패, 기본 프롬프트 사용")
         return {
@@ -149,7 +149,7 @@ def get_mandatory_rules(language=None):
     
     from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES, LANGUAGE_EN
     lang_key = language if language in SUPPORTED_LANGUAGES else LANGUAGE_EN
-    return _mandatory_rules_cache.get(lang_key, {
+    return mandatory_rules.get(lang_key, {
         'language_instruction': '',
         'mandatory_prompts': ''
     })
@@ -715,12 +715,8 @@ def _get_websocket_url(session_id, client_secret, use_proxy=True):
     
     return websocket_url
 
-def load_evaluation_guideline_template():
+def _read_evaluation_guideline_template():
     """ai/prompts/evaluation_guideline_template.yaml 파일을 로드합니다."""
-    global _evaluation_guideline_template_cache
-    if _evaluation_guideline_template_cache is not None:
-        return _evaluation_guideline_template_cache
-    
     try:
         base_dir = settings.BASE_DIR
         yaml_path = os.path.join(base_dir, 'ai', 'prompts', 'evaluation_guideline_template.yaml')
@@ -728,22 +724,27 @@ def load_evaluation_guideline_template():
         if not os.path.exists(yaml_path):
             logger.warning(f"⚠️ 평가 가이드라인 템플릿 YAML 파일을 찾을 수 없습니다: {yaml_path}")
             from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
-            _evaluation_guideline_template_cache = {lang: {'lenient': '', 'moderate': '', 'strict': ''} for lang in SUPPORTED_LANGUAGES}
-            return _evaluation_guideline_template_cache
+            return {lang: {'lenient': '', 'moderate': '', 'strict': ''} for lang in SUPPORTED_LANGUAGES}
         
         with open(yaml_path, 'r', encoding='utf-8') as f:
             templates = yaml.safe_load(f)
         
         from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
         default_templates = {lang: {'lenient': '', 'moderate': '', 'strict': ''} for lang in SUPPORTED_LANGUAGES}
-        _evaluation_guideline_template_cache = templates or default_templates
+        templates_data = templates or default_templates
         logger.info(f"✅ 평가 가이드라인 템플릿 YAML 파일 로드 성공: {yaml_path}")
-        return _evaluation_guideline_template_cache
+        return templates_data
     except Exception as e:
         logger.error(f"❌ 평가 가이드라인 템플릿 YAML 파일 로드 실패: {e}", exc_info=True)
         from quiz.utils.multilingual_utils import SUPPORTED_LANGUAGES
-        _evaluation_guideline_template_cache = {lang: {'lenient': '', 'moderate': '', 'strict': ''} for lang in SUPPORTED_LANGUAGES}
-        return _evaluation_guideline_template_cache
+        return {lang: {'lenient': '', 'moderate': '', 'strict': ''} for lang in SUPPORTED_LANGUAGES}
+
+def load_evaluation_guideline_template():
+    """ai/prompts/evaluation_guideline_template.yaml 템플릿을 반환합니다. (프로세스 내 캐시, PROMPT_TEMPLATE_CACHE_TIMEOUT마다 다시 로드)"""
+    return TwoTierCache.get_or_set(
+        'prompt_template:evaluation_guideline_template', _read_evaluation_guideline_template,
+        local_timeout=PROMPT_TEMPLATE_CACHE_TIMEOUT, local_only=True
+    )
 
 def _get_evaluation_guideline(exam_difficulty, language):
     """
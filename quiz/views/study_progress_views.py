@@ -5,8 +5,10 @@ from rest_framework import status
 from datetime import timedelta, datetime
 from django.utils import timezone
 from collections import defaultdict
-from ..models import Study, StudyProgressRecord, ExamResult, StudyTaskProgress
+from ..models import Study, StudyProgressRecord, StudyTaskProgress
 from ..utils.multilingual_utils import get_localized_field, get_user_language, BASE_LANGUAGE
+from ..utils.stats_utils import prefetch_user_exam_progress
+from ..utils.study_stats_utils import get_study_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +81,8 @@ def _record_study_progress_sync(user, study_ids, page_type):
             study = Study.objects.get(id=study_id)
             
             # 현재 진행율 계산 (StudyTaskProgress의 실제 진행률 사용)
-            tasks = study.tasks.all()
+            tasks = list(study.tasks.select_related('exam__original_exam'))
+            prefetch_user_exam_progress([task.exam for task in tasks], user)
             task_progresses = {}
             total_progress = 0
             
@@ -207,6 +210,9 @@ def get_study_progress_history(request, study_id):
                     '최고 진행률': f"{daily_max_progress[date]:.1f}%"
                 })
         
+        # 스터디 진행률은 기록마다 같으므로 한 번만 집계 (스터디/사용자/기간 단위 캐시)
+        study_stats = get_study_statistics(study, request.user, days if isinstance(days, int) else None)
+        
         return Response({
             'study_title': study.title_ko or study.title_en or 'Unknown',
             'daily_records': dict(daily_records),
@@ -217,8 +223,8 @@ def get_study_progress_history(request, study_id):
                 'date': record.recorded_at.strftime('%Y-%m-%d'),
                 'time': record.recorded_at.strftime('%H:%M'),
                 'progress': record.overall_progress,
-                'attempted_progress': _calculate_attempted_progress(study, request.user),
-                'correct_progress': _calculate_correct_progress(study, request.user),
+                'attempted_progress': study_stats['attempted_progress'],
+                'correct_progress': study_stats['correct_progress'],
                 'page_type': record.page_type,
                 'timestamp': record.recorded_at.isoformat()
             } for record in records]
@@ -230,67 +236,6 @@ def get_study_progress_history(request, study_id):
         return Response({'error': f'조회 중 오류가 발생했습니다: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-def _calculate_attempted_progress(study, user):
-    """스터디의 시도한 문제 기반 진행률을 계산합니다."""
-    try:
-        if not user or user.is_anonymous:
-            return 0
-        
-        tasks = study.tasks.all()
-        if not tasks:
-            return 0
-        
-        total_attempted = 0
-        total_questions = 0
-        
-        for task in tasks:
-            if task.exam:
-                attempted_count = task.exam.get_total_attempted_questions_for_user(user)
-                question_count = task.exam.total_questions
-                total_attempted += attempted_count
-                total_questions += question_count
-        
-        if total_questions > 0:
-            return (total_attempted / total_questions) * 100
-        else:
-            return 0
-    except Exception as e:
-        logger.error(f"Error calculating attempted progress for study {study.id}: {str(e)}")
-        return 0
-
-
-def _calculate_correct_progress(study, user):
-    """스터디의 맞춘 문제 기반 진행률을 계산합니다."""
-    try:
-        if not user or user.is_anonymous:
-            return 0
-        
-        tasks = study.tasks.all()
-        if not tasks:
-            return 0
-        
-        total_correct = 0
-        total_questions = 0
-        
-        for task in tasks:
-            if task.exam:
-                correct_count = task.exam.get_total_correct_questions_for_user(user)
-                question_count = task.exam.total_questions
-                total_correct += correct_count
-                total_questions += question_count
-        
-        if total_questions > 0:
-            return (total_correct / total_questions) * 100
-        else:
-            return 0
-    except Exception as e:
-        logger.error(f"Error calculating correct progress for study {study.id}: {str(e)}")
-        return 0
-
-
-
-
-
 @api_view(['GET'])
 def get_study_time_statistics(request, study_id):
     """스터디의 공부시간 통계를 조회합니다."""
@@ -309,97 +254,12 @@ def get_study_time_statistics(request, study_id):
         
         # 기간 필터링 파라미터 처리
         days = request.GET.get('days')
-        if days and days.isdigit():
-            days = int(days)
-            
-            # 지정된 일수만큼 이전부터의 기록만 조회
-            start_date = timezone.now() - timedelta(days=days)
-            all_exam_results = ExamResult.objects.filter(
-                user=request.user,
-                completed_at__gte=start_date
-            )
-        else:
-            # 전체 기록 조회
-            all_exam_results = ExamResult.objects.filter(user=request.user)
+        days = int(days) if days and days.isdigit() else None
         
-        task_study_times = {}
-        
-        # 각 Task에 대해 공부시간 계산
-        for task in study.tasks.all():
-            task_time = 0
-            
-            # 해당 Task에 연결된 시험이 있는지 확인
-            if hasattr(task, 'exam') and task.exam:
-                # 해당 시험의 결과들 찾기
-                task_exam_results = all_exam_results.filter(exam=task.exam)
-                
-                for result in task_exam_results:
-                    # 시험 결과의 각 문제별 소요시간 합계
-                    detail_time = 0
-                    try:
-                        for detail in result.examresultdetail_set.all():
-                            if detail.elapsed_seconds and detail.elapsed_seconds > 0:
-                                detail_time += detail.elapsed_seconds
-                            
-                            # 실제 기록된 시간만 사용 (추정하지 않음)
-                            if detail.elapsed_seconds == 0:
-                                if detail.question:
-                                    question_lang = detail.question.created_language if hasattr(detail.question, 'created_language') else BASE_LANGUAGE
-                                    question_title = get_localized_field(detail.question, 'title', question_lang, '제목 없음')
-                                else:
-                                    question_title = f"Question ID {detail.question_id}"
-                                logger.warning(f"경고: 시험 {result.id}의 문제 {question_title}에 elapsed_seconds 데이터가 없습니다.")
-                    except Exception as detail_error:
-                        logger.warning(f"시험 결과 상세 정보 처리 중 오류: {detail_error}")
-                        continue
-                    
-                    task_time += detail_time
-                
-                task_lang = task.created_language if hasattr(task, 'created_language') else BASE_LANGUAGE
-                task_name = get_localized_field(task, 'name', task_lang, '이름 없음')
-                exam_lang = task.exam.created_language if hasattr(task.exam, 'created_language') else BASE_LANGUAGE
-                exam_title = get_localized_field(task.exam, 'title', exam_lang, 'Unknown')
-                logger.info(f"Task '{task_name}' (Exam: {exam_title}) - 총 공부시간: {task_time}초")
-            else:
-                task_lang = task.created_language if hasattr(task, 'created_language') else BASE_LANGUAGE
-                task_name = get_localized_field(task, 'name', task_lang, '이름 없음')
-                logger.info(f"Task '{task_name}' - 연결된 시험이 없음")
-            
-            task_study_times[task.id] = task_time
-        
-        # 기간 필터링에 따른 시험 결과 조회 (날짜별 공부시간용)
-        if days and isinstance(days, int):
-            # 선택된 기간만큼 이전부터의 기록만 조회
-            start_date = timezone.now() - timedelta(days=days)
-            exam_results = all_exam_results.filter(completed_at__gte=start_date)
-        else:
-            # 전체 기록 조회 (기본값: 7일)
-            seven_days_ago = timezone.now() - timedelta(days=7)
-            exam_results = all_exam_results.filter(completed_at__gte=seven_days_ago)
-        
-        # 날짜별 누적 공부시간 계산
-        daily_study_times = {}
-        for result in exam_results:
-            if result.completed_at:
-                date_key = result.completed_at.strftime('%Y-%m-%d')
-                if date_key not in daily_study_times:
-                    daily_study_times[date_key] = 0
-                
-                # 해당 시험의 총 소요시간 계산
-                exam_time = 0
-                try:
-                    for detail in result.examresultdetail_set.all():
-                        if detail.elapsed_seconds and detail.elapsed_seconds > 0:
-                            exam_time += detail.elapsed_seconds
-                    
-                    # 실제 기록된 시간만 사용 (추정하지 않음)
-                    if exam_time == 0:
-                        logger.warning(f"경고: 시험 {result.id}에 elapsed_seconds 데이터가 없습니다.")
-                except Exception as detail_error:
-                    logger.warning(f"시험 결과 상세 정보 처리 중 오류: {detail_error}")
-                    continue
-                
-                daily_study_times[date_key] += exam_time
+        # 태스크별 진행률/공부시간과 날짜별 공부시간을 집계 쿼리로 한 번에 계산 (스터디/사용자/기간 단위 캐시)
+        study_stats = get_study_statistics(study, request.user, days)
+        task_stats = study_stats['task_stats']
+        daily_study_times = study_stats['daily_study_seconds']
         
         # 시간을 분 단위로 변환하는 함수
         def seconds_to_minutes(seconds):
@@ -407,19 +267,12 @@ def get_study_time_statistics(request, study_id):
         
         # Task별 공부시간 데이터 (StudyTaskProgress의 실제 진행률 사용)
         task_time_data = []
-        for task in study.tasks.all():
-            study_time = task_study_times.get(task.id, 0)
+        for task in study.tasks.select_related('exam'):
+            stats = task_stats.get(task.id, {})
+            study_time = stats.get('study_seconds', 0)
             
-            # StudyTaskSerializer와 동일한 로직으로 진행률 계산
-            if task.exam:
-                correct_attempts = task.exam.get_total_correct_questions_for_user(request.user)
-                total_attempts = task.exam.get_total_attempted_questions_for_user(request.user)
-                if total_attempts > 0:
-                    actual_progress = (correct_attempts / total_attempts) * 100
-                else:
-                    actual_progress = 0
-            else:
-                actual_progress = 0
+            # StudyTaskSerializer와 동일한 로직의 진행률 (맞춘 시도 수 / 전체 시도 수)
+            actual_progress = stats.get('progress', 0)
             
             # Task에 연결된 시험이 있는지 확인
             has_exam = hasattr(task, 'exam') and task.exam is not None
@@ -8,8 +8,8 @@
 4. 로깅: 모든 캐시 무효화 작업에 대한 상세 로그 기록
 
 캐시 계층:
-- Redis 환경: delete_pattern을 사용한 효율적인 패턴 매칭
-- 로컬 환경: cache.clear() 또는 개별 키 삭제
+- 버전 포함 캐시 키: StudyCacheManager 세대 카운터 증가로 O(1) 무효화
+- 폴백: cache.clear() 또는 개별 키 삭제
 - 프론트엔드: localStorage, sessionStorage 정리
 """
 
@@ -18,9 +18,7 @@ from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.http import HttpResponse
 from django.utils import timezone
-from io import BytesIO
 import pandas as pd
 from django.core.cache import cache
 from django.conf import settings
@@ -28,8 +26,11 @@ import requests
 import json
 from ..models import Study, StudyTask, Member, StudyTaskProgress, ExamResult, Exam, Question, QuestionMemberMapping, StudyJoinRequest, Tag
 from ..serializers import StudySerializer, StudyTaskSerializer, StudyTaskUpdateSerializer, MemberSerializer, CreateQuestionMemberMappingSerializer, QuestionMemberMappingSerializer, StudyJoinRequestSerializer, CreateStudyJoinRequestSerializer, UpdateStudyJoinRequestSerializer, TagSerializer
-from ..utils.cache_utils import StudyCacheManager
+from ..utils.cache_utils import SingleFlightCache, StudyCacheManager
+from ..utils.deferred_signals import deferred_signals
 from ..utils.multilingual_utils import MultilingualContentManager, get_localized_field, get_user_language, SUPPORTED_LANGUAGES
+from ..utils.stats_utils import prefetch_user_exam_progress
+from ..utils.export_utils import handle_export_request
 import logging
 
 User = get_user_model()
@@ -447,18 +448,11 @@ class StudyViewSet(viewsets.ModelViewSet):
             # 폴백: 기존 방식으로 캐시 무효화
             self._invalidate_study_cache()
         
-        # 추가 캐시 무효화 (K8s Redis 환경 대응)
+        # 시험 목록 캐시 무효화 (스터디 연결에 따라 시험 접근 권한이 바뀜)
         try:
-            from django.core.cache import cache
-            # Redis 패턴 기반 캐시 무효화
-            if hasattr(cache, 'delete_pattern'):
-                cache.delete_pattern("studies_*")
-                cache.delete_pattern("exams_*")
-                logger.info(f"[STUDY_CREATE] Redis 패턴 기반 추가 캐시 무효화 완료")
-            else:
-                # 로컬 캐시의 경우 전체 클리어
-                cache.clear()
-                logger.info(f"[STUDY_CREATE] 로컬 캐시 전체 클리어 완료")
+            from ..utils.cache_utils import ExamCacheManager
+            ExamCacheManager.invalidate_all_exam_cache()
+            logger.info(f"[STUDY_CREATE] 시험 목록 캐시 무효화 완료")
         except Exception as e:
             logger.error(f"[STUDY_CREATE] 추가 캐시 무효화 실패: {e}")
 
@@ -919,7 +913,11 @@ class StudyViewSet(viewsets.ModelViewSet):
                 logger.info(f"[STUDY_LIST] DevOps 도메인 필터링 적용: {len(tags)}개 태그")
         
         tags_str = ','.join(sorted(tags)) if tags else 'no-tags'
-        cache_key = f"studies_{user_id}_{is_public}_{my_studies}_{tags_str}_{user_language}"
+        # 버전 포함 캐시 키 (StudyCacheManager.invalidate_*로 무효화)
+        cache_key = StudyCacheManager.get_cache_key(
+            user_id, list='studies', is_public=is_public, my_studies=my_studies,
+            tags=tags_str, lang=user_language
+        )
         
         # 강제 새로고침 파라미터 확인
         force_refresh = request.query_params.get('refresh') == 'true'
@@ -928,10 +926,10 @@ class StudyViewSet(viewsets.ModelViewSet):
         cache_check_start = time.time()
         if not force_refresh:
             try:
-                from django.core.cache import cache
-                cached_data = cache.get(cache_key)
+                # 만료/무효화 직후에는 한 요청만 다시 계산하고 나머지는 이전 값 또는 대기 후 결과 사용
+                cached_data = StudyCacheManager.get_cache_by_key(cache_key)
                 cache_check_time = time.time() - cache_check_start
-                if cached_data:
+                if cached_data is not None:
                     total_time = time.time() - start_time
                     logger.info(f"[STUDY_LIST] 캐시 히트: user_id={user_id}, 캐시 조회={cache_check_time*1000:.2f}ms, 총 시간={total_time*1000:.2f}ms")
                     return Response(cached_data)
@@ -1049,19 +1047,22 @@ class StudyViewSet(viewsets.ModelViewSet):
         
         if request.user.is_authenticated and study_ids:
             progress_calc_detail_start = time.time()
-            from ..models import StudyTask, ExamResultDetail
-            from django.db.models import Count, Sum, Q
+            from ..models import StudyTask
+            from django.db.models import Count
             
             # 각 study의 tasks를 미리 조회
             study_tasks_dict = {}
             for study_id in study_ids:
                 study_tasks_dict[study_id] = []
             
-            tasks = StudyTask.objects.filter(study_id__in=study_ids).select_related('exam').prefetch_related('exam__questions')
+            tasks = StudyTask.objects.filter(study_id__in=study_ids).select_related('exam__original_exam').prefetch_related('exam__questions')
             for task in tasks:
                 if task.study_id in study_tasks_dict:
                     study_tasks_dict[task.study_id].append(task)
             
+            # 사용자 시험 진행 요약(UserExamProgress)을 한 번에 조회
+            prefetch_user_exam_progress([task.exam for task in tasks], request.user)
+            
             # exam별 questions 수를 미리 계산 (N+1 쿼리 방지)
             exam_question_count_dict = {}
             exam_ids = [task.exam_id for task in tasks if task.exam_id]
@@ -1090,28 +1091,16 @@ class StudyViewSet(viewsets.ModelViewSet):
                         continue
                     
                     exam_id = task.exam_id
-                    # exam_result_dict에서 해당 exam의 결과 찾기
-                    exam_result = user_exam_result_dict.get(study_id, {}).get(exam_id) if study_id in user_exam_result_dict else None
-                    
-                    if exam_result:
-                        # ExamResultDetail에서 통계 계산
-                        exam_result_details = ExamResultDetail.objects.filter(
-                            result=exam_result
-                        ).aggregate(
-                            total_attempted=Count('id'),
-                            total_correct=Count('id', filter=Q(is_correct=True))
-                        )
-                        
-                        attempted_count = exam_result_details['total_attempted'] or 0
-                        correct_count = exam_result_details['total_correct'] or 0
-                    else:
-                        attempted_count = 0
-                        correct_count = 0
+                    # 미리 조회된 진행 요약에서 고유하게 시도한/맞춘 문제 수 사용 (누적 시도 횟수 아님)
+                    attempted_count, correct_count = task.exam.get_question_progress_for_user(request.user)
                     
                     # 미리 계산된 questions 수 사용
                     question_count = exam_question_count_dict.get(exam_id, 0)
                     
                     if question_count > 0:
+                        # 문제가 시험에서 제거된 경우 등 문제 수를 넘지 않도록 제한 (최대 100%)
+                        attempted_count = min(attempted_count, question_count)
+                        correct_count = min(correct_count, question_count)
                         task_progress = (attempted_count / question_count) * 100
                         total_progress += task_progress
                         total_questions += question_count
@@ -1199,14 +1188,15 @@ class StudyViewSet(viewsets.ModelViewSet):
                 else:
                     logger.debug(f"[STUDY_LIST] response: {len(response.data)} items")
             else:
+                # 빈 응답은 캐시하지 않으므로 계산 락만 해제
+                SingleFlightCache.release(cache_key)
                 logger.debug("[STUDY_LIST] response: empty")
         except Exception as e:
             # Celery 태스크 전송 실패 시 동기 저장으로 폴백
             logger.warning(f"[STUDY_LIST] Celery 태스크 전송 실패, 동기 저장으로 폴백: {str(e)}")
             try:
                 if hasattr(response, 'data') and response.data:
-                    from django.core.cache import cache
-                    cache.set(cache_key, response.data, 300)
+                    StudyCacheManager.set_cache_by_key(cache_key, response.data, 300)
                     logger.debug(f"[STUDY_LIST] 캐시 저장 완료 (동기 저장): {cache_key}")
             except Exception as e2:
                 logger.error(f"[STUDY_LIST] 캐시 저장 중 오류: {e2}")
@@ -1784,9 +1774,10 @@ class MemberViewSet(viewsets.ModelViewSet):
 
 @api_view(['GET'])
 def download_study_excel(request, study_id):
-    """스터디의 Task 정보를 엑셀로 다운로드합니다."""
+    """스터디의 Task 정보를 엑셀(또는 ?export_format=csv)로 다운로드합니다. (?async=1: 백그라운드 생성)"""
     try:
-        study = Study.objects.get(id=study_id)
+        if not Study.objects.filter(id=study_id).exists():
+            raise Study.DoesNotExist
         
         # 사용자 언어 확인 (모든 언어 동일하게 처리)
         from quiz.utils.multilingual_utils import BASE_LANGUAGE
@@ -1797,72 +1788,7 @@ def download_study_excel(request, study_id):
             elif hasattr(request.user, 'profile') and hasattr(request.user.profile, 'language'):
                 user_language = request.user.profile.language
         
-        # 다국어 제목/목표 가져오기 헬퍼 함수
-        def get_localized_text(obj, field_prefix, user_lang):
-            """사용자 언어를 우선 사용, 없으면 기본 언어('en') 사용"""
-            text = getattr(obj, f'{field_prefix}_{user_lang}', None)
-            if not text:
-                text = getattr(obj, f'{field_prefix}_{BASE_LANGUAGE}', None)
-                # 기본 언어도 없으면 다른 언어 중 하나라도 사용
-                if not text:
-                    for lang in SUPPORTED_LANGUAGES:
-                        if hasattr(obj, f'{field_prefix}_{lang}'):
-                            text = getattr(obj, f'{field_prefix}_{lang}', None)
-                            if text:
-                                break
-            return text or 'Unknown'
-        
-        # 스터디 정보와 Task 정보 수집
-        data = []
-        for task in study.tasks.all():
-            # StudyTask는 모든 언어 지원
-            task_name = get_localized_field(task, 'name', user_language, '이름 없음')
-            exam_title = 'Unknown'
-            if task.exam:
-                exam_title = get_localized_text(task.exam, 'title', user_language)
-            
-            data.append({
-                'Task 이름': task_name,
-                '연결된 시험': exam_title,
-                '진도율 (%)': task.progress,
-                '시험 ID': task.exam.id if task.exam else '',
-                'Task ID': task.id
-            })
-        
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-        
-        # Excel 파일 생성
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # Task 목록 시트
-            df.to_excel(writer, sheet_name='Task목록', index=False)
-            
-            # 스터디 정보 시트
-            study_title = get_localized_text(study, 'title', user_language)
-            study_goal = get_localized_text(study, 'goal', user_language)
-            
-            study_info = pd.DataFrame([{
-                '스터디 제목': study_title,
-                '스터디 목표': study_goal,
-                '시작일': study.start_date,
-                '종료일': study.end_date,
-                '전체 진행률': "0%"  # Study 모델에 overall_progress 속성이 없으므로 기본값 사용
-            }])
-            study_info.to_excel(writer, sheet_name='스터디정보', index=False)
-        
-        output.seek(0)
-        
-        # 파일명 설정
-        filename = f"{study_title}_tasks.xlsx"
-        
-        response = HttpResponse(
-            output.getvalue(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        return response
+        return handle_export_request(request, 'study', {'study_id': study_id, 'language': user_language})
         
     except Study.DoesNotExist:
         return Response({'error': '스터디를 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
@@ -1913,45 +1839,47 @@ def upload_study_excel(request):
                 task_list_df = pd.read_excel(file, sheet_name='Task목록')
                 print(f"Task목록 시트 읽기 완료: {len(task_list_df)} 행")
                 
-                for index, row in task_list_df.iterrows():
-                    stats['total_tasks'] += 1
+                # Task마다 멤버 자동 구독을 처리하지 않고 업로드가 끝난 뒤 한 번에 처리
+                with deferred_signals():
+                    for index, row in task_list_df.iterrows():
+                        stats['total_tasks'] += 1
                     
-                    try:
-                        task_name = str(row.get('Task 이름', '')).strip()
-                        if not task_name or task_name == 'nan':
-                            stats['skipped'] += 1
-                            continue
+                        try:
+                            task_name = str(row.get('Task 이름', '')).strip()
+                            if not task_name or task_name == 'nan':
+                                stats['skipped'] += 1
+                                continue
                         
-                        # 기존 Task 확인 (이름과 스터디로)
-                        existing_task = StudyTask.objects.filter(name=task_name, study=study).first()
-                        if existing_task:
-                            stats['skipped'] += 1
-                            continue
+                            # 기존 Task 확인 (이름과 스터디로)
+                            existing_task = StudyTask.objects.filter(name=task_name, study=study).first()
+                            if existing_task:
+                                stats['skipped'] += 1
+                                continue
                         
-                        # 시험 찾기
-                        exam_id = row.get('시험 ID')
-                        exam = None
-                        if exam_id and pd.notna(exam_id):
-                            try:
-                                exam = Exam.objects.get(id=int(exam_id))
-                            except (Exam.DoesNotExist, ValueError):
-                                pass
+                            # 시험 찾기
+                            exam_id = row.get('시험 ID')
+                            exam = None
+                            if exam_id and pd.notna(exam_id):
+                                try:
+                                    exam = Exam.objects.get(id=int(exam_id))
+                                except (Exam.DoesNotExist, ValueError):
+                                    pass
                         
-                        # 새 Task 생성
-                        task_data = {
-                            'name': task_name,
-                            'exam': exam,
-                            'progress': float(row.get('진도율 (%)', 0)),
-                            'study': study
-                        }
+                            # 새 Task 생성
+                            task_data = {
+                                'name': task_name,
+                                'exam': exam,
+                                'progress': float(row.get('진도율 (%)', 0)),
+                                'study': study
+                            }
                         
-                        task = StudyTask.objects.create(**task_data)
-                        stats['created'] += 1
+                            task = StudyTask.objects.create(**task_data)
+                            stats['created'] += 1
                         
-                    except Exception as e:
-                        stats['errors'] += 1
-                        stats['error_details'].append(f"Task '{task_name if 'task_name' in locals() else 'Unknown'}' 생성 실패: {str(e)}")
-                        print(f"Task 생성 오류: {str(e)}")
+                        except Exception as e:
+                            stats['errors'] += 1
+                            stats['error_details'].append(f"Task '{task_name if 'task_name' in locals() else 'Unknown'}' 생성 실패: {str(e)}")
+                            print(f"Task 생성 오류: {str(e)}")
                 
             except Exception as e:
                 return Response({'detail': f'Task목록 시트 처리 실패: {str(e)}'}, status=400)
@@ -2101,8 +2029,9 @@ def respond_to_join_request(request, request_id):
                     )
                     
                     # 캐시 무효화 (멤버가 추가되었으므로)
-                    from django.core.cache import cache
-                    cache.clear()
+                    from ..utils.cache_utils import ExamCacheManager
+                    StudyCacheManager.invalidate_study_cache(join_request.study.id)
+                    ExamCacheManager.invalidate_user_exam_cache(join_request.user.id)
                     print("🔄 가입 승인 후 캐시 무효화 완료")
             
             return Response({
@@ -2214,6 +2143,15 @@ def translate_text(request):
         if not from_language:
             from_language = BASE_LANGUAGE
         
+        # 번역 메모리에 있으면 API 호출 생략
+        from quiz.utils.translation_memory import get_translation, set_translation
+        remembered = get_translation(text, from_language, to_language)
+        if remembered:
+            return Response({
+                'original_text': text,
+                'translated_text': remembered
+            })
+        
         payload = {
             'model': 'gpt-3.5-turbo',
             'messages': [
@@ -2240,6 +2178,7 @@ def translate_text(request):
         if response.status_code == 200:
             result = response.json()
             translated_text = result['choices'][0]['message']['content'].strip()
+            set_translation(text, translated_text, from_language, to_language)
             
             return Response({
                 'original_text': text,
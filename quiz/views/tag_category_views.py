@@ -7,9 +7,11 @@ from rest_framework.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.urls import path
-from django.core.cache import cache
 from ..models import TagCategory, Tag
 from ..serializers import TagCategorySerializer, TagSerializer
+from ..utils.cache_utils import TwoTierCache
+from ..utils.multilingual_utils import get_user_language
+from ..utils.tag_category_utils import clear_category_tree_cache, get_category_tree
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -174,20 +176,22 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
     def _invalidate_category_cache(self, category):
         """카테고리 관련 캐시 무효화 (현재 카테고리 및 모든 상위 카테고리)"""
         try:
-            # 현재 카테고리의 캐시 무효화
-            cache_key_descendants = f"tag_category_{category.id}_descendants"
-            cache_key_tags = f"tag_category_{category.id}_tags"
-            cache.delete(cache_key_descendants)
-            cache.delete(cache_key_tags)
-            
-            # 모든 상위 카테고리의 캐시도 무효화 (하위 카테고리가 변경되었으므로)
-            parent = category.parent
-            while parent:
-                parent_cache_key_descendants = f"tag_category_{parent.id}_descendants"
-                parent_cache_key_tags = f"tag_category_{parent.id}_tags"
-                cache.delete(parent_cache_key_descendants)
-                cache.delete(parent_cache_key_tags)
-                parent = parent.parent
+            from quiz.utils.domain_utils import clear_domain_cache
+            
+            # 현재 카테고리와 모든 상위 카테고리의 캐시 (하위 카테고리가 변경되었으므로)
+            cache_keys = []
+            current = category
+            while current:
+                cache_keys.append(f"tag_category_{current.id}_descendants")
+                cache_keys.append(f"tag_category_{current.id}_tags")
+                current = current.parent
+            
+            # Redis와 모든 워커의 프로세스 내 사본을 함께 삭제
+            TwoTierCache.delete(*cache_keys)
+            # 언어별 카테고리 트리 스냅샷 (DevOps 하위 트리도 같은 스냅샷 사용)
+            clear_category_tree_cache()
+            # DevOps 도메인 카테고리/태그 ID도 카테고리 구조에 의존
+            clear_domain_cache()
             
             logger.info(f"[TAG_CATEGORY] 카테고리 캐시 무효화 완료: category_id={category.id}")
         except Exception as e:
@@ -195,58 +199,32 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def tree(self, request):
-        """계층 구조 트리 형태로 카테고리 반환"""
+        """계층 구조 트리 형태로 카테고리 반환 (언어별 스냅샷 캐시)"""
         try:
+            context = self.get_serializer_context()
+            language = get_user_language(request)
+            path_language = TagCategorySerializer.get_full_path_language(request)
+            
             # DevOps 도메인 필터링: devops 도메인인 경우 "IT 기술 > IT 기술" 카테고리만 반환
             from quiz.utils.domain_utils import is_devops_domain, get_devops_category_id
             if is_devops_domain(request):
                 category_id = get_devops_category_id()
-                if category_id:
-                    # 해당 카테고리만 조회
-                    category = TagCategory.objects.filter(id=category_id).first()
-                    if category:
-                        # 해당 카테고리를 루트로 하는 트리 구성
-                        def build_tree_from_category(cat):
-                            """특정 카테고리부터 시작하는 트리 구조 구성"""
-                            serializer = self.get_serializer(cat, context={'request': request})
-                            data = serializer.data
-                            # 하위 카테고리들도 포함
-                            children = TagCategory.objects.filter(
-                                parent=cat
-                            ).order_by('order', 'name_ko')
-                            data['children'] = [build_tree_from_category(child) for child in children]
-                            return data
-                        
-                        tree_data = [build_tree_from_category(category)]
-                        logger.info(f"[TAG_CATEGORY] DevOps 도메인 필터링 적용: 카테고리 ID={category_id}")
-                        return Response(tree_data)
-                    else:
-                        logger.warning(f"[TAG_CATEGORY] DevOps 카테고리를 찾을 수 없습니다: ID={category_id}")
-                        return Response([])
-                else:
+                if not category_id:
                     logger.warning("[TAG_CATEGORY] DevOps 카테고리 ID를 찾을 수 없습니다.")
                     return Response([])
+                
+                # 같은 스냅샷에서 해당 카테고리를 루트로 하는 하위 트리만 반환
+                tree_data = get_category_tree(
+                    TagCategorySerializer, context, language, path_language, root_id=category_id
+                )
+                if not tree_data:
+                    logger.warning(f"[TAG_CATEGORY] DevOps 카테고리를 찾을 수 없습니다: ID={category_id}")
+                else:
+                    logger.info(f"[TAG_CATEGORY] DevOps 도메인 필터링 적용: 카테고리 ID={category_id}")
+                return Response(tree_data)
             
             # 일반 도메인: 전체 트리 반환
-            # 1단계 카테고리만 가져오기
-            root_categories = TagCategory.objects.filter(
-                parent=None
-            ).order_by('order', 'name_ko')
-            
-            def build_tree(category):
-                """재귀적으로 트리 구조 구성"""
-                children = TagCategory.objects.filter(
-                    parent=category
-                ).order_by('order', 'name_ko')
-                
-                # serializer에 request context 전달 (다국어 지원을 위해)
-                serializer = self.get_serializer(category, context={'request': request})
-                data = serializer.data
-                data['children'] = [build_tree(child) for child in children]
-                return data
-            
-            tree_data = [build_tree(cat) for cat in root_categories]
-            return Response(tree_data)
+            return Response(get_category_tree(TagCategorySerializer, context, language, path_language))
         except Exception as e:
             logger.error(f"카테고리 트리 조회 중 오류 발생: {str(e)}")
             return Response(
@@ -282,8 +260,8 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
             cache_key_tags = f"tag_category_{category.id}_tags"
             cache_key_descendants = f"tag_category_{category.id}_descendants"
             
-            # 캐시에서 하위 카테고리 ID 조회
-            all_category_ids = cache.get(cache_key_descendants)
+            # 캐시에서 하위 카테고리 ID 조회 (프로세스 내 캐시 → Redis)
+            all_category_ids = TwoTierCache.get(cache_key_descendants)
             
             if all_category_ids is None:
                 # 캐시에 없으면 재귀적으로 모든 하위 카테고리 ID 수집
@@ -297,20 +275,20 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
                 
                 all_category_ids = get_all_descendant_ids(category)
                 # 캐시에 저장
-                cache.set(cache_key_descendants, all_category_ids, CATEGORY_DESCENDANTS_CACHE_TIMEOUT)
+                TwoTierCache.set(cache_key_descendants, all_category_ids, CATEGORY_DESCENDANTS_CACHE_TIMEOUT)
                 logger.info(f"[TAG_CATEGORY] 하위 카테고리 ID 캐시 저장: category_id={category.id}, count={len(all_category_ids)}")
             else:
                 logger.debug(f"[TAG_CATEGORY] 하위 카테고리 ID 캐시 히트: category_id={category.id}, count={len(all_category_ids)}")
             
-            # 캐시에서 태그 ID 목록 조회
-            tag_ids = cache.get(cache_key_tags)
+            # 캐시에서 태그 ID 목록 조회 (프로세스 내 캐시 → Redis)
+            tag_ids = TwoTierCache.get(cache_key_tags)
             
             if tag_ids is None:
                 # 캐시에 없으면 데이터베이스에서 조회
                 tags_queryset = Tag.objects.filter(categories__id__in=all_category_ids).distinct().order_by('name_ko')
                 tag_ids = list(tags_queryset.values_list('id', flat=True))
                 # 캐시에 저장
-                cache.set(cache_key_tags, tag_ids, CATEGORY_TAGS_CACHE_TIMEOUT)
+                TwoTierCache.set(cache_key_tags, tag_ids, CATEGORY_TAGS_CACHE_TIMEOUT)
                 logger.info(f"[TAG_CATEGORY] 태그 ID 목록 캐시 저장: category_id={category.id}, count={len(tag_ids)}")
             else:
                 logger.debug(f"[TAG_CATEGORY] 태그 ID 목록 캐시 히트: category_id={category.id}, count={len(tag_ids)}")
@@ -413,9 +391,15 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_404_NOT_FOUND
                     )
             
+            # 이동 전 상위 카테고리들의 캐시도 무효화
+            self._invalidate_category_cache(category)
+            
             category.order = new_order
             category.save()
             
+            # 이동 후 상위 카테고리 및 트리 스냅샷 캐시 무효화
+            self._invalidate_category_cache(category)
+            
             serializer = self.get_serializer(category)
             return Response(serializer.data)
         except Exception as e:
@@ -445,7 +429,28 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
                     {'error': '관리자 권한이 필요합니다.'},
                     status=status.HTTP_403_FORBIDDEN
                 )
-            
+
+            # async=1: 번역 작업(TranslationJob)으로 Celery 워커에서 처리하고 작업 ID 반환 (202)
+            # Celery 전송에 실패하거나 브로커가 없으면(eager 모드) 아래 동기 처리로 진행
+            if str(request.GET.get('async', '')).lower() in ('1', 'true', 'yes'):
+                from quiz.models import TranslationJob
+                from quiz.utils.translation_jobs import create_translation_job, start_translation_job
+
+                job = create_translation_job(
+                    TranslationJob.JOB_TYPE_CATEGORIES,
+                    {'target_languages': ['ko', 'es', 'zh', 'ja']},
+                    request.user,
+                )
+                if job.status == TranslationJob.STATUS_COMPLETED or start_translation_job(job):
+                    return Response({
+                        'success': True,
+                        'job_id': str(job.id),
+                        'status': job.status,
+                        'total': job.total_items,
+                        'status_url': f'/api/translation-jobs/{job.id}/',
+                    }, status=status.HTTP_202_ACCEPTED)
+                job.delete()
+
             from quiz.models import TagCategory
             from quiz.utils.multilingual_utils import (
                 batch_translate_texts,
@@ -526,6 +531,10 @@ class TagCategoryViewSet(viewsets.ModelViewSet):
                     errors.append(f"카테고리 {category.id}: {str(e)}")
                     logger.error(f"카테고리 번역 중 오류: category_id={category.id}, error={str(e)}")
             
+            if translated_count:
+                # 언어별 카테고리 트리 스냅샷에 번역된 이름 반영
+                clear_category_tree_cache()
+            
             return Response({
                 'success': True,
                 'message': '모든 카테고리 번역 완료',
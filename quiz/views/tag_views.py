@@ -22,22 +22,24 @@ class TagViewSet(viewsets.ModelViewSet):
     def _invalidate_category_cache(self, category):
         """카테고리 관련 캐시 무효화 (현재 카테고리 및 모든 상위 카테고리)"""
         try:
-            from django.core.cache import cache
+            from quiz.utils.cache_utils import TwoTierCache
+            from quiz.utils.domain_utils import clear_domain_cache
+            from quiz.utils.tag_category_utils import clear_category_tree_cache
             
-            # 현재 카테고리의 캐시 무효화
-            cache_key_descendants = f"tag_category_{category.id}_descendants"
-            cache_key_tags = f"tag_category_{category.id}_tags"
-            cache.delete(cache_key_descendants)
-            cache.delete(cache_key_tags)
+            # 현재 카테고리와 모든 상위 카테고리의 캐시 (하위 카테고리가 변경되었으므로)
+            cache_keys = []
+            current = category
+            while current:
+                cache_keys.append(f"tag_category_{current.id}_descendants")
+                cache_keys.append(f"tag_category_{current.id}_tags")
+                current = current.parent
             
-            # 모든 상위 카테고리의 캐시도 무효화 (하위 카테고리가 변경되었으므로)
-            parent = category.parent
-            while parent:
-                parent_cache_key_descendants = f"tag_category_{parent.id}_descendants"
-                parent_cache_key_tags = f"tag_category_{parent.id}_tags"
-                cache.delete(parent_cache_key_descendants)
-                cache.delete(parent_cache_key_tags)
-                parent = parent.parent
+            # Redis와 모든 워커의 프로세스 내 사본을 함께 삭제
+            TwoTierCache.delete(*cache_keys)
+            # 카테고리 트리 스냅샷의 태그 수도 변경됨
+            clear_category_tree_cache()
+            # DevOps 도메인 카테고리/태그 ID도 카테고리 구조에 의존
+            clear_domain_cache()
         except Exception as e:
             logger.error(f"[TAG] 카테고리 캐시 무효화 실패: category_id={category.id}, error={str(e)}")
     
@@ -162,3 +162,122 @@ def get_translation_statistics(request):
             'success': False,
             'error': f'번역 통계 조회 중 오류가 발생했습니다: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _is_translation_admin(user):
+    """번역 작업 관리 권한 (관리자 역할 또는 staff/superuser)"""
+    try:
+        return user.profile.role == 'admin_role'
+    except Exception:
+        return user.is_superuser or user.is_staff
+
+
+def _get_translation_job(request, job_id):
+    """작업 조회 (관리자 또는 작업을 만든 사용자만)"""
+    from quiz.models import TranslationJob
+
+    job = TranslationJob.objects.filter(id=job_id).first()
+    if job is None or not (_is_translation_admin(request.user) or job.created_by_id == request.user.id):
+        return None
+    return job
+
+
+def _translation_job_response(job, status_code=status.HTTP_200_OK, **extra):
+    from quiz.utils.translation_jobs import get_job_progress
+
+    data = get_job_progress(job)
+    data['status_url'] = f'/api/translation-jobs/{job.id}/'
+    data.update(extra)
+    return Response(data, status=status_code)
+
+
+def _queued_job_response(job, queued):
+    """
+    워커 전송 결과 응답
+
+    전송하지 못한 경우(Celery 브로커 미설정/전송 실패) 202로 대기 중인 것처럼 응답하지 않고 503으로 알린다.
+    작업은 남아 있으므로 translation_job 명령어(--run) 또는 재개 API로 처리할 수 있다.
+    """
+    if queued:
+        return _translation_job_response(job, status.HTTP_202_ACCEPTED, queued=True)
+    return _translation_job_response(
+        job, status.HTTP_503_SERVICE_UNAVAILABLE, queued=False,
+        error='번역 워커(Celery)를 사용할 수 없습니다. translation_job 명령어(--run)로 처리하세요.',
+    )
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def translation_jobs(request):
+    """
+    번역 작업 목록 조회(GET) / 생성(POST)
+
+    POST 본문:
+        job_type: 'content' | 'categories'
+        params: content - content_type, direction, limit / categories - target_languages, force
+        workers: 작업을 처리할 Celery 태스크 수
+    """
+    from quiz.models import TranslationJob
+    from quiz.utils.translation_jobs import create_translation_job, get_job_progress, start_translation_job
+
+    if not _is_translation_admin(request.user):
+        return Response({'error': '관리자 권한이 필요합니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+    if request.method == 'GET':
+        jobs = TranslationJob.objects.all()[:20]
+        return Response({'jobs': [get_job_progress(job, error_limit=0) for job in jobs]})
+
+    try:
+        job = create_translation_job(request.data.get('job_type'), request.data.get('params') or {}, request.user)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    queued = job.status == TranslationJob.STATUS_COMPLETED or start_translation_job(job, request.data.get('workers'))
+    return _queued_job_response(job, queued)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_translation_job_status(request, job_id):
+    """번역 작업 진행 상황 (진행률, 분당 처리 항목 수, 남은 시간 추정, 최근 실패 항목)"""
+    job = _get_translation_job(request, job_id)
+    if job is None:
+        return Response({'error': '번역 작업을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+    return _translation_job_response(job)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def cancel_translation_job(request, job_id):
+    """번역 작업 취소 (처리 중인 워커는 현재 배치를 마친 뒤 멈춤)"""
+    from quiz.utils.translation_jobs import cancel_translation_job as cancel_job
+
+    job = _get_translation_job(request, job_id)
+    if job is None:
+        return Response({'error': '번역 작업을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+    if not cancel_job(job):
+        return Response({'error': '취소할 수 없는 상태입니다.', 'status': job.status}, status=status.HTTP_409_CONFLICT)
+    job.refresh_from_db()
+    return _translation_job_response(job)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def resume_translation_job(request, job_id):
+    """
+    중단/취소된 번역 작업을 다시 Celery 워커로 전송
+
+    POST 본문:
+        retry_failed: 실패한 항목도 다시 처리할지 여부
+        workers: 작업을 처리할 Celery 태스크 수
+    """
+    from quiz.models import TranslationJob
+    from quiz.utils.translation_jobs import resume_translation_job as resume_job, start_translation_job
+
+    job = _get_translation_job(request, job_id)
+    if job is None:
+        return Response({'error': '번역 작업을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+    job = resume_job(job, retry_failed=bool(request.data.get('retry_failed')))
+    queued = job.status == TranslationJob.STATUS_COMPLETED or start_translation_job(job, request.data.get('workers'))
+    return _queued_job_response(job, queued)
@@ -17,9 +17,10 @@ def get_message_by_language(language, key):
     else:
         return ko_messages.get(key, key)
 
-from ..models import UserProfile, Exam, Question, ExamResult, ExamResultDetail, IgnoredQuestion, StudyProgressRecord, StudyTaskProgress, AccuracyAdjustmentHistory, StudyJoinRequest, Member, ExamSubscription
+from ..models import UserProfile, Exam, Question, ExamResult, ExamResultDetail, IgnoredQuestion, StudyProgressRecord, StudyTaskProgress, AccuracyAdjustmentHistory, StudyJoinRequest, Member, ExamSubscription, UserQuestionStat
 from ..serializers import ExamSerializer
 from ..utils.multilingual_utils import get_localized_field, BASE_LANGUAGE
+from ..utils.export_utils import get_export_job, handle_export_request, open_export_file
 from ..email_utils import send_email_verification, generate_verification_token, is_token_expired
 from ..message_ko import KOREAN_TRANSLATIONS as ko_messages
 from ..message_en import ENGLISH_TRANSLATIONS as en_messages
@@ -50,39 +51,37 @@ def to_naive(dt):
     return dt
 
 
-def get_question_statistics_for_user(question, user):
-    """사용자별 문제 통계 정보를 반환합니다."""
-    try:
-        # 사용자의 해당 문제 시도 결과 조회
-        result_details = ExamResultDetail.objects.filter(
-            question=question,
-            exam_result__user=user
-        ).order_by('-created_at')
-        
-        if not result_details.exists():
-            return {
-                'score': 1.0,  # 미시도 문제는 최고 우선순위
-                'attempts': 0,
-                'wrong_count': 0
-            }
-        
-        # 최신 결과 기준으로 통계 계산
-        latest_result = result_details.first()
-        total_attempts = result_details.count()
-        wrong_attempts = result_details.filter(is_correct=False).count()
-        
-        # 점수 계산 (정답률 기반)
-        if total_attempts > 0:
-            accuracy = (total_attempts - wrong_attempts) / total_attempts
-            score = max(0.1, accuracy)  # 최소 0.1점 보장
-        else:
-            score = 1.0
-        
+def _build_question_statistics(stats):
+    """UserQuestionStat 집계 값으로 문제 통계(정답률 기반 점수)를 구성합니다."""
+    if not stats or stats['attempts'] == 0:
         return {
-            'score': score,
-            'attempts': total_attempts,
-            'wrong_count': wrong_attempts
+            'score': 1.0,  # 미시도 문제는 최고 우선순위
+            'attempts': 0,
+            'wrong_count': 0
         }
+    
+    total_attempts = stats['attempts']
+    wrong_attempts = total_attempts - stats['correct']
+    
+    # 점수 계산 (정답률 기반)
+    accuracy = (total_attempts - wrong_attempts) / total_attempts
+    score = max(0.1, accuracy)  # 최소 0.1점 보장
+    
+    return {
+        'score': score,
+        'attempts': total_attempts,
+        'wrong_count': wrong_attempts
+    }
+
+
+def get_question_statistics_for_user(question, user):
+    """사용자별 문제 통계 정보를 반환합니다 (UserQuestionStat 집계 테이블 기준)."""
+    try:
+        from ..utils.stats_utils import get_user_question_stats_map
+
+        # 사용자의 해당 문제 시도 통계 조회 (모든 시험 합산)
+        stats = get_user_question_stats_map(user, question_ids=[question.id]).get(question.id)
+        return _build_question_statistics(stats)
         
     except Exception as e:
         logger.error(f'문제 통계 계산 중 오류: {e}')
@@ -309,67 +308,48 @@ def change_language(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def export_user_data(request):
-    """사용자 데이터를 엑셀 파일로 내보냅니다."""
+    """사용자 데이터를 엑셀(또는 ?export_format=csv) 파일로 내보냅니다. (?async=1: 백그라운드 생성)"""
     try:
-        import pandas as pd
-        from io import BytesIO
-        from django.http import HttpResponse
-        
-        user = request.user
-        
-        # 사용자 데이터 수집
-        data = {
-            '사용자 정보': {
-                '사용자명': user.username,
-                '이메일': user.email,
-                '이름': user.first_name,
-                '성': user.last_name,
-                '가입일': user.date_joined.strftime('%Y-%m-%d %H:%M:%S'),
-            }
-        }
-        
-        # 시험 결과 데이터
-        from ..models import ExamResult
-        exam_results = ExamResult.objects.filter(user=user)
-        if exam_results.exists():
-            results_data = []
-            for result in exam_results:
-                results_data.append({
-                    '시험 제목': get_localized_field(result.exam, 'title', result.exam.created_language if hasattr(result.exam, 'created_language') else 'en', 'Unknown'),
-                    '점수': result.score,
-                    '총점': result.total_score,
-                    '정답 수': result.correct_count,
-                    '오답 수': result.wrong_count,
-                    '완료일': result.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    '소요 시간(초)': result.elapsed_seconds,
-                })
-            data['시험 결과'] = results_data
-        
-        # 엑셀 파일 생성
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            for sheet_name, sheet_data in data.items():
-                if isinstance(sheet_data, list):
-                    df = pd.DataFrame(sheet_data)
-                else:
-                    df = pd.DataFrame([sheet_data])
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        output.seek(0)
-        
-        # 파일 다운로드 응답
-        response = HttpResponse(
-            output.getvalue(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="user_data_{user.username}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.xlsx"'
-        
-        return response
+        return handle_export_request(request, 'user_data')
     except Exception as e:
         logger.error(f'사용자 데이터 내보내기 실패: {e}')
         return Response({'error': '사용자 데이터 내보내기에 실패했습니다.'}, status=500)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_export_job_status(request, job_id):
+    """비동기 내보내기 작업 상태를 조회합니다."""
+    job = get_export_job(job_id)
+    if not job or job.get('user_id') != request.user.id:
+        return Response({'error': '내보내기 작업을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+    data = {'job_id': job_id, 'status': job['status'], 'export': job.get('export')}
+    if job['status'] == 'completed':
+        data['filename'] = job['filename']
+        data['download_url'] = f'/api/exports/{job_id}/download/'
+    elif job['status'] == 'failed':
+        data['error'] = job.get('error')
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def download_export_file(request, job_id):
+    """완료된 비동기 내보내기 파일을 다운로드합니다. (작업을 요청한 사용자만)"""
+    job = get_export_job(job_id)
+    if not job or job.get('user_id') != request.user.id:
+        return Response({'error': '내보내기 작업을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+    if job['status'] != 'completed':
+        return Response({'error': '내보내기 파일이 아직 준비되지 않았습니다.', 'status': job['status']}, status=status.HTTP_409_CONFLICT)
+
+    try:
+        return open_export_file(job)
+    except Exception as e:
+        logger.error(f'내보내기 파일 다운로드 실패: {e}')
+        return Response({'error': '내보내기 파일을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def send_email_verification_request(request):
@@ -1366,6 +1346,10 @@ def manual_retention_cleanup(request):
             # 슬라이싱된 QuerySet의 ID 목록을 가져와서 삭제
             details_to_delete_ids = list(successful_details[:delete_count].values_list('id', flat=True))
             ExamResultDetail.objects.filter(id__in=details_to_delete_ids).delete()
+            
+            # 사용자별 문제 통계(UserQuestionStat) 재계산
+            from ..utils.stats_utils import refresh_user_question_stats
+            refresh_user_question_stats([request.user.id])
         
         return Response({
             'message': f'{delete_count}개의 성공한 기록이 삭제되었습니다.',
@@ -1549,7 +1533,7 @@ class UserUpdateView(APIView):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def download_users_excel(request):
-    """사용자 정보를 Excel 형식으로 다운로드합니다."""
+    """사용자 정보를 Excel(또는 ?export_format=csv) 형식으로 다운로드합니다. (?async=1: 백그라운드 생성)"""
     try:
         # 관리자 권한 확인
         if not request.user.is_authenticated:
@@ -1564,73 +1548,7 @@ def download_users_excel(request):
         if user_role not in ['admin_role', 'study_admin_role']:
             return Response({'error': '관리자 권한이 필요합니다.'}, status=status.HTTP_403_FORBIDDEN)
         
-        # 사용자 데이터 수집
-        users = User.objects.all().order_by('username')
-        user_list = []
-        
-        for user in users:
-            try:
-                profile = user.profile
-                role = profile.role
-            except UserProfile.DoesNotExist:
-                profile = UserProfile.objects.create(user=user, role='user_role')
-                role = profile.role
-            
-            user_list.append({
-                'id': user.id,
-                'first_name': user.first_name or '',
-                'username': user.username,
-                'email': user.email or '',
-                'role': role,
-                'date_joined': user.date_joined.strftime('%Y-%m-%d %H:%M:%S') if user.date_joined else '',
-                'is_active': '활성' if user.is_active else '비활성',
-                'is_staff': '예' if user.is_staff else '아니오',
-                'is_superuser': '예' if user.is_superuser else '아니오'
-            })
-        
-        # DataFrame 생성
-        df = pd.DataFrame(user_list)
-        
-        # 컬럼명을 한글로 변경
-        df.columns = ['ID', '이름', '사용자명', '이메일', '역할', '가입일', '활성화', '스태프', '슈퍼유저']
-        
-        # Excel 파일 생성
-        output = io.BytesIO()
-        
-        try:
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='사용자목록', index=False)
-                
-                # 워크시트 가져오기
-                worksheet = writer.sheets['사용자목록']
-                
-                # 컬럼 너비 자동 조정
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if cell.value and len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            output.seek(0)
-            
-            # HTTP 응답 생성
-            response = HttpResponse(
-                output.getvalue(),
-                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            )
-            response['Content-Disposition'] = f'attachment; filename="users_{timezone.now().strftime("%Y%m%d_%H%M%S")}.xlsx"'
-            
-            return response
-            
-        except Exception as excel_error:
-            logger.error(f'Excel 파일 생성 중 오류: {excel_error}')
-            return Response({'detail': f'Excel 파일 생성 중 오류가 발생했습니다: {str(excel_error)}'}, status=500)
+        return handle_export_request(request, 'users')
         
     except Exception as e:
         logger.error(f'사용자 Excel 다운로드 중 오류: {e}')
@@ -2171,132 +2089,37 @@ def create_random_recommendation_exam(request):
             'exams_with_questions': []
         }
         
-        # 모든 시험에서 문제 수집
-        all_exam_questions = []
-        print(f"[랜덤출제 API] 처리할 시험 목록: {list(accessible_exams.values_list('title_ko', flat=True))}")
-        
-        for exam in accessible_exams:
-            print(f"[랜덤출제 API] 시험 처리 중: {exam.title_ko}")
-            
-            # 시험의 문제들 조회 (무시된 문제 제외)
-            exam_questions = Question.objects.filter(
-                examquestion__exam=exam
-            ).distinct()
-            
-            print(f"[랜덤출제 API] 시험 '{exam.title_ko}'에서 {len(exam_questions)}개 문제 발견")
-            
-            # 무시된 문제 제외
-            ignored_question_ids = set(
-                IgnoredQuestion.objects.filter(user=batch_user)
-                .values_list('question_id', flat=True)
-            )
-            exam_questions = [q for q in exam_questions if q.id not in ignored_question_ids]
-            
-            print(f"[랜덤출제 API] 무시된 문제 제외 후 {len(exam_questions)}개 문제 남음")
-            
-            if not exam_questions:
-                print(f"[랜덤출제 API] 시험 '{exam.title_ko}'에 문제가 없음")
-                continue
-            
-            # 문제 통계 조회
-            for question in exam_questions:
-                total_attempts = ExamResultDetail.objects.filter(
-                    question=question,
-                    result__user=batch_user
-                ).count()
-                
-                if total_attempts > 0:
-                    wrong_count = ExamResultDetail.objects.filter(
-                        question=question,
-                        result__user=batch_user,
-                        is_correct=False
-                    ).count()
-                    # 틀린 비율이 높을수록 높은 점수
-                    wrong_rate = wrong_count / total_attempts
-                    # 틀린 비율이 같으면 적게 풀어본 문제가 우선순위 높음 (시도 횟수의 역수 사용)
-                    # 틀린 비율 + (1 / 시도 횟수)로 점수 계산
-                    score = wrong_rate + (1.0 / total_attempts)
-                    question_title = question.title_ko if question.title_ko else question.title_en or '제목 없음'
-                    print(f"[랜덤출제 API] 문제 {question.id} ({question_title}): 점수={score:.2f}, 시도={total_attempts}, 틀린={wrong_count}, 틀린비율={wrong_rate:.2f}")
-                else:
-                    # 시도 횟수가 0인 문제는 가장 높은 우선순위 (아직 풀어보지 않은 문제)
-                    score = 1.0
-                    question_title = question.title_ko if question.title_ko else question.title_en or '제목 없음'
-                    print(f"[랜덤출제 API] 문제 {question.id} ({question_title}): 점수=1.0, 시도=0, 틀린=0 (미시도 문제 - 최고 우선순위)")
-                
-                all_exam_questions.append({
-                    'question': question,
-                    'exam': exam,
-                    'score': score,
-                    'attempts': total_attempts,
-                    'wrong_count': wrong_count if total_attempts > 0 else 0
-                })
-            
-            summary_data['total_exams_processed'] += 1
+        # 모든 시험의 후보 문제 점수를 집합 기반으로 계산 (시험/문제 수와 무관하게 고정 쿼리 수)
+        from ..utils.recommendation_utils import (
+            score_candidate_questions, select_top_questions, assign_source_group_ids, build_question_data
+        )
+        candidates_by_exam = score_candidate_questions(
+            batch_user,
+            exam_ids=list(accessible_exams.values_list('id', flat=True))
+        )
+        summary_data['total_exams_processed'] = len(candidates_by_exam)
+        print(f"[랜덤출제 API] 후보 문제가 있는 시험 수: {len(candidates_by_exam)}")
         
-        # 각 시험에서 questions_per_exam 개수만큼 문제 선택
+        # 각 시험에서 최대 1개 문제만 선택 (동일 그룹 중복 방지)
         all_questions = []
         exam_question_map = {}
+        selected_items = select_top_questions(candidates_by_exam, per_exam=1)
         
-        # 시험별로 문제를 그룹화
-        exam_questions_map = {}
-        for item in all_exam_questions:
-            exam_title = item['exam'].title_ko
-            if exam_title not in exam_questions_map:
-                exam_questions_map[exam_title] = []
-            exam_questions_map[exam_title].append(item)
-        
-        print(f"[랜덤출제 API] 시험별 문제 그룹화 결과:")
-        for exam_title, questions in exam_questions_map.items():
-            print(f"  - {exam_title}: {len(questions)}개 문제")
+        # group_id에 소스 시험 이름 설정
+        # 단, 사용자가 이미 설정한 group_id가 있으면 보존 (빈 문자열이 아닌 경우)
+        assign_source_group_ids(selected_items)
         
-        # 각 시험에서 최대 1개 문제만 선택 (동일 그룹 중복 방지)
-        total_selected = 0
-        for exam_title, exam_questions in exam_questions_map.items():
-            # 해당 시험의 문제들을 점수 순으로 정렬
-            sorted_exam_questions = sorted(exam_questions, key=lambda x: x['score'], reverse=True)
-            
-            # 각 시험에서 최대 1개 문제만 선택 (동일 그룹 중복 방지)
-            selected_from_exam = sorted_exam_questions[:1] if sorted_exam_questions else []
-            
-            print(f"[랜덤출제 API] 시험 '{exam_title}'에서 {len(selected_from_exam)}개 문제 선택 (동일 그룹 중복 방지: 최대 1개, 가용: {len(sorted_exam_questions)}개)")
-            
-            for item in selected_from_exam:
-                question = item['question']
-                exam = item['exam']
-                
-                # group_id에 소스 시험 이름 설정
-                # 단, 사용자가 이미 설정한 group_id가 있으면 보존 (빈 문자열이 아닌 경우)
-                if not question.group_id or question.group_id.strip() == '':
-                    question.group_id = exam.title_ko
-                    question.save()
-                
-                # 사용자 언어에 맞는 제목 선택
-                question_title = question.title_ko if question.title_ko else question.title_en or '제목 없음'
-                
-                question_data = {
-                    'id': question.id,
-                    'title': question_title,
-                    'source_exam': exam.title_ko,
-                    'group_id': exam.title_ko,
-                    'score': item['score'],
-                    'attempts': item['attempts'],
-                    'wrong_count': item['wrong_count']
-                }
-                
-                # 선택된 문제 상세 로그
-                accuracy = (item['attempts'] - item['wrong_count']) / item['attempts'] if item['attempts'] > 0 else 1.0
-                print(f"[랜덤출제 API] 선택된 문제: {question.id} ({question_title}) - 점수={item['score']:.2f}, 시도={item['attempts']}, 틀린={item['wrong_count']}, 정확도={accuracy:.1%}")
-                
-                all_questions.append(question_data)
-                
-                # exam_question_map 업데이트
-                if exam.title_ko not in exam_question_map:
-                    exam_question_map[exam.title_ko] = []
-                exam_question_map[exam.title_ko].append(question_data)
+        for item in selected_items:
+            exam = item['exam']
+            question_data = build_question_data(item)
+            all_questions.append(question_data)
             
-            total_selected += len(selected_from_exam)
+            # exam_question_map 업데이트
+            if exam.title_ko not in exam_question_map:
+                exam_question_map[exam.title_ko] = []
+            exam_question_map[exam.title_ko].append(question_data)
         
+        total_selected = len(selected_items)
         print(f"[랜덤출제 API] 총 {total_selected}개 문제 선택 완료")
         
         # 선택된 문제들의 소스 시험별 분포 확인
@@ -2320,47 +2143,8 @@ def create_random_recommendation_exam(request):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         # 중복 제거 (문제 ID 기준 + 그룹 ID 기준)
-        # 1단계: 문제 ID 기준 중복 제거
-        unique_by_id = []
-        seen_ids = set()
-        
-        for question_data in all_questions:
-            if question_data['id'] not in seen_ids:
-                unique_by_id.append(question_data)
-                seen_ids.add(question_data['id'])
-        
-        # 2단계: 그룹 ID 기준 중복 제거 (동일 그룹에서 여러 문제가 선택된 경우 최고 점수 문제만 유지)
-        unique_questions = []
-        seen_group_ids = {}
-        
-        for question_data in unique_by_id:
-            group_id = question_data.get('group_id', '')
-            question_id = question_data['id']
-            question_score = question_data.get('score', 0)
-            
-            # 그룹 ID가 없거나 빈 문자열인 경우는 그대로 추가
-            if not group_id or group_id.strip() == '':
-                unique_questions.append(question_data)
-                continue
-            
-            # 같은 그룹의 문제가 이미 선택된 경우
-            if group_id in seen_group_ids:
-                existing_question = seen_group_ids[group_id]
-                existing_score = existing_question.get('score', 0)
-                
-                # 현재 문제의 점수가 더 높으면 기존 문제를 교체
-                if question_score > existing_score:
-                    # 기존 문제 제거
-                    unique_questions = [q for q in unique_questions if q['id'] != existing_question['id']]
-                    unique_questions.append(question_data)
-                    seen_group_ids[group_id] = question_data
-                    print(f"[랜덤출제 API] 그룹 '{group_id}'에서 더 높은 점수 문제로 교체: {existing_question['id']} → {question_id}")
-                else:
-                    print(f"[랜덤출제 API] 그룹 '{group_id}'에서 중복 문제 제거: {question_id} (기존: {existing_question['id']})")
-            else:
-                # 새로운 그룹의 문제
-                unique_questions.append(question_data)
-                seen_group_ids[group_id] = question_data
+        from ..utils.recommendation_utils import deduplicate_selected_questions
+        unique_by_id, unique_questions = deduplicate_selected_questions(all_questions)
         
         summary_data['total_questions_selected'] = len(all_questions)
         summary_data['unique_questions'] = len(unique_questions)
@@ -2381,14 +2165,11 @@ def create_random_recommendation_exam(request):
             print(f"[랜덤출제 API] 기존 문제 {existing_exam_questions.count()}개 제거")
             existing_exam_questions.delete()
             
-            # 새 문제들 추가
-            for i, question_data in enumerate(unique_questions):
-                question = Question.objects.get(id=question_data['id'])
-                ExamQuestion.objects.create(
-                    exam=existing_exam,
-                    question=question,
-                    order=i + 1
-                )
+            # 새 문제들 추가 (일괄 생성, total_questions는 아래에서 직접 갱신)
+            ExamQuestion.objects.bulk_create([
+                ExamQuestion(exam=existing_exam, question_id=question_data['id'], order=i + 1)
+                for i, question_data in enumerate(unique_questions)
+            ])
             
             print(f"[랜덤출제 API] 새 문제 {len(unique_questions)}개 추가 완료")
             
@@ -2400,9 +2181,14 @@ def create_random_recommendation_exam(request):
             existing_questions = existing_exam.questions.all()
             selected_questions = []
             
+            # 문제 통계 정보 (UserQuestionStat 정답률 기반 점수, 한 번의 쿼리로 조회)
+            from ..utils.stats_utils import get_user_question_stats_map
+            question_stats_map = get_user_question_stats_map(
+                batch_user, question_ids=[question.id for question in existing_questions]
+            )
+            
             for question in existing_questions:
-                # 문제 통계 정보 가져오기
-                question_stats = get_question_statistics_for_user(question, batch_user)
+                question_stats = _build_question_statistics(question_stats_map.get(question.id))
                 question_title = question.title_ko if question.title_ko else question.title_en or '제목 없음'
                 selected_questions.append({
                     'id': question.id,
@@ -2466,15 +2252,12 @@ def create_random_recommendation_exam(request):
         else:
             print(f"[랜덤출제 API] 대상 사용자가 admin이므로 접근 권한 설정 생략")
         
-        # 시험에 문제 추가
-        for i, question_data in enumerate(unique_questions):
-            question = Question.objects.get(id=question_data['id'])
-            from ..models import ExamQuestion
-            ExamQuestion.objects.create(
-                exam=exam,
-                question=question,
-                order=i + 1
-            )
+        # 시험에 문제 추가 (일괄 생성, total_questions는 시험 생성 시 설정됨)
+        from ..models import ExamQuestion
+        ExamQuestion.objects.bulk_create([
+            ExamQuestion(exam=exam, question_id=question_data['id'], order=i + 1)
+            for i, question_data in enumerate(unique_questions)
+        ])
         
         print(f"[랜덤출제 API] 시험 생성 완료: {exam.id}")
         
@@ -2902,6 +2685,9 @@ def reset_user_statistics(request):
         # 시험 결과 삭제
         deleted_counts['exam_results'] = ExamResult.objects.filter(user=user).delete()[0]
         
+        # 사용자별 문제 통계 삭제
+        deleted_counts['user_question_stats'] = UserQuestionStat.objects.filter(user=user).delete()[0]
+        
         # 스터디 진행률 기록 삭제
         deleted_counts['study_progress_records'] = StudyProgressRecord.objects.filter(user=user).delete()[0]
         
@@ -3230,6 +3016,7 @@ def clear_all_cache(request):
     try:
         user = request.user
         logger.info(f"[CLEAR_ALL_CACHE] 사용자 {user.username}의 모든 캐시 초기화 시작")
+        deleted_key_count = 0
         
         # ========================================
         # 🔄 백엔드 Redis 캐시 무효화 (본인 정보만)
@@ -3259,14 +3046,16 @@ def clear_all_cache(request):
                     f"*_{user.id}_*"            # 본인 ID가 포함된 모든 캐시
                 ]
                 
+                # SCAN + 파이프라인 UNLINK로 삭제 (Redis 블로킹 없음)
                 for pattern in user_specific_patterns:
                     try:
-                        cache.delete_pattern(pattern)
-                        logger.info(f"[CLEAR_ALL_CACHE] ✅ 본인 전용 패턴 '{pattern}' 캐시 삭제 완료")
+                        pattern_deleted = cache.delete_pattern(pattern) or 0
+                        deleted_key_count += pattern_deleted
+                        logger.info(f"[CLEAR_ALL_CACHE] ✅ 본인 전용 패턴 '{pattern}' 캐시 삭제 완료: {pattern_deleted}개 키")
                     except Exception as pattern_error:
                         logger.warning(f"[CLEAR_ALL_CACHE] ⚠️ 패턴 '{pattern}' 캐시 삭제 실패: {pattern_error}")
                 
-                logger.info(f"[CLEAR_ALL_CACHE] ✅ 본인 전용 Redis 캐시 무효화 완료")
+                logger.info(f"[CLEAR_ALL_CACHE] ✅ 본인 전용 Redis 캐시 무효화 완료: 총 {deleted_key_count}개 키 삭제")
                 
             else:
                 # 로컬 캐시 환경에서는 개별 키 기반으로 본인 관련 캐시만 삭제
@@ -3370,6 +3159,7 @@ def clear_all_cache(request):
             'message': '모든 캐시가 성공적으로 초기화되었습니다.',
             'details': {
                 'backend_cache': 'cleared',
+                'deleted_keys': deleted_key_count,
                 'orm_cache': 'cleared',
                 'frontend_cache': 'user_action_required',
                 'timestamp': timezone.now().isoformat()